@@ -5,11 +5,16 @@ from dataclasses import dataclass
 from datetime import datetime, timezone
 import ipaddress
 import json
+import logging
+import queue
 import re
 import ssl
-from typing import Optional, Sequence
+import threading
+import time
+from typing import Callable, Iterator, Optional, Sequence
 from urllib import error as urllib_error
 from urllib import request as urllib_request
+from urllib.parse import urlencode
 
 from app.imports import BundleImporter, ImportAuditContext, run_import
 from app.imports.models import ImportApplyResult
@@ -17,6 +22,21 @@ from app.models import IPAssetType
 from app.utils import split_tag_string
 
 
+# Nodes per list page; each page is decoded and parsed before the next is
+# requested, so memory is bounded by the page rather than the cluster size.
+KUBERNETES_PAGE_SIZE = 500
+# Server-side Table rendering with only object metadata drops node status,
+# images and conditions, which make up most of a full node list.
+KUBERNETES_TABLE_ACCEPT = "application/json;as=Table;v=v1;g=meta.k8s.io"
+_TABLE_NONE_VALUE = "<none>"
+KUBERNETES_WATCH_DEBOUNCE_SECONDS = 2.0
+KUBERNETES_WATCH_MAX_DELAY_SECONDS = 30.0
+KUBERNETES_WATCH_TIMEOUT_SECONDS = 300
+KUBERNETES_WATCH_RETRY_SECONDS = 5.0
+
+logger = logging.getLogger(__name__)
+
+
 class KubernetesConnectorError(Exception):
     pass
 
@@ -35,9 +55,11 @@ class KubernetesNodeRecords(list[KubernetesNodeRecord]):
         records: Sequence[KubernetesNodeRecord] = (),
         *,
         cluster_name: Optional[str] = None,
+        resource_version: Optional[str] = None,
     ):
         super().__init__(records)
         self.cluster_name = cluster_name
+        self.resource_version = resource_version
 
 
 def _build_ssl_context(*, insecure: bool) -> ssl.SSLContext:
@@ -48,8 +70,28 @@ def _build_ssl_context(*, insecure: bool) -> ssl.SSLContext:
     return context
 
 
-def _nodes_url(api_url: str) -> str:
-    return f"{api_url.rstrip('/')}/api/v1/nodes"
+def _nodes_url(
+    api_url: str,
+    *,
+    limit: Optional[int] = None,
+    continue_token: Optional[str] = None,
+    label_selector: Optional[str] = None,
+    field_selector: Optional[str] = None,
+    table_format: bool = False,
+) -> str:
+    url = f"{api_url.rstrip('/')}/api/v1/nodes"
+    params: list[tuple[str, str]] = []
+    if limit is not None:
+        params.append(("limit", str(limit)))
+    if continue_token:
+        params.append(("continue", continue_token))
+    if label_selector:
+        params.append(("labelSelector", label_selector))
+    if field_selector:
+        params.append(("fieldSelector", field_selector))
+    if table_format:
+        params.append(("includeObject", "Metadata"))
+    return f"{url}?{urlencode(params)}" if params else url
 
 
 def _request_json(
@@ -58,12 +100,13 @@ def _request_json(
     token: str,
     timeout: int,
     context: ssl.SSLContext,
+    accept: str = "application/json",
 ) -> object:
     request = urllib_request.Request(
         url,
         method="GET",
         headers={
-            "Accept": "application/json",
+            "Accept": accept,
             "Authorization": f"Bearer {token}",
         },
     )
@@ -83,19 +126,12 @@ def _request_json(
         raise KubernetesConnectorError(f"Failed to call Kubernetes API: {exc}") from exc
 
     try:
-        return json.loads(payload.decode("utf-8"))
+        return json.loads(payload)
     except (UnicodeDecodeError, json.JSONDecodeError) as exc:
         raise KubernetesConnectorError("Kubernetes API returned invalid JSON.") from exc
 
 
-def _extract_node_payloads(
-    payload: object,
-) -> tuple[list[dict[str, object]], Optional[str]]:
-    if not isinstance(payload, dict):
-        raise KubernetesConnectorError(
-            "Kubernetes node response was not a JSON object."
-        )
-
+def _extract_cluster_name(payload: dict[str, object]) -> Optional[str]:
     cluster_name = (
         str(payload.get("cluster_name")).strip()
         if payload.get("cluster_name") is not None
@@ -104,12 +140,30 @@ def _extract_node_payloads(
     metadata = payload.get("metadata")
     if isinstance(metadata, dict) and metadata.get("clusterName") is not None:
         cluster_name = str(metadata.get("clusterName")).strip() or cluster_name
+    return cluster_name
+
+
+def _extract_list_metadata(payload: object, key: str) -> Optional[str]:
+    metadata = payload.get("metadata") if isinstance(payload, dict) else None
+    if not isinstance(metadata, dict):
+        return None
+    return str(metadata.get(key) or "").strip() or None
+
+
+def _extract_node_payloads(
+    payload: object,
+) -> tuple[list[dict[str, object]], Optional[str]]:
+    if not isinstance(payload, dict):
+        raise KubernetesConnectorError(
+            "Kubernetes node response was not a JSON object."
+        )
 
     items = payload.get("items")
     if not isinstance(items, list):
         raise KubernetesConnectorError(
             "Kubernetes node response did not include an items list."
         )
+    cluster_name = _extract_cluster_name(payload)
     return [item for item in items if isinstance(item, dict)], cluster_name
 
 
@@ -144,35 +198,157 @@ def _extract_internal_ips(node_payload: dict[str, object]) -> tuple[str, ...]:
     return tuple(internal_ips)
 
 
+def _parse_node_payload(
+    node_payload: dict[str, object], cluster_name: Optional[str]
+) -> KubernetesNodeRecord:
+    metadata = node_payload.get("metadata")
+    metadata = metadata if isinstance(metadata, dict) else {}
+    return KubernetesNodeRecord(
+        name=str(metadata.get("name") or "").strip(),
+        internal_ips=_extract_internal_ips(node_payload),
+        labels=_normalize_labels(metadata.get("labels")),
+        cluster_name=cluster_name,
+    )
+
+
+def _parse_node_table(
+    payload: object,
+) -> tuple[list[KubernetesNodeRecord], Optional[str]]:
+    if not isinstance(payload, dict):
+        raise KubernetesConnectorError(
+            "Kubernetes node response was not a JSON object."
+        )
+    rows = payload.get("rows")
+    columns = payload.get("columnDefinitions")
+    if not isinstance(rows, list) or not isinstance(columns, list):
+        raise KubernetesConnectorError(
+            "Kubernetes node table response did not include rows and columns."
+        )
+    column_names = [
+        str(column.get("name") or "") if isinstance(column, dict) else ""
+        for column in columns
+    ]
+    try:
+        internal_ip_index = column_names.index("Internal-IP")
+    except ValueError:
+        raise KubernetesConnectorError(
+            "Kubernetes node table response did not include an Internal-IP column."
+        ) from None
+
+    cluster_name = _extract_cluster_name(payload)
+    records: list[KubernetesNodeRecord] = []
+    for row in rows:
+        if not isinstance(row, dict):
+            continue
+        cells = row.get("cells")
+        cells = cells if isinstance(cells, list) else []
+        internal_ip = (
+            str(cells[internal_ip_index] or "").strip()
+            if internal_ip_index < len(cells)
+            else ""
+        )
+        node_object = row.get("object")
+        metadata = node_object.get("metadata") if isinstance(node_object, dict) else {}
+        metadata = metadata if isinstance(metadata, dict) else {}
+        name = metadata.get("name") or (cells[0] if cells else "")
+        records.append(
+            KubernetesNodeRecord(
+                name=str(name or "").strip(),
+                internal_ips=(
+                    (internal_ip,)
+                    if internal_ip and internal_ip != _TABLE_NONE_VALUE
+                    else ()
+                ),
+                labels=_normalize_labels(metadata.get("labels")),
+                cluster_name=cluster_name,
+            )
+        )
+    return records, cluster_name
+
+
+def iter_kubernetes_node_pages(
+    *,
+    api_url: str,
+    token: str,
+    insecure: bool = False,
+    timeout: int = 30,
+    page_size: int = KUBERNETES_PAGE_SIZE,
+    label_selector: Optional[str] = None,
+    field_selector: Optional[str] = None,
+    table_format: bool = False,
+) -> Iterator[KubernetesNodeRecords]:
+    """List nodes with ``limit``/``continue`` paging, one parsed page at a time.
+
+    With ``table_format`` the API server renders a Table with node metadata
+    only; its Internal-IP column carries the first InternalIP of each node.
+    """
+    context = _build_ssl_context(insecure=insecure)
+    continue_token: Optional[str] = None
+    while True:
+        payload = _request_json(
+            url=_nodes_url(
+                api_url,
+                limit=page_size,
+                continue_token=continue_token,
+                label_selector=label_selector,
+                field_selector=field_selector,
+                table_format=table_format,
+            ),
+            token=token,
+            timeout=timeout,
+            context=context,
+            accept=KUBERNETES_TABLE_ACCEPT if table_format else "application/json",
+        )
+        if table_format:
+            records, cluster_name = _parse_node_table(payload)
+        else:
+            node_payloads, cluster_name = _extract_node_payloads(payload)
+            records = [
+                _parse_node_payload(node_payload, cluster_name)
+                for node_payload in node_payloads
+            ]
+        continue_token = _extract_list_metadata(payload, "continue")
+        resource_version = _extract_list_metadata(payload, "resourceVersion")
+        del payload  # Release the decoded page before the caller consumes it.
+        yield KubernetesNodeRecords(
+            records, cluster_name=cluster_name, resource_version=resource_version
+        )
+        if not continue_token:
+            return
+
+
 def fetch_kubernetes_nodes(
     *,
     api_url: str,
     token: str,
     insecure: bool = False,
     timeout: int = 30,
+    page_size: int = KUBERNETES_PAGE_SIZE,
+    label_selector: Optional[str] = None,
+    field_selector: Optional[str] = None,
+    table_format: bool = False,
 ) -> KubernetesNodeRecords:
-    payload = _request_json(
-        url=_nodes_url(api_url),
+    records: list[KubernetesNodeRecord] = []
+    cluster_name: Optional[str] = None
+    resource_version: Optional[str] = None
+    for page in iter_kubernetes_node_pages(
+        api_url=api_url,
         token=token,
+        insecure=insecure,
         timeout=timeout,
-        context=_build_ssl_context(insecure=insecure),
+        page_size=page_size,
+        label_selector=label_selector,
+        field_selector=field_selector,
+        table_format=table_format,
+    ):
+        records.extend(page)
+        cluster_name = cluster_name or page.cluster_name
+        # Every page of a paginated list is served from the first page's
+        # snapshot, so its resourceVersion is the one to watch from.
+        resource_version = resource_version or page.resource_version
+    return KubernetesNodeRecords(
+        records, cluster_name=cluster_name, resource_version=resource_version
     )
-    node_payloads, cluster_name = _extract_node_payloads(payload)
-    records: list[KubernetesNodeRecord] = []
-    for node_payload in node_payloads:
-        metadata = node_payload.get("metadata")
-        metadata = metadata if isinstance(metadata, dict) else {}
-        name = str(metadata.get("name") or "").strip()
-        labels = _normalize_labels(metadata.get("labels"))
-        records.append(
-            KubernetesNodeRecord(
-                name=name,
-                internal_ips=_extract_internal_ips(node_payload),
-                labels=labels,
-                cluster_name=cluster_name,
-            )
-        )
-    return KubernetesNodeRecords(records, cluster_name=cluster_name)
 
 
 def _normalize_ipv4(value: object) -> Optional[str]:
@@ -397,6 +573,291 @@ def import_bundle_via_pipeline(
     )
 
 
+def build_node_change_bundle(
+    upserts: Sequence[KubernetesNodeRecord],
+    deleted: Sequence[KubernetesNodeRecord],
+    **extract_options: object,
+) -> tuple[dict[str, object], list[str]]:
+    """Build a bundle for changed nodes; IPs of deleted nodes are archived.
+
+    ``extract_options`` are passed to :func:`extract_inventory_from_nodes`.
+    Archiving leaves the host, project, type, tags and notes of an address
+    as they are.
+    """
+    hosts, ip_assets, warnings = extract_inventory_from_nodes(
+        upserts, **extract_options
+    )
+    _deleted_hosts, deleted_assets, _deleted_warnings = extract_inventory_from_nodes(
+        deleted, **extract_options
+    )
+    archived_assets = [
+        {
+            "ip_address": asset["ip_address"],
+            "type": asset["type"],
+            "preserve_existing_type": True,
+            "archived": True,
+        }
+        for asset in deleted_assets
+    ]
+    # Upserts come first so an IP that moved to another node stays active.
+    bundle, bundle_warnings = build_import_bundle_from_kubernetes(
+        hosts, [*ip_assets, *archived_assets]
+    )
+    return bundle, [*warnings, *bundle_warnings]
+
+
+class _WatchExpired(Exception):
+    pass
+
+
+_WATCH_STREAM_END = object()
+
+
+class KubernetesNodeWatch:
+    """List nodes once, then follow the node watch and apply changed nodes.
+
+    Events are folded into a pending batch keyed by node name, and records
+    identical to the last applied state (status heartbeats) are dropped.
+    A batch is handed to ``apply_batch(upserts, deleted)`` once no change
+    has arrived for ``debounce_seconds``, or ``max_delay_seconds`` after its
+    first change. A batch that fails to apply stays pending and is retried
+    after ``retry_seconds``. An expired ``resourceVersion`` (``410 Gone``)
+    triggers a re-list that is diffed against the known nodes.
+    """
+
+    def __init__(
+        self,
+        *,
+        api_url: str,
+        token: str,
+        apply_batch: Callable[
+            [list[KubernetesNodeRecord], list[KubernetesNodeRecord]], None
+        ],
+        insecure: bool = False,
+        timeout: int = 30,
+        page_size: int = KUBERNETES_PAGE_SIZE,
+        label_selector: Optional[str] = None,
+        field_selector: Optional[str] = None,
+        debounce_seconds: float = KUBERNETES_WATCH_DEBOUNCE_SECONDS,
+        max_delay_seconds: float = KUBERNETES_WATCH_MAX_DELAY_SECONDS,
+        watch_timeout_seconds: int = KUBERNETES_WATCH_TIMEOUT_SECONDS,
+        retry_seconds: float = KUBERNETES_WATCH_RETRY_SECONDS,
+        poll_seconds: float = 0.5,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.api_url = api_url
+        self.token = token
+        self.apply_batch = apply_batch
+        self.insecure = insecure
+        self.timeout = timeout
+        self.page_size = page_size
+        self.label_selector = label_selector
+        self.field_selector = field_selector
+        self.debounce_seconds = debounce_seconds
+        self.max_delay_seconds = max_delay_seconds
+        self.watch_timeout_seconds = watch_timeout_seconds
+        self.retry_seconds = retry_seconds
+        self.poll_seconds = poll_seconds
+        self.clock = clock
+        self.nodes: dict[str, KubernetesNodeRecord] = {}
+        self.cluster_name: Optional[str] = None
+        self.resource_version: Optional[str] = None
+        self.relist_count = 0
+        self._pending: dict[str, tuple[bool, KubernetesNodeRecord]] = {}
+        self._pending_since: Optional[float] = None
+        self._changed_at = 0.0
+
+    def _record_change(self, record: KubernetesNodeRecord, *, deleted: bool) -> None:
+        if deleted:
+            if self.nodes.pop(record.name, None) is None:
+                self._pending.pop(record.name, None)
+                return
+        else:
+            if self.nodes.get(record.name) == record:
+                return
+            self.nodes[record.name] = record
+        self._pending[record.name] = (deleted, record)
+        now = self.clock()
+        self._changed_at = now
+        if self._pending_since is None:
+            self._pending_since = now
+
+    def relist(self) -> None:
+        records = fetch_kubernetes_nodes(
+            api_url=self.api_url,
+            token=self.token,
+            insecure=self.insecure,
+            timeout=self.timeout,
+            page_size=self.page_size,
+            label_selector=self.label_selector,
+            field_selector=self.field_selector,
+        )
+        self.cluster_name = records.cluster_name or self.cluster_name
+        listed = {record.name: record for record in records if record.name}
+        for name in set(self.nodes) - set(listed):
+            self._record_change(self.nodes[name], deleted=True)
+        for record in listed.values():
+            self._record_change(record, deleted=False)
+        self.resource_version = records.resource_version
+        self.relist_count += 1
+
+    def handle_event(self, event: object) -> None:
+        if not isinstance(event, dict):
+            raise KubernetesConnectorError("Kubernetes watch event was not an object.")
+        event_type = str(event.get("type") or "")
+        node_payload = event.get("object")
+        node_payload = node_payload if isinstance(node_payload, dict) else {}
+        if event_type == "ERROR":
+            if node_payload.get("code") == 410:
+                raise _WatchExpired()
+            raise KubernetesConnectorError(
+                f"Kubernetes watch failed: {node_payload.get('message') or event}"
+            )
+        resource_version = _extract_list_metadata(node_payload, "resourceVersion")
+        if event_type in {"ADDED", "MODIFIED", "DELETED"}:
+            record = _parse_node_payload(node_payload, self.cluster_name)
+            if record.name:
+                self._record_change(record, deleted=event_type == "DELETED")
+        self.resource_version = resource_version or self.resource_version
+
+    def flush(self, *, force: bool = False) -> bool:
+        """Apply the pending batch if it has settled; report whether it did."""
+        if not self._pending:
+            return False
+        now = self.clock()
+        settled = now - self._changed_at >= self.debounce_seconds
+        overdue = now - self._pending_since >= self.max_delay_seconds
+        if not (force or settled or overdue):
+            return False
+        pending, self._pending = self._pending, {}
+        pending_since, self._pending_since = self._pending_since, None
+        try:
+            self.apply_batch(
+                [record for deleted, record in pending.values() if not deleted],
+                [record for deleted, record in pending.values() if deleted],
+            )
+        except Exception:
+            # ``self.nodes`` already holds the observed state, so putting the
+            # batch back is enough for the next flush to apply it again.
+            pending.update(self._pending)
+            self._pending = pending
+            self._pending_since = pending_since
+            raise
+        return True
+
+    def _watch_url(self) -> str:
+        params = [
+            ("watch", "1"),
+            ("allowWatchBookmarks", "true"),
+            ("timeoutSeconds", str(self.watch_timeout_seconds)),
+        ]
+        if self.resource_version:
+            params.append(("resourceVersion", self.resource_version))
+        if self.label_selector:
+            params.append(("labelSelector", self.label_selector))
+        if self.field_selector:
+            params.append(("fieldSelector", self.field_selector))
+        return f"{_nodes_url(self.api_url)}?{urlencode(params)}"
+
+    def _open_watch(self):
+        request = urllib_request.Request(
+            self._watch_url(),
+            method="GET",
+            headers={
+                "Accept": "application/json",
+                "Authorization": f"Bearer {self.token}",
+            },
+        )
+        try:
+            return urllib_request.urlopen(
+                request,
+                timeout=self.watch_timeout_seconds + self.timeout,
+                context=_build_ssl_context(insecure=self.insecure),
+            )
+        except urllib_error.HTTPError as exc:
+            if exc.code == 410:
+                raise _WatchExpired() from exc
+            details = exc.read().decode("utf-8", errors="replace")
+            raise KubernetesConnectorError(
+                f"Kubernetes watch request failed with HTTP {exc.code}: {details}"
+            ) from exc
+        except urllib_error.URLError as exc:
+            raise KubernetesConnectorError(
+                f"Failed to call Kubernetes API: {exc}"
+            ) from exc
+
+    @staticmethod
+    def _read_events(response, events: queue.Queue) -> None:
+        try:
+            for line in response:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    events.put(json.loads(line))
+                except (UnicodeDecodeError, json.JSONDecodeError):
+                    events.put(
+                        KubernetesConnectorError(
+                            "Kubernetes watch returned invalid JSON."
+                        )
+                    )
+                    return
+        except Exception as exc:
+            events.put(KubernetesConnectorError(f"Kubernetes watch failed: {exc}"))
+        finally:
+            events.put(_WATCH_STREAM_END)
+
+    def watch_once(self, stop: threading.Event) -> None:
+        """Follow one watch request until the server ends it or ``stop`` is set."""
+        response = self._open_watch()
+        events: queue.Queue = queue.Queue()
+        reader = threading.Thread(
+            target=self._read_events,
+            args=(response, events),
+            name="kubernetes-node-watch",
+            daemon=True,
+        )
+        reader.start()
+        try:
+            while not stop.is_set():
+                try:
+                    item = events.get(timeout=self.poll_seconds)
+                except queue.Empty:
+                    self.flush()
+                    continue
+                if item is _WATCH_STREAM_END:
+                    return
+                if isinstance(item, Exception):
+                    raise item
+                self.handle_event(item)
+                self.flush()
+        finally:
+            response.close()
+
+    def run(self, stop: threading.Event) -> None:
+        needs_relist = True
+        while not stop.is_set():
+            try:
+                if needs_relist:
+                    self.relist()
+                    needs_relist = False
+                    self.flush()
+                self.watch_once(stop)
+            except _WatchExpired:
+                logger.info("Kubernetes node watch expired; re-listing nodes.")
+                needs_relist = True
+            except KubernetesConnectorError:
+                logger.exception("Kubernetes node watch failed; retrying.")
+                stop.wait(self.retry_seconds)
+            except Exception:
+                logger.exception("Applying Kubernetes node changes failed; retrying.")
+                stop.wait(self.retry_seconds)
+        try:
+            self.flush(force=True)
+        except Exception:
+            logger.exception("Applying the final Kubernetes node changes failed.")
+
+
 def _print_import_result(result: ImportApplyResult) -> None:
     total = result.summary.total()
     print(
@@ -476,6 +937,41 @@ def _build_parser() -> argparse.ArgumentParser:
         default=30,
         help="HTTP timeout in seconds for Kubernetes calls (default: 30)",
     )
+    parser.add_argument(
+        "--label-selector",
+        required=False,
+        help="Optional node label selector (example: node-role.kubernetes.io/worker).",
+    )
+    parser.add_argument(
+        "--field-selector",
+        required=False,
+        help="Optional node field selector (example: spec.unschedulable=false).",
+    )
+    parser.add_argument(
+        "--page-size",
+        type=int,
+        default=KUBERNETES_PAGE_SIZE,
+        help=f"Nodes per list request (default: {KUBERNETES_PAGE_SIZE})",
+    )
+    parser.add_argument(
+        "--table-format",
+        action="store_true",
+        help="Request a server-side table with node metadata only; imports the "
+        "first InternalIP of each node.",
+    )
+    parser.add_argument(
+        "--watch",
+        action="store_true",
+        help="Keep running: list nodes once, then apply node changes from the "
+        "watch API (requires --mode dry-run/apply).",
+    )
+    parser.add_argument(
+        "--debounce-seconds",
+        type=float,
+        default=KUBERNETES_WATCH_DEBOUNCE_SECONDS,
+        help="In --watch mode, wait this long after the last node change before "
+        f"applying a batch (default: {KUBERNETES_WATCH_DEBOUNCE_SECONDS:g})",
+    )
     parser.add_argument("--db-path", required=False, help="Path to local ipocket DB.")
     return parser
 
@@ -489,6 +985,62 @@ def _validate_cli_args(
         parser.error("--db-path is required when --mode is dry-run/apply")
     if args.timeout <= 0:
         parser.error("--timeout must be a positive integer")
+    if args.page_size <= 0:
+        parser.error("--page-size must be a positive integer")
+    if args.watch and args.mode == "file":
+        parser.error("--watch requires --mode dry-run or apply")
+    if args.watch and args.table_format:
+        parser.error("--watch cannot be combined with --table-format")
+    if args.debounce_seconds < 0:
+        parser.error("--debounce-seconds must not be negative")
+
+
+def _run_watch(args: argparse.Namespace, extract_options: dict[str, object]) -> int:
+    from app import db
+
+    connection = db.connect(args.db_path)
+    db.init_db(connection)
+
+    def _apply_batch(
+        upserts: list[KubernetesNodeRecord], deleted: list[KubernetesNodeRecord]
+    ) -> None:
+        bundle, warnings = build_node_change_bundle(upserts, deleted, **extract_options)
+        for warning in warnings:
+            print(f"Warning: {warning}")
+        print(
+            f"Applying {len(upserts)} changed and {len(deleted)} deleted Kubernetes nodes."
+        )
+        result = import_bundle_via_pipeline(
+            connection,
+            bundle=bundle,
+            user=None,
+            dry_run=args.mode == "dry-run",
+        )
+        _print_import_result(result)
+
+    watch = KubernetesNodeWatch(
+        api_url=args.api_url,
+        token=args.token,
+        apply_batch=_apply_batch,
+        insecure=args.insecure,
+        timeout=args.timeout,
+        page_size=args.page_size,
+        label_selector=args.label_selector,
+        field_selector=args.field_selector,
+        debounce_seconds=args.debounce_seconds,
+        max_delay_seconds=max(
+            KUBERNETES_WATCH_MAX_DELAY_SECONDS, args.debounce_seconds
+        ),
+    )
+    stop = threading.Event()
+    try:
+        watch.run(stop)
+    except KeyboardInterrupt:
+        stop.set()
+        watch.flush(force=True)
+    finally:
+        connection.close()
+    return 0
 
 
 def main(argv: Optional[Sequence[str]] = None) -> int:
@@ -499,6 +1051,17 @@ def main(argv: Optional[Sequence[str]] = None) -> int:
     note_value = (args.note or "").strip() if args.note is not None else None
     note = note_value if note_value else None
     cluster_name = (args.cluster_name or "").strip() or None
+    extract_options: dict[str, object] = {
+        "default_type": args.asset_type,
+        "project_name": args.project_name,
+        "tags": split_tag_string(args.tags) if args.tags else None,
+        "note": note,
+        "include_cluster_name_tag": args.include_cluster_name_tag,
+        "cluster_name": cluster_name,
+        "include_label_tags": args.include_label_tags,
+    }
+    if args.watch:
+        return _run_watch(args, extract_options)
 
     try:
         records = fetch_kubernetes_nodes(
@@ -506,16 +1069,13 @@ def main(argv: Optional[Sequence[str]] = None) -> int:
             token=args.token,
             insecure=args.insecure,
             timeout=args.timeout,
+            page_size=args.page_size,
+            label_selector=args.label_selector,
+            field_selector=args.field_selector,
+            table_format=args.table_format,
         )
         hosts, ip_assets, extraction_warnings = extract_inventory_from_nodes(
-            records,
-            default_type=args.asset_type,
-            project_name=args.project_name,
-            tags=split_tag_string(args.tags) if args.tags else None,
-            note=note,
-            include_cluster_name_tag=args.include_cluster_name_tag,
-            cluster_name=cluster_name,
-            include_label_tags=args.include_label_tags,
+            records, **extract_options
         )
         bundle, bundle_warnings = build_import_bundle_from_kubernetes(hosts, ip_assets)
 
@@ -6,12 +6,21 @@ from datetime import datetime, timezone
 import ipaddress
 import json
 import ssl
+from types import SimpleNamespace
 from typing import Any, Optional, Sequence
 
 from app.imports import BundleImporter, ImportAuditContext, run_import
 from app.imports.models import ImportApplyResult
 
 
+# Objects per RetrievePropertiesEx page; vCenter may return fewer.
+VCENTER_PAGE_SIZE = 1000
+# Only these properties are fetched, in one PropertyCollector query, instead
+# of reading each attribute from the managed objects with its own round trip.
+HOST_PROPERTY_PATHS = ("name", "summary.managementServerIp", "config.network.vnic")
+VM_PROPERTY_PATHS = ("name", "guest.ipAddress", "guest.net", "runtime.host")
+
+
 class VCenterConnectorError(Exception):
     pass
 
@@ -207,32 +216,124 @@ def build_import_bundle(
     return bundle, warnings
 
 
+def _nest_properties(properties: dict[str, Any]) -> SimpleNamespace:
+    """Turn ``{"summary.managementServerIp": ...}`` into nested attributes."""
+    root = SimpleNamespace()
+    for path, value in properties.items():
+        target = root
+        *parents, leaf = path.split(".")
+        for part in parents:
+            child = getattr(target, part, None)
+            if child is None:
+                child = SimpleNamespace()
+                setattr(target, part, child)
+            target = child
+        setattr(target, leaf, value)
+    return root
+
+
+def _managed_object_key(obj: Any) -> object:
+    return getattr(obj, "_moId", obj)
+
+
+def _retrieve_object_contents(
+    property_collector: Any,
+    filter_spec: Any,
+    vmodl: Any,
+    *,
+    page_size: int,
+) -> list[Any]:
+    options = vmodl.query.PropertyCollector.RetrieveOptions(maxObjects=page_size)
+    result = property_collector.RetrievePropertiesEx(
+        specSet=[filter_spec], options=options
+    )
+    object_contents: list[Any] = []
+    token: Optional[str] = None
+    try:
+        while result is not None:
+            object_contents.extend(result.objects or [])
+            token = getattr(result, "token", None)
+            if not token:
+                break
+            result = property_collector.ContinueRetrievePropertiesEx(token=token)
+        token = None
+    finally:
+        if token:
+            property_collector.CancelRetrievePropertiesEx(token=token)
+    return object_contents
+
+
 def _collect_inventory(
     service_instance: Any,
     vim: Any,
+    vmodl: Any,
+    *,
+    page_size: int = VCENTER_PAGE_SIZE,
 ) -> tuple[list[VCenterHostRecord], list[VCenterVmRecord], list[str]]:
     content = service_instance.RetrieveContent()
-    view_manager = content.viewManager
-
-    host_view = view_manager.CreateContainerView(
+    view = content.viewManager.CreateContainerView(
         content.rootFolder,
-        [vim.HostSystem],
+        [vim.HostSystem, vim.VirtualMachine],
         True,
     )
-    try:
-        host_systems = list(host_view.view)
-    finally:
-        host_view.Destroy()
-
-    vm_view = view_manager.CreateContainerView(
-        content.rootFolder,
-        [vim.VirtualMachine],
-        True,
+    collector_types = vmodl.query.PropertyCollector
+    filter_spec = collector_types.FilterSpec(
+        objectSet=[
+            collector_types.ObjectSpec(
+                obj=view,
+                skip=True,
+                selectSet=[
+                    collector_types.TraversalSpec(
+                        name="traverseView",
+                        type=vim.view.ContainerView,
+                        path="view",
+                        skip=False,
+                    )
+                ],
+            )
+        ],
+        propSet=[
+            collector_types.PropertySpec(
+                type=vim.HostSystem, pathSet=list(HOST_PROPERTY_PATHS)
+            ),
+            collector_types.PropertySpec(
+                type=vim.VirtualMachine, pathSet=list(VM_PROPERTY_PATHS)
+            ),
+        ],
     )
     try:
-        vms = list(vm_view.view)
+        object_contents = _retrieve_object_contents(
+            content.propertyCollector, filter_spec, vmodl, page_size=page_size
+        )
     finally:
-        vm_view.Destroy()
+        view.Destroy()
+
+    host_systems: list[SimpleNamespace] = []
+    vm_properties: list[dict[str, Any]] = []
+    host_names: dict[object, str] = {}
+    for object_content in object_contents:
+        properties = {prop.name: prop.val for prop in object_content.propSet or []}
+        if isinstance(object_content.obj, vim.HostSystem):
+            host_systems.append(_nest_properties(properties))
+            host_names[_managed_object_key(object_content.obj)] = str(
+                properties.get("name", "")
+            )
+        else:
+            vm_properties.append(properties)
+
+    # runtime.host is a reference; resolve it from the hosts in this result
+    # instead of reading its name with another round trip.
+    vms = []
+    for properties in vm_properties:
+        host_ref = properties.pop("runtime.host", None)
+        vm = _nest_properties(properties)
+        host_name = (
+            host_names.get(_managed_object_key(host_ref), "")
+            if host_ref is not None
+            else ""
+        )
+        vm.runtime = SimpleNamespace(host=SimpleNamespace(name=host_name))
+        vms.append(vm)
 
     hosts, host_warnings = parse_host_systems(host_systems)
     vm_records, vm_warnings = parse_virtual_machines(vms)
@@ -249,7 +350,7 @@ def fetch_vcenter_inventory(
 ) -> tuple[list[VCenterHostRecord], list[VCenterVmRecord], list[str]]:
     try:
         from pyVim.connect import Disconnect, SmartConnect
-        from pyVmomi import vim
+        from pyVmomi import vim, vmodl
     except ImportError as exc:
         raise VCenterConnectorError(
             "Missing dependency 'pyvmomi'. Install it with: pip install -r requirements.txt"
@@ -270,7 +371,7 @@ def fetch_vcenter_inventory(
         ) from exc
 
     try:
-        return _collect_inventory(service_instance, vim)
+        return _collect_inventory(service_instance, vim, vmodl)
     finally:
         Disconnect(service_instance)
 
@@ -0,0 +1,71 @@
+"""Check or rebuild the trigger-maintained inventory counters.
+
+Usage::
+
+    python -m app.counters --db-path ipocket.db
+    python -m app.counters --db-path ipocket.db --rebuild
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+from typing import Optional, Sequence
+
+from sqlalchemy.exc import OperationalError
+
+from app import db, repository
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        description="Compare inventory counters with a full recount."
+    )
+    parser.add_argument(
+        "--db-path",
+        default=os.getenv("IPAM_DB_PATH", "ipocket.db"),
+        help="SQLite database path (default: $IPAM_DB_PATH or ipocket.db).",
+    )
+    parser.add_argument(
+        "--rebuild",
+        action="store_true",
+        help="Recount every counter from the inventory tables.",
+    )
+    return parser
+
+
+def _format_value(value: Optional[int]) -> str:
+    return "missing" if value is None else str(value)
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = _build_parser()
+    args = parser.parse_args(argv)
+
+    connection = db.connect(args.db_path)
+    try:
+        try:
+            mismatches = repository.check_inventory_counters(connection)
+        except OperationalError as exc:
+            parser.exit(status=1, message=f"error: {exc.orig}\n")
+        for mismatch in mismatches:
+            print(
+                f"- {mismatch['counter']}[{mismatch['ref_id']}]: "
+                f"stored={_format_value(mismatch['stored'])}, "
+                f"expected={_format_value(mismatch['expected'])}"
+            )
+        if not mismatches:
+            print("Inventory counters are consistent.")
+            return 0
+        if not args.rebuild:
+            print(f"{len(mismatches)} inventory counter(s) out of date.")
+            return 1
+        rows = repository.rebuild_inventory_counters(connection)
+        print(f"Rebuilt {rows} inventory counter(s).")
+        return 0
+    finally:
+        connection.close()
+
+
+if __name__ == "__main__":  # pragma: no cover
+    raise SystemExit(main())
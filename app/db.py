@@ -114,6 +114,10 @@ def _apply_legacy_migrations(connection: sqlite3.Connection) -> None:
         if "ip_int" not in ip_asset_columns:
             connection.execute("ALTER TABLE ip_assets ADD COLUMN ip_int INTEGER")
             _backfill_ip_asset_int_column(connection)
+        if "import_fingerprint" not in ip_asset_columns:
+            connection.execute(
+                "ALTER TABLE ip_assets ADD COLUMN import_fingerprint TEXT"
+            )
         if "host_id" not in ip_asset_columns:
             connection.execute(
                 "ALTER TABLE ip_assets ADD COLUMN host_id INTEGER REFERENCES hosts(id)"
@@ -163,6 +167,9 @@ def _apply_legacy_migrations(connection: sqlite3.Connection) -> None:
 
     _drop_legacy_ip_asset_addressing(connection)
     _ensure_listing_indexes(connection)
+    _ensure_import_fingerprint_triggers(connection)
+    _ensure_change_tracking(connection)
+    _ensure_inventory_counters(connection)
 
     connection.commit()
 
@@ -207,6 +214,10 @@ def _ensure_listing_indexes(connection: sqlite3.Connection) -> None:
             "CREATE INDEX IF NOT EXISTS ix_ip_assets_archived_ip_int "
             "ON ip_assets(archived, ip_int)"
         )
+        connection.execute(
+            "CREATE INDEX IF NOT EXISTS ix_ip_assets_host_archived_type_ip_int "
+            "ON ip_assets(host_id, archived, type, ip_int)"
+        )
     if _has_table(connection, "ip_asset_tags"):
         connection.execute(
             "CREATE INDEX IF NOT EXISTS ix_ip_asset_tags_tag_id_ip_asset_id "
@@ -218,6 +229,60 @@ def _ensure_listing_indexes(connection: sqlite3.Connection) -> None:
         )
 
 
+def _ensure_import_fingerprint_triggers(connection: sqlite3.Connection) -> None:
+    if not _has_table(connection, "ip_assets"):
+        return
+    connection.execute(
+        """
+        CREATE TRIGGER IF NOT EXISTS trg_ip_assets_clear_import_fingerprint
+        AFTER UPDATE OF type, project_id, host_id, notes, archived ON ip_assets
+        FOR EACH ROW
+        WHEN NEW.import_fingerprint IS NOT NULL
+            AND NEW.import_fingerprint IS OLD.import_fingerprint
+            AND (
+                NEW.type IS NOT OLD.type
+                OR NEW.project_id IS NOT OLD.project_id
+                OR NEW.host_id IS NOT OLD.host_id
+                OR NEW.notes IS NOT OLD.notes
+                OR NEW.archived IS NOT OLD.archived
+            )
+        BEGIN
+            UPDATE ip_assets SET import_fingerprint = NULL WHERE id = NEW.id;
+        END
+        """
+    )
+    if _has_table(connection, "ip_asset_tags"):
+        for event, row in (("INSERT", "NEW"), ("DELETE", "OLD")):
+            connection.execute(
+                f"""
+                CREATE TRIGGER IF NOT EXISTS
+                    trg_ip_asset_tags_{event.lower()}_clear_import_fingerprint
+                AFTER {event} ON ip_asset_tags
+                FOR EACH ROW
+                BEGIN
+                    UPDATE ip_assets SET import_fingerprint = NULL
+                    WHERE id = {row}.ip_asset_id AND import_fingerprint IS NOT NULL;
+                END
+                """
+            )
+    if _has_table(connection, "tags") and _has_table(connection, "ip_asset_tags"):
+        connection.execute(
+            """
+            CREATE TRIGGER IF NOT EXISTS trg_tags_rename_clear_import_fingerprint
+            AFTER UPDATE OF name ON tags
+            FOR EACH ROW
+            WHEN NEW.name IS NOT OLD.name
+            BEGIN
+                UPDATE ip_assets SET import_fingerprint = NULL
+                WHERE import_fingerprint IS NOT NULL
+                    AND id IN (
+                        SELECT ip_asset_id FROM ip_asset_tags WHERE tag_id = NEW.id
+                    );
+            END
+            """
+        )
+
+
 def _drop_legacy_ip_asset_addressing(connection: sqlite3.Connection) -> None:
     if not _has_table(connection, "ip_assets"):
         return
@@ -250,6 +315,7 @@ def _drop_legacy_ip_asset_addressing(connection: sqlite3.Connection) -> None:
             host_id INTEGER REFERENCES hosts(id),
             notes TEXT,
             archived INTEGER NOT NULL DEFAULT 0,
+            import_fingerprint TEXT,
             created_at TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP,
             updated_at TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP
         )
@@ -285,3 +351,494 @@ def _drop_legacy_ip_asset_addressing(connection: sqlite3.Connection) -> None:
     )
     _backfill_ip_asset_int_column(connection)
     connection.execute("DROP TABLE ip_assets_old")
+
+
+# Tracked table -> (entity name, key column, columns whose change is exported).
+_CHANGE_TRACKED_TABLES = {
+    "vendors": ("vendor", "name", ("name",)),
+    "projects": ("project", "name", ("name", "description", "color")),
+    "tags": ("tag", "name", ("name", "color")),
+    "hosts": ("host", "name", ("name", "notes", "vendor_id")),
+    "ip_assets": (
+        "ip_asset",
+        "ip_address",
+        ("ip_address", "type", "project_id", "host_id", "notes", "archived"),
+    ),
+}
+# Columns that only bump the data version: ranges have no change feed, and
+# ip_assets.updated_at is served by the API but not exported.
+_DATA_VERSION_COLUMNS = {
+    "ip_ranges": ("name", "cidr", "notes", "updated_at"),
+    "ip_assets": ("updated_at",),
+}
+_CURRENT_CHANGE_SEQ = "(SELECT value FROM change_sequence WHERE id = 1)"
+# Rows whose exported form embeds another row's data are stamped along with
+# it; each statement lists the tables it needs.
+_CHANGE_DEPENDENTS = {
+    ("vendors", "UPDATE"): (
+        (
+            {"hosts"},
+            "UPDATE hosts SET change_seq = {seq} "
+            "WHERE vendor_id = NEW.id AND NEW.name IS NOT OLD.name",
+        ),
+    ),
+    ("projects", "UPDATE"): (
+        (
+            {"ip_assets"},
+            "UPDATE ip_assets SET change_seq = {seq} "
+            "WHERE project_id = NEW.id AND NEW.name IS NOT OLD.name",
+        ),
+        (
+            {"hosts", "ip_assets"},
+            "UPDATE hosts SET change_seq = {seq} WHERE NEW.name IS NOT OLD.name "
+            "AND id IN (SELECT host_id FROM ip_assets WHERE project_id = NEW.id)",
+        ),
+    ),
+    ("tags", "UPDATE"): (
+        (
+            {"ip_assets", "ip_asset_tags"},
+            "UPDATE ip_assets SET change_seq = {seq} WHERE NEW.name IS NOT OLD.name "
+            "AND id IN (SELECT ip_asset_id FROM ip_asset_tags WHERE tag_id = NEW.id)",
+        ),
+    ),
+    ("hosts", "UPDATE"): (
+        (
+            {"ip_assets"},
+            "UPDATE ip_assets SET change_seq = {seq} "
+            "WHERE host_id = NEW.id AND NEW.name IS NOT OLD.name",
+        ),
+    ),
+    ("ip_assets", "INSERT"): (
+        ({"hosts"}, "UPDATE hosts SET change_seq = {seq} WHERE id = NEW.host_id"),
+    ),
+    ("ip_assets", "UPDATE"): (
+        (
+            {"hosts"},
+            "UPDATE hosts SET change_seq = {seq} "
+            "WHERE id IN (OLD.host_id, NEW.host_id)",
+        ),
+    ),
+    ("ip_assets", "DELETE"): (
+        ({"hosts"}, "UPDATE hosts SET change_seq = {seq} WHERE id = OLD.host_id"),
+    ),
+}
+
+
+def _change_tracking_triggers(tables: set[str]) -> dict[str, str]:
+    triggers: dict[str, str] = {}
+    for table, (entity, key, columns) in _CHANGE_TRACKED_TABLES.items():
+        if table not in tables:
+            continue
+        for event in ("INSERT", "UPDATE", "DELETE"):
+            body = ["UPDATE change_sequence SET value = value + 1 WHERE id = 1"]
+            if event == "DELETE":
+                body.append(_tombstone_statement(entity, key))
+            else:
+                body.append(
+                    f"UPDATE {table} SET change_seq = {_CURRENT_CHANGE_SEQ} "
+                    "WHERE id = NEW.id"
+                )
+            if event == "UPDATE":
+                body.append(
+                    _tombstone_statement(entity, key)
+                    + f" WHERE NEW.{key} IS NOT OLD.{key}"
+                )
+            body.extend(
+                statement.format(seq=_CURRENT_CHANGE_SEQ)
+                for required, statement in _CHANGE_DEPENDENTS.get((table, event), ())
+                if required <= tables
+            )
+            name = f"trg_{table}_{event.lower()}_change_seq"
+            if event == "UPDATE":
+                # Writes that leave every exported column as it was are skipped.
+                triggers[name] = _trigger_sql(
+                    name,
+                    f"UPDATE OF {', '.join(columns)}",
+                    table,
+                    body,
+                    when=" OR ".join(
+                        f"NEW.{column} IS NOT OLD.{column}" for column in columns
+                    ),
+                )
+            else:
+                triggers[name] = _trigger_sql(name, event, table, body)
+    if {"ip_assets", "ip_asset_tags"} <= tables:
+        for event, row in (("INSERT", "NEW"), ("DELETE", "OLD")):
+            name = f"trg_ip_asset_tags_{event.lower()}_change_seq"
+            triggers[name] = _trigger_sql(
+                name,
+                event,
+                "ip_asset_tags",
+                [
+                    "UPDATE change_sequence SET value = value + 1 WHERE id = 1",
+                    f"UPDATE ip_assets SET change_seq = {_CURRENT_CHANGE_SEQ} "
+                    f"WHERE id = {row}.ip_asset_id",
+                ],
+            )
+    for table, columns in _DATA_VERSION_COLUMNS.items():
+        if table not in tables:
+            continue
+        events = (
+            ("UPDATE",)
+            if table in _CHANGE_TRACKED_TABLES
+            else ("INSERT", "UPDATE", "DELETE")
+        )
+        for event in events:
+            name = f"trg_{table}_{event.lower()}_data_version"
+            body = ["UPDATE change_sequence SET value = value + 1 WHERE id = 1"]
+            if event == "UPDATE":
+                triggers[name] = _trigger_sql(
+                    name,
+                    f"UPDATE OF {', '.join(columns)}",
+                    table,
+                    body,
+                    when=" OR ".join(
+                        f"NEW.{column} IS NOT OLD.{column}" for column in columns
+                    ),
+                )
+            else:
+                triggers[name] = _trigger_sql(name, event, table, body)
+    triggers["trg_change_sequence_changed_at"] = _trigger_sql(
+        "trg_change_sequence_changed_at",
+        "UPDATE OF value",
+        "change_sequence",
+        ["UPDATE change_sequence SET changed_at = CURRENT_TIMESTAMP WHERE id = 1"],
+    )
+    return triggers
+
+
+def _tombstone_statement(entity: str, key: str) -> str:
+    return (
+        "INSERT INTO change_tombstones (entity, key, change_seq) "
+        f"SELECT '{entity}', OLD.{key}, {_CURRENT_CHANGE_SEQ}"
+    )
+
+
+def _trigger_sql(
+    name: str, event: str, table: str, body: list[str], when: str | None = None
+) -> str:
+    condition = f"WHEN {when}\n" if when else ""
+    statements = "".join(f"    {statement};\n" for statement in body)
+    return (
+        f"CREATE TRIGGER IF NOT EXISTS {name}\n"
+        f"AFTER {event} ON {table}\n"
+        f"FOR EACH ROW\n{condition}BEGIN\n{statements}END"
+    )
+
+
+def _ensure_change_tracking(connection: sqlite3.Connection) -> None:
+    tables = {
+        table for table in _CHANGE_TRACKED_TABLES if _has_table(connection, table)
+    }
+    connection.execute(
+        """
+        CREATE TABLE IF NOT EXISTS change_sequence (
+            id INTEGER PRIMARY KEY CHECK (id = 1),
+            value INTEGER NOT NULL,
+            changed_at TEXT
+        )
+        """
+    )
+    sequence_columns = {
+        row["name"]
+        for row in connection.execute("PRAGMA table_info(change_sequence)").fetchall()
+    }
+    if "changed_at" not in sequence_columns:
+        connection.execute("ALTER TABLE change_sequence ADD COLUMN changed_at TEXT")
+    connection.execute(
+        "INSERT OR IGNORE INTO change_sequence (id, value, changed_at) "
+        "VALUES (1, 1, CURRENT_TIMESTAMP)"
+    )
+    connection.execute(
+        """
+        CREATE TABLE IF NOT EXISTS change_tombstones (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            entity TEXT NOT NULL,
+            key TEXT NOT NULL,
+            change_seq INTEGER NOT NULL,
+            deleted_at TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP
+        )
+        """
+    )
+    connection.execute(
+        "CREATE INDEX IF NOT EXISTS ix_change_tombstones_change_seq "
+        "ON change_tombstones(change_seq)"
+    )
+    for table in tables:
+        columns = {
+            row["name"]
+            for row in connection.execute(f"PRAGMA table_info({table})").fetchall()
+        }
+        if "change_seq" not in columns:
+            connection.execute(f"ALTER TABLE {table} ADD COLUMN change_seq INTEGER")
+            connection.execute(f"UPDATE {table} SET change_seq = 1")
+        connection.execute(
+            f"CREATE INDEX IF NOT EXISTS ix_{table}_change_seq ON {table}(change_seq)"
+        )
+    tables.update(
+        table
+        for table in ("ip_asset_tags", *_DATA_VERSION_COLUMNS)
+        if _has_table(connection, table)
+    )
+    for statement in _change_tracking_triggers(tables).values():
+        connection.execute(statement)
+
+
+_INVENTORY_COUNTER_TABLES = {
+    "ip_assets",
+    "ip_asset_tags",
+    "hosts",
+    "projects",
+    "vendors",
+    "tags",
+}
+_ACTIVE_HOST_ASSETS = (
+    "(SELECT COUNT(*) FROM ip_assets WHERE host_id = {row}.id AND archived = 0)"
+)
+# Recomputes every counter from the base tables; used to seed and repair.
+INVENTORY_COUNTERS_SQL = """
+SELECT 'active_ip_total', 0, COUNT(*) FROM ip_assets WHERE archived = 0
+UNION ALL
+SELECT 'archived_ip_total', 0, COUNT(*) FROM ip_assets WHERE archived != 0
+UNION ALL
+SELECT 'host_total', 0, COUNT(*) FROM hosts
+UNION ALL
+SELECT 'vendor_total', 0, COUNT(*) FROM vendors
+UNION ALL
+SELECT 'project_total', 0, COUNT(*) FROM projects
+UNION ALL
+SELECT 'project_ip', projects.id, (
+    SELECT COUNT(*) FROM ip_assets
+    WHERE ip_assets.project_id = projects.id AND ip_assets.archived = 0
+) FROM projects
+UNION ALL
+SELECT 'vendor_ip', vendors.id, (
+    SELECT COUNT(*) FROM ip_assets JOIN hosts ON hosts.id = ip_assets.host_id
+    WHERE hosts.vendor_id = vendors.id AND ip_assets.archived = 0
+) FROM vendors
+UNION ALL
+SELECT 'tag_ip', tags.id, (
+    SELECT COUNT(*) FROM ip_asset_tags
+    JOIN ip_assets ON ip_assets.id = ip_asset_tags.ip_asset_id
+    WHERE ip_asset_tags.tag_id = tags.id AND ip_assets.archived = 0
+) FROM tags
+"""
+
+
+def _counter_update(counter: str, ref: str, delta: str, when: str | None = None) -> str:
+    condition = f" AND {when}" if when else ""
+    return (
+        "UPDATE inventory_counters SET value = value "
+        f"{delta} WHERE counter = {counter} AND ref_id = {ref}{condition}"
+    )
+
+
+def _ip_asset_counter_statements(row: str, sign: str) -> list[str]:
+    """Add (``+``) or remove (``-``) one asset row's share of the counters."""
+    active = f"{row}.archived = 0"
+    return [
+        _counter_update(
+            f"CASE WHEN {active} THEN 'active_ip_total' ELSE 'archived_ip_total' END",
+            "0",
+            f"{sign} 1",
+        ),
+        _counter_update("'project_ip'", f"{row}.project_id", f"{sign} 1", active),
+        _counter_update(
+            "'vendor_ip'",
+            f"(SELECT vendor_id FROM hosts WHERE id = {row}.host_id)",
+            f"{sign} 1",
+            active,
+        ),
+    ]
+
+
+def _ip_asset_tag_counter_statement(row: str, sign: str, when: str) -> str:
+    # A new asset has no tag links yet, so inserts skip this statement.
+    return (
+        f"UPDATE inventory_counters SET value = value {sign} 1 "
+        f"WHERE counter = 'tag_ip' AND {when} AND ref_id IN "
+        f"(SELECT tag_id FROM ip_asset_tags WHERE ip_asset_id = {row}.id)"
+    )
+
+
+def _inventory_counter_triggers() -> dict[str, str]:
+    asset_changed = " OR ".join(
+        f"NEW.{column} IS NOT OLD.{column}"
+        for column in ("archived", "project_id", "host_id")
+    )
+    linked_active_asset = (
+        "EXISTS (SELECT 1 FROM ip_assets WHERE id = {row}.ip_asset_id AND archived = 0)"
+    )
+    triggers = {
+        "trg_ip_assets_insert_counters": (
+            "AFTER INSERT",
+            "ip_assets",
+            None,
+            _ip_asset_counter_statements("NEW", "+"),
+        ),
+        "trg_ip_assets_update_counters": (
+            "AFTER UPDATE OF archived, project_id, host_id",
+            "ip_assets",
+            asset_changed,
+            _ip_asset_counter_statements("OLD", "-")
+            + _ip_asset_counter_statements("NEW", "+")
+            + [
+                _ip_asset_tag_counter_statement(
+                    "NEW", "+", "NEW.archived = 0 AND OLD.archived != 0"
+                ),
+                _ip_asset_tag_counter_statement(
+                    "NEW", "-", "NEW.archived != 0 AND OLD.archived = 0"
+                ),
+            ],
+        ),
+        # BEFORE so tag links are still present when a cascade removes them.
+        "trg_ip_assets_delete_counters": (
+            "BEFORE DELETE",
+            "ip_assets",
+            None,
+            _ip_asset_counter_statements("OLD", "-")
+            + [_ip_asset_tag_counter_statement("OLD", "-", "OLD.archived = 0")],
+        ),
+        "trg_ip_asset_tags_insert_counters": (
+            "AFTER INSERT",
+            "ip_asset_tags",
+            None,
+            [
+                _counter_update(
+                    "'tag_ip'",
+                    "NEW.tag_id",
+                    "+ 1",
+                    linked_active_asset.format(row="NEW"),
+                )
+            ],
+        ),
+        "trg_ip_asset_tags_delete_counters": (
+            "AFTER DELETE",
+            "ip_asset_tags",
+            None,
+            [
+                _counter_update(
+                    "'tag_ip'",
+                    "OLD.tag_id",
+                    "- 1",
+                    linked_active_asset.format(row="OLD"),
+                )
+            ],
+        ),
+        "trg_hosts_insert_counters": (
+            "AFTER INSERT",
+            "hosts",
+            None,
+            [_counter_update("'host_total'", "0", "+ 1")],
+        ),
+        "trg_hosts_update_counters": (
+            "AFTER UPDATE OF vendor_id",
+            "hosts",
+            "NEW.vendor_id IS NOT OLD.vendor_id",
+            [
+                _counter_update(
+                    "'vendor_ip'",
+                    "OLD.vendor_id",
+                    "- " + _ACTIVE_HOST_ASSETS.format(row="OLD"),
+                ),
+                _counter_update(
+                    "'vendor_ip'",
+                    "NEW.vendor_id",
+                    "+ " + _ACTIVE_HOST_ASSETS.format(row="NEW"),
+                ),
+            ],
+        ),
+        "trg_hosts_delete_counters": (
+            "BEFORE DELETE",
+            "hosts",
+            None,
+            [
+                _counter_update("'host_total'", "0", "- 1"),
+                _counter_update(
+                    "'vendor_ip'",
+                    "OLD.vendor_id",
+                    "- " + _ACTIVE_HOST_ASSETS.format(row="OLD"),
+                ),
+            ],
+        ),
+    }
+    catalog_counts = {
+        "projects": (
+            "project",
+            "SELECT COUNT(*) FROM ip_assets WHERE project_id = NEW.id AND archived = 0",
+        ),
+        "vendors": (
+            "vendor",
+            "SELECT COUNT(*) FROM ip_assets JOIN hosts ON hosts.id = ip_assets.host_id "
+            "WHERE hosts.vendor_id = NEW.id AND ip_assets.archived = 0",
+        ),
+        "tags": (
+            "tag",
+            "SELECT COUNT(*) FROM ip_asset_tags "
+            "JOIN ip_assets ON ip_assets.id = ip_asset_tags.ip_asset_id "
+            "WHERE ip_asset_tags.tag_id = NEW.id AND ip_assets.archived = 0",
+        ),
+    }
+    for table, (entity, count_sql) in catalog_counts.items():
+        insert_body = [
+            "INSERT OR REPLACE INTO inventory_counters (counter, ref_id, value) "
+            f"VALUES ('{entity}_ip', NEW.id, ({count_sql}))"
+        ]
+        delete_body = [
+            "DELETE FROM inventory_counters "
+            f"WHERE counter = '{entity}_ip' AND ref_id = OLD.id"
+        ]
+        if table != "tags":
+            insert_body.append(_counter_update(f"'{entity}_total'", "0", "+ 1"))
+            delete_body.append(_counter_update(f"'{entity}_total'", "0", "- 1"))
+        triggers[f"trg_{table}_insert_counters"] = (
+            "AFTER INSERT",
+            table,
+            None,
+            insert_body,
+        )
+        triggers[f"trg_{table}_delete_counters"] = (
+            "AFTER DELETE",
+            table,
+            None,
+            delete_body,
+        )
+    return {
+        name: _counter_trigger_sql(name, timing, table, body, when)
+        for name, (timing, table, when, body) in triggers.items()
+    }
+
+
+def _counter_trigger_sql(
+    name: str, timing: str, table: str, body: list[str], when: str | None
+) -> str:
+    condition = f"WHEN {when}\n" if when else ""
+    statements = "".join(f"    {statement};\n" for statement in body)
+    return (
+        f"CREATE TRIGGER IF NOT EXISTS {name}\n"
+        f"{timing} ON {table}\n"
+        f"FOR EACH ROW\n{condition}BEGIN\n{statements}END"
+    )
+
+
+def _ensure_inventory_counters(connection: sqlite3.Connection) -> None:
+    if not all(_has_table(connection, table) for table in _INVENTORY_COUNTER_TABLES):
+        return
+    created = not _has_table(connection, "inventory_counters")
+    connection.execute(
+        """
+        CREATE TABLE IF NOT EXISTS inventory_counters (
+            counter TEXT NOT NULL,
+            ref_id INTEGER NOT NULL DEFAULT 0,
+            value INTEGER NOT NULL DEFAULT 0,
+            PRIMARY KEY (counter, ref_id)
+        ) WITHOUT ROWID
+        """
+    )
+    if created:
+        connection.execute(
+            "INSERT INTO inventory_counters (counter, ref_id, value) "
+            + INVENTORY_COUNTERS_SQL
+        )
+    for statement in _inventory_counter_triggers().values():
+        connection.execute(statement)
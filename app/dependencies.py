@@ -5,7 +5,7 @@ from functools import lru_cache
 from typing import Iterator
 
 from app import db
-from sqlalchemy import create_engine, text
+from sqlalchemy import Engine, create_engine, text
 from sqlalchemy.orm import Session, sessionmaker
 
 
@@ -14,13 +14,23 @@ def get_db_path() -> str:
 
 
 @lru_cache(maxsize=8)
-def _get_session_factory(db_path: str) -> sessionmaker[Session]:
-    engine = create_engine(
+def _get_engine(db_path: str) -> Engine:
+    return create_engine(
         f"sqlite:///{db_path}",
         connect_args={"check_same_thread": False},
         future=True,
     )
-    return sessionmaker(bind=engine, autoflush=False, expire_on_commit=False)
+
+
+@lru_cache(maxsize=8)
+def _get_session_factory(db_path: str) -> sessionmaker[Session]:
+    return sessionmaker(
+        bind=_get_engine(db_path), autoflush=False, expire_on_commit=False
+    )
+
+
+def get_db_engine(db_path: str | None = None) -> Engine:
+    return _get_engine(db_path or get_db_path())
 
 
 def create_db_session(db_path: str | None = None) -> Session:
@@ -18,3 +18,10 @@ def is_docker_runtime() -> bool:
     if override is not None:
         return override.strip().lower() not in _FALSE_VALUES
     return Path("/.dockerenv").exists()
+
+
+def use_bulk_audit_summary() -> bool:
+    override = os.getenv("IPOCKET_AUDIT_BULK_SUMMARY")
+    if override is None:
+        return False
+    return override.strip().lower() not in _FALSE_VALUES
@@ -1,10 +1,18 @@
 from __future__ import annotations
 
+import json
 from datetime import datetime, timezone
-from typing import Optional
+from typing import Iterable, Iterator, Mapping, Optional
 
 from app import repository
 from app.models import IPAssetType
+from app.utils import chunked
+
+# Entities encoded per chunk of a streamed bundle document.
+BUNDLE_JSON_CHUNK_ROWS = 500
+
+# Entities reported by the changes feed, in the order they are applied.
+CHANGE_FEED_ENTITIES = ("vendor", "project", "tag", "host", "ip_asset")
 
 
 def export_vendors(connection) -> list[dict[str, object]]:
@@ -15,43 +23,31 @@ def export_vendors(connection) -> list[dict[str, object]]:
 def export_projects(
     connection, project_name: Optional[str] = None
 ) -> list[dict[str, object]]:
-    projects = repository.list_projects(connection)
-    if project_name:
-        projects = [project for project in projects if project.name == project_name]
-    return [
-        {
-            "name": project.name,
-            "description": project.description,
-            "color": project.color,
-        }
-        for project in projects
-    ]
+    return repository.list_projects_for_export(connection, project_name=project_name)
 
 
 def export_hosts(
     connection, host_name: Optional[str] = None
 ) -> list[dict[str, object]]:
-    hosts = repository.list_hosts_with_ip_counts(connection)
-    if host_name:
-        hosts = [host for host in hosts if str(host["name"]) == host_name]
+    return list(iter_export_hosts(connection, host_name=host_name))
 
-    def _first_ip(value: object) -> Optional[str]:
-        if not isinstance(value, str):
-            return None
-        first = value.split(",", 1)[0].strip()
-        return first or None
 
-    return [
-        {
-            "name": host["name"],
-            "notes": host["notes"],
-            "vendor_name": host["vendor"],
-            "project_name": host["project_name"] or None,
-            "os_ip": _first_ip(host["os_ips"]),
-            "bmc_ip": _first_ip(host["bmc_ips"]),
-        }
-        for host in hosts
-    ]
+def iter_export_hosts(
+    connection, host_name: Optional[str] = None
+) -> Iterator[dict[str, object]]:
+    for host in repository.iter_hosts_for_export(connection, host_name=host_name):
+        yield _host_export_row(host)
+
+
+def _host_export_row(host: Mapping[str, object]) -> dict[str, object]:
+    return {
+        "name": host["name"],
+        "notes": host["notes"],
+        "vendor_name": host["vendor"],
+        "project_name": host["project_name"],
+        "os_ip": host["os_ip"],
+        "bmc_ip": host["bmc_ip"],
+    }
 
 
 def export_ip_assets(
@@ -70,6 +66,23 @@ def export_ip_assets(
     )
 
 
+def iter_export_ip_assets(
+    connection,
+    include_archived: bool = False,
+    asset_type: Optional[IPAssetType] = None,
+    project_name: Optional[str] = None,
+    host_name: Optional[str] = None,
+) -> Iterator[dict[str, object]]:
+    """Like ``export_ip_assets`` but yields rows from a streaming cursor."""
+    return repository.iter_ip_assets_for_export(
+        connection,
+        include_archived=include_archived,
+        asset_type=asset_type,
+        project_name=project_name,
+        host_name=host_name,
+    )
+
+
 def export_bundle(
     connection,
     include_archived: bool = False,
@@ -95,3 +108,118 @@ def export_bundle(
             ),
         },
     }
+
+
+def iter_export_bundle_json(
+    connection,
+    include_archived: bool = False,
+    asset_type: Optional[IPAssetType] = None,
+    project_name: Optional[str] = None,
+    host_name: Optional[str] = None,
+) -> Iterator[str]:
+    """Yield the ``export_bundle`` document as compact JSON text in chunks.
+
+    Hosts and IP assets are read from streaming cursors, so the document is
+    never held in memory. Sections keep the order the bundle importer needs.
+    """
+    header = _dumps(
+        {
+            "app": "ipocket",
+            "schema_version": "1",
+            "exported_at": datetime.now(timezone.utc).isoformat(),
+        }
+    )
+    yield header[:-1] + ',"data":'
+    yield from _iter_json_sections(
+        (
+            ("vendors", export_vendors(connection)),
+            ("projects", export_projects(connection, project_name=project_name)),
+            ("hosts", iter_export_hosts(connection, host_name=host_name)),
+            (
+                "ip_assets",
+                iter_export_ip_assets(
+                    connection,
+                    include_archived=include_archived,
+                    asset_type=asset_type,
+                    project_name=project_name,
+                    host_name=host_name,
+                ),
+            ),
+        )
+    )
+    yield "}"
+
+
+def iter_export_changes_json(connection, since: int = 0) -> Iterator[str]:
+    """Yield the records changed after the ``since`` cursor as JSON text.
+
+    ``data`` holds the current state of every vendor, project, tag, host and
+    IP asset created or updated (archiving included) after ``since``, in
+    change order; ``deleted`` lists the keys removed or renamed away, to be
+    applied before ``data``. ``cursor`` is the value to pass as ``since`` on
+    the next call. The cursor is read first and bounds every query, so a
+    change committed while the feed is produced is left for the next call.
+    A ``since`` ahead of the database is answered from the start (``since``
+    is reported as 0).
+    """
+    cursor = repository.get_change_cursor(connection)
+    if since > cursor:
+        # The database is behind the caller (restored from a backup, say):
+        # start over so nothing is missed.
+        since = 0
+    header = _dumps(
+        {
+            "app": "ipocket",
+            "schema_version": "1",
+            "exported_at": datetime.now(timezone.utc).isoformat(),
+            "since": since,
+            "cursor": cursor,
+        }
+    )
+    yield header[:-1] + ',"data":'
+    yield from _iter_json_sections(
+        (
+            (
+                "vendors",
+                repository.list_vendors_changed_since(connection, since, cursor),
+            ),
+            (
+                "projects",
+                repository.list_projects_changed_since(connection, since, cursor),
+            ),
+            ("tags", repository.list_tags_changed_since(connection, since, cursor)),
+            (
+                "hosts",
+                map(
+                    _host_export_row,
+                    repository.iter_hosts_changed_since(connection, since, cursor),
+                ),
+            ),
+            (
+                "ip_assets",
+                repository.iter_ip_assets_changed_since(connection, since, cursor),
+            ),
+        )
+    )
+    deleted = repository.list_change_tombstones(connection, since, cursor)
+    yield ',"deleted":' + _dumps(
+        {f"{entity}s": deleted.get(entity, []) for entity in CHANGE_FEED_ENTITIES}
+    )
+    yield "}"
+
+
+def _iter_json_sections(
+    sections: Iterable[tuple[str, Iterable[dict[str, object]]]],
+) -> Iterator[str]:
+    """Yield a JSON object of arrays, encoding each array in chunks."""
+    for index, (section, rows) in enumerate(sections):
+        opening = f"{',' if index else '{'}{_dumps(section)}:["
+        for batch in chunked(rows, BUNDLE_JSON_CHUNK_ROWS):
+            yield opening + ",".join(_dumps(row) for row in batch)
+            opening = ","
+        yield "]" if opening == "," else opening + "]"
+    yield "}"
+
+
+def _dumps(value: object) -> str:
+    return json.dumps(value, ensure_ascii=False, separators=(",", ":"))
@@ -0,0 +1,249 @@
+from __future__ import annotations
+
+import logging
+import os
+import re
+import tempfile
+import threading
+import time
+from contextlib import suppress
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Optional
+from urllib.parse import parse_qs
+
+from app import repository
+from app.dependencies import create_db_session, get_db_path
+from app.models import IPAssetType
+from app.sd_cache import SDQuery, render_sd_targets
+
+logger = logging.getLogger(__name__)
+
+FILE_SD_DEFAULT_TARGETS = "node:port=9100"
+FILE_SD_DEBOUNCE_SECONDS = 2.0
+FILE_SD_MAX_DELAY_SECONDS = 30.0
+FILE_SD_POLL_SECONDS = 1.0
+
+_FILE_SD_NAME_PATTERN = re.compile(r"^[A-Za-z0-9][A-Za-z0-9_.-]*$")
+_FILE_SD_PARAMETERS = {"port", "only_assigned", "project", "type", "group_by"}
+_TRUE_VALUES = {"1", "true", "yes", "on"}
+
+_FILE_SD_WRITER_LOCK = threading.Lock()
+_FILE_SD_WRITER: Optional[FileSDWriter] = None
+
+
+@dataclass(frozen=True)
+class FileSDTargetGroup:
+    name: str
+    query: SDQuery
+
+    @property
+    def filename(self) -> str:
+        return f"{self.name}.json"
+
+
+def _split_csv(values: list[str]) -> list[str]:
+    return [
+        part.strip() for value in values for part in value.split(",") if part.strip()
+    ]
+
+
+def parse_file_sd_targets(value: str) -> list[FileSDTargetGroup]:
+    """Parse ``name:query;name:query`` target group specs.
+
+    Each query takes the same parameters as ``/sd/node``, for example
+    ``core-vms:project=core&type=VM&port=9100``.
+    """
+    groups: list[FileSDTargetGroup] = []
+    for spec in value.split(";"):
+        spec = spec.strip()
+        if not spec:
+            continue
+        name, _, query_string = spec.partition(":")
+        name = name.strip()
+        if not _FILE_SD_NAME_PATTERN.match(name):
+            raise ValueError(f"Invalid file_sd target group name: {name!r}.")
+        if any(group.name == name for group in groups):
+            raise ValueError(f"Duplicate file_sd target group name: {name!r}.")
+        params = parse_qs(query_string.strip())
+        unknown = sorted(set(params) - _FILE_SD_PARAMETERS)
+        if unknown:
+            raise ValueError(
+                f"Unknown file_sd parameter(s) for {name!r}: {', '.join(unknown)}."
+            )
+        port = int(params.get("port", ["9100"])[-1])
+        if not 1 <= port <= 65535:
+            raise ValueError(f"Invalid file_sd port for {name!r}: {port}.")
+        group_by = params.get("group_by", ["none"])[-1]
+        if group_by not in {"none", "project"}:
+            raise ValueError(f"Invalid file_sd group_by for {name!r}: {group_by!r}.")
+        groups.append(
+            FileSDTargetGroup(
+                name=name,
+                query=SDQuery.normalize(
+                    port=port,
+                    only_assigned=params.get("only_assigned", ["0"])[-1].lower()
+                    in _TRUE_VALUES,
+                    project_names=_split_csv(params.get("project", [])),
+                    asset_types=[
+                        IPAssetType.normalize(asset_type)
+                        for asset_type in _split_csv(params.get("type", []))
+                    ],
+                    group_by=group_by,
+                ),
+            )
+        )
+    if not groups:
+        raise ValueError("No file_sd target groups configured.")
+    return groups
+
+
+def _write_atomic(path: Path, payload: bytes) -> bool:
+    """Replace ``path`` with ``payload`` in one rename; skip identical content."""
+    with suppress(FileNotFoundError):
+        if path.read_bytes() == payload:
+            return False
+    fd, temp_name = tempfile.mkstemp(
+        dir=path.parent, prefix=f".{path.name}.", suffix=".tmp"
+    )
+    try:
+        with os.fdopen(fd, "wb") as handle:
+            handle.write(payload)
+            handle.flush()
+            os.fsync(handle.fileno())
+        os.replace(temp_name, path)
+    except BaseException:
+        with suppress(FileNotFoundError):
+            os.unlink(temp_name)
+        raise
+    return True
+
+
+class FileSDWriter:
+    """Keep Prometheus ``file_sd`` files in step with the data version.
+
+    The writer polls the data version and rewrites once the version has
+    stopped moving for ``debounce_seconds``, so a bulk import is written
+    once at the end. A steady stream of writes is still flushed at least
+    every ``max_delay_seconds``.
+    """
+
+    def __init__(
+        self,
+        db_path: str,
+        directory: Path,
+        groups: list[FileSDTargetGroup],
+        *,
+        debounce_seconds: float = FILE_SD_DEBOUNCE_SECONDS,
+        max_delay_seconds: float = FILE_SD_MAX_DELAY_SECONDS,
+        poll_seconds: float = FILE_SD_POLL_SECONDS,
+    ) -> None:
+        self.db_path = db_path
+        self.directory = directory
+        self.groups = groups
+        self.debounce_seconds = debounce_seconds
+        self.max_delay_seconds = max_delay_seconds
+        self.poll_seconds = poll_seconds
+        self.written_version: Optional[int] = None
+        self.write_count = 0
+        self._seen_version: Optional[int] = None
+        self._seen_at = 0.0
+        self._pending_since: Optional[float] = None
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def _read_version(self) -> int:
+        session = create_db_session(self.db_path)
+        try:
+            return repository.get_data_version(session).value
+        finally:
+            session.close()
+
+    def write_files(self, data_version: int) -> list[Path]:
+        """Render every target group and return the files that changed."""
+        changed: list[Path] = []
+        for group in self.groups:
+            path = self.directory / group.filename
+            if _write_atomic(path, render_sd_targets(self.db_path, group.query)):
+                changed.append(path)
+        self.written_version = data_version
+        self.write_count += 1
+        self._pending_since = None
+        return changed
+
+    def poll(self, now: float) -> bool:
+        """Write the files if the data version has settled; report a write."""
+        version = self._read_version()
+        if version == self.written_version:
+            self._pending_since = None
+            return False
+        if version != self._seen_version:
+            self._seen_version = version
+            self._seen_at = now
+            if self._pending_since is None:
+                self._pending_since = now
+        settled = now - self._seen_at >= self.debounce_seconds
+        overdue = now - self._pending_since >= self.max_delay_seconds
+        if not (settled or overdue):
+            return False
+        self.write_files(version)
+        return True
+
+    def _run(self) -> None:
+        try:
+            self.write_files(self._read_version())
+        except Exception:
+            logger.exception("Initial file_sd write to %s failed.", self.directory)
+        while not self._stop.wait(self.poll_seconds):
+            try:
+                self.poll(time.monotonic())
+            except Exception:
+                logger.exception("file_sd write to %s failed.", self.directory)
+
+    def start(self) -> None:
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self._thread = threading.Thread(
+            target=self._run, name="file-sd-writer", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+
+def start_file_sd_writer() -> Optional[FileSDWriter]:
+    """Start the writer when ``IPOCKET_FILE_SD_DIR`` is configured."""
+    global _FILE_SD_WRITER
+    directory = os.getenv("IPOCKET_FILE_SD_DIR", "").strip()
+    if not directory:
+        return None
+    groups = parse_file_sd_targets(
+        os.getenv("IPOCKET_FILE_SD_TARGETS") or FILE_SD_DEFAULT_TARGETS
+    )
+    debounce_seconds = float(
+        os.getenv("IPOCKET_FILE_SD_DEBOUNCE_SECONDS") or FILE_SD_DEBOUNCE_SECONDS
+    )
+    writer = FileSDWriter(
+        get_db_path(),
+        Path(directory),
+        groups,
+        debounce_seconds=debounce_seconds,
+        max_delay_seconds=max(FILE_SD_MAX_DELAY_SECONDS, debounce_seconds),
+    )
+    with _FILE_SD_WRITER_LOCK:
+        if _FILE_SD_WRITER is not None:
+            _FILE_SD_WRITER.stop()
+        _FILE_SD_WRITER = writer
+        writer.start()
+    return writer
+
+
+def stop_file_sd_writer() -> None:
+    global _FILE_SD_WRITER
+    with _FILE_SD_WRITER_LOCK:
+        writer, _FILE_SD_WRITER = _FILE_SD_WRITER, None
+    if writer is not None:
+        writer.stop()
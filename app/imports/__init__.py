@@ -1,11 +1,21 @@
 from app.imports.applier import apply_bundle
-from app.imports.importers import BundleImporter, CsvImporter, Importer
+from app.imports.catalog import ImportCatalog, load_import_catalog
+from app.imports.importers import (
+    IMPORT_BATCH_SIZE,
+    BundleImporter,
+    CsvImporter,
+    Importer,
+    StreamingImporter,
+)
 from app.imports.models import (
     ImportApplyResult,
     ImportBundle,
+    ImportChange,
     ImportEntitySummary,
+    ImportFieldChange,
     ImportIssue,
     ImportParseError,
+    ImportProgress,
     ImportSummary,
     ImportValidationResult,
 )
@@ -14,15 +24,22 @@ from app.imports.validator import validate_bundle
 
 __all__ = [
     "Importer",
+    "StreamingImporter",
+    "IMPORT_BATCH_SIZE",
     "BundleImporter",
     "CsvImporter",
     "ImportBundle",
     "ImportEntitySummary",
+    "ImportChange",
+    "ImportFieldChange",
     "ImportSummary",
     "ImportIssue",
     "ImportParseError",
+    "ImportProgress",
     "ImportValidationResult",
     "ImportApplyResult",
+    "ImportCatalog",
+    "load_import_catalog",
     "validate_bundle",
     "apply_bundle",
     "ImportAuditContext",
@@ -1,46 +1,71 @@
 from __future__ import annotations
 
+import hashlib
+import json
+import sqlite3
+from typing import Callable, Optional, TypeVar
+
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
 from app import repository
+from app.imports.catalog import ImportCatalog, load_import_catalog
 from app.imports.models import (
     ImportApplyResult,
     ImportBundle,
+    ImportChange,
+    ImportFieldChange,
+    ImportIPAsset,
     ImportIssue,
+    ImportSource,
     ImportSummary,
 )
 from app.models import IPAssetType
 from app.utils import normalize_tag_names
 
+T = TypeVar("T")
+
 
 def apply_bundle(
-    connection, bundle: ImportBundle, dry_run: bool = False
+    connection,
+    bundle: ImportBundle,
+    dry_run: bool = False,
+    *,
+    catalog: Optional[ImportCatalog] = None,
 ) -> ImportApplyResult:
-    summary = ImportSummary()
-    warnings: list[ImportIssue] = []
+    if not isinstance(connection, Session):
+        with repository.transaction_scope(connection, rollback=dry_run) as session:
+            return apply_bundle(session, bundle, dry_run=dry_run, catalog=catalog)
 
-    vendor_id_map, vendor_updates = _upsert_vendors(
-        connection, bundle, summary, dry_run=dry_run
-    )
-    project_id_map, project_updates = _upsert_projects(
-        connection, bundle, summary, dry_run=dry_run
-    )
-    host_id_map, host_updates = _upsert_hosts(
-        connection,
-        bundle,
-        vendor_id_map,
-        summary,
-        dry_run=dry_run,
-    )
-    _upsert_ip_assets(
-        connection,
-        bundle,
-        project_id_map,
-        host_id_map,
-        summary,
-        dry_run=dry_run,
-    )
+    if catalog is None:
+        catalog = load_import_catalog(connection)
+    elif dry_run:
+        # The rolled-back writes must not leak into the caller's catalog.
+        catalog = catalog.copy()
+
+    # Dry-run executes exactly the same writes as apply inside a savepoint
+    # that is rolled back afterwards, so counts and change details are exact.
+    # Audit rows are buffered per batch so their labels are resolved together
+    # and they are written with one insert; failed rows drop theirs.
+    with repository.savepoint_scope(connection, rollback=dry_run):
+        with repository.audit_buffer_scope(connection):
+            result = _apply_bundle(connection, bundle, catalog)
+    result.catalog_load_ms = catalog.load_ms
+    return result
+
+
+def _apply_bundle(
+    session: Session, bundle: ImportBundle, catalog: ImportCatalog
+) -> ImportApplyResult:
+    result = ImportApplyResult(summary=ImportSummary())
 
-    if vendor_updates or project_updates or host_updates:
-        warnings.append(
+    _upsert_vendors(session, bundle, catalog, result)
+    project_updates = _upsert_projects(session, bundle, catalog, result)
+    host_updates = _upsert_hosts(session, bundle, catalog, result)
+    _upsert_ip_assets(session, bundle, catalog, result)
+
+    if project_updates or host_updates:
+        result.warnings.append(
             ImportIssue(
                 location="import",
                 message="Some related records were updated based on import data.",
@@ -48,109 +73,224 @@ def apply_bundle(
             )
         )
 
-    return ImportApplyResult(summary=summary, warnings=warnings)
+    return result
 
 
-def _upsert_vendors(
-    connection, bundle: ImportBundle, summary: ImportSummary, dry_run: bool
-) -> tuple[dict[str, int], bool]:
-    existing = {vendor.name: vendor for vendor in repository.list_vendors(connection)}
-    id_map = {name: vendor.id for name, vendor in existing.items()}
-    updated_any = False
-    temp_id = -1
+def _location(source: Optional[ImportSource]) -> str:
+    return source.location if source else "import"
+
+
+def _apply_in_savepoint(
+    session: Session,
+    result: ImportApplyResult,
+    source: Optional[ImportSource],
+    operation: Callable[[], T],
+) -> tuple[bool, Optional[T]]:
+    try:
+        with repository.savepoint_scope(session):
+            return True, operation()
+    # Only row-level problems become row errors; operational failures such as
+    # a locked database or a full disk abort the whole import.
+    except (IntegrityError, sqlite3.IntegrityError, ValueError) as exc:
+        detail = getattr(exc, "orig", None) or exc
+        result.errors.append(
+            ImportIssue(
+                location=_location(source),
+                message=f"Failed to apply row: {detail}",
+            )
+        )
+    return False, None
+
 
+def _record_change(
+    result: ImportApplyResult,
+    *,
+    entity: str,
+    action: str,
+    key: str,
+    source: Optional[ImportSource],
+    fields: Optional[dict[str, tuple[object, object]]] = None,
+    preserved_fields: Optional[list[str]] = None,
+) -> None:
+    result.changes.append(
+        ImportChange(
+            entity=entity,
+            action=action,
+            key=key,
+            source=source,
+            fields={
+                name: ImportFieldChange(before=before, after=after)
+                for name, (before, after) in (fields or {}).items()
+            },
+            preserved_fields=list(preserved_fields or []),
+        )
+    )
+
+
+def _changed_fields(
+    pairs: dict[str, tuple[object, object]],
+) -> dict[str, tuple[object, object]]:
+    return {name: pair for name, pair in pairs.items() if pair[0] != pair[1]}
+
+
+def _upsert_vendors(
+    session: Session,
+    bundle: ImportBundle,
+    catalog: ImportCatalog,
+    result: ImportApplyResult,
+) -> None:
     for vendor in bundle.vendors:
         name = vendor.name.strip()
         if not name:
             continue
-        existing_vendor = existing.get(name)
-        if existing_vendor:
-            summary.vendors.would_skip += 1
+        if name in catalog.vendor_ids:
+            result.summary.vendors.would_skip += 1
+            _record_change(
+                result, entity="vendor", action="skip", key=name, source=vendor.source
+            )
             continue
-        summary.vendors.would_create += 1
-        if dry_run:
-            id_map[name] = temp_id
-            temp_id -= 1
+        applied, created = _apply_in_savepoint(
+            session,
+            result,
+            vendor.source,
+            lambda: repository.create_vendor(session, name),
+        )
+        if not applied or created is None:
             continue
-        created = repository.create_vendor(connection, name)
-        id_map[name] = created.id
-    return id_map, updated_any
+        result.summary.vendors.would_create += 1
+        catalog.vendor_ids[name] = created.id
+        _record_change(
+            result,
+            entity="vendor",
+            action="create",
+            key=name,
+            source=vendor.source,
+            fields={"name": (None, name)},
+        )
 
 
 def _upsert_projects(
-    connection, bundle: ImportBundle, summary: ImportSummary, dry_run: bool
-) -> tuple[dict[str, int], bool]:
-    existing = {
-        project.name: project for project in repository.list_projects(connection)
-    }
-    id_map = {name: project.id for name, project in existing.items()}
+    session: Session,
+    bundle: ImportBundle,
+    catalog: ImportCatalog,
+    result: ImportApplyResult,
+) -> bool:
     updated_any = False
-    temp_id = -100
 
     for project in bundle.projects:
         name = project.name.strip()
         if not name:
             continue
-        existing_project = existing.get(name)
-        if existing_project is None:
-            summary.projects.would_create += 1
-            if dry_run:
-                id_map[name] = temp_id
-                temp_id -= 1
+        project_id = catalog.project_ids.get(name)
+        if project_id is None:
+            applied, created = _apply_in_savepoint(
+                session,
+                result,
+                project.source,
+                lambda: repository.create_project(
+                    session,
+                    name=name,
+                    description=project.description,
+                    color=project.color,
+                ),
+            )
+            if not applied or created is None:
                 continue
-            created = repository.create_project(
-                connection,
-                name=name,
-                description=project.description,
-                color=project.color,
+            result.summary.projects.would_create += 1
+            catalog.project_ids[name] = created.id
+            _record_change(
+                result,
+                entity="project",
+                action="create",
+                key=name,
+                source=project.source,
+                fields={
+                    "description": (None, created.description),
+                    "color": (None, created.color),
+                },
             )
-            id_map[name] = created.id
             continue
 
-        target_description = (
-            project.description
-            if project.description is not None
-            else existing_project.description
+        # Only fetch the stored project when the import could change it.
+        existing_project = (
+            repository.get_project_by_id(session, project_id)
+            if project.description is not None or project.color is not None
+            else None
         )
-        target_color = (
-            project.color if project.color is not None else existing_project.color
+        if existing_project is None:
+            result.summary.projects.would_skip += 1
+            _record_change(
+                result, entity="project", action="skip", key=name, source=project.source
+            )
+            continue
+        changes = _changed_fields(
+            {
+                "description": (
+                    existing_project.description,
+                    project.description
+                    if project.description is not None
+                    else existing_project.description,
+                ),
+                "color": (
+                    existing_project.color,
+                    project.color
+                    if project.color is not None
+                    else existing_project.color,
+                ),
+            }
         )
-        if (
-            target_description == existing_project.description
-            and target_color == existing_project.color
-        ):
-            summary.projects.would_skip += 1
+        if not changes:
+            result.summary.projects.would_skip += 1
+            _record_change(
+                result, entity="project", action="skip", key=name, source=project.source
+            )
             continue
-        summary.projects.would_update += 1
-        updated_any = True
-        if dry_run:
+        applied, updated = _apply_in_savepoint(
+            session,
+            result,
+            project.source,
+            lambda: repository.update_project(
+                session,
+                project_id=existing_project.id,
+                name=name,
+                description=project.description,
+                color=project.color,
+            ),
+        )
+        if not applied:
             continue
-        repository.update_project(
-            connection,
-            project_id=existing_project.id,
-            name=name,
-            description=project.description,
-            color=project.color,
+        result.summary.projects.would_update += 1
+        updated_any = True
+        _record_change(
+            result,
+            entity="project",
+            action="update",
+            key=name,
+            source=project.source,
+            fields=changes,
         )
 
-    return id_map, updated_any
+    return updated_any
 
 
 def _upsert_hosts(
-    connection,
+    session: Session,
     bundle: ImportBundle,
-    vendor_id_map: dict[str, int],
-    summary: ImportSummary,
-    dry_run: bool,
-) -> tuple[dict[str, int], bool]:
-    existing = {host.name: host for host in repository.list_hosts(connection)}
-    id_map = {name: host.id for name, host in existing.items()}
-    updated_any = False
-    temp_id = -200
-
-    vendor_lookup = {
-        vendor.name: vendor for vendor in repository.list_vendors(connection)
+    catalog: ImportCatalog,
+    result: ImportApplyResult,
+) -> bool:
+    existing = {
+        host.name: host
+        for host in repository.list_hosts_by_ids(
+            session,
+            [
+                catalog.host_ids[name]
+                for name in (host.name.strip() for host in bundle.hosts)
+                if name in catalog.host_ids
+            ],
+        )
     }
+    updated_any = False
 
     for host in bundle.hosts:
         name = host.name.strip()
@@ -158,90 +298,168 @@ def _upsert_hosts(
             continue
         existing_host = existing.get(name)
         vendor_name = host.vendor_name.strip() if host.vendor_name else None
-        vendor_id = vendor_id_map.get(vendor_name) if vendor_name else None
-        if vendor_name and vendor_id is None:
-            vendor = vendor_lookup.get(vendor_name)
-            vendor_id = vendor.id if vendor else None
         if existing_host is None:
-            summary.hosts.would_create += 1
-            if dry_run:
-                id_map[name] = temp_id
-                temp_id -= 1
+            applied, created = _apply_in_savepoint(
+                session,
+                result,
+                host.source,
+                lambda: repository.create_host(
+                    session,
+                    name=name,
+                    notes=host.notes,
+                    vendor=vendor_name,
+                ),
+            )
+            if not applied or created is None:
                 continue
-            vendor_name_value = vendor_name if vendor_name else None
-            created = repository.create_host(
-                connection,
-                name=name,
-                notes=host.notes,
-                vendor=vendor_name_value,
+            result.summary.hosts.would_create += 1
+            catalog.host_ids[name] = created.id
+            existing[name] = created
+            _record_change(
+                result,
+                entity="host",
+                action="create",
+                key=name,
+                source=host.source,
+                fields={"notes": (None, host.notes), "vendor": (None, vendor_name)},
             )
-            id_map[name] = created.id
             continue
 
-        target_notes = host.notes if host.notes is not None else existing_host.notes
-        target_vendor = vendor_name if vendor_name is not None else existing_host.vendor
-        if (
-            target_notes == existing_host.notes
-            and target_vendor == existing_host.vendor
-        ):
-            summary.hosts.would_skip += 1
+        changes = _changed_fields(
+            {
+                "notes": (
+                    existing_host.notes,
+                    host.notes if host.notes is not None else existing_host.notes,
+                ),
+                "vendor": (
+                    existing_host.vendor,
+                    vendor_name if vendor_name is not None else existing_host.vendor,
+                ),
+            }
+        )
+        if not changes:
+            result.summary.hosts.would_skip += 1
+            _record_change(
+                result, entity="host", action="skip", key=name, source=host.source
+            )
             continue
-        summary.hosts.would_update += 1
-        updated_any = True
-        if dry_run:
+        applied, updated = _apply_in_savepoint(
+            session,
+            result,
+            host.source,
+            lambda: repository.update_host(
+                session,
+                host_id=existing_host.id,
+                name=name,
+                notes=host.notes,
+                vendor=vendor_name,
+            ),
+        )
+        if not applied:
             continue
-        repository.update_host(
-            connection,
-            host_id=existing_host.id,
-            name=name,
-            notes=host.notes,
-            vendor=vendor_name,
+        result.summary.hosts.would_update += 1
+        updated_any = True
+        if updated is not None:
+            existing[name] = updated
+        _record_change(
+            result,
+            entity="host",
+            action="update",
+            key=name,
+            source=host.source,
+            fields=changes,
         )
 
-    return id_map, updated_any
+    return updated_any
 
 
 def _upsert_ip_assets(
-    connection,
+    session: Session,
     bundle: ImportBundle,
-    project_id_map: dict[str, int],
-    host_id_map: dict[str, int],
-    summary: ImportSummary,
-    dry_run: bool,
+    catalog: ImportCatalog,
+    result: ImportApplyResult,
 ) -> None:
+    project_id_map = catalog.project_ids
+    host_id_map = catalog.host_ids
+    project_names = {project_id: name for name, project_id in project_id_map.items()}
+    host_names = {host_id: name for name, host_id in host_id_map.items()}
+
+    def _project_label(project_id: Optional[int]) -> Optional[str]:
+        return project_names.get(project_id) if project_id is not None else None
+
+    def _host_label(host_id: Optional[int]) -> Optional[str]:
+        return host_names.get(host_id) if host_id is not None else None
+
+    # One query tells which addresses exist and which are still exactly as an
+    # identical import row left them; those rows are skipped without a lookup.
+    stored_fingerprints = repository.list_ip_asset_import_fingerprints(
+        session, (asset.ip_address.strip() for asset in bundle.ip_assets)
+    )
+    synced_fingerprints: dict[str, str] = {}
+
     for asset in bundle.ip_assets:
         ip_address = asset.ip_address.strip()
         if not ip_address:
             continue
-        existing = repository.get_ip_asset_by_ip(connection, ip_address)
         asset_type = IPAssetType.normalize(asset.asset_type)
         project_id = (
             project_id_map.get(asset.project_name) if asset.project_name else None
         )
         host_id = host_id_map.get(asset.host_name) if asset.host_name else None
+        fingerprint = _ip_asset_fingerprint(asset, asset_type, project_id, host_id)
+
+        if ip_address not in stored_fingerprints:
+            existing = None
+        elif stored_fingerprints[ip_address] == fingerprint:
+            result.summary.ip_assets.would_skip += 1
+            _record_change(
+                result,
+                entity="ip_asset",
+                action="skip",
+                key=ip_address,
+                source=asset.source,
+            )
+            continue
+        else:
+            existing = repository.get_ip_asset_by_ip(session, ip_address)
 
         if existing is None:
-            summary.ip_assets.would_create += 1
-            if dry_run:
+            applied, _ = _apply_in_savepoint(
+                session,
+                result,
+                asset.source,
+                lambda: _create_ip_asset(
+                    session, asset, ip_address, asset_type, project_id, host_id
+                ),
+            )
+            if not applied:
                 continue
-            created = repository.create_ip_asset(
-                connection,
-                ip_address=ip_address,
-                asset_type=asset_type,
-                project_id=project_id,
-                host_id=host_id,
-                notes=asset.notes,
-                tags=asset.tags,
+            stored_fingerprints[ip_address] = None
+            synced_fingerprints[ip_address] = fingerprint
+            result.summary.ip_assets.would_create += 1
+            _record_change(
+                result,
+                entity="ip_asset",
+                action="create",
+                key=ip_address,
+                source=asset.source,
+                fields={
+                    "type": (None, asset_type.value),
+                    "project": (None, _project_label(project_id)),
+                    "host": (None, _host_label(host_id)),
+                    "tags": (
+                        None,
+                        normalize_tag_names(asset.tags) if asset.tags else [],
+                    ),
+                    "notes": (None, asset.notes),
+                    "archived": (None, asset.archived is True),
+                },
             )
-            if asset.archived is True:
-                repository.set_ip_asset_archived(
-                    connection, created.ip_address, archived=True
-                )
             continue
 
-        existing_tags = repository.list_tags_for_ip_assets(
-            connection, [existing.id]
-        ).get(existing.id, [])
+        existing_tags = repository.list_tags_for_ip_assets(session, [existing.id]).get(
+            existing.id, []
+        )
         if asset.tags is None:
             target_tags = existing_tags
         elif asset.merge_tags:
@@ -249,8 +467,10 @@ def _upsert_ip_assets(
         else:
             target_tags = normalize_tag_names(asset.tags)
         notes_should_update = asset.notes_provided or asset.notes is not None
+        preserved_fields: list[str] = []
         if notes_should_update and asset.preserve_existing_notes and existing.notes:
             notes_should_update = False
+            preserved_fields.append("notes")
         target_notes = asset.notes if notes_should_update else existing.notes
         target_project_id = (
             project_id if asset.project_name is not None else existing.project_id
@@ -263,32 +483,137 @@ def _upsert_ip_assets(
             asset.archived if asset.archived is not None else existing.archived
         )
 
-        if (
-            target_notes == existing.notes
-            and target_project_id == existing.project_id
-            and target_host_id == existing.host_id
-            and target_asset_type == existing.asset_type
-            and bool(target_archived) == bool(existing.archived)
-            and target_tags == existing_tags
-        ):
-            summary.ip_assets.would_skip += 1
+        changes = _changed_fields(
+            {
+                "type": (existing.asset_type.value, target_asset_type.value),
+                "project": (
+                    _project_label(existing.project_id),
+                    _project_label(target_project_id),
+                ),
+                "host": (
+                    _host_label(existing.host_id),
+                    _host_label(target_host_id),
+                ),
+                "tags": (existing_tags, target_tags),
+                "notes": (existing.notes, target_notes),
+                "archived": (bool(existing.archived), bool(target_archived)),
+            }
+        )
+        if not changes:
+            synced_fingerprints[ip_address] = fingerprint
+            result.summary.ip_assets.would_skip += 1
+            _record_change(
+                result,
+                entity="ip_asset",
+                action="skip",
+                key=ip_address,
+                source=asset.source,
+                preserved_fields=preserved_fields,
+            )
             continue
 
-        summary.ip_assets.would_update += 1
-        if dry_run:
+        applied, _ = _apply_in_savepoint(
+            session,
+            result,
+            asset.source,
+            lambda: _update_ip_asset(
+                session,
+                asset,
+                ip_address,
+                target_asset_type,
+                project_id,
+                host_id,
+                notes_should_update,
+                target_tags,
+            ),
+        )
+        if not applied:
             continue
-
-        repository.update_ip_asset(
-            connection,
-            ip_address=ip_address,
-            asset_type=target_asset_type,
-            project_id=project_id,
-            host_id=host_id,
-            notes=asset.notes if notes_should_update else None,
-            tags=target_tags,
-            notes_provided=notes_should_update,
+        synced_fingerprints[ip_address] = fingerprint
+        result.summary.ip_assets.would_update += 1
+        _record_change(
+            result,
+            entity="ip_asset",
+            action="update",
+            key=ip_address,
+            source=asset.source,
+            fields=changes,
+            preserved_fields=preserved_fields,
         )
-        if asset.archived is not None:
-            repository.set_ip_asset_archived(
-                connection, ip_address, archived=asset.archived
-            )
+
+    repository.set_ip_asset_import_fingerprints(session, synced_fingerprints)
+
+
+def _ip_asset_fingerprint(
+    asset: ImportIPAsset,
+    asset_type: IPAssetType,
+    project_id: Optional[int],
+    host_id: Optional[int],
+) -> str:
+    """Hash everything about an import row that decides how it is applied.
+
+    Applying the same row twice leaves the asset unchanged, so a stored
+    fingerprint that matches means the row can be skipped outright.
+    """
+    payload = [
+        asset_type.value,
+        asset.project_name is not None,
+        project_id,
+        asset.host_name is not None,
+        host_id,
+        asset.notes,
+        asset.notes_provided,
+        asset.preserve_existing_notes,
+        asset.preserve_existing_type,
+        sorted(normalize_tag_names(asset.tags)) if asset.tags is not None else None,
+        asset.merge_tags,
+        asset.archived,
+    ]
+    return hashlib.sha256(
+        json.dumps(payload, separators=(",", ":")).encode("utf-8")
+    ).hexdigest()
+
+
+def _create_ip_asset(
+    session: Session,
+    asset: ImportIPAsset,
+    ip_address: str,
+    asset_type: IPAssetType,
+    project_id: Optional[int],
+    host_id: Optional[int],
+) -> None:
+    created = repository.create_ip_asset(
+        session,
+        ip_address=ip_address,
+        asset_type=asset_type,
+        project_id=project_id,
+        host_id=host_id,
+        notes=asset.notes,
+        tags=asset.tags,
+    )
+    if asset.archived is True:
+        repository.set_ip_asset_archived(session, created.ip_address, archived=True)
+
+
+def _update_ip_asset(
+    session: Session,
+    asset: ImportIPAsset,
+    ip_address: str,
+    asset_type: IPAssetType,
+    project_id: Optional[int],
+    host_id: Optional[int],
+    notes_should_update: bool,
+    tags: list[str],
+) -> None:
+    repository.update_ip_asset(
+        session,
+        ip_address=ip_address,
+        asset_type=asset_type,
+        project_id=project_id,
+        host_id=host_id,
+        notes=asset.notes if notes_should_update else None,
+        tags=tags,
+        notes_provided=notes_should_update,
+    )
+    if asset.archived is not None:
+        repository.set_ip_asset_archived(session, ip_address, archived=asset.archived)
@@ -0,0 +1,41 @@
+from __future__ import annotations
+
+import time
+from dataclasses import dataclass, field
+
+from app import repository
+
+
+@dataclass
+class ImportCatalog:
+    """Name to id maps of the records an import can reference.
+
+    Loaded once per import run and shared by validation and apply; the
+    applier adds the records it creates so later batches see them.
+    """
+
+    vendor_ids: dict[str, int] = field(default_factory=dict)
+    project_ids: dict[str, int] = field(default_factory=dict)
+    host_ids: dict[str, int] = field(default_factory=dict)
+    load_ms: float = 0.0
+
+    def copy(self) -> ImportCatalog:
+        return ImportCatalog(
+            vendor_ids=dict(self.vendor_ids),
+            project_ids=dict(self.project_ids),
+            host_ids=dict(self.host_ids),
+            load_ms=self.load_ms,
+        )
+
+
+def load_import_catalog(connection) -> ImportCatalog:
+    started = time.perf_counter()
+    vendor_ids = repository.list_vendor_ids_by_name(connection)
+    project_ids = repository.list_project_ids_by_name(connection)
+    host_ids = repository.list_host_ids_by_name(connection)
+    return ImportCatalog(
+        vendor_ids=vendor_ids,
+        project_ids=project_ids,
+        host_ids=host_ids,
+        load_ms=round((time.perf_counter() - started) * 1000, 2),
+    )
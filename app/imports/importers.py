@@ -2,9 +2,14 @@ from __future__ import annotations
 
 import csv
 import io
-import json
-from typing import Optional, Protocol
+from collections.abc import Callable, Iterator, Mapping
+from operator import itemgetter
+from typing import BinaryIO, Optional, Protocol, runtime_checkable
 
+from app.imports.json_stream import (
+    iter_json_bundle_entries,
+    iter_ndjson_bundle_entries,
+)
 from app.imports.models import (
     ImportBundle,
     ImportHost,
@@ -14,7 +19,10 @@ from app.imports.models import (
     ImportSource,
     ImportVendor,
 )
-from app.utils import split_tag_string
+from app.utils import chunked, split_tag_string
+
+IMPORT_BATCH_SIZE = 1000
+CSV_VALUE_POOL_LIMIT = 4096
 
 
 class Importer(Protocol):
@@ -23,208 +31,251 @@ class Importer(Protocol):
     ) -> ImportBundle: ...
 
 
+@runtime_checkable
+class StreamingImporter(Importer, Protocol):
+    def iter_batches(
+        self,
+        inputs: Mapping[str, bytes | BinaryIO],
+        options: Optional[dict[str, object]] = None,
+        *,
+        batch_size: int = IMPORT_BATCH_SIZE,
+    ) -> Iterator[ImportBundle]: ...
+
+
 class BundleImporter:
     def parse(
         self, inputs: dict[str, bytes], options: Optional[dict[str, object]] = None
     ) -> ImportBundle:
+        return _merge_batches(self.iter_batches(inputs, options, batch_size=0))
+
+    def iter_batches(
+        self,
+        inputs: Mapping[str, bytes | BinaryIO],
+        options: Optional[dict[str, object]] = None,
+        *,
+        batch_size: int = IMPORT_BATCH_SIZE,
+    ) -> Iterator[ImportBundle]:
+        """Yield bundles of at most ``batch_size`` entities while reading the input.
+
+        The input is a JSON bundle, or newline-delimited JSON when
+        ``options["format"]`` is ``"ndjson"``. Entities are emitted in the
+        order they appear, so records must come before those referencing
+        them, as they do in ipocket exports.
+        """
         if "bundle" not in inputs:
             raise ImportParseError("Missing bundle.json input.")
-        try:
-            payload = json.loads(inputs["bundle"].decode("utf-8"))
-        except (UnicodeDecodeError, json.JSONDecodeError) as exc:
-            raise ImportParseError("Invalid JSON payload.") from exc
+        if (options or {}).get("format") == "ndjson":
+            entries = iter_ndjson_bundle_entries(inputs["bundle"])
+        else:
+            entries = iter_json_bundle_entries(inputs["bundle"])
+        for chunk in chunked(entries, batch_size):
+            bundle = ImportBundle()
+            for section, entry, source in chunk:
+                getattr(bundle, section).append(
+                    _BUNDLE_ENTRY_PARSERS[section](entry, source)
+                )
+            yield bundle
 
-        if payload.get("schema_version") != "1":
-            raise ImportParseError(
-                "Unsupported schema_version (expected '1').", location="schema_version"
-            )
-        data = payload.get("data")
-        if not isinstance(data, dict):
-            raise ImportParseError("Missing data section.", location="data")
-
-        bundle = ImportBundle()
-        bundle.vendors = _parse_named_entities(data.get("vendors"), "data.vendors")
-        bundle.projects = _parse_projects(data.get("projects"), "data.projects")
-        bundle.hosts = _parse_hosts(data.get("hosts"), "data.hosts")
-        bundle.ip_assets = _parse_ip_assets(data.get("ip_assets"), "data.ip_assets")
-        return bundle
-
-
-def _parse_named_entities(section: object, base_path: str) -> list[ImportVendor]:
-    if section is None:
-        return []
-    if not isinstance(section, list):
-        raise ImportParseError("Expected a list.", location=base_path)
-    vendors: list[ImportVendor] = []
-    for index, entry in enumerate(section):
-        if not isinstance(entry, dict):
-            raise ImportParseError(
-                "Expected object entries.", location=f"{base_path}[{index}]"
-            )
-        vendors.append(
-            ImportVendor(
-                name=str(entry.get("name") or ""),
-                source=ImportSource(f"{base_path}[{index}]"),
-            )
-        )
-    return vendors
 
+def _merge_batches(batches: Iterator[ImportBundle]) -> ImportBundle:
+    bundle = ImportBundle()
+    for batch in batches:
+        bundle.vendors.extend(batch.vendors)
+        bundle.projects.extend(batch.projects)
+        bundle.hosts.extend(batch.hosts)
+        bundle.ip_assets.extend(batch.ip_assets)
+    return bundle
 
-def _parse_projects(section: object, base_path: str) -> list[ImportProject]:
-    if section is None:
-        return []
-    if not isinstance(section, list):
-        raise ImportParseError("Expected a list.", location=base_path)
-    projects: list[ImportProject] = []
-    for index, entry in enumerate(section):
-        if not isinstance(entry, dict):
-            raise ImportParseError(
-                "Expected object entries.", location=f"{base_path}[{index}]"
-            )
-        projects.append(
-            ImportProject(
-                name=str(entry.get("name") or ""),
-                description=_normalize_optional_str(entry.get("description")),
-                color=_normalize_optional_str(entry.get("color")),
-                source=ImportSource(f"{base_path}[{index}]"),
-            )
-        )
-    return projects
 
+def _require_object(entry: object, source: ImportSource) -> dict:
+    if not isinstance(entry, dict):
+        raise ImportParseError("Expected object entries.", location=source.location)
+    return entry
 
-def _parse_hosts(section: object, base_path: str) -> list[ImportHost]:
-    if section is None:
-        return []
-    if not isinstance(section, list):
-        raise ImportParseError("Expected a list.", location=base_path)
-    hosts: list[ImportHost] = []
-    for index, entry in enumerate(section):
-        if not isinstance(entry, dict):
-            raise ImportParseError(
-                "Expected object entries.", location=f"{base_path}[{index}]"
-            )
-        hosts.append(
-            ImportHost(
-                name=str(entry.get("name") or ""),
-                notes=_normalize_optional_str(entry.get("notes")),
-                vendor_name=_normalize_optional_str(entry.get("vendor_name")),
-                source=ImportSource(f"{base_path}[{index}]"),
-            )
-        )
-    return hosts
 
+def _parse_vendor(entry: object, source: ImportSource) -> ImportVendor:
+    entry = _require_object(entry, source)
+    return ImportVendor(
+        name=str(entry.get("name") or ""),
+        source=source,
+    )
 
-def _parse_ip_assets(section: object, base_path: str) -> list[ImportIPAsset]:
-    if section is None:
-        return []
-    if not isinstance(section, list):
-        raise ImportParseError("Expected a list.", location=base_path)
-    assets: list[ImportIPAsset] = []
-    for index, entry in enumerate(section):
-        if not isinstance(entry, dict):
-            raise ImportParseError(
-                "Expected object entries.", location=f"{base_path}[{index}]"
-            )
-        assets.append(
-            ImportIPAsset(
-                ip_address=str(entry.get("ip_address") or ""),
-                asset_type=str(entry.get("type") or ""),
-                project_name=_normalize_optional_str(entry.get("project_name")),
-                host_name=_normalize_optional_str(entry.get("host_name")),
-                notes=_normalize_optional_str(entry.get("notes")),
-                notes_provided="notes" in entry,
-                preserve_existing_notes=(
-                    _normalize_optional_bool(entry.get("preserve_existing_notes"))
-                    is True
-                ),
-                preserve_existing_type=(
-                    _normalize_optional_bool(entry.get("preserve_existing_type"))
-                    is True
-                ),
-                merge_tags=_normalize_optional_bool(entry.get("merge_tags")) is True,
-                archived=_normalize_optional_bool(entry.get("archived")),
-                tags=_parse_tags(entry.get("tags")),
-                source=ImportSource(f"{base_path}[{index}]"),
-            )
-        )
-    return assets
+
+def _parse_project(entry: object, source: ImportSource) -> ImportProject:
+    entry = _require_object(entry, source)
+    return ImportProject(
+        name=str(entry.get("name") or ""),
+        description=_normalize_optional_str(entry.get("description")),
+        color=_normalize_optional_str(entry.get("color")),
+        source=source,
+    )
+
+
+def _parse_host(entry: object, source: ImportSource) -> ImportHost:
+    entry = _require_object(entry, source)
+    return ImportHost(
+        name=str(entry.get("name") or ""),
+        notes=_normalize_optional_str(entry.get("notes")),
+        vendor_name=_normalize_optional_str(entry.get("vendor_name")),
+        source=source,
+    )
+
+
+def _parse_ip_asset(entry: object, source: ImportSource) -> ImportIPAsset:
+    entry = _require_object(entry, source)
+    return ImportIPAsset(
+        ip_address=str(entry.get("ip_address") or ""),
+        asset_type=str(entry.get("type") or ""),
+        project_name=_normalize_optional_str(entry.get("project_name")),
+        host_name=_normalize_optional_str(entry.get("host_name")),
+        notes=_normalize_optional_str(entry.get("notes")),
+        notes_provided="notes" in entry,
+        preserve_existing_notes=(
+            _normalize_optional_bool(entry.get("preserve_existing_notes")) is True
+        ),
+        preserve_existing_type=(
+            _normalize_optional_bool(entry.get("preserve_existing_type")) is True
+        ),
+        merge_tags=_normalize_optional_bool(entry.get("merge_tags")) is True,
+        archived=_normalize_optional_bool(entry.get("archived")),
+        tags=_parse_tags(entry.get("tags")),
+        source=source,
+    )
+
+
+_BUNDLE_ENTRY_PARSERS: dict[str, Callable[[object, ImportSource], object]] = {
+    "vendors": _parse_vendor,
+    "projects": _parse_project,
+    "hosts": _parse_host,
+    "ip_assets": _parse_ip_asset,
+}
 
 
 class CsvImporter:
     def parse(
         self, inputs: dict[str, bytes], options: Optional[dict[str, object]] = None
     ) -> ImportBundle:
+        return _merge_batches(self.iter_batches(inputs, options, batch_size=0))
+
+    def iter_batches(
+        self,
+        inputs: Mapping[str, bytes | BinaryIO],
+        options: Optional[dict[str, object]] = None,
+        *,
+        batch_size: int = IMPORT_BATCH_SIZE,
+    ) -> Iterator[ImportBundle]:
+        """Yield bundles of at most ``batch_size`` rows while reading the CSVs.
+
+        Hosts are emitted before IP assets, and each derived vendor or project
+        is only emitted in the first batch that references it. A batch size of
+        zero or less yields everything in a single bundle.
+        """
         if "hosts" not in inputs and "ip_assets" not in inputs:
             raise ImportParseError(
                 "CSV import requires hosts.csv and/or ip-assets.csv input."
             )
 
-        hosts = (
-            _parse_hosts_csv(inputs["hosts"], "hosts.csv") if "hosts" in inputs else []
+        # Open both files first so header problems are reported before any
+        # batch is handed to the caller.
+        host_rows = (
+            _iter_hosts_csv(inputs["hosts"], "hosts.csv") if "hosts" in inputs else ()
         )
-        ip_assets = (
-            _parse_ip_assets_csv(inputs["ip_assets"], "ip-assets.csv")
+        ip_asset_rows = (
+            _iter_ip_assets_csv(inputs["ip_assets"], "ip-assets.csv")
             if "ip_assets" in inputs
-            else []
-        )
-        derived_assets = _derive_ip_assets_from_hosts(hosts)
-        vendors = _derive_vendors_from_hosts(hosts)
-        projects = _derive_projects_from_ip_assets([*derived_assets, *ip_assets])
-        return ImportBundle(
-            vendors=vendors,
-            projects=projects,
-            hosts=hosts,
-            ip_assets=[*derived_assets, *ip_assets],
+            else ()
         )
 
-
-def _parse_hosts_csv(data: bytes, filename: str) -> list[ImportHost]:
-    rows, fieldnames = _read_csv(data)
-    _require_columns(fieldnames, {"name", "notes", "vendor_name"}, filename)
-    hosts: list[ImportHost] = []
-    for row, line_number in rows:
-        hosts.append(
-            ImportHost(
-                name=str(row.get("name") or ""),
-                notes=_normalize_optional_str(row.get("notes")),
-                vendor_name=_normalize_optional_str(row.get("vendor_name")),
-                project_name=_normalize_optional_str(row.get("project_name")),
-                os_ip=_normalize_optional_str(row.get("os_ip")),
-                bmc_ip=_normalize_optional_str(row.get("bmc_ip")),
-                source=ImportSource(f"{filename}:line {line_number}"),
+        seen_vendors: set[str] = set()
+        seen_projects: set[str] = set()
+        for hosts in chunked(host_rows, batch_size):
+            derived_assets = _derive_ip_assets_from_hosts(hosts)
+            yield ImportBundle(
+                vendors=_derive_vendors_from_hosts(hosts, seen_vendors),
+                projects=_derive_projects_from_ip_assets(derived_assets, seen_projects),
+                hosts=hosts,
+                ip_assets=derived_assets,
             )
+        for ip_assets in chunked(ip_asset_rows, batch_size):
+            yield ImportBundle(
+                projects=_derive_projects_from_ip_assets(ip_assets, seen_projects),
+                ip_assets=ip_assets,
+            )
+
+
+_HOST_CSV_COLUMNS = ("name", "notes", "vendor_name", "project_name", "os_ip", "bmc_ip")
+_IP_ASSET_CSV_COLUMNS = (
+    "ip_address",
+    "type",
+    "project_name",
+    "host_name",
+    "notes",
+    "archived",
+    "tags",
+)
+
+
+def _iter_hosts_csv(data: bytes | BinaryIO, filename: str) -> Iterator[ImportHost]:
+    rows = _open_csv(
+        data, {"name", "notes", "vendor_name"}, filename, _HOST_CSV_COLUMNS
+    )[0]
+    return _hosts_from_csv_rows(rows, filename)
+
+
+def _hosts_from_csv_rows(
+    rows: Iterator[tuple[tuple[Optional[str], ...], int]], filename: str
+) -> Iterator[ImportHost]:
+    names = _ValuePool()
+    for (name, notes, vendor_name, project_name, os_ip, bmc_ip), line_number in rows:
+        yield ImportHost(
+            name=name or "",
+            notes=_normalize_optional_str(notes),
+            vendor_name=names.get(_normalize_optional_str(vendor_name)),
+            project_name=names.get(_normalize_optional_str(project_name)),
+            os_ip=_normalize_optional_str(os_ip),
+            bmc_ip=_normalize_optional_str(bmc_ip),
+            source=ImportSource(filename, line_number),
         )
-    return hosts
 
 
-def _parse_ip_assets_csv(data: bytes, filename: str) -> list[ImportIPAsset]:
-    rows, fieldnames = _read_csv(data)
-    _require_columns(
-        fieldnames,
+def _iter_ip_assets_csv(
+    data: bytes | BinaryIO, filename: str
+) -> Iterator[ImportIPAsset]:
+    rows, fieldnames = _open_csv(
+        data,
         {"ip_address", "type", "project_name", "host_name", "notes", "archived"},
         filename,
+        _IP_ASSET_CSV_COLUMNS,
     )
-    has_tags = "tags" in fieldnames
-    assets: list[ImportIPAsset] = []
+    return _ip_assets_from_csv_rows(rows, filename, has_tags="tags" in fieldnames)
+
+
+def _ip_assets_from_csv_rows(
+    rows: Iterator[tuple[tuple[Optional[str], ...], int]],
+    filename: str,
+    *,
+    has_tags: bool,
+) -> Iterator[ImportIPAsset]:
+    names = _ValuePool()
+    tag_lists = _ValuePool()
     for row, line_number in rows:
-        assets.append(
-            ImportIPAsset(
-                ip_address=str(row.get("ip_address") or ""),
-                asset_type=str(row.get("type") or ""),
-                project_name=_normalize_optional_str(row.get("project_name")),
-                host_name=_normalize_optional_str(row.get("host_name")),
-                notes=_normalize_optional_str(row.get("notes")),
-                notes_provided=True,
-                archived=_normalize_optional_bool(row.get("archived")),
-                tags=_parse_tags(row.get("tags")) if has_tags else None,
-                source=ImportSource(f"{filename}:line {line_number}"),
-            )
+        ip_address, asset_type, project_name, host_name, notes, archived, tags = row
+        yield ImportIPAsset(
+            ip_address=ip_address or "",
+            asset_type=names.get(asset_type or ""),
+            project_name=names.get(_normalize_optional_str(project_name)),
+            host_name=names.get(_normalize_optional_str(host_name)),
+            notes=_normalize_optional_str(notes),
+            notes_provided=True,
+            archived=_normalize_optional_bool(archived),
+            tags=tag_lists.get(tags, _parse_tags) if has_tags else None,
+            source=ImportSource(filename, line_number),
         )
-    return assets
 
 
-def _derive_vendors_from_hosts(hosts: list[ImportHost]) -> list[ImportVendor]:
-    seen: set[str] = set()
+def _derive_vendors_from_hosts(
+    hosts: list[ImportHost], seen: set[str]
+) -> list[ImportVendor]:
     vendors: list[ImportVendor] = []
     for host in hosts:
         if host.vendor_name:
@@ -235,9 +286,8 @@ def _derive_vendors_from_hosts(hosts: list[ImportHost]) -> list[ImportVendor]:
 
 
 def _derive_projects_from_ip_assets(
-    ip_assets: list[ImportIPAsset],
+    ip_assets: list[ImportIPAsset], seen: set[str]
 ) -> list[ImportProject]:
-    seen: set[str] = set()
     projects: list[ImportProject] = []
     for asset in ip_assets:
         if asset.project_name:
@@ -292,7 +342,7 @@ def _with_host_field(
 ) -> Optional[ImportSource]:
     if source is None:
         return None
-    return ImportSource(location=f"{source.location}.{field}")
+    return source.with_field(field)
 
 
 def _normalize_optional_str(value: object) -> Optional[str]:
@@ -329,17 +379,78 @@ def _normalize_optional_bool(value: object) -> Optional[bool]:
     return None
 
 
-def _read_csv(data: bytes) -> tuple[list[tuple[dict[str, str], int]], list[str]]:
+class _ValuePool:
+    """Share equal values between rows instead of keeping a copy per row.
+
+    CSV columns such as the asset type, project and host names and tag lists
+    repeat heavily, so each distinct value is kept once (up to a bounded
+    number of distinct values) and handed to every row that uses it.
+    """
+
+    __slots__ = ("_values",)
+
+    def __init__(self) -> None:
+        self._values: dict[object, object] = {}
+
+    def get(self, value, build: Optional[Callable[[object], object]] = None):
+        if value is None:
+            return None if build is None else build(None)
+        shared = self._values.get(value)
+        if shared is None:
+            shared = value if build is None else build(value)
+            if len(self._values) < CSV_VALUE_POOL_LIMIT:
+                self._values[value] = shared
+        return shared
+
+
+def _open_csv(
+    data: bytes | BinaryIO, required: set[str], filename: str, columns: tuple[str, ...]
+) -> tuple[Iterator[tuple[tuple[Optional[str], ...], int]], list[str]]:
+    stream = io.BytesIO(data) if isinstance(data, bytes) else data
+    text = io.TextIOWrapper(stream, encoding="utf-8", newline="")
+    reader = csv.reader(text)
+    try:
+        fieldnames = next(reader, [])
+    except UnicodeDecodeError as exc:
+        text.detach()
+        raise ImportParseError("CSV is not valid UTF-8.") from exc
+    try:
+        _require_columns(fieldnames, required, filename)
+    except ImportParseError:
+        text.detach()
+        raise
+    return _iter_csv_rows(reader, text, fieldnames, columns), fieldnames
+
+
+def _iter_csv_rows(
+    reader,
+    text: io.TextIOWrapper,
+    fieldnames: list[str],
+    columns: tuple[str, ...],
+) -> Iterator[tuple[tuple[Optional[str], ...], int]]:
+    """Yield the values of ``columns`` for each row, ``None`` when absent.
+
+    Rows are read as plain lists and picked apart by position, which avoids
+    building a dict per row. Like ``csv.DictReader``, blank lines are
+    skipped and a repeated header name refers to its last column.
+    """
+    width = len(fieldnames)
+    positions = {name: index for index, name in enumerate(fieldnames)}
+    # Columns missing from the header read the padding cell after the row.
+    pick = itemgetter(*(positions.get(name, width) for name in columns))
+    padding = [None] * (width + 1)
     try:
-        text = data.decode("utf-8")
+        for row in reader:
+            if not row:
+                continue
+            if len(row) != width:
+                row = row[:width]
+            yield pick(row + padding[len(row) :]), reader.line_num
     except UnicodeDecodeError as exc:
         raise ImportParseError("CSV is not valid UTF-8.") from exc
-    buffer = io.StringIO(text)
-    reader = csv.DictReader(buffer)
-    rows: list[tuple[dict[str, str], int]] = []
-    for row in reader:
-        rows.append((row, reader.line_num))
-    return rows, reader.fieldnames or []
+    finally:
+        # Leave the caller's file open; it owns the underlying stream.
+        text.detach()
 
 
 def _require_columns(fieldnames: list[str], required: set[str], filename: str) -> None:
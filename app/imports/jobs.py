@@ -0,0 +1,234 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import threading
+import time
+import uuid
+from collections.abc import Callable, Mapping
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field, replace
+from typing import BinaryIO, Optional, TypeVar
+
+from app import db
+from app.imports.importers import Importer
+from app.imports.models import ImportApplyResult, ImportProgress
+from app.imports.pipeline import ImportAuditContext, run_import
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# Imports run on their own small pool so long-running jobs cannot occupy the
+# threads that serve interactive requests.
+IMPORT_JOB_MAX_WORKERS = 2
+IMPORT_JOB_MAX_PENDING = 8
+IMPORT_JOB_RETENTION_SECONDS = 3600
+# Synchronous imports (the request waits for the result) get a separate pool
+# so they neither queue behind background jobs nor pile up without bound.
+IMPORT_SYNC_MAX_WORKERS = 2
+IMPORT_SYNC_MAX_PENDING = 4
+
+_IMPORT_JOB_LOCK = threading.Lock()
+_IMPORT_JOBS: dict[str, ImportJob] = {}
+_IMPORT_EXECUTOR: Optional[ThreadPoolExecutor] = None
+_IMPORT_SYNC_EXECUTOR: Optional[ThreadPoolExecutor] = None
+_IMPORT_SYNC_PENDING = 0
+
+
+class ImportQueueFullError(RuntimeError):
+    pass
+
+
+class ImportJobQueueFullError(ImportQueueFullError):
+    pass
+
+
+@dataclass
+class ImportJob:
+    id: str
+    source: str
+    dry_run: bool
+    user_id: Optional[int] = None
+    status: str = "queued"
+    progress: ImportProgress = field(default_factory=ImportProgress)
+    result: Optional[ImportApplyResult] = None
+    error: Optional[str] = None
+    created_at: float = field(default_factory=time.time)
+    updated_at: float = field(default_factory=time.time)
+    version: int = 0
+
+    @property
+    def finished(self) -> bool:
+        return self.status in {"completed", "failed"}
+
+
+def _get_import_executor() -> ThreadPoolExecutor:
+    global _IMPORT_EXECUTOR
+    with _IMPORT_JOB_LOCK:
+        if _IMPORT_EXECUTOR is None:
+            _IMPORT_EXECUTOR = ThreadPoolExecutor(
+                max_workers=IMPORT_JOB_MAX_WORKERS, thread_name_prefix="import"
+            )
+        return _IMPORT_EXECUTOR
+
+
+def _get_sync_import_executor() -> ThreadPoolExecutor:
+    global _IMPORT_SYNC_EXECUTOR
+    with _IMPORT_JOB_LOCK:
+        if _IMPORT_SYNC_EXECUTOR is None:
+            _IMPORT_SYNC_EXECUTOR = ThreadPoolExecutor(
+                max_workers=IMPORT_SYNC_MAX_WORKERS, thread_name_prefix="import-sync"
+            )
+        return _IMPORT_SYNC_EXECUTOR
+
+
+def _release_sync_import_slot(_future: Optional[Future] = None) -> None:
+    global _IMPORT_SYNC_PENDING
+    with _IMPORT_JOB_LOCK:
+        _IMPORT_SYNC_PENDING -= 1
+
+
+async def run_in_import_executor(func: Callable[..., T], *args, **kwargs) -> T:
+    """Run a blocking import on the synchronous import pool and await its result.
+
+    Raises ``ImportQueueFullError`` when ``IMPORT_SYNC_MAX_PENDING`` imports are
+    already running or waiting. A slot is released only once the import has
+    finished (or was cancelled before starting), so a disconnected client does
+    not free capacity its import is still using.
+    """
+    global _IMPORT_SYNC_PENDING
+    with _IMPORT_JOB_LOCK:
+        if _IMPORT_SYNC_PENDING >= IMPORT_SYNC_MAX_PENDING:
+            raise ImportQueueFullError(
+                f"Too many imports in progress (limit {IMPORT_SYNC_MAX_PENDING})."
+            )
+        _IMPORT_SYNC_PENDING += 1
+    try:
+        future = _get_sync_import_executor().submit(func, *args, **kwargs)
+    except BaseException:
+        _release_sync_import_slot()
+        raise
+    future.add_done_callback(_release_sync_import_slot)
+    return await asyncio.wrap_future(future)
+
+
+def _prune_old_import_jobs(now: Optional[float] = None) -> None:
+    current = now or time.time()
+    with _IMPORT_JOB_LOCK:
+        stale_ids = [
+            job_id
+            for job_id, job in _IMPORT_JOBS.items()
+            if job.finished and current - job.updated_at > IMPORT_JOB_RETENTION_SECONDS
+        ]
+        for job_id in stale_ids:
+            _IMPORT_JOBS.pop(job_id, None)
+
+
+def _update_import_job(job_id: str, **fields: object) -> None:
+    with _IMPORT_JOB_LOCK:
+        job = _IMPORT_JOBS.get(job_id)
+        if job is None:
+            return
+        for name, value in fields.items():
+            setattr(job, name, value)
+        job.updated_at = time.time()
+        job.version += 1
+
+
+def get_import_job(job_id: str) -> Optional[ImportJob]:
+    _prune_old_import_jobs()
+    with _IMPORT_JOB_LOCK:
+        job = _IMPORT_JOBS.get(job_id)
+        return replace(job) if job is not None else None
+
+
+def submit_import_job(
+    *,
+    db_path: str,
+    importer: Importer,
+    inputs: Mapping[str, bytes | BinaryIO],
+    source: str,
+    options: Optional[dict[str, object]] = None,
+    dry_run: bool = False,
+    audit_context: Optional[ImportAuditContext] = None,
+    user_id: Optional[int] = None,
+) -> ImportJob:
+    """Queue an import on the import pool and return its job record.
+
+    The job takes ownership of file inputs and closes them when it finishes.
+    Raises ``ImportJobQueueFullError`` when too many jobs are already pending;
+    the inputs stay with the caller in that case.
+    """
+    _prune_old_import_jobs()
+    job = ImportJob(
+        id=uuid.uuid4().hex, source=source, dry_run=dry_run, user_id=user_id
+    )
+    with _IMPORT_JOB_LOCK:
+        pending = sum(1 for existing in _IMPORT_JOBS.values() if not existing.finished)
+        if pending >= IMPORT_JOB_MAX_PENDING:
+            raise ImportJobQueueFullError(
+                f"Too many import jobs in progress (limit {IMPORT_JOB_MAX_PENDING})."
+            )
+        _IMPORT_JOBS[job.id] = job
+    _get_import_executor().submit(
+        _run_import_job,
+        job.id,
+        db_path=db_path,
+        importer=importer,
+        inputs=inputs,
+        options=options,
+        dry_run=dry_run,
+        audit_context=audit_context,
+    )
+    return replace(job)
+
+
+def _run_import_job(
+    job_id: str,
+    *,
+    db_path: str,
+    importer: Importer,
+    inputs: Mapping[str, bytes | BinaryIO],
+    options: Optional[dict[str, object]],
+    dry_run: bool,
+    audit_context: Optional[ImportAuditContext],
+) -> None:
+    connection = None
+    try:
+        _update_import_job(job_id, status="running")
+        connection = db.connect(db_path)
+        result = run_import(
+            connection,
+            importer,
+            inputs,
+            options=options,
+            dry_run=dry_run,
+            audit_context=audit_context,
+            progress=lambda progress: _update_import_job(job_id, progress=progress),
+        )
+    except Exception as exc:
+        logger.exception("Import job %s failed.", job_id)
+        job = get_import_job(job_id)
+        progress = job.progress if job is not None else ImportProgress()
+        _update_import_job(
+            job_id,
+            status="failed",
+            error=str(exc),
+            progress=replace(progress, phase="failed", eta_seconds=None),
+        )
+    else:
+        job = get_import_job(job_id)
+        progress = job.progress if job is not None else ImportProgress()
+        _update_import_job(
+            job_id,
+            status="completed",
+            result=result,
+            progress=replace(progress, phase="completed", eta_seconds=0.0),
+        )
+    finally:
+        if connection is not None:
+            connection.close()
+        for value in inputs.values():
+            if not isinstance(value, bytes):
+                value.close()
@@ -0,0 +1,264 @@
+from __future__ import annotations
+
+import io
+import json
+from collections.abc import Iterator
+from typing import BinaryIO
+
+from app.imports.models import ImportParseError, ImportSource
+
+JSON_READ_CHUNK_SIZE = 64 * 1024
+
+BUNDLE_SECTIONS = ("vendors", "projects", "hosts", "ip_assets")
+
+# NDJSON entity lines name their kind in this field.
+NDJSON_ENTITY_SECTIONS = {
+    "vendor": "vendors",
+    "project": "projects",
+    "host": "hosts",
+    "ip_asset": "ip_assets",
+}
+
+_WHITESPACE = " \t\r\n"
+# A decode error this close to the end of the buffer may be a value cut off
+# by the chunk boundary (a partial literal, number or escape) rather than bad
+# input; anything earlier is final.
+_TRUNCATION_SLACK = 16
+
+
+class _JsonReader:
+    """Pull values out of a JSON text stream without loading all of it.
+
+    Containers are walked token by token with ``object_keys`` and
+    ``array_items``; everything else is decoded whole with the standard
+    decoder, so only one entity at a time is held in memory.
+    """
+
+    def __init__(
+        self, text: io.TextIOBase, chunk_size: int = JSON_READ_CHUNK_SIZE
+    ) -> None:
+        self._text = text
+        self._chunk_size = chunk_size
+        self._decoder = json.JSONDecoder()
+        self._buffer = ""
+        self._pos = 0
+        self._eof = False
+
+    def _fill(self) -> bool:
+        if self._eof:
+            return False
+        pending = len(self._buffer) - self._pos
+        # Read at least as much as is already buffered so a value spanning
+        # many chunks is re-decoded a logarithmic number of times.
+        try:
+            chunk = self._text.read(max(self._chunk_size, pending))
+        except UnicodeDecodeError as exc:
+            raise ImportParseError("Invalid JSON payload.") from exc
+        if not chunk:
+            self._eof = True
+            return False
+        self._buffer = self._buffer[self._pos :] + chunk
+        self._pos = 0
+        return True
+
+    def peek(self) -> str:
+        while True:
+            buffer = self._buffer
+            position = self._pos
+            while position < len(buffer) and buffer[position] in _WHITESPACE:
+                position += 1
+            self._pos = position
+            if position < len(buffer):
+                return buffer[position]
+            if not self._fill():
+                return ""
+
+    def expect(self, char: str) -> None:
+        if self.peek() != char:
+            raise ImportParseError("Invalid JSON payload.")
+        self._pos += 1
+
+    def _may_be_truncated(self, exc: json.JSONDecodeError) -> bool:
+        # An unterminated string runs to the end of the buffer by definition.
+        return (
+            exc.msg.startswith("Unterminated string")
+            or len(self._buffer) - exc.pos <= _TRUNCATION_SLACK
+        )
+
+    def value(self) -> object:
+        self.peek()
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self._buffer, self._pos)
+            except json.JSONDecodeError as exc:
+                if self._may_be_truncated(exc) and self._fill():
+                    continue
+                raise ImportParseError("Invalid JSON payload.") from exc
+            # A value ending at the buffer edge may continue in the next
+            # chunk, and a number cut after ``1.`` or ``1e`` still decodes as
+            # the complete number ``1``, so refill near the edge for those.
+            remaining = len(self._buffer) - end
+            is_number = isinstance(value, (int, float)) and not isinstance(value, bool)
+            if (
+                remaining == 0 or (is_number and remaining < _TRUNCATION_SLACK)
+            ) and self._fill():
+                continue
+            self._pos = end
+            return value
+
+    def object_keys(self) -> Iterator[str]:
+        """Yield each key of the object just opened; the caller reads its value."""
+        if self.peek() == "}":
+            self._pos += 1
+            return
+        while True:
+            if self.peek() != '"':
+                raise ImportParseError("Invalid JSON payload.")
+            key = self.value()
+            self.expect(":")
+            yield str(key)
+            char = self.peek()
+            self._pos += 1
+            if char == "}":
+                return
+            if char != ",":
+                raise ImportParseError("Invalid JSON payload.")
+
+    def array_items(self) -> Iterator[object]:
+        """Decode the items of the array just opened one at a time."""
+        if self.peek() == "]":
+            self._pos += 1
+            return
+        while True:
+            yield self.value()
+            char = self.peek()
+            self._pos += 1
+            if char == "]":
+                return
+            if char != ",":
+                raise ImportParseError("Invalid JSON payload.")
+
+    def expect_end(self) -> None:
+        if self.peek() != "":
+            raise ImportParseError("Invalid JSON payload.")
+
+
+def _open_text(data: bytes | BinaryIO) -> io.TextIOWrapper:
+    stream = io.BytesIO(data) if isinstance(data, bytes) else data
+    return io.TextIOWrapper(stream, encoding="utf-8", newline="")
+
+
+def iter_json_bundle_entries(
+    data: bytes | BinaryIO, *, chunk_size: int = JSON_READ_CHUNK_SIZE
+) -> Iterator[tuple[str, object, ImportSource]]:
+    """Yield ``(section, entry, source)`` for every entity of a JSON bundle.
+
+    Entities come out in document order. ``schema_version`` and the ``data``
+    section are checked as they are reached, and their absence once the
+    document ends; callers that apply entries as they go must be prepared to
+    discard that work when a later ``ImportParseError`` is raised.
+    """
+    text = _open_text(data)
+    try:
+        reader = _JsonReader(text, chunk_size)
+        reader.expect("{")
+        schema_version: object = None
+        has_data = False
+        for key in reader.object_keys():
+            if key == "schema_version":
+                schema_version = reader.value()
+                _check_schema_version(schema_version)
+            elif key == "data":
+                if reader.peek() != "{":
+                    raise ImportParseError("Missing data section.", location="data")
+                reader.expect("{")
+                has_data = True
+                yield from _iter_data_sections(reader)
+            else:
+                reader.value()
+        reader.expect_end()
+        _check_schema_version(schema_version)
+        if not has_data:
+            raise ImportParseError("Missing data section.", location="data")
+    finally:
+        # Leave the caller's file open; it owns the underlying stream.
+        text.detach()
+
+
+def _iter_data_sections(
+    reader: _JsonReader,
+) -> Iterator[tuple[str, object, ImportSource]]:
+    for section in reader.object_keys():
+        if section not in BUNDLE_SECTIONS:
+            reader.value()
+            continue
+        base_path = f"data.{section}"
+        if reader.peek() != "[":
+            if reader.value() is not None:
+                raise ImportParseError("Expected a list.", location=base_path)
+            continue
+        reader.expect("[")
+        for index, entry in enumerate(reader.array_items()):
+            yield section, entry, ImportSource(base_path, index=index)
+
+
+def iter_ndjson_bundle_entries(
+    data: bytes | BinaryIO,
+) -> Iterator[tuple[str, object, ImportSource]]:
+    """Yield ``(section, entry, source)`` for each line of an NDJSON bundle.
+
+    The first non-blank line is a header object carrying ``schema_version``;
+    every following line is one entity whose ``entity`` field names its kind
+    (``vendor``, ``project``, ``host`` or ``ip_asset``).
+    """
+    text = _open_text(data)
+    try:
+        has_header = False
+        line_number = 0
+        while True:
+            try:
+                line = text.readline()
+            except UnicodeDecodeError as exc:
+                raise ImportParseError("Invalid JSON payload.") from exc
+            if not line:
+                break
+            line_number += 1
+            if not line.strip():
+                continue
+            source = ImportSource("", line_number)
+            try:
+                entry = json.loads(line)
+            except json.JSONDecodeError as exc:
+                raise ImportParseError(
+                    "Invalid JSON line.", location=source.location
+                ) from exc
+            if not has_header:
+                if not isinstance(entry, dict):
+                    raise ImportParseError(
+                        "Expected a header object.", location=source.location
+                    )
+                _check_schema_version(entry.get("schema_version"))
+                has_header = True
+                continue
+            if not isinstance(entry, dict):
+                raise ImportParseError(
+                    "Expected object entries.", location=source.location
+                )
+            section = NDJSON_ENTITY_SECTIONS.get(str(entry.get("entity") or ""))
+            if section is None:
+                raise ImportParseError(
+                    "Unknown entity (expected vendor, project, host or ip_asset).",
+                    location=source.with_field("entity").location,
+                )
+            yield section, entry, source
+        if not has_header:
+            _check_schema_version(None)
+    finally:
+        text.detach()
+
+
+def _check_schema_version(value: object) -> None:
+    if value != "1":
+        raise ImportParseError(
+            "Unsupported schema_version (expected '1').", location="schema_version"
+        )
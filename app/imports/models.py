@@ -4,18 +4,46 @@ from dataclasses import dataclass, field
 from typing import Optional
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ImportSource:
-    location: str
+    """Where an import record came from.
 
+    Rows keep the shared file label plus a line number or list index, and
+    the readable location is only formatted when an issue or change is
+    reported.
+    """
 
-@dataclass
+    file: str
+    line: Optional[int] = None
+    index: Optional[int] = None
+    field: Optional[str] = None
+
+    @property
+    def location(self) -> str:
+        location = self.file
+        if self.line is not None:
+            location = (
+                f"{location}:line {self.line}" if location else f"line {self.line}"
+            )
+        if self.index is not None:
+            location = f"{location}[{self.index}]"
+        if self.field:
+            location = f"{location}.{self.field}"
+        return location
+
+    def with_field(self, field: str) -> ImportSource:
+        if self.field:
+            field = f"{self.field}.{field}"
+        return ImportSource(self.file, self.line, self.index, field)
+
+
+@dataclass(slots=True)
 class ImportVendor:
     name: str
     source: Optional[ImportSource] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ImportProject:
     name: str
     description: Optional[str] = None
@@ -23,7 +51,7 @@ class ImportProject:
     source: Optional[ImportSource] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ImportHost:
     name: str
     notes: Optional[str] = None
@@ -34,7 +62,7 @@ class ImportHost:
     source: Optional[ImportSource] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ImportIPAsset:
     ip_address: str
     asset_type: str
@@ -105,12 +133,53 @@ class ImportSummary:
             + self.ip_assets.would_skip,
         )
 
+    def add(self, other: ImportSummary) -> None:
+        for name in ("vendors", "projects", "hosts", "ip_assets"):
+            mine = getattr(self, name)
+            theirs = getattr(other, name)
+            mine.would_create += theirs.would_create
+            mine.would_update += theirs.would_update
+            mine.would_skip += theirs.would_skip
+
+
+@dataclass(frozen=True)
+class ImportFieldChange:
+    before: object
+    after: object
+
+
+@dataclass(slots=True)
+class ImportChange:
+    entity: str
+    action: str
+    key: str
+    source: Optional[ImportSource] = None
+    fields: dict[str, ImportFieldChange] = field(default_factory=dict)
+    preserved_fields: list[str] = field(default_factory=list)
+
+    @property
+    def location(self) -> str:
+        return self.source.location if self.source else "import"
+
 
 @dataclass
 class ImportApplyResult:
     summary: ImportSummary
     errors: list[ImportIssue] = field(default_factory=list)
     warnings: list[ImportIssue] = field(default_factory=list)
+    changes: list[ImportChange] = field(default_factory=list)
+    catalog_load_ms: Optional[float] = None
+
+
+@dataclass
+class ImportProgress:
+    phase: str = "queued"
+    rows_processed: int = 0
+    batches_processed: int = 0
+    bytes_read: Optional[int] = None
+    bytes_total: Optional[int] = None
+    elapsed_seconds: float = 0.0
+    eta_seconds: Optional[float] = None
 
 
 class ImportParseError(Exception):
@@ -1,19 +1,24 @@
 from __future__ import annotations
 
+from collections.abc import Iterator
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
+import io
 import ipaddress
 import logging
-from typing import Optional
+from typing import BinaryIO, Optional
 
 from defusedxml import ElementTree as ET
 from defusedxml.common import DefusedXmlException
 
 from app import repository
 from app.models import IPAssetType, User
+from app.utils import chunked
 
 logger = logging.getLogger(__name__)
 
+NMAP_IMPORT_BATCH_SIZE = 1000
+
 
 class NmapParseError(Exception):
     pass
@@ -46,46 +51,72 @@ class NmapImportResult:
     new_assets: list[NmapImportAsset] = field(default_factory=list)
 
 
-def parse_nmap_xml(payload: bytes) -> NmapParseResult:
+def parse_nmap_xml(payload: bytes | BinaryIO) -> NmapParseResult:
+    errors: list[str] = []
+    hosts = list(iter_nmap_hosts(payload, errors))
+    return NmapParseResult(hosts=hosts, errors=errors)
+
+
+def iter_nmap_hosts(
+    source: bytes | BinaryIO, errors: Optional[list[str]] = None
+) -> Iterator[NmapHost]:
+    """Yield up IPv4 hosts while reading the scan incrementally.
+
+    Each top-level ``<host>`` element is discarded once processed, so memory
+    does not grow with the size of the scan. Invalid addresses are appended to
+    ``errors``; malformed XML raises ``NmapParseError`` when it is reached.
+    """
+    stream = io.BytesIO(source) if isinstance(source, bytes) else source
+    root = None
+    depth = 0
     try:
-        root = ET.fromstring(payload)
+        for event, element in ET.iterparse(stream, events=("start", "end")):
+            if event == "start":
+                if root is None:
+                    root = element
+                depth += 1
+                continue
+            depth -= 1
+            if depth != 1:
+                continue
+            if element.tag == "host":
+                host = _parse_host_element(element, errors)
+                if host is not None:
+                    yield host
+            root.clear()
     except (ET.ParseError, DefusedXmlException) as exc:
         raise NmapParseError("Invalid Nmap XML payload.") from exc
 
-    hosts: list[NmapHost] = []
-    errors: list[str] = []
 
-    for host in root.findall("host"):
-        status = host.find("status")
-        if status is None or status.get("state") != "up":
-            continue
-        ipv4_address = None
-        for address in host.findall("address"):
-            if address.get("addrtype") == "ipv4":
-                ipv4_address = address.get("addr")
-                break
-        if not ipv4_address:
-            continue
-        vendor = None
-        for address in host.findall("address"):
-            if address.get("addrtype") == "mac" and address.get("vendor"):
-                vendor = address.get("vendor")
-                break
-        try:
-            parsed_ip = ipaddress.ip_address(ipv4_address)
-        except ValueError:
+def _parse_host_element(host, errors: Optional[list[str]]) -> Optional[NmapHost]:
+    status = host.find("status")
+    if status is None or status.get("state") != "up":
+        return None
+    ipv4_address = None
+    for address in host.findall("address"):
+        if address.get("addrtype") == "ipv4":
+            ipv4_address = address.get("addr")
+            break
+    if not ipv4_address:
+        return None
+    vendor = None
+    for address in host.findall("address"):
+        if address.get("addrtype") == "mac" and address.get("vendor"):
+            vendor = address.get("vendor")
+            break
+    try:
+        parsed_ip = ipaddress.ip_address(ipv4_address)
+    except ValueError:
+        if errors is not None:
             errors.append(f"Invalid IP address '{ipv4_address}' in Nmap XML.")
-            continue
-        if parsed_ip.version != 4:
-            continue
-        hosts.append(NmapHost(ip_address=str(parsed_ip), vendor=vendor))
-
-    return NmapParseResult(hosts=hosts, errors=errors)
+        return None
+    if parsed_ip.version != 4:
+        return None
+    return NmapHost(ip_address=str(parsed_ip), vendor=vendor)
 
 
-def _unique_hosts(hosts: list[NmapHost]) -> list[NmapHost]:
+def _unique_hosts(hosts: list[NmapHost], seen: set[str]) -> list[NmapHost]:
     unique: list[NmapHost] = []
-    seen: set[str] = set()
     for host in hosts:
         if host.ip_address in seen:
             continue
@@ -127,14 +158,49 @@ def _infer_asset_type_from_vendor(vendor: Optional[str]) -> IPAssetType:
 
 def import_nmap_xml(
     connection,
-    payload: bytes,
+    payload: bytes | BinaryIO,
     *,
     dry_run: bool = False,
     current_user: Optional[User] = None,
     now: Optional[datetime] = None,
+    batch_size: int = NMAP_IMPORT_BATCH_SIZE,
 ) -> NmapImportResult:
+    timestamp = (now or datetime.now(timezone.utc)).isoformat(timespec="seconds")
+    note = f"Discovered via nmap upload at {timestamp}"
+
+    errors: list[str] = []
+    seen_ips: set[str] = set()
+    new_assets: list[NmapImportAsset] = []
+    new_ips_created = 0
+    existing_ips_seen = 0
+
+    # Hosts are applied batch by batch as the XML is read; the whole run is
+    # one transaction so malformed XML late in the file leaves nothing behind.
     try:
-        parse_result = parse_nmap_xml(payload)
+        with repository.transaction_scope(connection, rollback=dry_run) as session:
+            for batch in chunked(iter_nmap_hosts(payload, errors), batch_size):
+                hosts = _unique_hosts(batch, seen_ips)
+                existing = repository.list_existing_ip_addresses(
+                    session, [host.ip_address for host in hosts]
+                )
+                missing = [host for host in hosts if host.ip_address not in existing]
+                existing_ips_seen += len(existing)
+                new_ips_created += len(missing)
+                if dry_run or not missing:
+                    continue
+                created = repository.bulk_create_ip_assets(
+                    session,
+                    [
+                        (host.ip_address, _infer_asset_type_from_vendor(host.vendor))
+                        for host in missing
+                    ],
+                    notes=note,
+                    current_user=current_user,
+                )
+                new_assets.extend(
+                    NmapImportAsset(id=asset.id, ip_address=asset.ip_address)
+                    for asset in created
+                )
     except NmapParseError as exc:
         return NmapImportResult(
             discovered_up_hosts=0,
@@ -145,43 +211,18 @@ def import_nmap_xml(
 
     logger.info(
         "Nmap import parsed %s up hosts with %s parse errors.",
-        len(parse_result.hosts),
-        len(parse_result.errors),
+        len(seen_ips),
+        len(errors),
     )
-    if parse_result.errors:
-        logger.warning("Nmap import parse errors: %s", "; ".join(parse_result.errors))
-
-    unique_hosts = _unique_hosts(parse_result.hosts)
-    if not unique_hosts:
+    if errors:
+        logger.warning("Nmap import parse errors: %s", "; ".join(errors))
+    if not seen_ips:
         logger.warning("Nmap import found no up hosts to import.")
-    timestamp = (now or datetime.now(timezone.utc)).isoformat(timespec="seconds")
-    note = f"Discovered via nmap upload at {timestamp}"
-
-    new_assets: list[NmapImportAsset] = []
-    new_ips_created = 0
-    existing_ips_seen = 0
-
-    for host in unique_hosts:
-        existing = repository.get_ip_asset_by_ip(connection, host.ip_address)
-        if existing is not None:
-            existing_ips_seen += 1
-            continue
-        new_ips_created += 1
-        if dry_run:
-            continue
-        asset = repository.create_ip_asset(
-            connection,
-            ip_address=host.ip_address,
-            asset_type=_infer_asset_type_from_vendor(host.vendor),
-            notes=note,
-            current_user=current_user,
-        )
-        new_assets.append(NmapImportAsset(id=asset.id, ip_address=asset.ip_address))
 
     return NmapImportResult(
-        discovered_up_hosts=len(unique_hosts),
+        discovered_up_hosts=len(seen_ips),
         new_ips_created=new_ips_created,
         existing_ips_seen=existing_ips_seen,
-        errors=parse_result.errors,
+        errors=errors,
         new_assets=new_assets,
     )
@@ -1,19 +1,27 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Optional
+import os
+import time
+from collections.abc import Callable, Iterator, Mapping
+from dataclasses import dataclass, replace
+from typing import BinaryIO, Optional
 
 from app import repository
 from app.imports.applier import apply_bundle
-from app.imports.importers import Importer
+from app.imports.catalog import load_import_catalog
+from app.imports.importers import IMPORT_BATCH_SIZE, Importer, StreamingImporter
 from app.imports.models import (
     ImportApplyResult,
+    ImportBundle,
     ImportIssue,
     ImportParseError,
+    ImportProgress,
     ImportSummary,
 )
 from app.imports.validator import validate_bundle
 
+IMPORT_CHANGE_LIMIT = 5000
+
 
 @dataclass
 class ImportAuditContext:
@@ -24,7 +32,7 @@ class ImportAuditContext:
 
 
 def _record_import_apply_audit(
-    connection,
+    session,
     *,
     context: ImportAuditContext,
     result: ImportApplyResult,
@@ -36,54 +44,214 @@ def _record_import_apply_audit(
         f"skip={total.would_skip}; warnings={len(result.warnings)}; "
         f"errors={len(result.errors)}."
     )
-    with connection:
-        repository.create_audit_log(
-            connection,
-            user=context.user,
-            action="APPLY",
-            target_type="IMPORT_RUN",
-            target_id=0,
-            target_label=context.source,
-            changes=changes,
+    repository.create_audit_log(
+        session,
+        user=context.user,
+        action="APPLY",
+        target_type="IMPORT_RUN",
+        target_id=0,
+        target_label=context.source,
+        changes=changes,
+    )
+
+
+class _ProgressTracker:
+    """Reports batch progress, estimating the ETA from input bytes consumed."""
+
+    def __init__(
+        self,
+        inputs: Mapping[str, bytes | BinaryIO],
+        callback: Optional[Callable[[ImportProgress], None]],
+    ) -> None:
+        self._callback = callback
+        self._started = time.monotonic()
+        streams = [value for value in inputs.values() if not isinstance(value, bytes)]
+        # A byte-based ETA is only possible when every input is a seekable file.
+        self._streams = streams if len(streams) == len(inputs) else []
+        self._progress = ImportProgress(
+            bytes_total=(
+                sum(_stream_size(stream) for stream in self._streams)
+                if self._streams
+                else None
+            )
         )
 
+    def report(self, phase: str, *, rows: int = 0, batches: int = 0) -> None:
+        if self._callback is None:
+            return
+        progress = self._progress
+        progress.phase = phase
+        progress.rows_processed += rows
+        progress.batches_processed += batches
+        progress.elapsed_seconds = round(time.monotonic() - self._started, 3)
+        if self._streams and progress.bytes_total:
+            bytes_read = min(
+                sum(_stream_position(stream) for stream in self._streams),
+                progress.bytes_total,
+            )
+            progress.bytes_read = bytes_read
+            if bytes_read:
+                progress.eta_seconds = round(
+                    progress.elapsed_seconds
+                    * (progress.bytes_total - bytes_read)
+                    / bytes_read,
+                    1,
+                )
+        self._callback(replace(progress))
+
+
+def _stream_size(stream: BinaryIO) -> int:
+    try:
+        position = stream.tell()
+        size = stream.seek(0, os.SEEK_END)
+        stream.seek(position)
+    except (OSError, ValueError):
+        return 0
+    return size
+
+
+def _stream_position(stream: BinaryIO) -> int:
+    try:
+        return stream.tell()
+    except (OSError, ValueError):
+        return _stream_size(stream)
+
+
+class _ImportAborted(Exception):
+    def __init__(self, result: ImportApplyResult) -> None:
+        super().__init__("import aborted")
+        self.result = result
+
 
 def run_import(
     connection,
     importer: Importer,
-    inputs: dict[str, bytes],
+    inputs: Mapping[str, bytes | BinaryIO],
     *,
     options: Optional[dict[str, object]] = None,
     dry_run: bool = False,
     audit_context: Optional[ImportAuditContext] = None,
+    batch_size: int = IMPORT_BATCH_SIZE,
+    progress: Optional[Callable[[ImportProgress], None]] = None,
 ) -> ImportApplyResult:
+    """Parse, validate and apply an import in a single transaction.
+
+    Importers that implement ``iter_batches`` are consumed batch by batch so
+    only ``batch_size`` rows are held in memory at once. Once any batch fails
+    validation nothing further is applied, the remaining batches are still
+    validated so every error is reported, and the transaction is rolled back.
+    ``progress`` is called after each batch with an ``ImportProgress``.
+    """
+    tracker = _ProgressTracker(inputs, progress)
+    tracker.report("parsing")
     try:
-        bundle = importer.parse(inputs, options=options)
+        # Validation, every row write and the import-run audit entry share one
+        # transaction; each entity is applied in its own savepoint so a failing
+        # row is reported without discarding the rest of the batch.
+        with repository.transaction_scope(connection, rollback=dry_run) as session:
+            result = _apply_batches(
+                session,
+                _iter_import_batches(importer, inputs, options, batch_size),
+                tracker,
+            )
+            tracker.report("finalizing")
+            if (
+                not dry_run
+                and audit_context is not None
+                and audit_context.mode.lower() == "apply"
+            ):
+                _record_import_apply_audit(
+                    session,
+                    context=audit_context,
+                    result=result,
+                )
     except ImportParseError as exc:
         return ImportApplyResult(
             summary=ImportSummary(),
             errors=[ImportIssue(location=exc.location, message=str(exc))],
         )
+    except _ImportAborted as aborted:
+        return aborted.result
+    return result
 
-    validation = validate_bundle(connection, bundle)
-    if not validation.is_valid:
-        return ImportApplyResult(
-            summary=ImportSummary(),
-            errors=validation.errors,
-            warnings=validation.warnings,
+
+def _iter_import_batches(
+    importer: Importer,
+    inputs: Mapping[str, bytes | BinaryIO],
+    options: Optional[dict[str, object]],
+    batch_size: int,
+) -> Iterator[ImportBundle]:
+    if isinstance(importer, StreamingImporter):
+        yield from importer.iter_batches(inputs, options, batch_size=batch_size)
+    else:
+        yield importer.parse(dict(inputs), options=options)
+
+
+def _apply_batches(
+    session, batches: Iterator[ImportBundle], tracker: _ProgressTracker
+) -> ImportApplyResult:
+    # One catalog snapshot serves every batch; the applier keeps it current.
+    catalog = load_import_catalog(session)
+    result = ImportApplyResult(summary=ImportSummary(), catalog_load_ms=catalog.load_ms)
+    validation_errors: list[ImportIssue] = []
+    validation_warnings: list[ImportIssue] = []
+    vendor_names: set[str] = set()
+    project_names: set[str] = set()
+    host_names: set[str] = set()
+    omitted_changes = 0
+
+    for bundle in batches:
+        validation = validate_bundle(
+            session,
+            bundle,
+            catalog=catalog,
+            extra_vendor_names=vendor_names,
+            extra_project_names=project_names,
+            extra_host_names=host_names,
+        )
+        validation_errors.extend(validation.errors)
+        validation_warnings.extend(validation.warnings)
+        vendor_names.update(vendor.name.strip() for vendor in bundle.vendors)
+        project_names.update(project.name.strip() for project in bundle.projects)
+        host_names.update(host.name.strip() for host in bundle.hosts)
+        rows = len(bundle.hosts) + len(bundle.ip_assets)
+        if validation_errors:
+            tracker.report("validating", rows=rows, batches=1)
+            continue
+
+        # Batches are applied for real inside the outer transaction so later
+        # batches see earlier writes; dry-run rolls the whole transaction back.
+        applied = apply_bundle(session, bundle, catalog=catalog)
+        result.summary.add(applied.summary)
+        result.errors.extend(applied.errors)
+        for warning in applied.warnings:
+            if warning not in result.warnings:
+                result.warnings.append(warning)
+        room = IMPORT_CHANGE_LIMIT - len(result.changes)
+        result.changes.extend(applied.changes[:room])
+        omitted_changes += max(0, len(applied.changes) - room)
+        tracker.report("applying", rows=rows, batches=1)
+
+    if validation_errors:
+        raise _ImportAborted(
+            ImportApplyResult(
+                summary=ImportSummary(),
+                errors=validation_errors,
+                warnings=validation_warnings,
+                catalog_load_ms=catalog.load_ms,
+            )
         )
 
-    applied = apply_bundle(connection, bundle, dry_run=dry_run)
-    applied.warnings = validation.warnings + applied.warnings
-    if (
-        not dry_run
-        and audit_context is not None
-        and audit_context.mode.lower() == "apply"
-        and not applied.errors
-    ):
-        _record_import_apply_audit(
-            connection,
-            context=audit_context,
-            result=applied,
+    result.warnings = validation_warnings + result.warnings
+    if omitted_changes:
+        result.warnings.append(
+            ImportIssue(
+                location="import",
+                message=(
+                    f"Change details truncated; {omitted_changes} more change(s) "
+                    "not listed."
+                ),
+                level="warning",
+            )
         )
-    return applied
+    return result
@@ -1,15 +1,33 @@
 from __future__ import annotations
 
-from typing import Protocol
+import tempfile
+import zlib
+from collections.abc import Iterator
+from typing import BinaryIO, Optional, Protocol
 
 IMPORT_UPLOAD_CHUNK_SIZE = 64 * 1024
 IMPORT_UPLOAD_MAX_BYTES = 10 * 1024 * 1024
+IMPORT_STREAMED_UPLOAD_MAX_BYTES = 1024 * 1024 * 1024
+IMPORT_SPOOL_MEMORY_BYTES = 1024 * 1024
+
+GZIP_SUFFIX = ".gz"
+GZIP_CONTENT_TYPES = frozenset({"application/gzip", "application/x-gzip"})
+_GZIP_MAGIC = b"\x1f\x8b"
+
+NDJSON_BUNDLE_SUFFIXES = (".ndjson", ".jsonl")
+NDJSON_CONTENT_TYPES = frozenset(
+    {"application/x-ndjson", "application/ndjson", "application/jsonl"}
+)
 
 
 class UploadTooLargeError(ValueError):
     """Raised when an uploaded file exceeds the configured size limit."""
 
 
+class UploadDecodeError(ValueError):
+    """Raised when a gzip upload cannot be decompressed."""
+
+
 class UploadLike(Protocol):
     async def read(self, size: int = -1) -> bytes: ...
 
@@ -39,6 +57,121 @@ async def read_upload_limited(
     return b"".join(chunks)
 
 
+async def spool_upload_limited(
+    upload: UploadLike,
+    *,
+    max_bytes: int = IMPORT_STREAMED_UPLOAD_MAX_BYTES,
+    chunk_size: int = IMPORT_UPLOAD_CHUNK_SIZE,
+) -> Optional[BinaryIO]:
+    """Copy an upload into a temporary file without buffering it in memory.
+
+    Gzip uploads (see ``upload_is_gzip``, or any upload starting with the
+    gzip magic bytes) are decompressed on the fly, and ``max_bytes`` applies
+    to the decompressed size. Returns the spooled file rewound to the start,
+    or ``None`` for an empty upload. The caller owns the returned file and
+    must close it.
+    """
+    if max_bytes < 0:
+        raise ValueError("max_bytes must be non-negative")
+    if chunk_size <= 0:
+        raise ValueError("chunk_size must be positive")
+
+    spooled = tempfile.SpooledTemporaryFile(max_size=IMPORT_SPOOL_MEMORY_BYTES)
+    decoder: Optional[_GzipDecoder] = None
+    declared_gzip = upload_is_gzip(upload)
+    total = 0
+    first = True
+    try:
+        while True:
+            chunk = await upload.read(chunk_size)
+            if not chunk:
+                break
+            if first:
+                first = False
+                if declared_gzip or chunk.startswith(_GZIP_MAGIC):
+                    decoder = _GzipDecoder()
+            pieces = decoder.feed(chunk, chunk_size) if decoder else (chunk,)
+            for piece in pieces:
+                total += len(piece)
+                if total > max_bytes:
+                    raise UploadTooLargeError
+                spooled.write(piece)
+        if decoder is not None:
+            decoder.finish()
+    except BaseException:
+        spooled.close()
+        raise
+
+    if total == 0:
+        spooled.close()
+        return None
+    spooled.seek(0)
+    return spooled
+
+
+class _GzipDecoder:
+    """Incremental gzip decoder that never inflates more than it is asked for.
+
+    Output is produced at most ``max_length`` bytes at a time so the caller
+    can enforce its size limit before a decompression bomb is expanded.
+    Concatenated gzip members are decoded one after another.
+    """
+
+    def __init__(self) -> None:
+        self._decompressor = zlib.decompressobj(zlib.MAX_WBITS | 16)
+
+    def feed(self, data: bytes, max_length: int) -> Iterator[bytes]:
+        try:
+            while True:
+                output = self._decompressor.decompress(data, max_length)
+                if output:
+                    yield output
+                if self._decompressor.eof:
+                    data = self._decompressor.unused_data
+                    if not data:
+                        return
+                    self._decompressor = zlib.decompressobj(zlib.MAX_WBITS | 16)
+                    continue
+                data = self._decompressor.unconsumed_tail
+                if not data and len(output) < max_length:
+                    return
+        except zlib.error as exc:
+            raise UploadDecodeError("Uploaded file is not valid gzip data.") from exc
+
+    def finish(self) -> None:
+        if not self._decompressor.eof:
+            raise UploadDecodeError("Uploaded gzip file is truncated.")
+
+
+def upload_is_gzip(upload: object) -> bool:
+    """Whether an upload declares gzip by name, content type or encoding."""
+    filename = (getattr(upload, "filename", None) or "").lower()
+    headers = getattr(upload, "headers", None)
+    encoding = (headers.get("content-encoding") if headers is not None else None) or ""
+    return (
+        filename.endswith(GZIP_SUFFIX)
+        or _media_type(getattr(upload, "content_type", None)) in GZIP_CONTENT_TYPES
+        or encoding.strip().lower() == "gzip"
+    )
+
+
+def _media_type(content_type: Optional[str]) -> str:
+    return (content_type or "").split(";")[0].strip().lower()
+
+
+def bundle_import_options(
+    filename: Optional[str], content_type: Optional[str] = None
+) -> dict[str, object]:
+    """Importer options for an uploaded bundle; NDJSON is told by name or type."""
+    name = (filename or "").lower().removesuffix(GZIP_SUFFIX)
+    if (
+        name.endswith(NDJSON_BUNDLE_SUFFIXES)
+        or _media_type(content_type) in NDJSON_CONTENT_TYPES
+    ):
+        return {"format": "ndjson"}
+    return {}
+
+
 def describe_upload_limit(max_bytes: int) -> str:
     mb = 1024 * 1024
     if max_bytes % mb == 0 and max_bytes >= mb:
@@ -1,29 +1,46 @@
 from __future__ import annotations
 
 import ipaddress
+from collections.abc import Iterable
+from typing import Optional
 
-from app import repository
+from app.imports.catalog import ImportCatalog, load_import_catalog
 from app.imports.models import ImportBundle, ImportIssue, ImportValidationResult
 from app.models import IPAssetType
 from app.utils import normalize_hex_color, normalize_tag_name
 
 
-def validate_bundle(connection, bundle: ImportBundle) -> ImportValidationResult:
+def validate_bundle(
+    connection,
+    bundle: ImportBundle,
+    *,
+    catalog: Optional[ImportCatalog] = None,
+    extra_vendor_names: Iterable[str] = (),
+    extra_project_names: Iterable[str] = (),
+    extra_host_names: Iterable[str] = (),
+) -> ImportValidationResult:
+    """Validate a bundle against itself and the current catalog.
+
+    ``catalog`` is loaded from ``connection`` when not supplied. The
+    ``extra_*_names`` arguments list names declared by earlier batches of
+    the same import, which may not have been written to the database.
+    """
     result = ImportValidationResult()
 
     vendor_names = {vendor.name.strip() for vendor in bundle.vendors if vendor.name}
+    vendor_names.update(extra_vendor_names)
     project_names = {
         project.name.strip() for project in bundle.projects if project.name
     }
+    project_names.update(extra_project_names)
     host_names = {host.name.strip() for host in bundle.hosts if host.name}
+    host_names.update(extra_host_names)
 
-    existing_vendor_names = {
-        vendor.name for vendor in repository.list_vendors(connection)
-    }
-    existing_project_names = {
-        project.name for project in repository.list_projects(connection)
-    }
-    existing_host_names = {host.name for host in repository.list_hosts(connection)}
+    if catalog is None:
+        catalog = load_import_catalog(connection)
+    existing_vendor_names = catalog.vendor_ids
+    existing_project_names = catalog.project_ids
+    existing_host_names = catalog.host_ids
 
     for vendor in bundle.vendors:
         if not vendor.name.strip():
@@ -118,7 +135,7 @@ def _issue(source, message: str) -> ImportIssue:
 def _with_field(source, field: str):
     if source is None:
         return None
-    return type(source)(location=f"{source.location}.{field}")
+    return source.with_field(field)
 
 
 def _is_valid_ip(value: str) -> bool:
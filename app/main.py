@@ -4,6 +4,7 @@ from fastapi import FastAPI
 from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
 
+from app.file_sd import start_file_sd_writer, stop_file_sd_writer
 from app.routes import api, ui
 from app.startup import configure_logging, init_database
 
@@ -19,3 +20,5 @@ app.include_router(api.router)
 app.include_router(ui.router)
 
 app.add_event_handler("startup", init_database)
+app.add_event_handler("startup", start_file_sd_writer)
+app.add_event_handler("shutdown", stop_file_sd_writer)
@@ -0,0 +1,56 @@
+from __future__ import annotations
+
+import os
+import threading
+import time
+from typing import Optional
+
+from app import repository
+from app.dependencies import create_db_session
+
+METRICS_CACHE_SECONDS = 15.0
+
+_METRICS_CACHE_LOCK = threading.Lock()
+_METRICS_CACHE: dict[str, tuple[int, float, dict[str, object]]] = {}
+
+
+def metrics_cache_seconds() -> float:
+    value = os.getenv("IPOCKET_METRICS_CACHE_SECONDS")
+    if not value:
+        return METRICS_CACHE_SECONDS
+    return max(float(value), 0.0)
+
+
+def get_inventory_metrics(
+    db_path: str, *, now: Optional[float] = None
+) -> dict[str, object]:
+    """Return inventory counts, recomputed only when they may have changed.
+
+    A cached result is served while the data version is unchanged, and for
+    up to ``IPOCKET_METRICS_CACHE_SECONDS`` after it moves, so scrapes during
+    a bulk import do not each rerun the aggregate. Concurrent scrapes wait
+    for one computation and then share it.
+    """
+    current = time.monotonic() if now is None else now
+    session = create_db_session(db_path)
+    try:
+        version = repository.get_data_version(session).value
+        with _METRICS_CACHE_LOCK:
+            cached = _METRICS_CACHE.get(db_path)
+            if cached is not None:
+                cached_version, computed_at, inventory = cached
+                if (
+                    cached_version == version
+                    or current - computed_at < metrics_cache_seconds()
+                ):
+                    return inventory
+            inventory = repository.get_inventory_metrics(session)
+            _METRICS_CACHE[db_path] = (version, current, inventory)
+            return inventory
+    finally:
+        session.close()
+
+
+def clear_metrics_cache() -> None:
+    with _METRICS_CACHE_LOCK:
+        _METRICS_CACHE.clear()
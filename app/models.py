@@ -100,3 +100,9 @@ class IPRange:
     notes: Optional[str]
     created_at: str
     updated_at: str
+
+
+@dataclass
+class DataVersion:
+    value: int
+    changed_at: Optional[str]
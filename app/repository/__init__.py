@@ -1,5 +1,6 @@
 from .assets import (
     archive_ip_asset,
+    bulk_create_ip_assets,
     bulk_update_ip_assets,
     count_active_ip_assets,
     create_ip_asset,
@@ -7,24 +8,46 @@ from .assets import (
     get_ip_asset_by_id,
     get_ip_asset_by_ip,
     get_ip_asset_metrics,
+    iter_ip_assets_changed_since,
+    iter_ip_assets_for_export,
     list_active_ip_assets,
     list_active_ip_assets_paginated,
+    list_existing_ip_addresses,
+    list_ip_asset_import_fingerprints,
     list_ip_assets_by_ids,
     list_ip_assets_for_export,
     list_sd_targets,
     list_tag_details_for_ip_assets,
     list_tags_for_ip_assets,
     set_ip_asset_archived,
+    set_ip_asset_import_fingerprints,
     set_ip_asset_tags,
+    set_ip_asset_tags_bulk,
     update_ip_asset,
 )
+from ._db import savepoint_scope, transaction_scope
 from .audit import (
+    AuditBuffer,
+    audit_buffer_scope,
     count_audit_logs,
     create_audit_log,
     get_audit_logs_for_ip,
     list_audit_logs,
     list_audit_logs_paginated,
 )
+from .changes import (
+    get_change_cursor,
+    get_data_version,
+    list_change_tombstones,
+    list_projects_changed_since,
+    list_tags_changed_since,
+    list_vendors_changed_since,
+)
+from .counters import (
+    check_inventory_counters,
+    get_inventory_counters,
+    rebuild_inventory_counters,
+)
 from .hosts import (
     count_hosts,
     create_host,
@@ -32,8 +55,12 @@ from .hosts import (
     get_host_by_id,
     get_host_by_name,
     get_host_linked_assets_grouped,
+    iter_hosts_changed_since,
+    iter_hosts_for_export,
+    list_host_ids_by_name,
     list_host_pair_ips_for_hosts,
     list_hosts,
+    list_hosts_by_ids,
     list_hosts_with_ip_counts,
     list_hosts_with_ip_counts_paginated,
     update_host,
@@ -51,10 +78,13 @@ from .metadata import (
     get_vendor_by_id,
     get_vendor_by_name,
     list_project_ip_counts,
+    list_project_ids_by_name,
     list_projects,
+    list_projects_for_export,
     list_tag_ip_counts,
     list_tags,
     list_vendor_ip_counts,
+    list_vendor_ids_by_name,
     list_vendors,
     update_project,
     update_tag,
@@ -69,7 +99,7 @@ from .ranges import (
     list_ip_ranges,
     update_ip_range,
 )
-from .summary import get_management_summary
+from .summary import get_inventory_metrics, get_management_summary
 from .sessions import (
     clear_sessions,
     create_session,
@@ -91,6 +121,7 @@ from .users import (
 
 __all__ = [
     "archive_ip_asset",
+    "bulk_create_ip_assets",
     "bulk_update_ip_assets",
     "count_active_ip_assets",
     "create_ip_asset",
@@ -98,29 +129,50 @@ __all__ = [
     "get_ip_asset_by_id",
     "get_ip_asset_by_ip",
     "get_ip_asset_metrics",
+    "iter_ip_assets_changed_since",
+    "iter_ip_assets_for_export",
     "list_active_ip_assets",
     "list_active_ip_assets_paginated",
+    "list_existing_ip_addresses",
+    "list_ip_asset_import_fingerprints",
     "list_ip_assets_by_ids",
     "list_ip_assets_for_export",
     "list_sd_targets",
     "list_tag_details_for_ip_assets",
     "list_tags_for_ip_assets",
     "set_ip_asset_archived",
+    "set_ip_asset_import_fingerprints",
     "set_ip_asset_tags",
+    "set_ip_asset_tags_bulk",
     "update_ip_asset",
+    "AuditBuffer",
+    "audit_buffer_scope",
     "count_audit_logs",
     "create_audit_log",
     "get_audit_logs_for_ip",
     "list_audit_logs",
     "list_audit_logs_paginated",
+    "get_change_cursor",
+    "get_data_version",
+    "list_change_tombstones",
+    "list_projects_changed_since",
+    "list_tags_changed_since",
+    "list_vendors_changed_since",
+    "check_inventory_counters",
+    "get_inventory_counters",
+    "rebuild_inventory_counters",
     "count_hosts",
     "create_host",
     "delete_host",
     "get_host_by_id",
     "get_host_by_name",
     "get_host_linked_assets_grouped",
+    "iter_hosts_changed_since",
+    "iter_hosts_for_export",
+    "list_host_ids_by_name",
     "list_host_pair_ips_for_hosts",
     "list_hosts",
+    "list_hosts_by_ids",
     "list_hosts_with_ip_counts",
     "list_hosts_with_ip_counts_paginated",
     "update_host",
@@ -136,10 +188,13 @@ __all__ = [
     "get_vendor_by_id",
     "get_vendor_by_name",
     "list_project_ip_counts",
+    "list_project_ids_by_name",
     "list_projects",
+    "list_projects_for_export",
     "list_tag_ip_counts",
     "list_tags",
     "list_vendor_ip_counts",
+    "list_vendor_ids_by_name",
     "list_vendors",
     "update_project",
     "update_tag",
@@ -151,6 +206,7 @@ __all__ = [
     "get_ip_range_utilization",
     "list_ip_ranges",
     "update_ip_range",
+    "get_inventory_metrics",
     "get_management_summary",
     "create_session",
     "get_session_user_id",
@@ -166,4 +222,6 @@ __all__ = [
     "set_user_active",
     "update_user_password",
     "update_user_role",
+    "savepoint_scope",
+    "transaction_scope",
 ]
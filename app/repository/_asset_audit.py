@@ -1,40 +1,96 @@
 from __future__ import annotations
 
 import sqlite3
-from typing import Optional
+from dataclasses import dataclass, field
+from typing import Iterable, Optional
 
 from sqlalchemy import select
 from sqlalchemy.orm import Session
 
 from app import schema as db_schema
 from app.models import IPAsset
+from app.utils import chunked
 
-from ._db import session_scope
+from ._db import IN_CLAUSE_CHUNK_SIZE, session_scope
+
+
+@dataclass
+class _ChangeLabels:
+    """Project and host names preloaded for a batch of change summaries."""
+
+    projects: dict[int, str] = field(default_factory=dict)
+    hosts: dict[int, str] = field(default_factory=dict)
+
+
+def _load_change_labels(
+    connection_or_session: sqlite3.Connection | Session,
+    assets: Iterable[IPAsset],
+) -> _ChangeLabels:
+    project_ids: set[int] = set()
+    host_ids: set[int] = set()
+    for asset in assets:
+        if asset.project_id is not None:
+            project_ids.add(asset.project_id)
+        if asset.host_id is not None:
+            host_ids.add(asset.host_id)
+    labels = _ChangeLabels()
+    with session_scope(connection_or_session) as session:
+        for chunk in chunked(sorted(project_ids), IN_CLAUSE_CHUNK_SIZE):
+            labels.projects.update(
+                session.execute(
+                    select(db_schema.Project.id, db_schema.Project.name).where(
+                        db_schema.Project.id.in_(chunk)
+                    )
+                )
+                .tuples()
+                .all()
+            )
+        for chunk in chunked(sorted(host_ids), IN_CLAUSE_CHUNK_SIZE):
+            labels.hosts.update(
+                session.execute(
+                    select(db_schema.Host.id, db_schema.Host.name).where(
+                        db_schema.Host.id.in_(chunk)
+                    )
+                )
+                .tuples()
+                .all()
+            )
+    return labels
 
 
 def _project_label(
-    connection_or_session: sqlite3.Connection | Session, project_id: Optional[int]
+    connection_or_session: sqlite3.Connection | Session,
+    project_id: Optional[int],
+    labels: Optional[_ChangeLabels] = None,
 ) -> str:
     if project_id is None:
         return "Unassigned"
-    with session_scope(connection_or_session) as session:
-        project_name = session.scalar(
-            select(db_schema.Project.name).where(db_schema.Project.id == project_id)
-        )
+    if labels is not None:
+        project_name = labels.projects.get(project_id)
+    else:
+        with session_scope(connection_or_session) as session:
+            project_name = session.scalar(
+                select(db_schema.Project.name).where(db_schema.Project.id == project_id)
+            )
     if project_name is None:
         return f"Unknown ({project_id})"
     return str(project_name)
 
 
 def _host_label(
-    connection_or_session: sqlite3.Connection | Session, host_id: Optional[int]
+    connection_or_session: sqlite3.Connection | Session,
+    host_id: Optional[int],
+    labels: Optional[_ChangeLabels] = None,
 ) -> str:
     if host_id is None:
         return "Unassigned"
-    with session_scope(connection_or_session) as session:
-        host_name = session.scalar(
-            select(db_schema.Host.name).where(db_schema.Host.id == host_id)
-        )
+    if labels is not None:
+        host_name = labels.hosts.get(host_id)
+    else:
+        with session_scope(connection_or_session) as session:
+            host_name = session.scalar(
+                select(db_schema.Host.name).where(db_schema.Host.id == host_id)
+            )
     if host_name is None:
         return f"Unknown ({host_id})"
     return str(host_name)
@@ -47,6 +103,7 @@ def _summarize_ip_asset_changes(
     *,
     tags_before: Optional[list[str]] = None,
     tags_after: Optional[list[str]] = None,
+    labels: Optional[_ChangeLabels] = None,
 ) -> str:
     changes: list[str] = []
     if existing.asset_type != updated.asset_type:
@@ -55,11 +112,11 @@ def _summarize_ip_asset_changes(
         )
     if existing.project_id != updated.project_id:
         changes.append(
-            f"project: {_project_label(connection_or_session, existing.project_id)} -> {_project_label(connection_or_session, updated.project_id)}"
+            f"project: {_project_label(connection_or_session, existing.project_id, labels)} -> {_project_label(connection_or_session, updated.project_id, labels)}"
         )
     if existing.host_id != updated.host_id:
         changes.append(
-            f"host: {_host_label(connection_or_session, existing.host_id)} -> {_host_label(connection_or_session, updated.host_id)}"
+            f"host: {_host_label(connection_or_session, existing.host_id, labels)} -> {_host_label(connection_or_session, updated.host_id, labels)}"
         )
     if (existing.notes or "") != (updated.notes or ""):
         changes.append(f"notes: {existing.notes or ''} -> {updated.notes or ''}")
@@ -72,3 +129,26 @@ def _summarize_ip_asset_changes(
         after_label = ", ".join(tags_after) if tags_after else "none"
         changes.append(f"tags: {before_label} -> {after_label}")
     return "; ".join(changes) if changes else "No changes recorded."
+
+
+def _summarize_bulk_ip_asset_changes(
+    connection_or_session: sqlite3.Connection | Session,
+    changes: list[tuple[IPAsset, IPAsset, list[str], list[str]]],
+) -> str:
+    """One line per asset, labels resolved once for the whole operation."""
+    labels = _load_change_labels(
+        connection_or_session,
+        [asset for existing, updated, _, _ in changes for asset in (existing, updated)],
+    )
+    lines = [f"Bulk updated {len(changes)} IP assets."]
+    for existing, updated, tags_before, tags_after in changes:
+        summary = _summarize_ip_asset_changes(
+            connection_or_session,
+            existing,
+            updated,
+            tags_before=tags_before,
+            tags_after=tags_after,
+            labels=labels,
+        )
+        lines.append(f"{updated.ip_address}: {summary}")
+    return "\n".join(lines)
@@ -1,16 +1,16 @@
 from __future__ import annotations
 
 import sqlite3
-from typing import Iterable
+from typing import Iterable, Mapping
 
-from sqlalchemy import delete, select
+from sqlalchemy import delete, insert, select, tuple_
 from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.orm import Session
 
 from app import schema as db_schema
-from app.utils import normalize_tag_names
+from app.utils import chunked, normalize_tag_names
 
-from ._db import session_scope, write_session_scope
+from ._db import IN_CLAUSE_CHUNK_SIZE, session_scope, write_session_scope
 
 
 def list_tag_details_for_ip_assets(
@@ -68,40 +68,91 @@ def set_ip_asset_tags(
     asset_id: int,
     tag_names: Iterable[str],
 ) -> list[str]:
-    normalized_tags = normalize_tag_names(list(tag_names))
+    return set_ip_asset_tags_bulk(connection_or_session, {asset_id: tag_names})[
+        asset_id
+    ]
+
+
+def set_ip_asset_tags_bulk(
+    connection_or_session: sqlite3.Connection | Session,
+    tags_by_asset: Mapping[int, Iterable[str]],
+) -> dict[int, list[str]]:
+    """Replace the tags of many assets, touching only links that change.
+
+    Tag names are upserted once for the whole batch, then missing links are
+    inserted and stale ones deleted with set-based statements. Returns the
+    normalized tag names per asset.
+    """
+    normalized = {
+        int(asset_id): normalize_tag_names(list(tag_names))
+        for asset_id, tag_names in tags_by_asset.items()
+    }
+    if not normalized:
+        return {}
     with write_session_scope(connection_or_session) as session:
-        session.execute(
-            delete(db_schema.IPAssetTag).where(
-                db_schema.IPAssetTag.ip_asset_id == asset_id
-            )
+        tag_ids = _upsert_tag_ids(
+            session, {name for names in normalized.values() for name in names}
         )
-        if not normalized_tags:
-            if not isinstance(connection_or_session, Session):
-                session.commit()
-            return []
-
-        for tag_name in normalized_tags:
-            session.execute(
-                sqlite_insert(db_schema.Tag)
-                .values(name=tag_name)
-                .on_conflict_do_nothing(index_elements=[db_schema.Tag.name])
-            )
-        tag_rows = session.execute(
-            select(db_schema.Tag.id, db_schema.Tag.name).where(
-                db_schema.Tag.name.in_(normalized_tags)
+        desired = {
+            (asset_id, tag_ids[name])
+            for asset_id, names in normalized.items()
+            for name in names
+            if name in tag_ids
+        }
+        current: set[tuple[int, int]] = set()
+        for chunk in chunked(list(normalized), IN_CLAUSE_CHUNK_SIZE):
+            current.update(
+                session.execute(
+                    select(
+                        db_schema.IPAssetTag.ip_asset_id, db_schema.IPAssetTag.tag_id
+                    ).where(db_schema.IPAssetTag.ip_asset_id.in_(chunk))
+                )
+                .tuples()
+                .all()
             )
-        ).all()
-        tag_ids = {str(row.name): int(row.id) for row in tag_rows}
-        for tag_name in normalized_tags:
-            tag_id = tag_ids.get(tag_name)
-            if tag_id is None:
-                continue
+        for chunk in chunked(sorted(current - desired), IN_CLAUSE_CHUNK_SIZE):
             session.execute(
-                sqlite_insert(db_schema.IPAssetTag).values(
-                    ip_asset_id=asset_id,
-                    tag_id=tag_id,
+                delete(db_schema.IPAssetTag)
+                .where(
+                    tuple_(
+                        db_schema.IPAssetTag.ip_asset_id, db_schema.IPAssetTag.tag_id
+                    ).in_(chunk)
                 )
+                .execution_options(synchronize_session=False)
+            )
+        missing = sorted(desired - current)
+        if missing:
+            session.execute(
+                insert(db_schema.IPAssetTag),
+                [
+                    {"ip_asset_id": asset_id, "tag_id": tag_id}
+                    for asset_id, tag_id in missing
+                ],
             )
         if not isinstance(connection_or_session, Session):
             session.commit()
-    return normalized_tags
+    return normalized
+
+
+def _upsert_tag_ids(session: Session, tag_names: set[str]) -> dict[str, int]:
+    if not tag_names:
+        return {}
+    ordered_names = sorted(tag_names)
+    session.execute(
+        sqlite_insert(db_schema.Tag).on_conflict_do_nothing(
+            index_elements=[db_schema.Tag.name]
+        ),
+        [{"name": name} for name in ordered_names],
+    )
+    tag_ids: dict[str, int] = {}
+    for chunk in chunked(ordered_names, IN_CLAUSE_CHUNK_SIZE):
+        tag_ids.update(
+            session.execute(
+                select(db_schema.Tag.name, db_schema.Tag.id).where(
+                    db_schema.Tag.name.in_(chunk)
+                )
+            )
+            .tuples()
+            .all()
+        )
+    return tag_ids
@@ -7,7 +7,17 @@ from typing import Iterator
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
-from app.dependencies import create_db_session
+from app.dependencies import create_db_session, get_db_engine
+
+# Keeps IN (...) lists well below SQLite's bound-parameter limit.
+IN_CLAUSE_CHUNK_SIZE = 500
+
+# Rows fetched per round trip by streaming export cursors; related rows
+# (tags, links) are looked up once per fetched batch.
+EXPORT_FETCH_SIZE = IN_CLAUSE_CHUNK_SIZE
+
+# ``Session.info`` key of the active ``audit.AuditBuffer``, if any.
+AUDIT_BUFFER_INFO_KEY = "audit_buffer"
 
 
 def _resolve_db_path(connection: sqlite3.Connection) -> str | None:
@@ -44,6 +54,84 @@ def write_session_scope(
             raise
 
 
+@contextmanager
+def transaction_scope(
+    connection_or_session: sqlite3.Connection | Session,
+    *,
+    rollback: bool = False,
+) -> Iterator[Session]:
+    """Yield a session whose writes share a single database transaction.
+
+    Repository helpers commit the session they are handed; inside this scope
+    those commits only release a SAVEPOINT, so the whole block is committed
+    once on exit. The transaction is rolled back if the block raises, or
+    unconditionally when ``rollback`` is set.
+    """
+    if isinstance(connection_or_session, Session):
+        engine = connection_or_session.get_bind()
+    else:
+        engine = get_db_engine(_resolve_db_path(connection_or_session))
+
+    with engine.connect() as connection:
+        # pysqlite defers BEGIN until the first DML statement, which would let
+        # the session's first SAVEPOINT open (and its RELEASE commit) the
+        # transaction. Issue BEGIN explicitly so savepoints nest inside it.
+        connection.exec_driver_sql("PRAGMA foreign_keys = ON")
+        connection.exec_driver_sql("BEGIN")
+        session = Session(
+            bind=connection,
+            join_transaction_mode="create_savepoint",
+            autoflush=False,
+            expire_on_commit=False,
+        )
+        try:
+            yield session
+            session.commit()
+        except Exception:
+            session.close()
+            connection.rollback()
+            raise
+        session.close()
+        if rollback:
+            connection.rollback()
+        else:
+            connection.commit()
+
+
+@contextmanager
+def savepoint_scope(session: Session, *, rollback: bool = False) -> Iterator[None]:
+    """Run the block inside its own SAVEPOINT of a ``transaction_scope``.
+
+    Any exception rolls back only the work done in the block before being
+    re-raised, leaving the enclosing transaction usable. With ``rollback``
+    set, the block's work is discarded even when it succeeds.
+    """
+    session.commit()
+    connection = session.get_bind()
+    savepoint = connection.begin_nested()
+    audit_buffer = session.info.get(AUDIT_BUFFER_INFO_KEY)
+    audit_mark = len(audit_buffer) if audit_buffer is not None else 0
+    try:
+        yield
+        session.commit()
+    except Exception:
+        session.rollback()
+        savepoint.rollback()
+        # Rows flushed earlier in the block are gone; drop their stale
+        # identity-map entries so reused primary keys are not confused.
+        session.expunge_all()
+        if audit_buffer is not None:
+            audit_buffer.discard_after(audit_mark)
+        raise
+    if rollback:
+        savepoint.rollback()
+        session.expunge_all()
+        if audit_buffer is not None:
+            audit_buffer.discard_after(audit_mark)
+    else:
+        savepoint.commit()
+
+
 def reraise_as_sqlite_integrity_error(exc: IntegrityError) -> None:
     detail = str(exc.orig) if exc.orig else str(exc)
     raise sqlite3.IntegrityError(detail) from exc
@@ -1,17 +1,20 @@
 from __future__ import annotations
 
+import heapq
+import itertools
 import sqlite3
-from typing import Iterable, Mapping, Optional
+from typing import Iterable, Iterator, Mapping, Optional
 
-from sqlalchemy import case, func, select, update, delete
+from sqlalchemy import bindparam, case, func, insert, select, update, delete
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
 from app import schema as db_schema
 from app.models import IPAsset, IPAssetType, User
-from app.utils import ipv4_to_int, normalize_tag_names
+from app.utils import chunked, ipv4_to_int, normalize_tag_names
 
 from ._asset_audit import (
+    _summarize_bulk_ip_asset_changes,
     _summarize_ip_asset_changes as _summarize_ip_asset_changes,
 )
 from ._asset_filters import count_active_assets, list_active_assets
@@ -19,13 +22,20 @@ from ._asset_tags import (
     list_tag_details_for_ip_assets as list_tag_details_for_ip_assets,
     list_tags_for_ip_assets as list_tags_for_ip_assets,
     set_ip_asset_tags as set_ip_asset_tags,
+    set_ip_asset_tags_bulk as set_ip_asset_tags_bulk,
 )
 from ._db import (
+    EXPORT_FETCH_SIZE,
+    IN_CLAUSE_CHUNK_SIZE,
     reraise_as_sqlite_integrity_error,
     session_scope,
     write_session_scope,
 )
-from .audit import create_audit_log
+from .audit import (
+    _create_ip_asset_update_audit_log,
+    audit_buffer_scope,
+    create_audit_log,
+)
 from .mappers import _row_to_ip_asset
 
 
@@ -178,6 +188,125 @@ def create_ip_asset(
     )
 
 
+def bulk_create_ip_assets(
+    connection_or_session: sqlite3.Connection | Session,
+    assets: Iterable[tuple[str, IPAssetType]],
+    notes: Optional[str] = None,
+    current_user: Optional[User] = None,
+) -> list[IPAsset]:
+    """Insert new, unassigned IP assets and their audit rows in bulk.
+
+    Unlike ``create_ip_asset`` this does not restore archived assets; callers
+    are expected to skip addresses that already exist.
+    """
+    values = [
+        {
+            "ip_address": ip_address,
+            "ip_int": ipv4_to_int(ip_address),
+            "type": asset_type.value,
+            "notes": notes,
+        }
+        for ip_address, asset_type in assets
+    ]
+    if not values:
+        return []
+    with write_session_scope(connection_or_session) as session:
+        try:
+            rows = (
+                session.execute(
+                    insert(db_schema.IPAsset).returning(
+                        *_asset_columns(), sort_by_parameter_order=True
+                    ),
+                    values,
+                )
+                .mappings()
+                .all()
+            )
+        except IntegrityError as exc:
+            reraise_as_sqlite_integrity_error(exc)
+        session.execute(
+            insert(db_schema.AuditLog),
+            [
+                {
+                    "user_id": current_user.id if current_user else None,
+                    "username": current_user.username if current_user else None,
+                    "target_type": "IP_ASSET",
+                    "target_id": int(row["id"]),
+                    "target_label": row["ip_address"],
+                    "action": "CREATE",
+                    "changes": (
+                        "Created IP asset "
+                        f"(type={row['type']}, project_id=None, host_id=None, notes={notes or ''})"
+                    ),
+                }
+                for row in rows
+            ],
+        )
+        session.commit()
+    return [_row_to_ip_asset(row) for row in rows]
+
+
+def list_existing_ip_addresses(
+    connection_or_session: sqlite3.Connection | Session, ip_addresses: Iterable[str]
+) -> set[str]:
+    """Return the subset of ``ip_addresses`` that already exist (archived or not)."""
+    existing: set[str] = set()
+    with session_scope(connection_or_session) as session:
+        for chunk in chunked(dict.fromkeys(ip_addresses), IN_CLAUSE_CHUNK_SIZE):
+            existing.update(
+                session.scalars(
+                    select(db_schema.IPAsset.ip_address).where(
+                        db_schema.IPAsset.ip_address.in_(chunk)
+                    )
+                )
+            )
+    return existing
+
+
+def list_ip_asset_import_fingerprints(
+    connection_or_session: sqlite3.Connection | Session, ip_addresses: Iterable[str]
+) -> dict[str, Optional[str]]:
+    """Map each existing address in ``ip_addresses`` to its import fingerprint.
+
+    Addresses without an asset are left out; assets changed since their last
+    import map to ``None``.
+    """
+    fingerprints: dict[str, Optional[str]] = {}
+    with session_scope(connection_or_session) as session:
+        for chunk in chunked(dict.fromkeys(ip_addresses), IN_CLAUSE_CHUNK_SIZE):
+            fingerprints.update(
+                session.execute(
+                    select(
+                        db_schema.IPAsset.ip_address,
+                        db_schema.IPAsset.import_fingerprint,
+                    ).where(db_schema.IPAsset.ip_address.in_(chunk))
+                )
+                .tuples()
+                .all()
+            )
+    return fingerprints
+
+
+def set_ip_asset_import_fingerprints(
+    connection_or_session: sqlite3.Connection | Session,
+    fingerprints: Mapping[str, str],
+) -> None:
+    """Record the fingerprint of the import row each address was last synced to."""
+    if not fingerprints:
+        return
+    with write_session_scope(connection_or_session) as session:
+        session.connection().execute(
+            update(db_schema.IPAsset)
+            .where(db_schema.IPAsset.ip_address == bindparam("target_ip"))
+            .values(import_fingerprint=bindparam("fingerprint")),
+            [
+                {"target_ip": ip_address, "fingerprint": fingerprint}
+                for ip_address, fingerprint in fingerprints.items()
+            ],
+        )
+        session.commit()
+
+
 def get_ip_asset_by_ip(
     connection_or_session: sqlite3.Connection | Session, ip_address: str
 ) -> Optional[IPAsset]:
@@ -378,7 +507,114 @@ def list_ip_assets_for_export(
     project_name: Optional[str] = None,
     host_name: Optional[str] = None,
 ) -> list[dict[str, object]]:
+    return list(
+        iter_ip_assets_for_export(
+            connection_or_session,
+            include_archived=include_archived,
+            asset_type=asset_type,
+            project_name=project_name,
+            host_name=host_name,
+        )
+    )
+
+
+def iter_ip_assets_for_export(
+    connection_or_session: sqlite3.Connection | Session,
+    include_archived: bool = False,
+    asset_type: Optional[IPAssetType] = None,
+    project_name: Optional[str] = None,
+    host_name: Optional[str] = None,
+    *,
+    fetch_size: int = EXPORT_FETCH_SIZE,
+) -> Iterator[dict[str, object]]:
+    """Yield IP asset export rows in numeric IP order from a streaming cursor.
+
+    Rows are fetched ``fetch_size`` at a time and their tags are looked up
+    per fetched batch, so memory does not depend on the inventory size. Rows
+    are already ordered by the ``ip_int`` index; only rows without an
+    ``ip_int`` (IPv4 rows not yet backfilled, and non-IPv4 addresses) are
+    read up front, in a single pass, and held until they are emitted.
+    """
+    statement = _ip_asset_export_statement()
+    if not include_archived:
+        statement = statement.where(db_schema.IPAsset.archived == 0)
+    if asset_type is not None:
+        statement = statement.where(db_schema.IPAsset.type == asset_type.value)
+    with session_scope(connection_or_session) as session:
+        # Filter on the asset's own columns so the archived/project and
+        # host indexes apply; an unknown name matches nothing.
+        if project_name:
+            project_id = session.scalar(
+                select(db_schema.Project.id).where(
+                    db_schema.Project.name == project_name
+                )
+            )
+            if project_id is None:
+                return
+            statement = statement.where(db_schema.IPAsset.project_id == project_id)
+        if host_name:
+            host_id = session.scalar(
+                select(db_schema.Host.id).where(db_schema.Host.name == host_name)
+            )
+            if host_id is None:
+                return
+            statement = statement.where(db_schema.IPAsset.host_id == host_id)
+        indexed_statement = statement.where(
+            db_schema.IPAsset.ip_int.is_not(None)
+        ).order_by(db_schema.IPAsset.ip_int, db_schema.IPAsset.ip_address)
+        unindexed_statement = statement.where(
+            db_schema.IPAsset.ip_int.is_(None)
+        ).order_by(db_schema.IPAsset.ip_address)
+
+        # Read the rows without ip_int once: legacy IPv4 rows are merged into
+        # the indexed stream, everything else follows in ip_address order.
+        legacy_ipv4_rows: list[Mapping[str, object]] = []
+        non_ipv4_rows: list[Mapping[str, object]] = []
+        for row in _stream_export_rows(session, unindexed_statement, fetch_size):
+            if ipv4_to_int(str(row["ip_address"] or "")) is not None:
+                legacy_ipv4_rows.append(row)
+            else:
+                non_ipv4_rows.append(row)
+        legacy_ipv4_rows.sort(key=_ip_asset_export_sort_key)
+        ordered_rows: Iterable[Mapping[str, object]] = _stream_export_rows(
+            session, indexed_statement, fetch_size
+        )
+        if legacy_ipv4_rows:
+            ordered_rows = heapq.merge(
+                ordered_rows, legacy_ipv4_rows, key=_ip_asset_export_sort_key
+            )
+        rows = itertools.chain(ordered_rows, non_ipv4_rows)
+        yield from _ip_asset_export_payloads(session, rows, fetch_size)
+
+
+def iter_ip_assets_changed_since(
+    connection_or_session: sqlite3.Connection | Session,
+    since: int,
+    until: int,
+    *,
+    fetch_size: int = EXPORT_FETCH_SIZE,
+) -> Iterator[dict[str, object]]:
+    """Yield export rows for assets changed in ``(since, until]``.
+
+    Archived assets are included so that archiving shows up as a change.
+    Rows come in change order from the ``change_seq`` index.
+    """
     statement = (
+        _ip_asset_export_statement()
+        .where(
+            db_schema.IPAsset.change_seq > since,
+            db_schema.IPAsset.change_seq <= until,
+        )
+        .order_by(db_schema.IPAsset.change_seq)
+    )
+    with session_scope(connection_or_session) as session:
+        yield from _ip_asset_export_payloads(
+            session, _stream_export_rows(session, statement, fetch_size), fetch_size
+        )
+
+
+def _ip_asset_export_statement():
+    return (
         select(
             db_schema.IPAsset.id.label("asset_id"),
             db_schema.IPAsset.ip_address.label("ip_address"),
@@ -401,41 +637,34 @@ def list_ip_assets_for_export(
             db_schema.Host, db_schema.Host.id == db_schema.IPAsset.host_id, isouter=True
         )
     )
-    if not include_archived:
-        statement = statement.where(db_schema.IPAsset.archived == 0)
-    if asset_type is not None:
-        statement = statement.where(db_schema.IPAsset.type == asset_type.value)
-    if project_name:
-        statement = statement.where(db_schema.Project.name == project_name)
-    if host_name:
-        statement = statement.where(db_schema.Host.name == host_name)
-    statement = statement.order_by(
-        db_schema.IPAsset.ip_int.is_(None),
-        db_schema.IPAsset.ip_int,
-        db_schema.IPAsset.ip_address,
-    )
-    with session_scope(connection_or_session) as session:
-        rows = sorted(
-            session.execute(statement).mappings().all(),
-            key=_ip_asset_export_sort_key,
+
+
+def _ip_asset_export_payloads(
+    session: Session, rows: Iterable[Mapping[str, object]], fetch_size: int
+) -> Iterator[dict[str, object]]:
+    for batch in chunked(rows, fetch_size):
+        tag_map = list_tags_for_ip_assets(
+            session, [int(row["asset_id"]) for row in batch]
         )
-    tag_map = list_tags_for_ip_assets(
-        connection_or_session, [int(row["asset_id"]) for row in rows]
-    )
-    return [
-        {
-            "ip_address": row["ip_address"],
-            "type": row["asset_type"],
-            "project_name": row["project_name"],
-            "host_name": row["host_name"],
-            "notes": row["notes"],
-            "archived": bool(row["archived"]),
-            "created_at": row["created_at"],
-            "updated_at": row["updated_at"],
-            "tags": tag_map.get(int(row["asset_id"]), []),
-        }
-        for row in rows
-    ]
+        for row in batch:
+            yield {
+                "ip_address": row["ip_address"],
+                "type": row["asset_type"],
+                "project_name": row["project_name"],
+                "host_name": row["host_name"],
+                "notes": row["notes"],
+                "archived": bool(row["archived"]),
+                "created_at": row["created_at"],
+                "updated_at": row["updated_at"],
+                "tags": tag_map.get(int(row["asset_id"]), []),
+            }
+
+
+def _stream_export_rows(
+    session: Session, statement, fetch_size: int
+) -> Iterator[Mapping[str, object]]:
+    result = session.execute(statement.execution_options(yield_per=fetch_size))
+    yield from result.mappings()
 
 
 def get_ip_asset_metrics(
@@ -604,20 +833,13 @@ def update_ip_asset(
 
         updated = get_ip_asset_by_ip(session, ip_address)
         if updated is not None:
-            create_audit_log(
+            _create_ip_asset_update_audit_log(
                 session,
-                user=current_user,
-                action="UPDATE",
-                target_type="IP_ASSET",
-                target_id=updated.id,
-                target_label=updated.ip_address,
-                changes=_summarize_ip_asset_changes(
-                    session,
-                    existing,
-                    updated,
-                    tags_before=existing_tags if normalized_tags is not None else None,
-                    tags_after=normalized_tags,
-                ),
+                current_user,
+                existing,
+                updated,
+                tags_before=existing_tags if normalized_tags is not None else None,
+                tags_after=normalized_tags,
             )
         if updated is not None and tags_changed and normalized_tags is not None:
             set_ip_asset_tags(session, updated.id, normalized_tags)
@@ -636,7 +858,14 @@ def bulk_update_ip_assets(
     tags_to_add: Optional[list[str]] = None,
     tags_to_remove: Optional[list[str]] = None,
     current_user: Optional[User] = None,
+    summarize_audit: bool = False,
 ) -> list[IPAsset]:
+    """Apply the same changes to many assets.
+
+    Audit rows are buffered and written in one insert; with
+    ``summarize_audit`` a single ``BULK_UPDATE`` row lists every asset's
+    changes instead of one row per asset.
+    """
     assets = list_ip_assets_by_ids(connection_or_session, asset_ids)
     if not assets:
         return []
@@ -648,52 +877,68 @@ def bulk_update_ip_assets(
         connection_or_session, [asset.id for asset in assets]
     )
     updated_assets: list[IPAsset] = []
+    pending_tags: dict[int, list[str]] = {}
+    summarized_changes: list[tuple[IPAsset, IPAsset, list[str], list[str]]] = []
     with write_session_scope(connection_or_session) as session:
-        for asset in assets:
-            next_type = asset_type or asset.asset_type
-            next_project_id = project_id if set_project_id else asset.project_id
-            next_notes = notes if set_notes else asset.notes
-            if set_notes and (next_notes is None or not next_notes.strip()):
-                next_notes = None
-            session.execute(
-                update(db_schema.IPAsset)
-                .where(db_schema.IPAsset.id == asset.id)
-                .values(
-                    type=next_type.value,
-                    project_id=next_project_id,
-                    notes=next_notes,
-                    updated_at=func.current_timestamp(),
+        with audit_buffer_scope(session):
+            for asset in assets:
+                next_type = asset_type or asset.asset_type
+                next_project_id = project_id if set_project_id else asset.project_id
+                next_notes = notes if set_notes else asset.notes
+                if set_notes and (next_notes is None or not next_notes.strip()):
+                    next_notes = None
+                session.execute(
+                    update(db_schema.IPAsset)
+                    .where(db_schema.IPAsset.id == asset.id)
+                    .values(
+                        type=next_type.value,
+                        project_id=next_project_id,
+                        notes=next_notes,
+                        updated_at=func.current_timestamp(),
+                    )
                 )
-            )
-            updated = get_ip_asset_by_id(session, asset.id)
-            if updated is None:
-                continue
-            existing_tags = tag_map.get(asset.id, [])
-            next_tags = normalize_tag_names([*existing_tags, *normalized_tags_to_add])
-            if normalized_tags_to_remove:
-                removal_set = set(normalized_tags_to_remove)
-                next_tags = [tag for tag in next_tags if tag not in removal_set]
-            create_audit_log(
-                session,
-                user=current_user,
-                action="UPDATE",
-                target_type="IP_ASSET",
-                target_id=updated.id,
-                target_label=updated.ip_address,
-                changes=_summarize_ip_asset_changes(
+                updated = get_ip_asset_by_id(session, asset.id)
+                if updated is None:
+                    continue
+                existing_tags = tag_map.get(asset.id, [])
+                next_tags = normalize_tag_names(
+                    [*existing_tags, *normalized_tags_to_add]
+                )
+                if normalized_tags_to_remove:
+                    removal_set = set(normalized_tags_to_remove)
+                    next_tags = [tag for tag in next_tags if tag not in removal_set]
+                if summarize_audit:
+                    summarized_changes.append(
+                        (asset, updated, existing_tags, next_tags)
+                    )
+                else:
+                    _create_ip_asset_update_audit_log(
+                        session,
+                        current_user,
+                        asset,
+                        updated,
+                        tags_before=existing_tags,
+                        tags_after=next_tags,
+                    )
+                if (
+                    normalized_tags_to_add
+                    or normalized_tags_to_remove
+                    or sorted(existing_tags) != sorted(next_tags)
+                ):
+                    pending_tags[updated.id] = next_tags
+                updated_assets.append(updated)
+            if summarized_changes:
+                create_audit_log(
                     session,
-                    asset,
-                    updated,
-                    tags_before=existing_tags,
-                    tags_after=next_tags,
-                ),
-            )
-            if (
-                normalized_tags_to_add
-                or normalized_tags_to_remove
-                or sorted(existing_tags) != sorted(next_tags)
-            ):
-                set_ip_asset_tags(session, updated.id, next_tags)
-            updated_assets.append(updated)
+                    user=current_user,
+                    action="BULK_UPDATE",
+                    target_type="IP_ASSET",
+                    target_id=0,
+                    target_label=f"{len(summarized_changes)} IP assets",
+                    changes=_summarize_bulk_ip_asset_changes(
+                        session, summarized_changes
+                    ),
+                )
+        set_ip_asset_tags_bulk(session, pending_tags)
         session.commit()
     return updated_assets
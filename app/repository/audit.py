@@ -1,18 +1,131 @@
 from __future__ import annotations
 
 import sqlite3
-from typing import Optional
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Iterator, Optional
 
-from sqlalchemy import desc, func, select
+from sqlalchemy import desc, func, insert, select
 from sqlalchemy.orm import Session
 
 from app import schema as db_schema
-from app.models import AuditLog, User
+from app.models import AuditLog, IPAsset, User
 
-from ._db import session_scope, write_session_scope
+from ._asset_audit import _load_change_labels, _summarize_ip_asset_changes
+from ._db import AUDIT_BUFFER_INFO_KEY, session_scope, write_session_scope
 from .mappers import _row_to_audit_log
 
 
+@dataclass
+class _IPAssetChange:
+    existing: IPAsset
+    updated: IPAsset
+    tags_before: Optional[list[str]] = None
+    tags_after: Optional[list[str]] = None
+
+
+@dataclass
+class _PendingAuditLog:
+    user: Optional[User]
+    action: str
+    target_type: str
+    target_id: int
+    target_label: str
+    changes: Optional[str] = None
+    ip_asset_change: Optional[_IPAssetChange] = None
+
+
+class AuditBuffer:
+    """Audit rows collected inside a transaction and written in one insert.
+
+    IP asset change summaries are rendered at flush time so project and host
+    labels are resolved once for the whole batch.
+    """
+
+    def __init__(self) -> None:
+        self._pending: list[_PendingAuditLog] = []
+
+    def __len__(self) -> int:
+        return len(self._pending)
+
+    def add(self, entry: _PendingAuditLog) -> None:
+        self._pending.append(entry)
+
+    def discard_after(self, mark: int) -> None:
+        del self._pending[mark:]
+
+    def flush(self, session: Session) -> int:
+        if not self._pending:
+            return 0
+        asset_changes = [
+            entry.ip_asset_change
+            for entry in self._pending
+            if entry.ip_asset_change is not None
+        ]
+        labels = _load_change_labels(
+            session,
+            [
+                asset
+                for change in asset_changes
+                for asset in (change.existing, change.updated)
+            ],
+        )
+        rows = []
+        for entry in self._pending:
+            changes = entry.changes
+            if entry.ip_asset_change is not None:
+                changes = _summarize_ip_asset_changes(
+                    session,
+                    entry.ip_asset_change.existing,
+                    entry.ip_asset_change.updated,
+                    tags_before=entry.ip_asset_change.tags_before,
+                    tags_after=entry.ip_asset_change.tags_after,
+                    labels=labels,
+                )
+            rows.append(
+                {
+                    "user_id": entry.user.id if entry.user else None,
+                    "username": entry.user.username if entry.user else None,
+                    "target_type": entry.target_type,
+                    "target_id": entry.target_id,
+                    "target_label": entry.target_label,
+                    "action": entry.action,
+                    "changes": changes,
+                }
+            )
+        session.execute(insert(db_schema.AuditLog), rows)
+        self._pending.clear()
+        return len(rows)
+
+
+@contextmanager
+def audit_buffer_scope(session: Session) -> Iterator[AuditBuffer]:
+    """Buffer the audit rows written through ``session`` until the block ends.
+
+    Nested scopes share the outermost buffer. Rows recorded inside a
+    ``savepoint_scope`` that rolls back are dropped with it.
+    """
+    active = session.info.get(AUDIT_BUFFER_INFO_KEY)
+    if active is not None:
+        yield active
+        return
+    buffer = AuditBuffer()
+    session.info[AUDIT_BUFFER_INFO_KEY] = buffer
+    try:
+        yield buffer
+        buffer.flush(session)
+    finally:
+        session.info.pop(AUDIT_BUFFER_INFO_KEY, None)
+
+
+def _active_audit_buffer(
+    connection_or_session: sqlite3.Connection | Session,
+) -> Optional[AuditBuffer]:
+    if not isinstance(connection_or_session, Session):
+        return None
+    return connection_or_session.info.get(AUDIT_BUFFER_INFO_KEY)
+
+
 def create_audit_log(
     connection_or_session: sqlite3.Connection | Session,
     user: Optional[User],
@@ -22,6 +135,19 @@ def create_audit_log(
     target_label: str,
     changes: Optional[str] = None,
 ) -> None:
+    buffer = _active_audit_buffer(connection_or_session)
+    if buffer is not None:
+        buffer.add(
+            _PendingAuditLog(
+                user=user,
+                action=action,
+                target_type=target_type,
+                target_id=target_id,
+                target_label=target_label,
+                changes=changes,
+            )
+        )
+        return
     with write_session_scope(connection_or_session) as session:
         session.add(
             db_schema.AuditLog(
@@ -38,6 +164,51 @@ def create_audit_log(
             session.commit()
 
 
+def _create_ip_asset_update_audit_log(
+    session: Session,
+    user: Optional[User],
+    existing: IPAsset,
+    updated: IPAsset,
+    *,
+    tags_before: Optional[list[str]] = None,
+    tags_after: Optional[list[str]] = None,
+) -> None:
+    change = _IPAssetChange(
+        existing=existing,
+        updated=updated,
+        tags_before=tags_before,
+        tags_after=tags_after,
+    )
+    buffer = _active_audit_buffer(session)
+    if buffer is not None:
+        buffer.add(
+            _PendingAuditLog(
+                user=user,
+                action="UPDATE",
+                target_type="IP_ASSET",
+                target_id=updated.id,
+                target_label=updated.ip_address,
+                ip_asset_change=change,
+            )
+        )
+        return
+    create_audit_log(
+        session,
+        user=user,
+        action="UPDATE",
+        target_type="IP_ASSET",
+        target_id=updated.id,
+        target_label=updated.ip_address,
+        changes=_summarize_ip_asset_changes(
+            session,
+            existing,
+            updated,
+            tags_before=tags_before,
+            tags_after=tags_after,
+        ),
+    )
+
+
 def get_audit_logs_for_ip(
     connection_or_session: sqlite3.Connection | Session, ip_asset_id: int
 ) -> list[AuditLog]:
@@ -0,0 +1,125 @@
+from __future__ import annotations
+
+import sqlite3
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from app import schema as db_schema
+from app.models import DataVersion
+
+from ._db import session_scope
+
+
+def get_change_cursor(connection_or_session: sqlite3.Connection | Session) -> int:
+    """Return the latest committed change sequence value."""
+    with session_scope(connection_or_session) as session:
+        value = session.scalar(
+            select(db_schema.ChangeSequence.value).where(
+                db_schema.ChangeSequence.id == 1
+            )
+        )
+    return int(value or 0)
+
+
+def get_data_version(
+    connection_or_session: sqlite3.Connection | Session,
+) -> DataVersion:
+    """Return the data version and when it last moved in a single read.
+
+    The version is the change sequence, which every write to served data
+    bumps, so it also covers ranges and touch-only asset updates.
+    """
+    with session_scope(connection_or_session) as session:
+        row = session.execute(
+            select(
+                db_schema.ChangeSequence.value, db_schema.ChangeSequence.changed_at
+            ).where(db_schema.ChangeSequence.id == 1)
+        ).first()
+    if row is None:
+        return DataVersion(value=0, changed_at=None)
+    return DataVersion(value=int(row.value or 0), changed_at=row.changed_at)
+
+
+def _list_changed(session: Session, model, columns, since: int, until: int):
+    return (
+        session.execute(
+            select(*columns)
+            .where(model.change_seq > since, model.change_seq <= until)
+            .order_by(model.change_seq)
+        )
+        .mappings()
+        .all()
+    )
+
+
+def list_vendors_changed_since(
+    connection_or_session: sqlite3.Connection | Session, since: int, until: int
+) -> list[dict[str, object]]:
+    with session_scope(connection_or_session) as session:
+        rows = _list_changed(
+            session, db_schema.Vendor, (db_schema.Vendor.name,), since, until
+        )
+    return [{"name": row["name"]} for row in rows]
+
+
+def list_projects_changed_since(
+    connection_or_session: sqlite3.Connection | Session, since: int, until: int
+) -> list[dict[str, object]]:
+    with session_scope(connection_or_session) as session:
+        rows = _list_changed(
+            session,
+            db_schema.Project,
+            (
+                db_schema.Project.name,
+                db_schema.Project.description,
+                db_schema.Project.color,
+            ),
+            since,
+            until,
+        )
+    return [
+        {
+            "name": row["name"],
+            "description": row["description"],
+            "color": row["color"],
+        }
+        for row in rows
+    ]
+
+
+def list_tags_changed_since(
+    connection_or_session: sqlite3.Connection | Session, since: int, until: int
+) -> list[dict[str, object]]:
+    with session_scope(connection_or_session) as session:
+        rows = _list_changed(
+            session,
+            db_schema.Tag,
+            (db_schema.Tag.name, db_schema.Tag.color),
+            since,
+            until,
+        )
+    return [{"name": row["name"], "color": row["color"]} for row in rows]
+
+
+def list_change_tombstones(
+    connection_or_session: sqlite3.Connection | Session, since: int, until: int
+) -> dict[str, list[str]]:
+    """Return the keys deleted or renamed away in ``(since, until]`` by entity.
+
+    A key can reappear later in the same range when a record is re-created
+    or renamed back, so consumers apply deletions before upserts.
+    """
+    with session_scope(connection_or_session) as session:
+        rows = session.execute(
+            select(db_schema.ChangeTombstone.entity, db_schema.ChangeTombstone.key)
+            .where(
+                db_schema.ChangeTombstone.change_seq > since,
+                db_schema.ChangeTombstone.change_seq <= until,
+            )
+            .order_by(db_schema.ChangeTombstone.change_seq)
+        ).all()
+    deleted: dict[str, list[str]] = {}
+    for entity, key in rows:
+        deleted.setdefault(str(entity), []).append(str(key))
+    return deleted
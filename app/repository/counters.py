@@ -0,0 +1,86 @@
+from __future__ import annotations
+
+import sqlite3
+
+from sqlalchemy import delete, select, text
+from sqlalchemy.orm import Session
+
+from app import schema as db_schema
+from app.db import INVENTORY_COUNTERS_SQL
+
+from ._db import session_scope, write_session_scope
+
+MANAGEMENT_SUMMARY_COUNTERS = (
+    "active_ip_total",
+    "archived_ip_total",
+    "host_total",
+    "vendor_total",
+    "project_total",
+)
+
+
+def get_inventory_counters(
+    connection_or_session: sqlite3.Connection | Session, counter: str
+) -> dict[int, int]:
+    """Return the non-zero ``ref_id -> value`` rows of one counter."""
+    with session_scope(connection_or_session) as session:
+        rows = session.execute(
+            select(
+                db_schema.InventoryCounter.ref_id, db_schema.InventoryCounter.value
+            ).where(
+                db_schema.InventoryCounter.counter == counter,
+                db_schema.InventoryCounter.value != 0,
+            )
+        ).all()
+    return {int(ref_id): int(value) for ref_id, value in rows}
+
+
+def check_inventory_counters(
+    connection_or_session: sqlite3.Connection | Session,
+) -> list[dict[str, object]]:
+    """Compare the trigger-maintained counters with a full recount.
+
+    Returns one entry per counter row that is missing, stale or unexpected,
+    with the ``stored`` and ``expected`` values (``None`` when absent).
+    """
+    with session_scope(connection_or_session) as session:
+        stored = {
+            (str(counter), int(ref_id)): int(value)
+            for counter, ref_id, value in session.execute(
+                select(
+                    db_schema.InventoryCounter.counter,
+                    db_schema.InventoryCounter.ref_id,
+                    db_schema.InventoryCounter.value,
+                )
+            )
+        }
+        expected = {
+            (str(counter), int(ref_id)): int(value)
+            for counter, ref_id, value in session.execute(text(INVENTORY_COUNTERS_SQL))
+        }
+    return [
+        {
+            "counter": counter,
+            "ref_id": ref_id,
+            "stored": stored.get((counter, ref_id)),
+            "expected": expected.get((counter, ref_id)),
+        }
+        for counter, ref_id in sorted(stored.keys() | expected.keys())
+        if stored.get((counter, ref_id)) != expected.get((counter, ref_id))
+    ]
+
+
+def rebuild_inventory_counters(
+    connection_or_session: sqlite3.Connection | Session,
+) -> int:
+    """Recount every inventory counter and return the number of rows written."""
+    with write_session_scope(connection_or_session) as session:
+        session.execute(delete(db_schema.InventoryCounter))
+        result = session.execute(
+            text(
+                "INSERT INTO inventory_counters (counter, ref_id, value) "
+                + INVENTORY_COUNTERS_SQL
+            )
+        )
+        session.commit()
+    return int(result.rowcount or 0)
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 import sqlite3
-from typing import Iterable, Mapping, Optional, Sequence
+from typing import Iterable, Iterator, Mapping, Optional, Sequence
 
 from sqlalchemy import distinct, func, select, update, delete
 from sqlalchemy.exc import IntegrityError
@@ -9,8 +9,11 @@ from sqlalchemy.orm import Session
 
 from app import schema as db_schema
 from app.models import Host, IPAsset, IPAssetType
+from app.utils import chunked
 
 from ._db import (
+    EXPORT_FETCH_SIZE,
+    IN_CLAUSE_CHUNK_SIZE,
     reraise_as_sqlite_integrity_error,
     session_scope,
     write_session_scope,
@@ -74,6 +77,43 @@ def list_hosts(connection_or_session: sqlite3.Connection | Session) -> Iterable[
     return [_row_to_host(row) for row in rows]
 
 
+def list_host_ids_by_name(
+    connection_or_session: sqlite3.Connection | Session,
+) -> dict[str, int]:
+    with session_scope(connection_or_session) as session:
+        rows = session.execute(select(db_schema.Host.name, db_schema.Host.id)).all()
+    return {str(name): int(host_id) for name, host_id in rows}
+
+
+def list_hosts_by_ids(
+    connection_or_session: sqlite3.Connection | Session, host_ids: Iterable[int]
+) -> list[Host]:
+    hosts: list[Host] = []
+    with session_scope(connection_or_session) as session:
+        for chunk in chunked(dict.fromkeys(host_ids), IN_CLAUSE_CHUNK_SIZE):
+            rows = (
+                session.execute(
+                    select(
+                        db_schema.Host.id,
+                        db_schema.Host.name,
+                        db_schema.Host.notes,
+                        db_schema.Vendor.name.label("vendor_name"),
+                    )
+                    .select_from(db_schema.Host)
+                    .join(
+                        db_schema.Vendor,
+                        db_schema.Vendor.id == db_schema.Host.vendor_id,
+                        isouter=True,
+                    )
+                    .where(db_schema.Host.id.in_(chunk))
+                )
+                .mappings()
+                .all()
+            )
+            hosts.extend(_row_to_host(row) for row in rows)
+    return hosts
+
+
 def get_host_by_id(
     connection_or_session: sqlite3.Connection | Session, host_id: int
 ) -> Optional[Host]:
@@ -485,6 +525,97 @@ def list_hosts_with_ip_counts(
     return _host_count_row_payloads(rows, links_by_host, tags_by_host)
 
 
+def _host_first_ip_subquery(asset_type: IPAssetType):
+    return (
+        select(db_schema.IPAsset.ip_address)
+        .where(
+            db_schema.IPAsset.host_id == db_schema.Host.id,
+            db_schema.IPAsset.archived == 0,
+            db_schema.IPAsset.type == asset_type.value,
+        )
+        .order_by(
+            db_schema.IPAsset.ip_int.is_(None),
+            db_schema.IPAsset.ip_int,
+            db_schema.IPAsset.ip_address,
+        )
+        .limit(1)
+        .scalar_subquery()
+    )
+
+
+def iter_hosts_for_export(
+    connection_or_session: sqlite3.Connection | Session,
+    host_name: Optional[str] = None,
+    *,
+    fetch_size: int = EXPORT_FETCH_SIZE,
+) -> Iterator[Mapping[str, object]]:
+    """Yield host export rows by name from a streaming cursor.
+
+    Each row carries the host's vendor, its first project name and its
+    lowest OS and BMC addresses, each read by a seek on the ``host_id``
+    index rather than the counts and lists of the host listing query.
+    """
+    statement = _host_export_statement().order_by(db_schema.Host.name)
+    if host_name:
+        statement = statement.where(db_schema.Host.name == host_name)
+    with session_scope(connection_or_session) as session:
+        result = session.execute(statement.execution_options(yield_per=fetch_size))
+        yield from result.mappings()
+
+
+def iter_hosts_changed_since(
+    connection_or_session: sqlite3.Connection | Session,
+    since: int,
+    until: int,
+    *,
+    fetch_size: int = EXPORT_FETCH_SIZE,
+) -> Iterator[Mapping[str, object]]:
+    """Yield host export rows for hosts changed in ``(since, until]``.
+
+    A host is also marked changed when one of its IP assets changes, since
+    its project name and OS/BMC addresses are read from them.
+    """
+    statement = (
+        _host_export_statement()
+        .where(
+            db_schema.Host.change_seq > since,
+            db_schema.Host.change_seq <= until,
+        )
+        .order_by(db_schema.Host.change_seq)
+    )
+    with session_scope(connection_or_session) as session:
+        result = session.execute(statement.execution_options(yield_per=fetch_size))
+        yield from result.mappings()
+
+
+def _host_export_statement():
+    project_name_subquery = (
+        select(func.min(db_schema.Project.name))
+        .join(db_schema.IPAsset, db_schema.Project.id == db_schema.IPAsset.project_id)
+        .where(
+            db_schema.IPAsset.host_id == db_schema.Host.id,
+            db_schema.IPAsset.archived == 0,
+        )
+        .scalar_subquery()
+    )
+    return (
+        select(
+            db_schema.Host.name.label("name"),
+            db_schema.Host.notes.label("notes"),
+            db_schema.Vendor.name.label("vendor"),
+            project_name_subquery.label("project_name"),
+            _host_first_ip_subquery(IPAssetType.OS).label("os_ip"),
+            _host_first_ip_subquery(IPAssetType.BMC).label("bmc_ip"),
+        )
+        .select_from(db_schema.Host)
+        .join(
+            db_schema.Vendor,
+            db_schema.Vendor.id == db_schema.Host.vendor_id,
+            isouter=True,
+        )
+    )
+
+
 def count_hosts(
     connection_or_session: sqlite3.Connection | Session,
     *,
@@ -9,6 +9,7 @@ from sqlalchemy.orm import Session
 from app import schema as db_schema
 from app.models import Project, Tag, Vendor
 from app.utils import DEFAULT_PROJECT_COLOR, DEFAULT_TAG_COLOR, normalize_hex_color
+from .counters import get_inventory_counters
 from ._db import session_scope as _session_scope
 from ._db import write_session_scope as _write_session_scope
 
@@ -89,6 +90,39 @@ def list_projects(
         return [_to_project(model) for model in models]
 
 
+def list_projects_for_export(
+    connection_or_session: sqlite3.Connection | Session,
+    project_name: Optional[str] = None,
+) -> list[dict[str, object]]:
+    statement = select(
+        db_schema.Project.name,
+        db_schema.Project.description,
+        db_schema.Project.color,
+    ).order_by(db_schema.Project.name)
+    if project_name:
+        statement = statement.where(db_schema.Project.name == project_name)
+    with _session_scope(connection_or_session) as session:
+        rows = session.execute(statement).mappings().all()
+    return [
+        {
+            "name": row["name"],
+            "description": row["description"],
+            "color": row["color"],
+        }
+        for row in rows
+    ]
+
+
+def list_project_ids_by_name(
+    connection_or_session: sqlite3.Connection | Session,
+) -> dict[str, int]:
+    with _session_scope(connection_or_session) as session:
+        rows = session.execute(
+            select(db_schema.Project.name, db_schema.Project.id)
+        ).all()
+    return {str(name): int(project_id) for name, project_id in rows}
+
+
 def delete_project(
     connection_or_session: sqlite3.Connection | Session, project_id: int
 ) -> bool:
@@ -108,16 +142,7 @@ def delete_project(
 def list_project_ip_counts(
     connection_or_session: sqlite3.Connection | Session,
 ) -> dict[int, int]:
-    with _session_scope(connection_or_session) as session:
-        rows = session.execute(
-            select(db_schema.IPAsset.project_id, func.count().label("total"))
-            .where(
-                db_schema.IPAsset.project_id.is_not(None),
-                db_schema.IPAsset.archived == 0,
-            )
-            .group_by(db_schema.IPAsset.project_id)
-        ).all()
-        return {int(project_id): int(total) for project_id, total in rows}
+    return get_inventory_counters(connection_or_session, "project_ip")
 
 
 def create_vendor(
@@ -141,23 +166,18 @@ def list_vendors(
         return [_to_vendor(vendor_model) for vendor_model in vendor_models]
 
 
+def list_vendor_ids_by_name(
+    connection_or_session: sqlite3.Connection | Session,
+) -> dict[str, int]:
+    with _session_scope(connection_or_session) as session:
+        rows = session.execute(select(db_schema.Vendor.name, db_schema.Vendor.id)).all()
+    return {str(name): int(vendor_id) for name, vendor_id in rows}
+
+
 def list_vendor_ip_counts(
     connection_or_session: sqlite3.Connection | Session,
 ) -> dict[int, int]:
-    with _session_scope(connection_or_session) as session:
-        rows = session.execute(
-            select(
-                db_schema.Host.vendor_id,
-                func.count(db_schema.IPAsset.id).label("total"),
-            )
-            .join(db_schema.IPAsset, db_schema.IPAsset.host_id == db_schema.Host.id)
-            .where(
-                db_schema.Host.vendor_id.is_not(None),
-                db_schema.IPAsset.archived == 0,
-            )
-            .group_by(db_schema.Host.vendor_id)
-        ).all()
-        return {int(vendor_id): int(total) for vendor_id, total in rows}
+    return get_inventory_counters(connection_or_session, "vendor_ip")
 
 
 def get_vendor_by_id(
@@ -236,20 +256,7 @@ def list_tags(connection_or_session: sqlite3.Connection | Session) -> Iterable[T
 def list_tag_ip_counts(
     connection_or_session: sqlite3.Connection | Session,
 ) -> dict[int, int]:
-    with _session_scope(connection_or_session) as session:
-        rows = session.execute(
-            select(
-                db_schema.IPAssetTag.tag_id,
-                func.count(db_schema.IPAsset.id).label("total"),
-            )
-            .join(
-                db_schema.IPAsset,
-                db_schema.IPAsset.id == db_schema.IPAssetTag.ip_asset_id,
-            )
-            .where(db_schema.IPAsset.archived == 0)
-            .group_by(db_schema.IPAssetTag.tag_id)
-        ).all()
-        return {int(tag_id): int(total) for tag_id, total in rows}
+    return get_inventory_counters(connection_or_session, "tag_ip")
 
 
 def get_tag_by_id(
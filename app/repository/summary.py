@@ -8,33 +8,102 @@ from sqlalchemy.orm import Session
 from app import schema as db_schema
 
 from ._db import session_scope
+from .counters import MANAGEMENT_SUMMARY_COUNTERS
+from .ranges import get_ip_range_utilization
 
 
 def get_management_summary(
     connection_or_session: sqlite3.Connection | Session,
 ) -> dict[str, int]:
+    """Return the dashboard totals from the trigger-maintained counters."""
     with session_scope(connection_or_session) as session:
-        active_ip_total = session.scalar(
-            select(func.count())
+        rows = session.execute(
+            select(
+                db_schema.InventoryCounter.counter, db_schema.InventoryCounter.value
+            ).where(
+                db_schema.InventoryCounter.counter.in_(MANAGEMENT_SUMMARY_COUNTERS),
+                db_schema.InventoryCounter.ref_id == 0,
+            )
+        ).all()
+    values = {str(counter): int(value) for counter, value in rows}
+    return {counter: values.get(counter, 0) for counter in MANAGEMENT_SUMMARY_COUNTERS}
+
+
+def get_inventory_metrics(
+    connection_or_session: sqlite3.Connection | Session,
+) -> dict[str, object]:
+    """Return the /metrics inventory counts from one grouped pass per table.
+
+    IP assets are counted once, grouped by project, type and archived flag,
+    and the scalar totals are derived from those groups.
+    """
+    with session_scope(connection_or_session) as session:
+        asset_rows = session.execute(
+            select(
+                db_schema.Project.name.label("project"),
+                db_schema.IPAsset.type.label("type"),
+                db_schema.IPAsset.archived.label("archived"),
+                func.count().label("total"),
+            )
             .select_from(db_schema.IPAsset)
+            .join(
+                db_schema.Project,
+                db_schema.Project.id == db_schema.IPAsset.project_id,
+                isouter=True,
+            )
+            .group_by(
+                db_schema.IPAsset.project_id,
+                db_schema.IPAsset.type,
+                db_schema.IPAsset.archived,
+            )
+        ).all()
+        tag_rows = session.execute(
+            select(db_schema.Tag.name, func.count().label("total"))
+            .select_from(db_schema.IPAssetTag)
+            .join(db_schema.Tag, db_schema.Tag.id == db_schema.IPAssetTag.tag_id)
+            .join(
+                db_schema.IPAsset,
+                db_schema.IPAsset.id == db_schema.IPAssetTag.ip_asset_id,
+            )
             .where(db_schema.IPAsset.archived == 0)
-        )
-        archived_ip_total = session.scalar(
-            select(func.count())
-            .select_from(db_schema.IPAsset)
-            .where(db_schema.IPAsset.archived == 1)
-        )
-        host_total = session.scalar(select(func.count()).select_from(db_schema.Host))
-        vendor_total = session.scalar(
-            select(func.count()).select_from(db_schema.Vendor)
-        )
-        project_total = session.scalar(
-            select(func.count()).select_from(db_schema.Project)
-        )
+            .group_by(db_schema.IPAssetTag.tag_id)
+            .order_by(db_schema.Tag.name)
+        ).all()
+        ranges = get_ip_range_utilization(session)
+
+    totals = {
+        "total": 0,
+        "archived_total": 0,
+        "unassigned_project_total": 0,
+        "unassigned_owner_total": 0,
+        "unassigned_both_total": 0,
+    }
+    active: dict[tuple[str, str], int] = {}
+    for project, asset_type, archived, total in asset_rows:
+        totals["total"] += int(total)
+        if archived:
+            totals["archived_total"] += int(total)
+            continue
+        if project is None:
+            totals["unassigned_project_total"] += int(total)
+        key = (str(project or "unassigned"), str(asset_type))
+        active[key] = active.get(key, 0) + int(total)
     return {
-        "active_ip_total": int(active_ip_total or 0),
-        "archived_ip_total": int(archived_ip_total or 0),
-        "host_total": int(host_total or 0),
-        "vendor_total": int(vendor_total or 0),
-        "project_total": int(project_total or 0),
+        "totals": totals,
+        "active_by_project_type": [
+            {"project": project, "type": asset_type, "total": total}
+            for (project, asset_type), total in sorted(active.items())
+        ],
+        "active_by_tag": [
+            {"tag": str(name), "total": int(total)} for name, total in tag_rows
+        ],
+        "ranges": [
+            {
+                "name": row["name"],
+                "cidr": row["cidr"],
+                "total_usable": row["total_usable"],
+                "used": row["used"],
+            }
+            for row in ranges
+        ],
     }
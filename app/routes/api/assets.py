@@ -7,6 +7,7 @@ from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
 
 from app import repository
 from app.dependencies import get_connection
+from app.routes.conditional import check_data_version
 from app.utils import validate_ip_address
 
 from .dependencies import require_editor
@@ -68,6 +69,7 @@ def list_ip_assets(
     project_id: Optional[int] = None,
     asset_type: Optional[str] = Query(default=None, alias="type"),
     unassigned_only: bool = Query(default=False, alias="unassigned-only"),
+    _data_version=Depends(check_data_version),
     connection=Depends(get_connection),
 ):
     normalized_asset_type = (
@@ -88,6 +90,7 @@ def list_ip_assets(
 @router.get("/ip-assets/{ip_address}")
 def get_ip_asset(
     ip_address: str,
+    _data_version=Depends(check_data_version),
     connection=Depends(get_connection),
 ):
     asset = repository.get_ip_asset_by_ip(connection, ip_address)
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import os
 from typing import Optional
 
 from fastapi import Depends, Header, HTTPException, status
@@ -8,6 +9,8 @@ from app import auth, repository
 from app.dependencies import get_connection
 from app.models import UserRole
 
+from .utils import require_sd_token_if_configured
+
 
 def get_current_user(
     authorization: Optional[str] = Header(default=None),
@@ -31,3 +34,9 @@ def require_editor(user=Depends(get_current_user)):
     if user.role != UserRole.EDITOR:
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN)
     return user
+
+
+def require_sd_token(
+    sd_token: Optional[str] = Header(default=None, alias="X-SD-Token"),
+) -> None:
+    require_sd_token_if_configured(sd_token, os.getenv("IPOCKET_SD_TOKEN"))
@@ -4,6 +4,7 @@ from fastapi import APIRouter, Depends, HTTPException, status
 
 from app import repository
 from app.dependencies import get_connection
+from app.routes.conditional import check_data_version
 
 from .dependencies import require_editor
 from .schemas import HostCreate, HostUpdate
@@ -13,7 +14,10 @@ router = APIRouter()
 
 
 @router.get("/hosts")
-def list_hosts(connection=Depends(get_connection)):
+def list_hosts(
+    _data_version=Depends(check_data_version),
+    connection=Depends(get_connection),
+):
     hosts = repository.list_hosts(connection)
     return [host_payload(host) for host in hosts]
 
@@ -44,7 +48,11 @@ def create_host(
 
 
 @router.get("/hosts/{host_id}")
-def get_host(host_id: int, connection=Depends(get_connection)):
+def get_host(
+    host_id: int,
+    _data_version=Depends(check_data_version),
+    connection=Depends(get_connection),
+):
     host = repository.get_host_by_id(connection, host_id)
     if host is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND)
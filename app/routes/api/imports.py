@@ -1,55 +1,147 @@
 from __future__ import annotations
 
+import asyncio
+import json
+from typing import AsyncIterator, BinaryIO, Mapping
+
 from fastapi import APIRouter, Depends, File, HTTPException, Query, UploadFile, status
+from fastapi.responses import StreamingResponse
 
-from app.dependencies import get_connection
+from app.dependencies import get_connection, get_db_path
 from app.imports import BundleImporter, CsvImporter, ImportAuditContext, run_import
+from app.imports.jobs import (
+    ImportJob,
+    ImportJobQueueFullError,
+    ImportQueueFullError,
+    get_import_job,
+    run_in_import_executor,
+    submit_import_job,
+)
 from app.imports.uploads import (
-    IMPORT_UPLOAD_MAX_BYTES,
+    IMPORT_STREAMED_UPLOAD_MAX_BYTES,
+    UploadDecodeError,
     UploadTooLargeError,
+    bundle_import_options,
     describe_upload_limit,
-    read_upload_limited,
+    spool_upload_limited,
 )
 from app.models import UserRole
 
 from .dependencies import get_current_user
-from .utils import import_result_payload
+from .utils import import_job_payload, import_result_payload
 
 router = APIRouter()
 
+IMPORT_JOB_EVENT_INTERVAL_SECONDS = 0.5
+IMPORT_JOB_EVENT_HEARTBEAT_SECONDS = 15.0
+
 
 def _upload_size_detail(max_bytes: int) -> str:
     return f"Uploaded file exceeds maximum size of {describe_upload_limit(max_bytes)}."
 
 
-@router.post("/import/bundle")
-async def import_bundle_json(
-    dry_run: bool = Query(default=False, alias="dry_run"),
-    file: UploadFile = File(...),
-    connection=Depends(get_connection),
-    user=Depends(get_current_user),
-):
+def _require_apply_permission(dry_run: bool, user) -> None:
     if not dry_run and user.role != UserRole.EDITOR:
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN)
+
+
+async def _spool_upload(upload: UploadFile) -> BinaryIO | None:
+    """Spool one upload, decompressing gzip, or raise the matching HTTP error."""
     try:
-        payload = await read_upload_limited(file, max_bytes=IMPORT_UPLOAD_MAX_BYTES)
+        return await spool_upload_limited(
+            upload, max_bytes=IMPORT_STREAMED_UPLOAD_MAX_BYTES
+        )
     except UploadTooLargeError as exc:
         raise HTTPException(
             status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
-            detail=_upload_size_detail(IMPORT_UPLOAD_MAX_BYTES),
+            detail=_upload_size_detail(IMPORT_STREAMED_UPLOAD_MAX_BYTES),
         ) from exc
-    result = run_import(
-        connection,
-        BundleImporter(),
-        {"bundle": payload},
-        dry_run=dry_run,
-        audit_context=ImportAuditContext(
-            user=user,
-            source="api_import_bundle",
-            mode="apply" if not dry_run else "dry-run",
-            input_label="bundle.json",
-        ),
+    except UploadDecodeError as exc:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)
+        ) from exc
+
+
+async def _spool_bundle_upload(file: UploadFile) -> dict[str, bytes | BinaryIO]:
+    """Spool the bundle upload to a temporary file; the caller must close it."""
+    spooled = await _spool_upload(file)
+    return {"bundle": spooled if spooled is not None else b""}
+
+
+async def _spool_csv_uploads(
+    hosts_file: UploadFile | None, ip_assets_file: UploadFile | None
+) -> dict[str, BinaryIO]:
+    """Spool the CSV uploads to temporary files; the caller must close them."""
+    if hosts_file is None and ip_assets_file is None:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="CSV import requires at least one file.",
+        )
+    inputs: dict[str, BinaryIO] = {}
+    try:
+        for key, upload in (("hosts", hosts_file), ("ip_assets", ip_assets_file)):
+            if upload is None:
+                continue
+            spooled = await _spool_upload(upload)
+            if spooled is not None:
+                inputs[key] = spooled
+        if not inputs:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="CSV import requires at least one file.",
+            )
+    except BaseException:
+        _close_inputs(inputs)
+        raise
+    return inputs
+
+
+def _close_inputs(inputs: Mapping[str, bytes | BinaryIO]) -> None:
+    for value in inputs.values():
+        if not isinstance(value, bytes):
+            value.close()
+
+
+async def _run_sync_import(*args, **kwargs):
+    try:
+        return await run_in_import_executor(run_import, *args, **kwargs)
+    except ImportQueueFullError as exc:
+        raise HTTPException(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS, detail=str(exc)
+        ) from exc
+
+
+def _audit_context(user, source: str, dry_run: bool, input_label: str):
+    return ImportAuditContext(
+        user=user,
+        source=source,
+        mode="apply" if not dry_run else "dry-run",
+        input_label=input_label,
     )
+
+
+@router.post("/import/bundle")
+async def import_bundle_json(
+    dry_run: bool = Query(default=False, alias="dry_run"),
+    file: UploadFile = File(...),
+    connection=Depends(get_connection),
+    user=Depends(get_current_user),
+):
+    _require_apply_permission(dry_run, user)
+    inputs = await _spool_bundle_upload(file)
+    try:
+        result = await _run_sync_import(
+            connection,
+            BundleImporter(),
+            inputs,
+            options=bundle_import_options(file.filename, file.content_type),
+            dry_run=dry_run,
+            audit_context=_audit_context(
+                user, "api_import_bundle", dry_run, "bundle.json"
+            ),
+        )
+    finally:
+        _close_inputs(inputs)
     return import_result_payload(result)
 
 
@@ -61,53 +153,122 @@ async def import_csv_files(
     connection=Depends(get_connection),
     user=Depends(get_current_user),
 ):
-    if not dry_run and user.role != UserRole.EDITOR:
-        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN)
-    if hosts_file is None and ip_assets_file is None:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="CSV import requires at least one file.",
+    _require_apply_permission(dry_run, user)
+    inputs = await _spool_csv_uploads(hosts_file, ip_assets_file)
+    try:
+        result = await _run_sync_import(
+            connection,
+            CsvImporter(),
+            inputs,
+            dry_run=dry_run,
+            audit_context=_audit_context(user, "api_import_csv", dry_run, "csv"),
         )
-    inputs: dict[str, bytes] = {}
-    if hosts_file is not None:
-        try:
-            hosts_payload = await read_upload_limited(
-                hosts_file, max_bytes=IMPORT_UPLOAD_MAX_BYTES
-            )
-        except UploadTooLargeError as exc:
-            raise HTTPException(
-                status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
-                detail=_upload_size_detail(IMPORT_UPLOAD_MAX_BYTES),
-            ) from exc
-        if hosts_payload:
-            inputs["hosts"] = hosts_payload
-    if ip_assets_file is not None:
-        try:
-            ip_assets_payload = await read_upload_limited(
-                ip_assets_file, max_bytes=IMPORT_UPLOAD_MAX_BYTES
-            )
-        except UploadTooLargeError as exc:
-            raise HTTPException(
-                status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
-                detail=_upload_size_detail(IMPORT_UPLOAD_MAX_BYTES),
-            ) from exc
-        if ip_assets_payload:
-            inputs["ip_assets"] = ip_assets_payload
-    if not inputs:
+    finally:
+        _close_inputs(inputs)
+    return import_result_payload(result)
+
+
+def _submit_job(**kwargs) -> ImportJob:
+    try:
+        return submit_import_job(**kwargs)
+    except ImportJobQueueFullError as exc:
         raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="CSV import requires at least one file.",
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS, detail=str(exc)
+        ) from exc
+
+
+@router.post("/import/jobs/bundle", status_code=status.HTTP_202_ACCEPTED)
+async def submit_bundle_import_job(
+    dry_run: bool = Query(default=False, alias="dry_run"),
+    file: UploadFile = File(...),
+    db_path: str = Depends(get_db_path),
+    user=Depends(get_current_user),
+):
+    _require_apply_permission(dry_run, user)
+    inputs = await _spool_bundle_upload(file)
+    try:
+        job = _submit_job(
+            db_path=db_path,
+            importer=BundleImporter(),
+            inputs=inputs,
+            source="api_import_bundle",
+            options=bundle_import_options(file.filename, file.content_type),
+            dry_run=dry_run,
+            audit_context=_audit_context(
+                user, "api_import_bundle", dry_run, "bundle.json"
+            ),
+            user_id=user.id,
         )
-    result = run_import(
-        connection,
-        CsvImporter(),
-        inputs,
-        dry_run=dry_run,
-        audit_context=ImportAuditContext(
-            user=user,
+    except HTTPException:
+        _close_inputs(inputs)
+        raise
+    return import_job_payload(job)
+
+
+@router.post("/import/jobs/csv", status_code=status.HTTP_202_ACCEPTED)
+async def submit_csv_import_job(
+    dry_run: bool = Query(default=False, alias="dry_run"),
+    hosts_file: UploadFile | None = File(None, alias="hosts"),
+    ip_assets_file: UploadFile | None = File(None, alias="ip_assets"),
+    db_path: str = Depends(get_db_path),
+    user=Depends(get_current_user),
+):
+    _require_apply_permission(dry_run, user)
+    inputs = await _spool_csv_uploads(hosts_file, ip_assets_file)
+    try:
+        job = _submit_job(
+            db_path=db_path,
+            importer=CsvImporter(),
+            inputs=inputs,
             source="api_import_csv",
-            mode="apply" if not dry_run else "dry-run",
-            input_label="csv",
-        ),
+            dry_run=dry_run,
+            audit_context=_audit_context(user, "api_import_csv", dry_run, "csv"),
+            user_id=user.id,
+        )
+    except HTTPException:
+        _close_inputs(inputs)
+        raise
+    return import_job_payload(job)
+
+
+def _get_owned_job(job_id: str, user) -> ImportJob:
+    job = get_import_job(job_id)
+    if job is None or job.user_id != user.id:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND)
+    return job
+
+
+@router.get("/import/jobs/{job_id}")
+def get_import_job_status(job_id: str, user=Depends(get_current_user)):
+    return import_job_payload(_get_owned_job(job_id, user))
+
+
+@router.get("/import/jobs/{job_id}/events")
+async def stream_import_job_events(job_id: str, user=Depends(get_current_user)):
+    _get_owned_job(job_id, user)
+    return StreamingResponse(
+        _import_job_events(job_id),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
     )
-    return import_result_payload(result)
+
+
+async def _import_job_events(job_id: str) -> AsyncIterator[str]:
+    last_version = -1
+    idle_seconds = 0.0
+    while True:
+        job = get_import_job(job_id)
+        if job is None:
+            return
+        if job.version != last_version:
+            last_version = job.version
+            idle_seconds = 0.0
+            event = "result" if job.finished else "progress"
+            yield f"event: {event}\ndata: {json.dumps(import_job_payload(job))}\n\n"
+            if job.finished:
+                return
+        elif idle_seconds >= IMPORT_JOB_EVENT_HEARTBEAT_SECONDS:
+            idle_seconds = 0.0
+            yield ": keep-alive\n\n"
+        await asyncio.sleep(IMPORT_JOB_EVENT_INTERVAL_SECONDS)
+        idle_seconds += IMPORT_JOB_EVENT_INTERVAL_SECONDS
@@ -4,6 +4,7 @@ from fastapi import APIRouter, Depends, HTTPException, status
 
 from app import repository
 from app.dependencies import get_connection, get_session
+from app.routes.conditional import check_data_version
 
 from .dependencies import require_editor
 from .schemas import (
@@ -76,7 +77,10 @@ def update_project(
 
 
 @router.get("/ranges")
-def list_ranges(connection=Depends(get_connection)):
+def list_ranges(
+    _data_version=Depends(check_data_version),
+    connection=Depends(get_connection),
+):
     ranges = repository.list_ip_ranges(connection)
     return [
         {
@@ -1,19 +1,22 @@
 from __future__ import annotations
 
-import os
 from typing import Literal, Optional
 
-from fastapi import APIRouter, Depends, Header, Query
+from fastapi import APIRouter, Depends, Query
 from fastapi.responses import JSONResponse, Response
 
-from app import build_info, repository
-from app.dependencies import get_connection
+from app import build_info, metrics_cache, sd_cache
+from app.dependencies import get_db_path
+from app.models import DataVersion
+from app.routes.conditional import check_data_version, data_version_headers
 
+from .dependencies import require_sd_token
 from .utils import (
     expand_csv_query_values,
+    inventory_metrics_payload,
     metrics_payload,
     normalize_asset_type_value,
-    require_sd_token_if_configured,
+    sd_cache_metrics_payload,
 )
 
 router = APIRouter()
@@ -25,9 +28,14 @@ def health_check() -> Response:
 
 
 @router.get("/metrics")
-def metrics(connection=Depends(get_connection)) -> Response:
-    payload = repository.get_ip_asset_metrics(connection)
-    return Response(content=metrics_payload(payload), media_type="text/plain")
+def metrics(db_path: str = Depends(get_db_path)) -> Response:
+    inventory = metrics_cache.get_inventory_metrics(db_path)
+    content = (
+        metrics_payload(inventory["totals"])
+        + inventory_metrics_payload(inventory)
+        + sd_cache_metrics_payload(sd_cache.get_sd_cache_stats())
+    )
+    return Response(content=content, media_type="text/plain")
 
 
 @router.get("/sd/node")
@@ -37,19 +45,23 @@ def service_discovery_targets(
     project: Optional[list[str]] = Query(default=None),
     asset_type: Optional[list[str]] = Query(default=None, alias="type"),
     group_by: Literal["none", "project"] = Query(default="none"),
-    sd_token: Optional[str] = Header(default=None, alias="X-SD-Token"),
-    connection=Depends(get_connection),
-):
-    require_sd_token_if_configured(sd_token, os.getenv("IPOCKET_SD_TOKEN"))
+    _sd_token=Depends(require_sd_token),
+    data_version: DataVersion = Depends(check_data_version),
+    db_path: str = Depends(get_db_path),
+) -> Response:
     normalized_types = [
         normalize_asset_type_value(value)
         for value in expand_csv_query_values(asset_type)
     ]
-    return repository.list_sd_targets(
-        connection,
+    query = sd_cache.SDQuery.normalize(
         port=port,
         only_assigned=only_assigned,
         project_names=expand_csv_query_values(project),
         asset_types=normalized_types,
         group_by=group_by,
     )
+    return Response(
+        content=sd_cache.get_sd_targets_json(db_path, data_version.value, query),
+        media_type="application/json",
+        headers=data_version_headers(data_version),
+    )
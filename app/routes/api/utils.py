@@ -5,7 +5,8 @@ from typing import Optional
 
 from fastapi import HTTPException, status
 
-from app.imports.models import ImportApplyResult, ImportSummary
+from app.imports.jobs import ImportJob
+from app.imports.models import ImportApplyResult, ImportChange, ImportSummary
 from app.models import Host, IPAsset, IPAssetType
 
 
@@ -55,6 +56,54 @@ def metrics_payload(metrics: dict[str, int]) -> str:
     )
 
 
+def _metric_label_value(value: object) -> str:
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _metric_labels(**labels: object) -> str:
+    pairs = ",".join(
+        f'{name}="{_metric_label_value(value)}"' for name, value in labels.items()
+    )
+    return "{" + pairs + "}"
+
+
+def inventory_metrics_payload(inventory: dict[str, object]) -> str:
+    lines = [
+        "ipam_ip_active_total"
+        f"{_metric_labels(project=row['project'], type=row['type'])} {row['total']}"
+        for row in inventory["active_by_project_type"]
+    ]
+    lines.extend(
+        f"ipam_ip_tag_total{_metric_labels(tag=row['tag'])} {row['total']}"
+        for row in inventory["active_by_tag"]
+    )
+    for row in inventory["ranges"]:
+        labels = _metric_labels(range=row["name"], cidr=row["cidr"])
+        total_usable = int(row["total_usable"])
+        ratio = int(row["used"]) / total_usable if total_usable else 0.0
+        lines.extend(
+            [
+                f"ipam_range_used_total{labels} {row['used']}",
+                f"ipam_range_usable_total{labels} {total_usable}",
+                f"ipam_range_utilization_ratio{labels} {ratio:.6g}",
+            ]
+        )
+    lines.append("")
+    return "\n".join(lines)
+
+
+def sd_cache_metrics_payload(stats: dict[str, int]) -> str:
+    return "\n".join(
+        [
+            f"ipam_sd_cache_hits_total {stats['hits']}",
+            f"ipam_sd_cache_misses_total {stats['misses']}",
+            f"ipam_sd_cache_coalesced_total {stats['coalesced']}",
+            f"ipam_sd_cache_entries {stats['entries']}",
+            "",
+        ]
+    )
+
+
 def summary_payload(summary: ImportSummary) -> dict[str, dict[str, int]]:
     return {
         "vendors": summary.vendors.__dict__,
@@ -65,11 +114,45 @@ def summary_payload(summary: ImportSummary) -> dict[str, dict[str, int]]:
     }
 
 
+def change_payload(change: ImportChange) -> dict[str, object]:
+    return {
+        "entity": change.entity,
+        "action": change.action,
+        "key": change.key,
+        "location": change.location,
+        "fields": {
+            name: {"before": field_change.before, "after": field_change.after}
+            for name, field_change in change.fields.items()
+        },
+        "preserved_fields": change.preserved_fields,
+    }
+
+
 def import_result_payload(result: ImportApplyResult) -> dict[str, object]:
     return {
         "summary": summary_payload(result.summary),
         "errors": [issue.__dict__ for issue in result.errors],
         "warnings": [issue.__dict__ for issue in result.warnings],
+        "changes": [
+            change_payload(change)
+            for change in result.changes
+            if change.action != "skip"
+        ],
+        "catalog_load_ms": result.catalog_load_ms,
+    }
+
+
+def import_job_payload(job: ImportJob) -> dict[str, object]:
+    return {
+        "job_id": job.id,
+        "status": job.status,
+        "source": job.source,
+        "dry_run": job.dry_run,
+        "progress": dict(job.progress.__dict__),
+        "error": job.error,
+        "result": import_result_payload(job.result) if job.result else None,
+        "status_url": f"/import/jobs/{job.id}",
+        "events_url": f"/import/jobs/{job.id}/events",
     }
 
 
@@ -0,0 +1,69 @@
+from __future__ import annotations
+
+from datetime import datetime, timezone
+from email.utils import format_datetime
+from typing import Optional
+
+from fastapi import Depends, HTTPException, Request, Response, status
+
+from app import repository
+from app.dependencies import create_db_session, get_db_path
+from app.models import DataVersion
+
+
+def data_version_etag(version: DataVersion) -> str:
+    # Weak because exports stamp exported_at into otherwise identical bodies.
+    return f'W/"{version.value}"'
+
+
+def _http_date(changed_at: Optional[str]) -> Optional[str]:
+    if not changed_at:
+        return None
+    try:
+        parsed = datetime.strptime(changed_at, "%Y-%m-%d %H:%M:%S")
+    except ValueError:
+        return None
+    return format_datetime(parsed.replace(tzinfo=timezone.utc), usegmt=True)
+
+
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    opaque_tag = etag.removeprefix("W/")
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate == "*" or candidate.removeprefix("W/") == opaque_tag:
+            return True
+    return False
+
+
+def data_version_headers(version: DataVersion) -> dict[str, str]:
+    headers = {"ETag": data_version_etag(version), "Cache-Control": "no-cache"}
+    last_modified = _http_date(version.changed_at)
+    if last_modified:
+        headers["Last-Modified"] = last_modified
+    return headers
+
+
+def check_data_version(
+    request: Request,
+    response: Response,
+    db_path: str = Depends(get_db_path),
+) -> DataVersion:
+    """Answer ``If-None-Match`` from the data version before any other query.
+
+    A matching tag short-circuits with ``304``; otherwise the validators are
+    set on the dependency response, and routes that build their own
+    ``Response`` copy them with :func:`data_version_headers`. Declare this
+    after auth dependencies so a ``304`` is only ever sent to callers
+    allowed to see the body.
+    """
+    session = create_db_session(db_path)
+    try:
+        version = repository.get_data_version(session)
+    finally:
+        session.close()
+    headers = data_version_headers(version)
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match and _etag_matches(if_none_match, headers["ETag"]):
+        raise HTTPException(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    response.headers.update(headers)
+    return version
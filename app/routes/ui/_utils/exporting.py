@@ -2,40 +2,76 @@ from __future__ import annotations
 
 import csv
 import io
+import json
+import time
 import zipfile
+from collections.abc import Iterable, Iterator
 from urllib.parse import parse_qs
 
 from fastapi import Request
-from fastapi.responses import JSONResponse, Response
+from fastapi.responses import JSONResponse, Response, StreamingResponse
 
+from app.utils import chunked
 
-def _build_csv_content(headers: list[str], rows: list[dict[str, object]]) -> str:
+
+# Rows written per chunk of a streamed CSV or JSON export response.
+EXPORT_STREAM_CHUNK_ROWS = 500
+
+
+def _build_csv_content(headers: list[str], rows: Iterable[dict[str, object]]) -> str:
+    return "".join(_iter_csv_content(headers, rows))
+
+
+def _iter_csv_content(
+    headers: list[str], rows: Iterable[dict[str, object]]
+) -> Iterator[str]:
+    """Yield CSV text a header line and then a chunk of rows at a time."""
     buffer = io.StringIO()
     writer = csv.DictWriter(buffer, fieldnames=headers)
     writer.writeheader()
-    for row in rows:
-        writer.writerow(
+    for batch in chunked(rows, EXPORT_STREAM_CHUNK_ROWS):
+        writer.writerows(
             {key: "" if row.get(key) is None else row.get(key) for key in headers}
+            for row in batch
         )
-    return buffer.getvalue()
+        yield buffer.getvalue()
+        buffer.seek(0)
+        buffer.truncate()
+    if buffer.tell():
+        yield buffer.getvalue()
+
+
+def _iter_json_array(rows: Iterable[object]) -> Iterator[str]:
+    """Yield a JSON array a chunk of items at a time, encoded like JSONResponse."""
+    separator = "["
+    for batch in chunked(rows, EXPORT_STREAM_CHUNK_ROWS):
+        yield separator + ",".join(_encode_json(row) for row in batch)
+        separator = ","
+    yield "]" if separator == "," else "[]"
 
 
-def _format_ip_asset_csv_rows(rows: list[dict[str, object]]) -> list[dict[str, object]]:
-    formatted: list[dict[str, object]] = []
+def _encode_json(value: object) -> str:
+    return json.dumps(
+        value, ensure_ascii=False, allow_nan=False, indent=None, separators=(",", ":")
+    )
+
+
+def _format_ip_asset_csv_rows(
+    rows: Iterable[dict[str, object]],
+) -> Iterator[dict[str, object]]:
     for row in rows:
-        updated = dict(row)
-        tags = updated.get("tags")
+        tags = row.get("tags")
         if isinstance(tags, list):
-            updated["tags"] = ", ".join(tags)
-        formatted.append(updated)
-    return formatted
+            row = {**row, "tags": ", ".join(tags)}
+        yield row
 
 
 def _csv_response(
-    filename: str, headers: list[str], rows: list[dict[str, object]]
+    filename: str, headers: list[str], rows: Iterable[dict[str, object]]
 ) -> Response:
-    response = Response(
-        content=_build_csv_content(headers, rows), media_type="text/csv"
+    """Stream ``rows`` as CSV; ``rows`` may be a lazy iterator."""
+    response = StreamingResponse(
+        _iter_csv_content(headers, rows), media_type="text/csv"
     )
     response.headers["Content-Disposition"] = f'attachment; filename="{filename}"'
     return response
@@ -47,12 +83,65 @@ def _json_response(filename: str, payload: object) -> Response:
     return response
 
 
-def _zip_response(filename: str, files: dict[str, str]) -> Response:
-    buffer = io.BytesIO()
-    with zipfile.ZipFile(buffer, "w", compression=zipfile.ZIP_DEFLATED) as archive:
-        for file_name, content in files.items():
-            archive.writestr(file_name, content)
-    response = Response(content=buffer.getvalue(), media_type="application/zip")
+def _json_array_response(filename: str, rows: Iterable[object]) -> Response:
+    """Stream ``rows`` as a JSON array; ``rows`` may be a lazy iterator."""
+    response = StreamingResponse(_iter_json_array(rows), media_type="application/json")
+    response.headers["Content-Disposition"] = f'attachment; filename="{filename}"'
+    return response
+
+
+class _ZipStreamSink(io.RawIOBase):
+    """Unseekable sink that collects what ``zipfile`` writes until drained."""
+
+    def __init__(self) -> None:
+        self._chunks: list[bytes] = []
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data) -> int:
+        self._chunks.append(bytes(data))
+        return len(data)
+
+    def drain(self) -> bytes:
+        data = b"".join(self._chunks)
+        self._chunks.clear()
+        return data
+
+
+def _iter_zip_content(
+    members: Iterable[tuple[str, str | Iterable[str]]],
+) -> Iterator[bytes]:
+    """Yield a deflated ZIP archive while its members are still being produced.
+
+    Each member is a name and either its text or an iterator of text chunks.
+    The archive goes to an unseekable sink, so sizes and CRCs are written in
+    data descriptors after each member and only compressed output is held.
+    """
+    sink = _ZipStreamSink()
+    with zipfile.ZipFile(sink, "w", compression=zipfile.ZIP_DEFLATED) as archive:
+        for name, content in members:
+            info = zipfile.ZipInfo(name, date_time=time.localtime()[:6])
+            info.compress_type = zipfile.ZIP_DEFLATED
+            info.external_attr = 0o600 << 16
+            chunks = (content,) if isinstance(content, str) else content
+            # The member size is unknown up front; zip64 keeps >2 GiB valid.
+            with archive.open(info, "w", force_zip64=True) as member:
+                for chunk in chunks:
+                    member.write(chunk.encode("utf-8"))
+                    if data := sink.drain():
+                        yield data
+            if data := sink.drain():
+                yield data
+    yield sink.drain()
+
+
+def _zip_response(
+    filename: str, members: Iterable[tuple[str, str | Iterable[str]]] | dict[str, str]
+) -> Response:
+    """Stream a ZIP archive; ``members`` may be a lazy iterator of name/content."""
+    items = members.items() if isinstance(members, dict) else members
+    response = StreamingResponse(_iter_zip_content(items), media_type="application/zip")
     response.headers["Content-Disposition"] = f'attachment; filename="{filename}"'
     return response
 
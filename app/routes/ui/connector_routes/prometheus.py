@@ -129,6 +129,15 @@ def _run_prometheus_connector(
         query=query,
     )
     logs.append(f"Prepared {len(ip_assets)} IP assets from query results.")
+
+    bundle, bundle_warnings = build_import_bundle_from_prometheus(ip_assets)
+    result = import_prometheus_bundle_via_pipeline(
+        connection,
+        bundle=bundle,
+        user=user,
+        dry_run=dry_run,
+    )
+
     if dry_run:
         preview_limit = 20
         preview_ips = [
@@ -144,17 +153,7 @@ def _run_prometheus_connector(
                 )
         else:
             logs.append("Dry-run IP preview: no valid IPs were extracted.")
-        logs.extend(
-            _build_prometheus_dry_run_change_logs(connection, ip_assets=ip_assets)
-        )
-
-    bundle, bundle_warnings = build_import_bundle_from_prometheus(ip_assets)
-    result = import_prometheus_bundle_via_pipeline(
-        connection,
-        bundle=bundle,
-        user=user,
-        dry_run=dry_run,
-    )
+        logs.extend(_build_prometheus_dry_run_change_logs(result.changes))
 
     mode_label = "dry-run" if dry_run else "apply"
     total = result.summary.total()
@@ -1,28 +1,40 @@
 from __future__ import annotations
 
-import json
-
-from typing import Optional
+from collections.abc import Callable, Iterable, Iterator
+from contextlib import ExitStack
+from functools import partial
+from typing import BinaryIO, Optional, TypeVar
 
 from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
-from fastapi.responses import HTMLResponse, RedirectResponse, Response
+from fastapi.responses import (
+    HTMLResponse,
+    RedirectResponse,
+    Response,
+    StreamingResponse,
+)
+from sqlalchemy.orm import Session
 
 from app import exports
-from app.dependencies import get_connection
+from app.dependencies import create_db_session, get_connection, get_db_path
 from app.imports import BundleImporter, CsvImporter, ImportAuditContext, run_import
+from app.imports.jobs import ImportQueueFullError, run_in_import_executor
 from app.imports.models import ImportApplyResult, ImportSummary
 from app.imports.nmap import NmapImportResult, import_nmap_xml
 from app.imports.uploads import (
-    IMPORT_UPLOAD_MAX_BYTES,
+    IMPORT_STREAMED_UPLOAD_MAX_BYTES,
+    UploadDecodeError,
     UploadTooLargeError,
+    bundle_import_options,
     describe_upload_limit,
-    read_upload_limited,
+    spool_upload_limited,
 )
-from app.models import UserRole
+from app.models import DataVersion, IPAssetType, UserRole
+from app.routes.conditional import check_data_version, data_version_headers
 from .utils import (
-    _build_csv_content,
     _csv_response,
     _format_ip_asset_csv_rows,
+    _iter_csv_content,
+    _json_array_response,
     _json_response,
     _normalize_export_asset_type,
     _parse_multipart_form,
@@ -33,6 +45,13 @@ from .utils import (
 
 router = APIRouter()
 
+T = TypeVar("T")
+
+
+def _with_data_version(response: Response, version: DataVersion) -> Response:
+    response.headers.update(data_version_headers(version))
+    return response
+
 
 def _upload_size_error_message(max_bytes: int) -> str:
     return f"Uploaded file exceeds maximum size of {describe_upload_limit(max_bytes)}."
@@ -152,22 +171,42 @@ async def ui_import_nmap_submit(
             status_code=status.HTTP_400_BAD_REQUEST,
         )
     try:
-        payload = await read_upload_limited(upload, max_bytes=IMPORT_UPLOAD_MAX_BYTES)
+        spooled = await spool_upload_limited(
+            upload, max_bytes=IMPORT_STREAMED_UPLOAD_MAX_BYTES
+        )
     except UploadTooLargeError:
         return _render_data_ops_template(
             request,
             active_tab="import",
-            nmap_errors=[_upload_size_error_message(IMPORT_UPLOAD_MAX_BYTES)],
+            nmap_errors=[_upload_size_error_message(IMPORT_STREAMED_UPLOAD_MAX_BYTES)],
             status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
         )
-    if not payload:
+    except UploadDecodeError as exc:
+        return _render_data_ops_template(
+            request,
+            active_tab="import",
+            nmap_errors=[str(exc)],
+            status_code=status.HTTP_400_BAD_REQUEST,
+        )
+    if spooled is None:
         return _render_data_ops_template(
             request,
             active_tab="import",
             nmap_errors=["Nmap XML file is empty."],
             status_code=status.HTTP_400_BAD_REQUEST,
         )
-    result = import_nmap_xml(connection, payload, dry_run=dry_run, current_user=user)
+    with spooled:
+        try:
+            result = await run_in_import_executor(
+                import_nmap_xml, connection, spooled, dry_run=dry_run, current_user=user
+            )
+        except ImportQueueFullError as exc:
+            return _render_data_ops_template(
+                request,
+                active_tab="import",
+                nmap_errors=[str(exc)],
+                status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            )
     toast_messages = []
     if not dry_run:
         if result.errors:
@@ -206,26 +245,51 @@ async def ui_import_bundle(
             status_code=status.HTTP_400_BAD_REQUEST,
         )
     try:
-        payload = await read_upload_limited(upload, max_bytes=IMPORT_UPLOAD_MAX_BYTES)
+        spooled = await spool_upload_limited(
+            upload, max_bytes=IMPORT_STREAMED_UPLOAD_MAX_BYTES
+        )
     except UploadTooLargeError:
         return _render_data_ops_template(
             request,
             active_tab="import",
-            errors=[_upload_size_error_message(IMPORT_UPLOAD_MAX_BYTES)],
+            errors=[_upload_size_error_message(IMPORT_STREAMED_UPLOAD_MAX_BYTES)],
             status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
         )
-    result = run_import(
-        connection,
-        BundleImporter(),
-        {"bundle": payload},
-        dry_run=dry_run,
-        audit_context=ImportAuditContext(
-            user=user,
-            source="ui_import_bundle",
-            mode=mode,
-            input_label="bundle.json",
-        ),
-    )
+    except UploadDecodeError as exc:
+        return _render_data_ops_template(
+            request,
+            active_tab="import",
+            errors=[str(exc)],
+            status_code=status.HTTP_400_BAD_REQUEST,
+        )
+    with ExitStack() as stack:
+        if spooled is not None:
+            stack.callback(spooled.close)
+        try:
+            result = await run_in_import_executor(
+                run_import,
+                connection,
+                BundleImporter(),
+                {"bundle": spooled if spooled is not None else b""},
+                options=bundle_import_options(
+                    getattr(upload, "filename", None),
+                    getattr(upload, "content_type", None),
+                ),
+                dry_run=dry_run,
+                audit_context=ImportAuditContext(
+                    user=user,
+                    source="ui_import_bundle",
+                    mode=mode,
+                    input_label="bundle.json",
+                ),
+            )
+        except ImportQueueFullError as exc:
+            return _render_data_ops_template(
+                request,
+                active_tab="import",
+                errors=[str(exc)],
+                status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            )
     toast_messages = []
     if not dry_run:
         if result.errors:
@@ -264,56 +328,64 @@ async def ui_import_csv(
             errors=["Upload at least one CSV file (hosts.csv or ip-assets.csv)."],
             status_code=status.HTTP_400_BAD_REQUEST,
         )
-    inputs: dict[str, bytes] = {}
-    if hosts_file is not None:
-        try:
-            hosts_payload = await read_upload_limited(
-                hosts_file, max_bytes=IMPORT_UPLOAD_MAX_BYTES
-            )
-        except UploadTooLargeError:
+    with ExitStack() as stack:
+        inputs: dict[str, BinaryIO] = {}
+        for key, upload in (("hosts", hosts_file), ("ip_assets", ip_assets_file)):
+            if upload is None:
+                continue
+            try:
+                spooled = await spool_upload_limited(
+                    upload, max_bytes=IMPORT_STREAMED_UPLOAD_MAX_BYTES
+                )
+            except UploadTooLargeError:
+                return _render_data_ops_template(
+                    request,
+                    active_tab="import",
+                    errors=[
+                        _upload_size_error_message(IMPORT_STREAMED_UPLOAD_MAX_BYTES)
+                    ],
+                    status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+                )
+            except UploadDecodeError as exc:
+                return _render_data_ops_template(
+                    request,
+                    active_tab="import",
+                    errors=[str(exc)],
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                )
+            if spooled is not None:
+                inputs[key] = stack.enter_context(spooled)
+        if not inputs:
             return _render_data_ops_template(
                 request,
                 active_tab="import",
-                errors=[_upload_size_error_message(IMPORT_UPLOAD_MAX_BYTES)],
-                status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+                errors=[
+                    "Upload at least one non-empty CSV file "
+                    "(hosts.csv or ip-assets.csv)."
+                ],
+                status_code=status.HTTP_400_BAD_REQUEST,
             )
-        if hosts_payload:
-            inputs["hosts"] = hosts_payload
-    if ip_assets_file is not None:
         try:
-            ip_assets_payload = await read_upload_limited(
-                ip_assets_file, max_bytes=IMPORT_UPLOAD_MAX_BYTES
+            result = await run_in_import_executor(
+                run_import,
+                connection,
+                CsvImporter(),
+                inputs,
+                dry_run=dry_run,
+                audit_context=ImportAuditContext(
+                    user=user,
+                    source="ui_import_csv",
+                    mode=mode,
+                    input_label="csv",
+                ),
             )
-        except UploadTooLargeError:
+        except ImportQueueFullError as exc:
             return _render_data_ops_template(
                 request,
                 active_tab="import",
-                errors=[_upload_size_error_message(IMPORT_UPLOAD_MAX_BYTES)],
-                status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+                errors=[str(exc)],
+                status_code=status.HTTP_429_TOO_MANY_REQUESTS,
             )
-        if ip_assets_payload:
-            inputs["ip_assets"] = ip_assets_payload
-    if not inputs:
-        return _render_data_ops_template(
-            request,
-            active_tab="import",
-            errors=[
-                "Upload at least one non-empty CSV file (hosts.csv or ip-assets.csv)."
-            ],
-            status_code=status.HTTP_400_BAD_REQUEST,
-        )
-    result = run_import(
-        connection,
-        CsvImporter(),
-        inputs,
-        dry_run=dry_run,
-        audit_context=ImportAuditContext(
-            user=user,
-            source="ui_import_csv",
-            mode=mode,
-            input_label="csv",
-        ),
-    )
     toast_messages = []
     if not dry_run:
         if result.errors:
@@ -332,35 +404,69 @@ async def ui_import_csv(
     )
 
 
+_IP_ASSET_EXPORT_HEADERS = [
+    "ip_address",
+    "type",
+    "project_name",
+    "host_name",
+    "tags",
+    "notes",
+    "archived",
+    "created_at",
+    "updated_at",
+]
+_HOST_EXPORT_HEADERS = [
+    "name",
+    "notes",
+    "vendor_name",
+    "project_name",
+    "os_ip",
+    "bmc_ip",
+]
+
+
+def _stream_export_rows(
+    db_path: str, build: Callable[[Session], Iterable[T]]
+) -> Iterator[T]:
+    """Run an export in its own session for as long as the response streams.
+
+    Request-scoped connections are closed before a streamed body is sent,
+    so the session is only opened once the response starts iterating.
+    """
+    session = create_db_session(db_path)
+    try:
+        yield from build(session)
+    finally:
+        session.close()
+
+
 @router.get("/export/ip-assets.csv")
 def export_ip_assets_csv(
     include_archived: bool = Query(default=False),
     asset_type: Optional[str] = Query(default=None, alias="type"),
     project: Optional[str] = Query(default=None),
     host: Optional[str] = Query(default=None),
-    connection=Depends(get_connection),
+    db_path: str = Depends(get_db_path),
     _user=Depends(get_current_ui_user),
+    data_version: DataVersion = Depends(check_data_version),
 ) -> Response:
-    export_rows = exports.export_ip_assets(
-        connection,
-        include_archived=include_archived,
-        asset_type=_normalize_export_asset_type(asset_type),
-        project_name=project,
-        host_name=host,
+    export_rows = _stream_export_rows(
+        db_path,
+        partial(
+            exports.iter_export_ip_assets,
+            include_archived=include_archived,
+            asset_type=_normalize_export_asset_type(asset_type),
+            project_name=project,
+            host_name=host,
+        ),
     )
-    headers = [
-        "ip_address",
-        "type",
-        "project_name",
-        "host_name",
-        "tags",
-        "notes",
-        "archived",
-        "created_at",
-        "updated_at",
-    ]
-    return _csv_response(
-        "ip-assets.csv", headers, _format_ip_asset_csv_rows(export_rows)
+    return _with_data_version(
+        _csv_response(
+            "ip-assets.csv",
+            _IP_ASSET_EXPORT_HEADERS,
+            _format_ip_asset_csv_rows(export_rows),
+        ),
+        data_version,
     )
 
 
@@ -370,40 +476,58 @@ def export_ip_assets_json(
     asset_type: Optional[str] = Query(default=None, alias="type"),
     project: Optional[str] = Query(default=None),
     host: Optional[str] = Query(default=None),
-    connection=Depends(get_connection),
+    db_path: str = Depends(get_db_path),
     _user=Depends(get_current_ui_user),
+    data_version: DataVersion = Depends(check_data_version),
 ) -> Response:
-    export_rows = exports.export_ip_assets(
-        connection,
-        include_archived=include_archived,
-        asset_type=_normalize_export_asset_type(asset_type),
-        project_name=project,
-        host_name=host,
+    export_rows = _stream_export_rows(
+        db_path,
+        partial(
+            exports.iter_export_ip_assets,
+            include_archived=include_archived,
+            asset_type=_normalize_export_asset_type(asset_type),
+            project_name=project,
+            host_name=host,
+        ),
+    )
+    return _with_data_version(
+        _json_array_response("ip-assets.json", export_rows),
+        data_version,
     )
-    return _json_response("ip-assets.json", export_rows)
 
 
 @router.get("/export/hosts.csv")
 def export_hosts_csv(
     include_archived: bool = Query(default=False),
     host: Optional[str] = Query(default=None),
-    connection=Depends(get_connection),
+    db_path: str = Depends(get_db_path),
     _user=Depends(get_current_ui_user),
+    data_version: DataVersion = Depends(check_data_version),
 ) -> Response:
-    export_rows = exports.export_hosts(connection, host_name=host)
-    headers = ["name", "notes", "vendor_name", "project_name", "os_ip", "bmc_ip"]
-    return _csv_response("hosts.csv", headers, export_rows)
+    export_rows = _stream_export_rows(
+        db_path, partial(exports.iter_export_hosts, host_name=host)
+    )
+    return _with_data_version(
+        _csv_response("hosts.csv", _HOST_EXPORT_HEADERS, export_rows),
+        data_version,
+    )
 
 
 @router.get("/export/hosts.json")
 def export_hosts_json(
     include_archived: bool = Query(default=False),
     host: Optional[str] = Query(default=None),
-    connection=Depends(get_connection),
+    db_path: str = Depends(get_db_path),
     _user=Depends(get_current_ui_user),
+    data_version: DataVersion = Depends(check_data_version),
 ) -> Response:
-    export_rows = exports.export_hosts(connection, host_name=host)
-    return _json_response("hosts.json", export_rows)
+    export_rows = _stream_export_rows(
+        db_path, partial(exports.iter_export_hosts, host_name=host)
+    )
+    return _with_data_version(
+        _json_array_response("hosts.json", export_rows),
+        data_version,
+    )
 
 
 @router.get("/export/vendors.csv")
@@ -411,10 +535,14 @@ def export_vendors_csv(
     include_archived: bool = Query(default=False),
     connection=Depends(get_connection),
     _user=Depends(get_current_ui_user),
+    data_version: DataVersion = Depends(check_data_version),
 ) -> Response:
     export_rows = exports.export_vendors(connection)
     headers = ["name"]
-    return _csv_response("vendors.csv", headers, export_rows)
+    return _with_data_version(
+        _csv_response("vendors.csv", headers, export_rows),
+        data_version,
+    )
 
 
 @router.get("/export/vendors.json")
@@ -422,9 +550,13 @@ def export_vendors_json(
     include_archived: bool = Query(default=False),
     connection=Depends(get_connection),
     _user=Depends(get_current_ui_user),
+    data_version: DataVersion = Depends(check_data_version),
 ) -> Response:
     export_rows = exports.export_vendors(connection)
-    return _json_response("vendors.json", export_rows)
+    return _with_data_version(
+        _json_response("vendors.json", export_rows),
+        data_version,
+    )
 
 
 @router.get("/export/projects.csv")
@@ -433,10 +565,14 @@ def export_projects_csv(
     project: Optional[str] = Query(default=None),
     connection=Depends(get_connection),
     _user=Depends(get_current_ui_user),
+    data_version: DataVersion = Depends(check_data_version),
 ) -> Response:
     export_rows = exports.export_projects(connection, project_name=project)
     headers = ["name", "description", "color"]
-    return _csv_response("projects.csv", headers, export_rows)
+    return _with_data_version(
+        _csv_response("projects.csv", headers, export_rows),
+        data_version,
+    )
 
 
 @router.get("/export/projects.json")
@@ -445,9 +581,13 @@ def export_projects_json(
     project: Optional[str] = Query(default=None),
     connection=Depends(get_connection),
     _user=Depends(get_current_ui_user),
+    data_version: DataVersion = Depends(check_data_version),
 ) -> Response:
     export_rows = exports.export_projects(connection, project_name=project)
-    return _json_response("projects.json", export_rows)
+    return _with_data_version(
+        _json_response("projects.json", export_rows),
+        data_version,
+    )
 
 
 @router.get("/export/bundle.json")
@@ -456,18 +596,101 @@ def export_bundle_json(
     asset_type: Optional[str] = Query(default=None, alias="type"),
     project: Optional[str] = Query(default=None),
     host: Optional[str] = Query(default=None),
-    connection=Depends(get_connection),
+    db_path: str = Depends(get_db_path),
     _user=Depends(get_current_ui_user),
+    data_version: DataVersion = Depends(check_data_version),
 ) -> Response:
-    normalized_type = _normalize_export_asset_type(asset_type)
-    bundle = exports.export_bundle(
-        connection,
-        include_archived=include_archived,
-        asset_type=normalized_type,
-        project_name=project,
-        host_name=host,
+    bundle_json = _stream_export_rows(
+        db_path,
+        partial(
+            exports.iter_export_bundle_json,
+            include_archived=include_archived,
+            asset_type=_normalize_export_asset_type(asset_type),
+            project_name=project,
+            host_name=host,
+        ),
     )
-    return _json_response("bundle.json", bundle)
+    response = StreamingResponse(bundle_json, media_type="application/json")
+    response.headers["Content-Disposition"] = 'attachment; filename="bundle.json"'
+    return _with_data_version(response, data_version)
+
+
+@router.get("/export/changes")
+def export_changes(
+    since: int = Query(default=0, ge=0),
+    db_path: str = Depends(get_db_path),
+    _user=Depends(get_current_ui_user),
+    data_version: DataVersion = Depends(check_data_version),
+) -> Response:
+    changes_json = _stream_export_rows(
+        db_path, partial(exports.iter_export_changes_json, since=since)
+    )
+    return _with_data_version(
+        StreamingResponse(changes_json, media_type="application/json"),
+        data_version,
+    )
+
+
+def _bundle_zip_members(
+    db_path: str,
+    *,
+    include_archived: bool,
+    asset_type: Optional[IPAssetType],
+    project_name: Optional[str],
+    host_name: Optional[str],
+) -> Iterator[tuple[str, Iterable[str]]]:
+    """Yield each bundle.zip member as a name and a lazy text generator.
+
+    Members are consumed one after another, so a single session serves all
+    of them for the lifetime of the response.
+    """
+    session = create_db_session(db_path)
+    try:
+        yield (
+            "bundle.json",
+            exports.iter_export_bundle_json(
+                session,
+                include_archived=include_archived,
+                asset_type=asset_type,
+                project_name=project_name,
+                host_name=host_name,
+            ),
+        )
+        yield (
+            "ip-assets.csv",
+            _iter_csv_content(
+                _IP_ASSET_EXPORT_HEADERS,
+                _format_ip_asset_csv_rows(
+                    exports.iter_export_ip_assets(
+                        session,
+                        include_archived=include_archived,
+                        asset_type=asset_type,
+                        project_name=project_name,
+                        host_name=host_name,
+                    )
+                ),
+            ),
+        )
+        yield (
+            "projects.csv",
+            _iter_csv_content(
+                ["name", "description", "color"],
+                exports.export_projects(session, project_name=project_name),
+            ),
+        )
+        yield (
+            "hosts.csv",
+            _iter_csv_content(
+                _HOST_EXPORT_HEADERS,
+                exports.iter_export_hosts(session, host_name=host_name),
+            ),
+        )
+        yield (
+            "vendors.csv",
+            _iter_csv_content(["name"], exports.export_vendors(session)),
+        )
+    finally:
+        session.close()
 
 
 @router.get("/export/bundle.zip")
@@ -476,48 +699,18 @@ def export_bundle_zip(
     asset_type: Optional[str] = Query(default=None, alias="type"),
     project: Optional[str] = Query(default=None),
     host: Optional[str] = Query(default=None),
-    connection=Depends(get_connection),
+    db_path: str = Depends(get_db_path),
     _user=Depends(get_current_ui_user),
+    data_version: DataVersion = Depends(check_data_version),
 ) -> Response:
-    normalized_type = _normalize_export_asset_type(asset_type)
-    ip_assets = exports.export_ip_assets(
-        connection,
+    members = _bundle_zip_members(
+        db_path,
         include_archived=include_archived,
-        asset_type=normalized_type,
+        asset_type=_normalize_export_asset_type(asset_type),
         project_name=project,
         host_name=host,
     )
-    projects = exports.export_projects(connection, project_name=project)
-    hosts = exports.export_hosts(connection, host_name=host)
-    vendors = exports.export_vendors(connection)
-    bundle = exports.export_bundle(
-        connection,
-        include_archived=include_archived,
-        asset_type=normalized_type,
-        project_name=project,
-        host_name=host,
+    return _with_data_version(
+        _zip_response("bundle.zip", members),
+        data_version,
     )
-    files = {
-        "bundle.json": json.dumps(bundle),
-        "ip-assets.csv": _build_csv_content(
-            [
-                "ip_address",
-                "type",
-                "project_name",
-                "host_name",
-                "tags",
-                "notes",
-                "archived",
-                "created_at",
-                "updated_at",
-            ],
-            _format_ip_asset_csv_rows(ip_assets),
-        ),
-        "projects.csv": _build_csv_content(["name", "description", "color"], projects),
-        "hosts.csv": _build_csv_content(
-            ["name", "notes", "vendor_name", "project_name", "os_ip", "bmc_ip"],
-            hosts,
-        ),
-        "vendors.csv": _build_csv_content(["name"], vendors),
-    }
-    return _zip_response("bundle.zip", files)
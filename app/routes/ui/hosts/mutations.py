@@ -9,6 +9,7 @@ from fastapi.responses import HTMLResponse, Response
 
 from app import repository
 from app.dependencies import get_connection
+from app.environment import use_bulk_audit_summary
 from app.models import IPAssetType
 from app.routes.ui.utils import (
     _collect_inline_ip_errors,
@@ -331,6 +332,7 @@ async def ui_edit_host(
                         asset_ids,
                         project_id=project_id,
                         set_project_id=True,
+                        summarize_audit=use_bulk_audit_summary(),
                     )
         for ip_address, asset_type in inline_assets_to_create:
             repository.create_ip_asset(
@@ -10,6 +10,7 @@ from fastapi.responses import HTMLResponse, JSONResponse, RedirectResponse
 
 from app import repository
 from app.dependencies import get_connection
+from app.environment import use_bulk_audit_summary
 from app.models import IPAssetType
 from app.routes.ui.utils import (
     _append_query_param,
@@ -125,6 +126,7 @@ async def ui_bulk_edit_ip_assets(
         tags_to_add=tags_to_add,
         tags_to_remove=tags_to_remove,
         current_user=user,
+        summarize_audit=use_bulk_audit_summary(),
     )
     success_message = f"Updated {len(updated_assets)} IP assets."
     return RedirectResponse(
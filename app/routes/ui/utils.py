@@ -11,6 +11,8 @@ from ._utils.exporting import (
     _build_csv_content as _build_csv_content,
     _csv_response as _csv_response,
     _format_ip_asset_csv_rows as _format_ip_asset_csv_rows,
+    _iter_csv_content as _iter_csv_content,
+    _json_array_response as _json_array_response,
     _json_response as _json_response,
     _parse_form_data as _parse_form_data,
     _parse_multipart_form as _parse_multipart_form,
@@ -86,8 +88,10 @@ __all__ = [
     "_normalize_export_asset_type",
     "_build_csv_content",
     "_format_ip_asset_csv_rows",
+    "_iter_csv_content",
     "_csv_response",
     "_json_response",
+    "_json_array_response",
     "_zip_response",
     "_build_asset_view_models",
     "_parse_form_data",
@@ -21,6 +21,7 @@ class Project(Base):
     name = Column(Text, nullable=False, unique=True)
     description = Column(Text)
     color = Column(Text, nullable=False, server_default=text("'#94a3b8'"))
+    change_seq = Column(Integer, index=True)
 
 
 class User(Base):
@@ -57,6 +58,7 @@ class Vendor(Base):
     name = Column(Text, nullable=False, unique=True)
     created_at = Column(Text, nullable=False, server_default=text("CURRENT_TIMESTAMP"))
     updated_at = Column(Text, nullable=False, server_default=text("CURRENT_TIMESTAMP"))
+    change_seq = Column(Integer, index=True)
 
 
 class Tag(Base):
@@ -67,6 +69,7 @@ class Tag(Base):
     color = Column(Text, nullable=False, server_default=text("'#e2e8f0'"))
     created_at = Column(Text, nullable=False, server_default=text("CURRENT_TIMESTAMP"))
     updated_at = Column(Text, nullable=False, server_default=text("CURRENT_TIMESTAMP"))
+    change_seq = Column(Integer, index=True)
 
 
 class IPAssetTag(Base):
@@ -93,6 +96,7 @@ class Host(Base):
     vendor_id = Column(Integer, ForeignKey("vendors.id"))
     created_at = Column(Text, nullable=False, server_default=text("CURRENT_TIMESTAMP"))
     updated_at = Column(Text, nullable=False, server_default=text("CURRENT_TIMESTAMP"))
+    change_seq = Column(Integer, index=True)
 
 
 class IPAsset(Base):
@@ -106,8 +110,10 @@ class IPAsset(Base):
     host_id = Column(Integer, ForeignKey("hosts.id"))
     notes = Column(Text)
     archived = Column(Integer, nullable=False, server_default=text("0"))
+    import_fingerprint = Column(Text, nullable=True)
     created_at = Column(Text, nullable=False, server_default=text("CURRENT_TIMESTAMP"))
     updated_at = Column(Text, nullable=False, server_default=text("CURRENT_TIMESTAMP"))
+    change_seq = Column(Integer, index=True)
 
     __table_args__ = (
         CheckConstraint(
@@ -139,3 +145,33 @@ class AuditLog(Base):
     action = Column(Text, nullable=False)
     changes = Column(Text)
     created_at = Column(Text, nullable=False, server_default=text("CURRENT_TIMESTAMP"))
+
+
+class ChangeSequence(Base):
+    __tablename__ = "change_sequence"
+
+    id = Column(Integer, primary_key=True)
+    value = Column(Integer, nullable=False)
+    changed_at = Column(Text)
+
+    __table_args__ = (CheckConstraint("id = 1", name="ck_change_sequence_single_row"),)
+
+
+class InventoryCounter(Base):
+    __tablename__ = "inventory_counters"
+
+    counter = Column(Text, primary_key=True)
+    ref_id = Column(Integer, primary_key=True, server_default="0")
+    value = Column(Integer, nullable=False, server_default="0")
+
+    __table_args__ = {"sqlite_with_rowid": False}
+
+
+class ChangeTombstone(Base):
+    __tablename__ = "change_tombstones"
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    entity = Column(Text, nullable=False)
+    key = Column(Text, nullable=False)
+    change_seq = Column(Integer, nullable=False, index=True)
+    deleted_at = Column(Text, nullable=False, server_default=text("CURRENT_TIMESTAMP"))
@@ -0,0 +1,149 @@
+from __future__ import annotations
+
+import json
+import threading
+from collections import OrderedDict
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from typing import Optional
+
+from app import repository
+from app.dependencies import create_db_session
+from app.models import IPAssetType
+
+# Each Prometheus server polls with its own parameter set, so a few hundred
+# entries cover every distinct scrape config with room to spare.
+SD_CACHE_MAX_ENTRIES = 256
+
+_SD_CACHE_LOCK = threading.Lock()
+_SD_CACHE: OrderedDict[tuple[str, int, SDQuery], bytes] = OrderedDict()
+_SD_INFLIGHT: dict[tuple[str, int, SDQuery], _SDFlight] = {}
+_SD_CACHE_STATS = {"hits": 0, "misses": 0, "coalesced": 0}
+
+
+@dataclass(frozen=True)
+class SDQuery:
+    port: int
+    only_assigned: bool
+    project_names: tuple[str, ...]
+    asset_types: tuple[IPAssetType, ...]
+    group_by: str
+
+    @classmethod
+    def normalize(
+        cls,
+        *,
+        port: int,
+        only_assigned: bool,
+        project_names: Optional[list[str]],
+        asset_types: Optional[list[IPAssetType]],
+        group_by: str,
+    ) -> SDQuery:
+        """Build a cache key that ignores the order and repetition of filters."""
+        return cls(
+            port=port,
+            only_assigned=only_assigned,
+            project_names=tuple(sorted(set(project_names or []))),
+            asset_types=tuple(
+                sorted(set(asset_types or []), key=lambda value: value.value)
+            ),
+            group_by=group_by,
+        )
+
+
+@dataclass
+class _SDFlight:
+    done: threading.Event = field(default_factory=threading.Event)
+    payload: Optional[bytes] = None
+    error: Optional[BaseException] = None
+
+
+def render_sd_targets(db_path: str, query: SDQuery) -> bytes:
+    session = create_db_session(db_path)
+    try:
+        groups = repository.list_sd_targets(
+            session,
+            port=query.port,
+            only_assigned=query.only_assigned,
+            project_names=list(query.project_names),
+            asset_types=list(query.asset_types),
+            group_by=query.group_by,
+        )
+    finally:
+        session.close()
+    return json.dumps(groups, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def get_sd_targets_json(
+    db_path: str,
+    data_version: int,
+    query: SDQuery,
+    *,
+    render: Callable[[str, SDQuery], bytes] = render_sd_targets,
+) -> bytes:
+    """Return the serialized SD response for ``query`` at ``data_version``.
+
+    Entries are keyed on the data version, so any write makes them
+    unreachable and the next request recomputes. Concurrent misses for the
+    same key wait for the first caller's result instead of each querying.
+    """
+    key = (db_path, data_version, query)
+    with _SD_CACHE_LOCK:
+        payload = _SD_CACHE.get(key)
+        if payload is not None:
+            _SD_CACHE.move_to_end(key)
+            _SD_CACHE_STATS["hits"] += 1
+            return payload
+        flight = _SD_INFLIGHT.get(key)
+        leader = flight is None
+        if leader:
+            flight = _SDFlight()
+            _SD_INFLIGHT[key] = flight
+            _SD_CACHE_STATS["misses"] += 1
+        else:
+            _SD_CACHE_STATS["coalesced"] += 1
+
+    if not leader:
+        flight.done.wait()
+        if flight.error is not None:
+            raise flight.error
+        return flight.payload
+
+    try:
+        flight.payload = render(db_path, query)
+    except BaseException as exc:
+        flight.error = exc
+        raise
+    finally:
+        with _SD_CACHE_LOCK:
+            _SD_INFLIGHT.pop(key, None)
+            if flight.payload is not None:
+                _store_sd_payload(key, flight.payload)
+        flight.done.set()
+    return flight.payload
+
+
+def _store_sd_payload(key: tuple[str, int, SDQuery], payload: bytes) -> None:
+    db_path, data_version, _query = key
+    stale_keys = [
+        cached_key
+        for cached_key in _SD_CACHE
+        if cached_key[0] == db_path and cached_key[1] < data_version
+    ]
+    for stale_key in stale_keys:
+        del _SD_CACHE[stale_key]
+    _SD_CACHE[key] = payload
+    while len(_SD_CACHE) > SD_CACHE_MAX_ENTRIES:
+        _SD_CACHE.popitem(last=False)
+
+
+def get_sd_cache_stats() -> dict[str, int]:
+    with _SD_CACHE_LOCK:
+        return {**_SD_CACHE_STATS, "entries": len(_SD_CACHE)}
+
+
+def clear_sd_cache() -> None:
+    with _SD_CACHE_LOCK:
+        _SD_CACHE.clear()
+        for name in _SD_CACHE_STATS:
+            _SD_CACHE_STATS[name] = 0
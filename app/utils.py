@@ -2,11 +2,16 @@ from __future__ import annotations
 
 import colorsys
 import ipaddress
+import itertools
 import random
 import re
+from collections.abc import Iterable, Iterator
+from typing import TypeVar
 
 from fastapi import HTTPException, status
 
+T = TypeVar("T")
+
 
 def validate_ip_address(value: str) -> None:
     try:
@@ -101,3 +106,15 @@ def normalize_tag_names(values: list[str]) -> list[str]:
         seen.add(normalized)
         normalized_tags.append(normalized)
     return normalized_tags
+
+
+def chunked(items: Iterable[T], size: int) -> Iterator[list[T]]:
+    """Yield lists of up to ``size`` items; a non-positive size yields one list."""
+    if size <= 0:
+        collected = list(items)
+        if collected:
+            yield collected
+        return
+    iterator = iter(items)
+    while batch := list(itertools.islice(iterator, size)):
+        yield batch
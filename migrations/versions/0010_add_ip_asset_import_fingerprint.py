@@ -0,0 +1,83 @@
+"""add_ip_asset_import_fingerprint
+
+Revision ID: 0010_add_ip_asset_import_fingerprint
+Revises: 0009_add_ip_int_column
+Create Date: 2026-03-02 00:00:00.000000
+"""
+
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0010_add_ip_asset_import_fingerprint"
+down_revision = "0009_add_ip_int_column"
+branch_labels = None
+depends_on = None
+
+# The fingerprint is only trustworthy while the asset still looks exactly as
+# the import left it, so any other change to its fields or tags clears it.
+TRIGGERS = {
+    "trg_ip_assets_clear_import_fingerprint": """
+        CREATE TRIGGER trg_ip_assets_clear_import_fingerprint
+        AFTER UPDATE OF type, project_id, host_id, notes, archived ON ip_assets
+        FOR EACH ROW
+        WHEN NEW.import_fingerprint IS NOT NULL
+            AND NEW.import_fingerprint IS OLD.import_fingerprint
+            AND (
+                NEW.type IS NOT OLD.type
+                OR NEW.project_id IS NOT OLD.project_id
+                OR NEW.host_id IS NOT OLD.host_id
+                OR NEW.notes IS NOT OLD.notes
+                OR NEW.archived IS NOT OLD.archived
+            )
+        BEGIN
+            UPDATE ip_assets SET import_fingerprint = NULL WHERE id = NEW.id;
+        END
+    """,
+    "trg_ip_asset_tags_insert_clear_import_fingerprint": """
+        CREATE TRIGGER trg_ip_asset_tags_insert_clear_import_fingerprint
+        AFTER INSERT ON ip_asset_tags
+        FOR EACH ROW
+        BEGIN
+            UPDATE ip_assets SET import_fingerprint = NULL
+            WHERE id = NEW.ip_asset_id AND import_fingerprint IS NOT NULL;
+        END
+    """,
+    "trg_ip_asset_tags_delete_clear_import_fingerprint": """
+        CREATE TRIGGER trg_ip_asset_tags_delete_clear_import_fingerprint
+        AFTER DELETE ON ip_asset_tags
+        FOR EACH ROW
+        BEGIN
+            UPDATE ip_assets SET import_fingerprint = NULL
+            WHERE id = OLD.ip_asset_id AND import_fingerprint IS NOT NULL;
+        END
+    """,
+    "trg_tags_rename_clear_import_fingerprint": """
+        CREATE TRIGGER trg_tags_rename_clear_import_fingerprint
+        AFTER UPDATE OF name ON tags
+        FOR EACH ROW
+        WHEN NEW.name IS NOT OLD.name
+        BEGIN
+            UPDATE ip_assets SET import_fingerprint = NULL
+            WHERE import_fingerprint IS NOT NULL
+                AND id IN (
+                    SELECT ip_asset_id FROM ip_asset_tags WHERE tag_id = NEW.id
+                );
+        END
+    """,
+}
+
+
+def upgrade() -> None:
+    with op.batch_alter_table("ip_assets") as batch_op:
+        batch_op.add_column(sa.Column("import_fingerprint", sa.Text(), nullable=True))
+    for statement in TRIGGERS.values():
+        op.execute(statement)
+
+
+def downgrade() -> None:
+    for name in TRIGGERS:
+        op.execute(f"DROP TRIGGER IF EXISTS {name}")
+    with op.batch_alter_table("ip_assets") as batch_op:
+        batch_op.drop_column("import_fingerprint")
@@ -0,0 +1,27 @@
+"""add_ip_asset_host_index
+
+Revision ID: 0011_add_ip_asset_host_index
+Revises: 0010_add_ip_asset_import_fingerprint
+Create Date: 2026-03-09 00:00:00.000000
+"""
+
+from __future__ import annotations
+
+from alembic import op
+
+revision = "0011_add_ip_asset_host_index"
+down_revision = "0010_add_ip_asset_import_fingerprint"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_ip_assets_host_archived_type_ip_int",
+        "ip_assets",
+        ["host_id", "archived", "type", "ip_int"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_ip_assets_host_archived_type_ip_int", table_name="ip_assets")
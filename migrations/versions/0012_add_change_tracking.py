@@ -0,0 +1,202 @@
+"""add_change_tracking
+
+Revision ID: 0012_add_change_tracking
+Revises: 0011_add_ip_asset_host_index
+Create Date: 2026-03-16 00:00:00.000000
+"""
+
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0012_add_change_tracking"
+down_revision = "0011_add_ip_asset_host_index"
+branch_labels = None
+depends_on = None
+
+# Tracked table -> (entity name, key column, columns whose change is exported).
+TRACKED_TABLES = {
+    "vendors": ("vendor", "name", ("name",)),
+    "projects": ("project", "name", ("name", "description", "color")),
+    "tags": ("tag", "name", ("name", "color")),
+    "hosts": ("host", "name", ("name", "notes", "vendor_id")),
+    "ip_assets": (
+        "ip_asset",
+        "ip_address",
+        ("ip_address", "type", "project_id", "host_id", "notes", "archived"),
+    ),
+}
+CURRENT_CHANGE_SEQ = "(SELECT value FROM change_sequence WHERE id = 1)"
+# Rows whose exported form embeds another row's data are stamped along with
+# it; each statement lists the tables it needs.
+DEPENDENTS = {
+    ("vendors", "UPDATE"): (
+        (
+            {"hosts"},
+            "UPDATE hosts SET change_seq = {seq} "
+            "WHERE vendor_id = NEW.id AND NEW.name IS NOT OLD.name",
+        ),
+    ),
+    ("projects", "UPDATE"): (
+        (
+            {"ip_assets"},
+            "UPDATE ip_assets SET change_seq = {seq} "
+            "WHERE project_id = NEW.id AND NEW.name IS NOT OLD.name",
+        ),
+        (
+            {"hosts", "ip_assets"},
+            "UPDATE hosts SET change_seq = {seq} WHERE NEW.name IS NOT OLD.name "
+            "AND id IN (SELECT host_id FROM ip_assets WHERE project_id = NEW.id)",
+        ),
+    ),
+    ("tags", "UPDATE"): (
+        (
+            {"ip_assets", "ip_asset_tags"},
+            "UPDATE ip_assets SET change_seq = {seq} WHERE NEW.name IS NOT OLD.name "
+            "AND id IN (SELECT ip_asset_id FROM ip_asset_tags WHERE tag_id = NEW.id)",
+        ),
+    ),
+    ("hosts", "UPDATE"): (
+        (
+            {"ip_assets"},
+            "UPDATE ip_assets SET change_seq = {seq} "
+            "WHERE host_id = NEW.id AND NEW.name IS NOT OLD.name",
+        ),
+    ),
+    ("ip_assets", "INSERT"): (
+        ({"hosts"}, "UPDATE hosts SET change_seq = {seq} WHERE id = NEW.host_id"),
+    ),
+    ("ip_assets", "UPDATE"): (
+        (
+            {"hosts"},
+            "UPDATE hosts SET change_seq = {seq} "
+            "WHERE id IN (OLD.host_id, NEW.host_id)",
+        ),
+    ),
+    ("ip_assets", "DELETE"): (
+        ({"hosts"}, "UPDATE hosts SET change_seq = {seq} WHERE id = OLD.host_id"),
+    ),
+}
+
+
+def change_tracking_triggers(tables: set[str]) -> dict[str, str]:
+    triggers: dict[str, str] = {}
+    for table, (entity, key, columns) in TRACKED_TABLES.items():
+        if table not in tables:
+            continue
+        for event in ("INSERT", "UPDATE", "DELETE"):
+            body = ["UPDATE change_sequence SET value = value + 1 WHERE id = 1"]
+            if event == "DELETE":
+                body.append(_tombstone_statement(entity, key))
+            else:
+                body.append(
+                    f"UPDATE {table} SET change_seq = {CURRENT_CHANGE_SEQ} "
+                    "WHERE id = NEW.id"
+                )
+            if event == "UPDATE":
+                body.append(
+                    _tombstone_statement(entity, key)
+                    + f" WHERE NEW.{key} IS NOT OLD.{key}"
+                )
+            body.extend(
+                statement.format(seq=CURRENT_CHANGE_SEQ)
+                for required, statement in DEPENDENTS.get((table, event), ())
+                if required <= tables
+            )
+            name = f"trg_{table}_{event.lower()}_change_seq"
+            if event == "UPDATE":
+                # Writes that leave every exported column as it was are skipped.
+                triggers[name] = _trigger_sql(
+                    name,
+                    f"UPDATE OF {', '.join(columns)}",
+                    table,
+                    body,
+                    when=" OR ".join(
+                        f"NEW.{column} IS NOT OLD.{column}" for column in columns
+                    ),
+                )
+            else:
+                triggers[name] = _trigger_sql(name, event, table, body)
+    if {"ip_assets", "ip_asset_tags"} <= tables:
+        for event, row in (("INSERT", "NEW"), ("DELETE", "OLD")):
+            name = f"trg_ip_asset_tags_{event.lower()}_change_seq"
+            triggers[name] = _trigger_sql(
+                name,
+                event,
+                "ip_asset_tags",
+                [
+                    "UPDATE change_sequence SET value = value + 1 WHERE id = 1",
+                    f"UPDATE ip_assets SET change_seq = {CURRENT_CHANGE_SEQ} "
+                    f"WHERE id = {row}.ip_asset_id",
+                ],
+            )
+    return triggers
+
+
+def _tombstone_statement(entity: str, key: str) -> str:
+    return (
+        "INSERT INTO change_tombstones (entity, key, change_seq) "
+        f"SELECT '{entity}', OLD.{key}, {CURRENT_CHANGE_SEQ}"
+    )
+
+
+def _trigger_sql(
+    name: str, event: str, table: str, body: list[str], when: str | None = None
+) -> str:
+    condition = f"WHEN {when}\n" if when else ""
+    statements = "".join(f"    {statement};\n" for statement in body)
+    return (
+        f"CREATE TRIGGER {name}\n"
+        f"AFTER {event} ON {table}\n"
+        f"FOR EACH ROW\n{condition}BEGIN\n{statements}END"
+    )
+
+
+ALL_TABLES = set(TRACKED_TABLES) | {"ip_asset_tags"}
+
+
+def upgrade() -> None:
+    op.create_table(
+        "change_sequence",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("value", sa.Integer(), nullable=False),
+        sa.CheckConstraint("id = 1", name="ck_change_sequence_single_row"),
+    )
+    op.execute("INSERT INTO change_sequence (id, value) VALUES (1, 1)")
+    op.create_table(
+        "change_tombstones",
+        sa.Column("id", sa.Integer(), primary_key=True, autoincrement=True),
+        sa.Column("entity", sa.Text(), nullable=False),
+        sa.Column("key", sa.Text(), nullable=False),
+        sa.Column("change_seq", sa.Integer(), nullable=False),
+        sa.Column(
+            "deleted_at",
+            sa.Text(),
+            nullable=False,
+            server_default=sa.text("CURRENT_TIMESTAMP"),
+        ),
+    )
+    op.create_index(
+        "ix_change_tombstones_change_seq", "change_tombstones", ["change_seq"]
+    )
+    # Existing rows share the first sequence value, so a sync from 0 sees them.
+    for table in TRACKED_TABLES:
+        with op.batch_alter_table(table) as batch_op:
+            batch_op.add_column(sa.Column("change_seq", sa.Integer(), nullable=True))
+        op.execute(f"UPDATE {table} SET change_seq = 1")
+        op.create_index(f"ix_{table}_change_seq", table, ["change_seq"])
+    for statement in change_tracking_triggers(ALL_TABLES).values():
+        op.execute(statement)
+
+
+def downgrade() -> None:
+    for name in change_tracking_triggers(ALL_TABLES):
+        op.execute(f"DROP TRIGGER IF EXISTS {name}")
+    for table in TRACKED_TABLES:
+        op.drop_index(f"ix_{table}_change_seq", table_name=table)
+        with op.batch_alter_table(table) as batch_op:
+            batch_op.drop_column("change_seq")
+    op.drop_index("ix_change_tombstones_change_seq", table_name="change_tombstones")
+    op.drop_table("change_tombstones")
+    op.drop_table("change_sequence")
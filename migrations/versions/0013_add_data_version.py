@@ -0,0 +1,72 @@
+"""add_data_version
+
+Revision ID: 0013_add_data_version
+Revises: 0012_add_change_tracking
+Create Date: 2026-03-23 00:00:00.000000
+"""
+
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0013_add_data_version"
+down_revision = "0012_add_change_tracking"
+branch_labels = None
+depends_on = None
+
+BUMP_DATA_VERSION = "UPDATE change_sequence SET value = value + 1 WHERE id = 1"
+# Columns that only bump the data version: ranges have no change feed, and
+# ip_assets.updated_at is served by the API but not exported.
+TRIGGERS = {
+    "trg_ip_ranges_insert_data_version": (
+        "CREATE TRIGGER trg_ip_ranges_insert_data_version\n"
+        "AFTER INSERT ON ip_ranges\n"
+        "FOR EACH ROW\n"
+        f"BEGIN\n    {BUMP_DATA_VERSION};\nEND"
+    ),
+    "trg_ip_ranges_update_data_version": (
+        "CREATE TRIGGER trg_ip_ranges_update_data_version\n"
+        "AFTER UPDATE OF name, cidr, notes, updated_at ON ip_ranges\n"
+        "FOR EACH ROW\n"
+        "WHEN NEW.name IS NOT OLD.name OR NEW.cidr IS NOT OLD.cidr "
+        "OR NEW.notes IS NOT OLD.notes OR NEW.updated_at IS NOT OLD.updated_at\n"
+        f"BEGIN\n    {BUMP_DATA_VERSION};\nEND"
+    ),
+    "trg_ip_ranges_delete_data_version": (
+        "CREATE TRIGGER trg_ip_ranges_delete_data_version\n"
+        "AFTER DELETE ON ip_ranges\n"
+        "FOR EACH ROW\n"
+        f"BEGIN\n    {BUMP_DATA_VERSION};\nEND"
+    ),
+    "trg_ip_assets_update_data_version": (
+        "CREATE TRIGGER trg_ip_assets_update_data_version\n"
+        "AFTER UPDATE OF updated_at ON ip_assets\n"
+        "FOR EACH ROW\n"
+        "WHEN NEW.updated_at IS NOT OLD.updated_at\n"
+        f"BEGIN\n    {BUMP_DATA_VERSION};\nEND"
+    ),
+    "trg_change_sequence_changed_at": (
+        "CREATE TRIGGER trg_change_sequence_changed_at\n"
+        "AFTER UPDATE OF value ON change_sequence\n"
+        "FOR EACH ROW\n"
+        "BEGIN\n"
+        "    UPDATE change_sequence SET changed_at = CURRENT_TIMESTAMP WHERE id = 1;\n"
+        "END"
+    ),
+}
+
+
+def upgrade() -> None:
+    with op.batch_alter_table("change_sequence") as batch_op:
+        batch_op.add_column(sa.Column("changed_at", sa.Text(), nullable=True))
+    op.execute("UPDATE change_sequence SET changed_at = CURRENT_TIMESTAMP")
+    for statement in TRIGGERS.values():
+        op.execute(statement)
+
+
+def downgrade() -> None:
+    for name in TRIGGERS:
+        op.execute(f"DROP TRIGGER IF EXISTS {name}")
+    with op.batch_alter_table("change_sequence") as batch_op:
+        batch_op.drop_column("changed_at")
@@ -0,0 +1,265 @@
+"""add_inventory_counters
+
+Revision ID: 0014_add_inventory_counters
+Revises: 0013_add_data_version
+Create Date: 2026-03-30 00:00:00.000000
+"""
+
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0014_add_inventory_counters"
+down_revision = "0013_add_data_version"
+branch_labels = None
+depends_on = None
+
+_ACTIVE_HOST_ASSETS = (
+    "(SELECT COUNT(*) FROM ip_assets WHERE host_id = {row}.id AND archived = 0)"
+)
+# Recomputes every counter from the base tables; used to seed and repair.
+COUNTERS_SQL = """
+SELECT 'active_ip_total', 0, COUNT(*) FROM ip_assets WHERE archived = 0
+UNION ALL
+SELECT 'archived_ip_total', 0, COUNT(*) FROM ip_assets WHERE archived != 0
+UNION ALL
+SELECT 'host_total', 0, COUNT(*) FROM hosts
+UNION ALL
+SELECT 'vendor_total', 0, COUNT(*) FROM vendors
+UNION ALL
+SELECT 'project_total', 0, COUNT(*) FROM projects
+UNION ALL
+SELECT 'project_ip', projects.id, (
+    SELECT COUNT(*) FROM ip_assets
+    WHERE ip_assets.project_id = projects.id AND ip_assets.archived = 0
+) FROM projects
+UNION ALL
+SELECT 'vendor_ip', vendors.id, (
+    SELECT COUNT(*) FROM ip_assets JOIN hosts ON hosts.id = ip_assets.host_id
+    WHERE hosts.vendor_id = vendors.id AND ip_assets.archived = 0
+) FROM vendors
+UNION ALL
+SELECT 'tag_ip', tags.id, (
+    SELECT COUNT(*) FROM ip_asset_tags
+    JOIN ip_assets ON ip_assets.id = ip_asset_tags.ip_asset_id
+    WHERE ip_asset_tags.tag_id = tags.id AND ip_assets.archived = 0
+) FROM tags
+"""
+
+
+def _counter_update(counter: str, ref: str, delta: str, when: str | None = None) -> str:
+    condition = f" AND {when}" if when else ""
+    return (
+        "UPDATE inventory_counters SET value = value "
+        f"{delta} WHERE counter = {counter} AND ref_id = {ref}{condition}"
+    )
+
+
+def _ip_asset_counter_statements(row: str, sign: str) -> list[str]:
+    """Add (``+``) or remove (``-``) one asset row's share of the counters."""
+    active = f"{row}.archived = 0"
+    return [
+        _counter_update(
+            f"CASE WHEN {active} THEN 'active_ip_total' ELSE 'archived_ip_total' END",
+            "0",
+            f"{sign} 1",
+        ),
+        _counter_update("'project_ip'", f"{row}.project_id", f"{sign} 1", active),
+        _counter_update(
+            "'vendor_ip'",
+            f"(SELECT vendor_id FROM hosts WHERE id = {row}.host_id)",
+            f"{sign} 1",
+            active,
+        ),
+    ]
+
+
+def _ip_asset_tag_counter_statement(row: str, sign: str, when: str) -> str:
+    # A new asset has no tag links yet, so inserts skip this statement.
+    return (
+        f"UPDATE inventory_counters SET value = value {sign} 1 "
+        f"WHERE counter = 'tag_ip' AND {when} AND ref_id IN "
+        f"(SELECT tag_id FROM ip_asset_tags WHERE ip_asset_id = {row}.id)"
+    )
+
+
+def inventory_counter_triggers() -> dict[str, str]:
+    asset_changed = " OR ".join(
+        f"NEW.{column} IS NOT OLD.{column}"
+        for column in ("archived", "project_id", "host_id")
+    )
+    linked_active_asset = (
+        "EXISTS (SELECT 1 FROM ip_assets WHERE id = {row}.ip_asset_id AND archived = 0)"
+    )
+    triggers = {
+        "trg_ip_assets_insert_counters": (
+            "AFTER INSERT",
+            "ip_assets",
+            None,
+            _ip_asset_counter_statements("NEW", "+"),
+        ),
+        "trg_ip_assets_update_counters": (
+            "AFTER UPDATE OF archived, project_id, host_id",
+            "ip_assets",
+            asset_changed,
+            _ip_asset_counter_statements("OLD", "-")
+            + _ip_asset_counter_statements("NEW", "+")
+            + [
+                _ip_asset_tag_counter_statement(
+                    "NEW", "+", "NEW.archived = 0 AND OLD.archived != 0"
+                ),
+                _ip_asset_tag_counter_statement(
+                    "NEW", "-", "NEW.archived != 0 AND OLD.archived = 0"
+                ),
+            ],
+        ),
+        # BEFORE so tag links are still present when a cascade removes them.
+        "trg_ip_assets_delete_counters": (
+            "BEFORE DELETE",
+            "ip_assets",
+            None,
+            _ip_asset_counter_statements("OLD", "-")
+            + [_ip_asset_tag_counter_statement("OLD", "-", "OLD.archived = 0")],
+        ),
+        "trg_ip_asset_tags_insert_counters": (
+            "AFTER INSERT",
+            "ip_asset_tags",
+            None,
+            [
+                _counter_update(
+                    "'tag_ip'",
+                    "NEW.tag_id",
+                    "+ 1",
+                    linked_active_asset.format(row="NEW"),
+                )
+            ],
+        ),
+        "trg_ip_asset_tags_delete_counters": (
+            "AFTER DELETE",
+            "ip_asset_tags",
+            None,
+            [
+                _counter_update(
+                    "'tag_ip'",
+                    "OLD.tag_id",
+                    "- 1",
+                    linked_active_asset.format(row="OLD"),
+                )
+            ],
+        ),
+        "trg_hosts_insert_counters": (
+            "AFTER INSERT",
+            "hosts",
+            None,
+            [_counter_update("'host_total'", "0", "+ 1")],
+        ),
+        "trg_hosts_update_counters": (
+            "AFTER UPDATE OF vendor_id",
+            "hosts",
+            "NEW.vendor_id IS NOT OLD.vendor_id",
+            [
+                _counter_update(
+                    "'vendor_ip'",
+                    "OLD.vendor_id",
+                    "- " + _ACTIVE_HOST_ASSETS.format(row="OLD"),
+                ),
+                _counter_update(
+                    "'vendor_ip'",
+                    "NEW.vendor_id",
+                    "+ " + _ACTIVE_HOST_ASSETS.format(row="NEW"),
+                ),
+            ],
+        ),
+        "trg_hosts_delete_counters": (
+            "BEFORE DELETE",
+            "hosts",
+            None,
+            [
+                _counter_update("'host_total'", "0", "- 1"),
+                _counter_update(
+                    "'vendor_ip'",
+                    "OLD.vendor_id",
+                    "- " + _ACTIVE_HOST_ASSETS.format(row="OLD"),
+                ),
+            ],
+        ),
+    }
+    catalog_counts = {
+        "projects": (
+            "project",
+            "SELECT COUNT(*) FROM ip_assets WHERE project_id = NEW.id AND archived = 0",
+        ),
+        "vendors": (
+            "vendor",
+            "SELECT COUNT(*) FROM ip_assets JOIN hosts ON hosts.id = ip_assets.host_id "
+            "WHERE hosts.vendor_id = NEW.id AND ip_assets.archived = 0",
+        ),
+        "tags": (
+            "tag",
+            "SELECT COUNT(*) FROM ip_asset_tags "
+            "JOIN ip_assets ON ip_assets.id = ip_asset_tags.ip_asset_id "
+            "WHERE ip_asset_tags.tag_id = NEW.id AND ip_assets.archived = 0",
+        ),
+    }
+    for table, (entity, count_sql) in catalog_counts.items():
+        insert_body = [
+            "INSERT OR REPLACE INTO inventory_counters (counter, ref_id, value) "
+            f"VALUES ('{entity}_ip', NEW.id, ({count_sql}))"
+        ]
+        delete_body = [
+            "DELETE FROM inventory_counters "
+            f"WHERE counter = '{entity}_ip' AND ref_id = OLD.id"
+        ]
+        if table != "tags":
+            insert_body.append(_counter_update(f"'{entity}_total'", "0", "+ 1"))
+            delete_body.append(_counter_update(f"'{entity}_total'", "0", "- 1"))
+        triggers[f"trg_{table}_insert_counters"] = (
+            "AFTER INSERT",
+            table,
+            None,
+            insert_body,
+        )
+        triggers[f"trg_{table}_delete_counters"] = (
+            "AFTER DELETE",
+            table,
+            None,
+            delete_body,
+        )
+    return {
+        name: _counter_trigger_sql(name, timing, table, body, when)
+        for name, (timing, table, when, body) in triggers.items()
+    }
+
+
+def _counter_trigger_sql(
+    name: str, timing: str, table: str, body: list[str], when: str | None
+) -> str:
+    condition = f"WHEN {when}\n" if when else ""
+    statements = "".join(f"    {statement};\n" for statement in body)
+    return (
+        f"CREATE TRIGGER {name}\n"
+        f"{timing} ON {table}\n"
+        f"FOR EACH ROW\n{condition}BEGIN\n{statements}END"
+    )
+
+
+def upgrade() -> None:
+    op.create_table(
+        "inventory_counters",
+        sa.Column("counter", sa.Text(), primary_key=True),
+        sa.Column("ref_id", sa.Integer(), primary_key=True, server_default="0"),
+        sa.Column("value", sa.Integer(), nullable=False, server_default="0"),
+        sqlite_with_rowid=False,
+    )
+    op.execute(
+        "INSERT INTO inventory_counters (counter, ref_id, value) " + COUNTERS_SQL
+    )
+    for statement in inventory_counter_triggers().values():
+        op.execute(statement)
+
+
+def downgrade() -> None:
+    for name in inventory_counter_triggers():
+        op.execute(f"DROP TRIGGER IF EXISTS {name}")
+    op.drop_table("inventory_counters")
@@ -96,6 +96,30 @@ def test_ranges_create_and_list_flow(
     assert any(ip_range["cidr"] == "192.168.10.0/24" for ip_range in listed.json())
 
 
+def test_ranges_list_is_revalidated_by_data_version(
+    client, _create_user, _login, _auth_headers
+) -> None:
+    _create_user("editor", "editor-pass", UserRole.EDITOR)
+    headers = _auth_headers(_login("editor", "editor-pass"))
+
+    first = client.get("/ranges", headers=headers)
+    etag = first.headers["ETag"]
+    assert first.headers["Last-Modified"].endswith("GMT")
+
+    cached = client.get("/ranges", headers={**headers, "If-None-Match": etag})
+    assert cached.status_code == 304
+    assert cached.content == b""
+    assert cached.headers["ETag"] == etag
+
+    client.post(
+        "/ranges", headers=headers, json={"name": "Lab", "cidr": "10.10.0.0/24"}
+    )
+    refreshed = client.get("/ranges", headers={**headers, "If-None-Match": etag})
+    assert refreshed.status_code == 200
+    assert refreshed.headers["ETag"] != etag
+    assert [ip_range["cidr"] for ip_range in refreshed.json()] == ["10.10.0.0/24"]
+
+
 def test_metadata_writes_require_editor_role(
     client, _create_user, _login, _auth_headers
 ) -> None:
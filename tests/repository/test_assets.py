@@ -3,16 +3,21 @@ from __future__ import annotations
 from app.models import IPAssetType
 from app.repository import (
     archive_ip_asset,
+    bulk_create_ip_assets,
     bulk_update_ip_assets,
     count_active_ip_assets,
     create_host,
     create_ip_asset,
+    create_ip_range,
     create_project,
     delete_ip_asset,
     get_host_by_name,
+    get_inventory_metrics,
     get_ip_asset_by_ip,
     get_ip_asset_metrics,
     list_active_ip_assets_paginated,
+    list_audit_logs,
+    list_existing_ip_addresses,
     list_hosts,
     list_tags_for_ip_assets,
     update_ip_asset,
@@ -56,6 +61,37 @@ def test_get_ip_asset_metrics_counts(_setup_connection) -> None:
     assert metrics["unassigned_project_total"] == 2
 
 
+def test_get_inventory_metrics_groups_active_assets(_setup_connection) -> None:
+    connection = _setup_connection()
+    project = create_project(connection, name="Apps")
+    create_ip_range(connection, name="Lab", cidr="10.0.1.0/30")
+    create_ip_asset(
+        connection, "10.0.1.1", IPAssetType.VM, project_id=project.id, tags=["prod"]
+    )
+    create_ip_asset(
+        connection, "10.0.1.2", IPAssetType.VM, project_id=project.id, tags=["prod"]
+    )
+    create_ip_asset(connection, "10.0.2.1", IPAssetType.OS, tags=["edge"])
+    create_ip_asset(
+        connection, "10.0.2.2", IPAssetType.OS, project_id=project.id, tags=["edge"]
+    )
+    archive_ip_asset(connection, "10.0.2.2")
+
+    inventory = get_inventory_metrics(connection)
+    assert inventory["totals"] == get_ip_asset_metrics(connection)
+    assert inventory["active_by_project_type"] == [
+        {"project": "Apps", "type": "VM", "total": 2},
+        {"project": "unassigned", "type": "OS", "total": 1},
+    ]
+    assert inventory["active_by_tag"] == [
+        {"tag": "edge", "total": 1},
+        {"tag": "prod", "total": 2},
+    ]
+    assert inventory["ranges"] == [
+        {"name": "Lab", "cidr": "10.0.1.0/30", "total_usable": 2, "used": 2}
+    ]
+
+
 def test_create_and_update_ip_asset_tags(_setup_connection) -> None:
     connection = _setup_connection()
     asset = create_ip_asset(
@@ -185,6 +221,40 @@ def test_bulk_update_ip_assets_overwrites_notes_when_requested(
     assert cleared_two.notes is None
 
 
+def test_bulk_create_ip_assets_inserts_assets_and_audit_rows(
+    _setup_connection,
+) -> None:
+    connection = _setup_connection()
+    created = bulk_create_ip_assets(
+        connection,
+        [("10.0.5.1", IPAssetType.VM), ("10.0.5.2", IPAssetType.OTHER)],
+        notes="Discovered",
+    )
+
+    assert [asset.ip_address for asset in created] == ["10.0.5.1", "10.0.5.2"]
+    assert [asset.asset_type for asset in created] == [
+        IPAssetType.VM,
+        IPAssetType.OTHER,
+    ]
+    assert all(asset.notes == "Discovered" for asset in created)
+    logs = list_audit_logs(connection, target_type="IP_ASSET", limit=10)
+    assert sorted(log.target_label for log in logs) == ["10.0.5.1", "10.0.5.2"]
+    assert all(log.action == "CREATE" for log in logs)
+
+
+def test_list_existing_ip_addresses_includes_archived(_setup_connection) -> None:
+    connection = _setup_connection()
+    create_ip_asset(connection, "10.0.6.1", IPAssetType.VM)
+    create_ip_asset(connection, "10.0.6.2", IPAssetType.VM)
+    archive_ip_asset(connection, "10.0.6.2")
+
+    existing = list_existing_ip_addresses(
+        connection, ["10.0.6.1", "10.0.6.2", "10.0.6.3"]
+    )
+
+    assert existing == {"10.0.6.1", "10.0.6.2"}
+
+
 def test_create_bmc_without_host_creates_server_host_and_links_asset(
     _setup_connection,
 ) -> None:
@@ -1,9 +1,12 @@
 from __future__ import annotations
 
+import pytest
 
 from app.models import IPAssetType, UserRole
 from app.repository import (
     archive_ip_asset,
+    audit_buffer_scope,
+    bulk_update_ip_assets,
     count_audit_logs,
     create_host,
     create_ip_asset,
@@ -15,6 +18,8 @@ from app.repository import (
     get_management_summary,
     list_audit_logs,
     list_audit_logs_paginated,
+    savepoint_scope,
+    transaction_scope,
     update_ip_asset,
     update_project,
 )
@@ -277,3 +282,80 @@ def test_update_project_color(_setup_connection) -> None:
 
     assert updated is not None
     assert updated.color == "#112233"
+
+
+def test_bulk_update_ip_assets_writes_one_audit_row_per_asset(
+    _setup_connection,
+) -> None:
+    connection = _setup_connection()
+    project = create_project(connection, name="Core")
+    first = create_ip_asset(
+        connection, ip_address="10.20.0.1", asset_type=IPAssetType.VM
+    )
+    second = create_ip_asset(
+        connection, ip_address="10.20.0.2", asset_type=IPAssetType.VM
+    )
+
+    bulk_update_ip_assets(
+        connection,
+        [first.id, second.id],
+        project_id=project.id,
+        set_project_id=True,
+        tags_to_add=["prod"],
+    )
+
+    for asset in (first, second):
+        logs = get_audit_logs_for_ip(connection, asset.id)
+        assert logs[0].action == "UPDATE"
+        assert logs[0].changes == "project: Unassigned -> Core; tags: none -> prod"
+
+
+def test_bulk_update_ip_assets_can_record_one_summarized_audit_row(
+    _setup_connection,
+) -> None:
+    connection = _setup_connection()
+    first = create_ip_asset(
+        connection, ip_address="10.21.0.1", asset_type=IPAssetType.VM
+    )
+    second = create_ip_asset(
+        connection, ip_address="10.21.0.2", asset_type=IPAssetType.VM
+    )
+    before = count_audit_logs(connection)
+
+    bulk_update_ip_assets(
+        connection,
+        [first.id, second.id],
+        asset_type=IPAssetType.OS,
+        summarize_audit=True,
+    )
+
+    assert count_audit_logs(connection) == before + 1
+    summary = list_audit_logs(connection, limit=1)[0]
+    assert summary.action == "BULK_UPDATE"
+    assert summary.target_label == "2 IP assets"
+    assert summary.changes.splitlines() == [
+        "Bulk updated 2 IP assets.",
+        "10.21.0.1: type: VM -> OS",
+        "10.21.0.2: type: VM -> OS",
+    ]
+
+
+def test_audit_buffer_drops_rows_from_rolled_back_savepoints(
+    _setup_connection,
+) -> None:
+    connection = _setup_connection()
+    before = count_audit_logs(connection)
+
+    with transaction_scope(connection) as session:
+        with audit_buffer_scope(session) as buffer:
+            create_ip_asset(session, ip_address="10.22.0.1", asset_type=IPAssetType.VM)
+            with pytest.raises(RuntimeError):
+                with savepoint_scope(session):
+                    create_ip_asset(
+                        session, ip_address="10.22.0.2", asset_type=IPAssetType.VM
+                    )
+                    raise RuntimeError("row failed")
+            assert len(buffer) == 1
+            assert count_audit_logs(session) == before
+
+    assert count_audit_logs(connection) == before + 1
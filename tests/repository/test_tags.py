@@ -9,8 +9,12 @@ from app.repository import (
     create_ip_asset,
     create_tag,
     delete_tag,
+    list_ip_asset_import_fingerprints,
     list_tag_ip_counts,
     list_tags,
+    list_tags_for_ip_assets,
+    set_ip_asset_import_fingerprints,
+    set_ip_asset_tags_bulk,
     update_tag,
 )
 from app.utils import normalize_tag_name, suggest_random_tag_color
@@ -71,3 +75,35 @@ def test_list_tag_ip_counts_excludes_archived_assets(_setup_connection) -> None:
     assert counts[prod_tag.id] == 1
     assert counts[edge_tag.id] == 1
     assert active_asset.id != archived_asset.id
+
+
+def test_set_ip_asset_tags_bulk_only_touches_changed_links(_setup_connection) -> None:
+    connection = _setup_connection()
+    kept = create_ip_asset(
+        connection, ip_address="10.9.0.1", asset_type=IPAssetType.VM, tags=["prod"]
+    )
+    changed = create_ip_asset(
+        connection,
+        ip_address="10.9.0.2",
+        asset_type=IPAssetType.VM,
+        tags=["prod", "old"],
+    )
+    set_ip_asset_import_fingerprints(
+        connection, {"10.9.0.1": "kept", "10.9.0.2": "changed"}
+    )
+
+    result = set_ip_asset_tags_bulk(
+        connection, {kept.id: ["Prod"], changed.id: ["prod", "edge"]}
+    )
+
+    assert result == {kept.id: ["prod"], changed.id: ["prod", "edge"]}
+    assert list_tags_for_ip_assets(connection, [kept.id, changed.id]) == {
+        kept.id: ["prod"],
+        changed.id: ["edge", "prod"],
+    }
+    assert {tag.name for tag in list_tags(connection)} >= {"prod", "edge"}
+    # Untouched links leave the asset's import fingerprint in place.
+    assert list_ip_asset_import_fingerprints(connection, ["10.9.0.1", "10.9.0.2"]) == {
+        "10.9.0.1": "kept",
+        "10.9.0.2": None,
+    }
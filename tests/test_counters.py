@@ -0,0 +1,108 @@
+from __future__ import annotations
+
+from app import counters, db, repository
+from app.models import IPAssetType
+
+
+def test_inventory_counters_follow_inventory_writes(_setup_connection) -> None:
+    connection = _setup_connection()
+    try:
+        dell = repository.create_vendor(connection, "Dell")
+        hp = repository.create_vendor(connection, "HP")
+        core = repository.create_project(connection, name="core")
+        edge = repository.create_project(connection, name="edge")
+        host = repository.create_host(connection, "node-01", vendor="Dell")
+        for index in range(4):
+            repository.create_ip_asset(
+                connection,
+                f"10.40.0.{index}",
+                IPAssetType.VM,
+                project_id=core.id,
+                host_id=host.id,
+                tags=["prod"],
+            )
+        prod = repository.get_tag_by_name(connection, "prod")
+        assert repository.list_project_ip_counts(connection) == {core.id: 4}
+        assert repository.list_vendor_ip_counts(connection) == {dell.id: 4}
+        assert repository.list_tag_ip_counts(connection) == {prod.id: 4}
+
+        repository.archive_ip_asset(connection, "10.40.0.0")
+        repository.update_ip_asset(
+            connection,
+            "10.40.0.1",
+            project_id=edge.id,
+            project_id_provided=True,
+            tags=[],
+        )
+        repository.update_host(connection, host.id, vendor="HP")
+        repository.delete_ip_asset(connection, "10.40.0.2")
+
+        assert repository.list_project_ip_counts(connection) == {
+            core.id: 1,
+            edge.id: 1,
+        }
+        assert repository.list_vendor_ip_counts(connection) == {hp.id: 2}
+        assert repository.list_tag_ip_counts(connection) == {prod.id: 1}
+        assert repository.get_management_summary(connection) == {
+            "active_ip_total": 2,
+            "archived_ip_total": 1,
+            "host_total": 1,
+            "vendor_total": 2,
+            "project_total": 2,
+        }
+
+        repository.delete_host(connection, host.id)
+        repository.delete_project(connection, core.id)
+        repository.delete_tag(connection, prod.id)
+        assert repository.list_vendor_ip_counts(connection) == {}
+        assert repository.list_project_ip_counts(connection) == {edge.id: 1}
+        assert repository.check_inventory_counters(connection) == []
+    finally:
+        connection.close()
+
+
+def test_counters_command_reports_and_rebuilds_drift(
+    _setup_connection, db_path, capsys
+) -> None:
+    connection = _setup_connection()
+    try:
+        repository.create_ip_asset(connection, "10.40.1.1", IPAssetType.VM)
+        connection.execute(
+            "UPDATE inventory_counters SET value = 7 WHERE counter = 'active_ip_total'"
+        )
+        connection.commit()
+    finally:
+        connection.close()
+
+    assert counters.main(["--db-path", str(db_path)]) == 1
+    assert "active_ip_total[0]: stored=7, expected=1" in capsys.readouterr().out
+
+    assert counters.main(["--db-path", str(db_path), "--rebuild"]) == 0
+    assert counters.main(["--db-path", str(db_path)]) == 0
+    assert "consistent" in capsys.readouterr().out
+
+
+def test_legacy_databases_get_seeded_inventory_counters(_setup_connection) -> None:
+    connection = _setup_connection()
+    try:
+        repository.create_ip_asset(connection, "10.40.2.1", IPAssetType.VM)
+        triggers = [
+            row[0]
+            for row in connection.execute(
+                "SELECT name FROM sqlite_master "
+                "WHERE type = 'trigger' AND name LIKE '%_counters'"
+            )
+        ]
+        for name in triggers:
+            connection.execute(f"DROP TRIGGER {name}")
+        connection.execute("DROP TABLE inventory_counters")
+        connection.execute("DROP TABLE alembic_version")
+        connection.commit()
+
+        db.init_db(connection)
+
+        assert repository.get_management_summary(connection)["active_ip_total"] == 1
+        repository.create_ip_asset(connection, "10.40.2.2", IPAssetType.VM)
+        assert repository.check_inventory_counters(connection) == []
+    finally:
+        connection.close()
@@ -2,15 +2,18 @@ from __future__ import annotations
 
 import csv
 import io
+import json
 import warnings
+import zipfile
 from http.cookies import SimpleCookie
 
 import pytest
 from fastapi.testclient import TestClient as FastAPITestClient
 
-from app import auth, db, repository
+from app import auth, db, exports, repository
 from app.main import app
 from app.models import IPAssetType, UserRole
+from app.repository import assets as assets_repository
 from app.routes import ui
 
 
@@ -233,6 +236,269 @@ def test_ip_assets_csv_export_orders_ips_numerically_when_ip_int_is_null(
     ]
 
 
+def test_ip_asset_export_streams_in_order_across_fetch_batches(
+    db_path, monkeypatch
+) -> None:
+    connection = db.connect(str(db_path))
+    try:
+        db.init_db(connection)
+        for ip_address in ("10.0.0.9", "10.0.0.30", "2001:db8::1", "10.0.0.4"):
+            asset = repository.create_ip_asset(
+                connection, ip_address=ip_address, asset_type=IPAssetType.VM
+            )
+            repository.set_ip_asset_tags(connection, asset.id, [f"t{asset.id}"])
+        repository.create_ip_asset(
+            connection, ip_address="10.0.0.12", asset_type=IPAssetType.VM
+        )
+        # A row whose ip_int was never backfilled is merged into place.
+        connection.execute(
+            "UPDATE ip_assets SET ip_int = NULL WHERE ip_address = '10.0.0.12'"
+        )
+        connection.commit()
+
+        streamed: list[object] = []
+        stream_export_rows = assets_repository._stream_export_rows
+
+        def _counting_stream(session, statement, fetch_size):
+            streamed.append(statement)
+            return stream_export_rows(session, statement, fetch_size)
+
+        monkeypatch.setattr(assets_repository, "_stream_export_rows", _counting_stream)
+        rows = list(repository.iter_ip_assets_for_export(connection, fetch_size=2))
+    finally:
+        connection.close()
+
+    assert [row["ip_address"] for row in rows] == [
+        "10.0.0.4",
+        "10.0.0.9",
+        "10.0.0.12",
+        "10.0.0.30",
+        "2001:db8::1",
+    ]
+    assert [len(row["tags"]) for row in rows] == [1, 1, 0, 1, 1]
+    # One query for indexed rows and a single pass over rows without ip_int.
+    assert len(streamed) == 2
+
+
+def test_ip_asset_and_host_exports_are_streamed(client) -> None:
+    test_client, db_path = client
+    _create_user(db_path, "stream-user", "stream-pass")
+    _seed_export_data(db_path)
+    session_cookie = _login_ui(test_client, "stream-user", "stream-pass")
+
+    for endpoint in (
+        "/export/ip-assets.csv",
+        "/export/ip-assets.json",
+        "/export/hosts.csv",
+        "/export/hosts.json",
+    ):
+        response = test_client.get(endpoint, headers=_auth_headers(session_cookie))
+        assert response.status_code == 200
+        assert "content-length" not in response.headers
+
+    assets = test_client.get(
+        "/export/ip-assets.json", headers=_auth_headers(session_cookie)
+    ).json()
+    hosts = test_client.get(
+        "/export/hosts.json?host=node-01", headers=_auth_headers(session_cookie)
+    ).json()
+    missing = test_client.get(
+        "/export/hosts.json?host=missing", headers=_auth_headers(session_cookie)
+    ).json()
+    assert [asset["tags"] for asset in assets] == [["edge", "prod"]]
+    assert [host["name"] for host in hosts] == ["node-01"]
+    assert missing == []
+
+
+def test_export_filters_are_applied_in_sql(db_path) -> None:
+    _seed_export_data(db_path)
+    connection = db.connect(str(db_path))
+    try:
+        host = repository.get_host_by_name(connection, "node-01")
+        for ip_address, asset_type in (
+            ("10.0.0.20", IPAssetType.OS),
+            ("10.0.0.3", IPAssetType.OS),
+            ("10.0.0.21", IPAssetType.BMC),
+        ):
+            repository.create_ip_asset(
+                connection,
+                ip_address=ip_address,
+                asset_type=asset_type,
+                host_id=host.id,
+            )
+        repository.create_project(connection, "edge", "Edge", color="#abcdef")
+
+        hosts = exports.export_hosts(connection, host_name="node-01")
+        projects = exports.export_projects(connection, project_name="edge")
+        by_project = exports.export_ip_assets(connection, project_name="core")
+        by_host = exports.export_ip_assets(
+            connection, asset_type=IPAssetType.OS, host_name="node-01"
+        )
+        unknown = exports.export_ip_assets(connection, project_name="missing")
+    finally:
+        connection.close()
+
+    assert hosts == [
+        {
+            "name": "node-01",
+            "notes": "primary",
+            "vendor_name": "Dell",
+            "project_name": "core",
+            "os_ip": "10.0.0.3",
+            "bmc_ip": "10.0.0.21",
+        }
+    ]
+    assert projects == [{"name": "edge", "description": "Edge", "color": "#abcdef"}]
+    assert [asset["ip_address"] for asset in by_project] == ["10.0.0.10"]
+    assert [asset["ip_address"] for asset in by_host] == ["10.0.0.3", "10.0.0.20"]
+    assert unknown == []
+
+
+def test_streamed_bundle_json_matches_export_bundle(db_path) -> None:
+    _seed_export_data(db_path)
+    connection = db.connect(str(db_path))
+    try:
+        expected = exports.export_bundle(connection)
+        streamed = json.loads("".join(exports.iter_export_bundle_json(connection)))
+        empty = json.loads(
+            "".join(exports.iter_export_bundle_json(connection, host_name="missing"))
+        )
+    finally:
+        connection.close()
+
+    assert streamed["data"] == expected["data"]
+    assert streamed["schema_version"] == "1"
+    assert empty["data"]["hosts"] == []
+    assert empty["data"]["ip_assets"] == []
+
+
+def test_bundle_zip_export_is_streamed(client) -> None:
+    test_client, db_path = client
+    _create_user(db_path, "zip-user", "zip-pass")
+    _seed_export_data(db_path)
+    session_cookie = _login_ui(test_client, "zip-user", "zip-pass")
+
+    response = test_client.get(
+        "/export/bundle.zip", headers=_auth_headers(session_cookie)
+    )
+    assert response.status_code == 200
+    assert "content-length" not in response.headers
+    archive = zipfile.ZipFile(io.BytesIO(response.content))
+    assert archive.testzip() is None
+    assert archive.namelist() == [
+        "bundle.json",
+        "ip-assets.csv",
+        "projects.csv",
+        "hosts.csv",
+        "vendors.csv",
+    ]
+    bundle = json.loads(archive.read("bundle.json"))
+    assert bundle["data"]["ip_assets"][0]["tags"] == ["edge", "prod"]
+    rows = _parse_csv_rows(archive.read("ip-assets.csv").decode("utf-8"))
+    assert [row["ip_address"] for row in rows] == [
+        asset["ip_address"] for asset in bundle["data"]["ip_assets"]
+    ]
+
+
+def test_changes_feed_returns_only_records_changed_after_cursor(client) -> None:
+    test_client, db_path = client
+    _create_user(db_path, "sync-user", "sync-pass")
+    _seed_export_data(db_path)
+    session_cookie = _login_ui(test_client, "sync-user", "sync-pass")
+    headers = _auth_headers(session_cookie)
+
+    first = test_client.get("/export/changes", headers=headers)
+    assert first.status_code == 200
+    initial = first.json()
+    assert initial["since"] == 0
+    assert [vendor["name"] for vendor in initial["data"]["vendors"]] == ["Dell"]
+    assert {tag["name"] for tag in initial["data"]["tags"]} == {"edge", "prod"}
+    assert [host["name"] for host in initial["data"]["hosts"]] == ["node-01"]
+    assert {asset["ip_address"] for asset in initial["data"]["ip_assets"]} == {
+        "10.0.0.10",
+        "10.0.0.99",
+    }
+    assert all(keys == [] for keys in initial["deleted"].values())
+
+    connection = db.connect(str(db_path))
+    try:
+        host = repository.get_host_by_name(connection, "node-01")
+        repository.update_host(connection, host.id, name="node-02")
+        repository.archive_ip_asset(connection, "10.0.0.10")
+        repository.delete_ip_asset(connection, "10.0.0.99")
+        repository.create_ip_asset(
+            connection, ip_address="10.0.0.50", asset_type=IPAssetType.VM
+        )
+        # Writing back unchanged values is not reported as a change.
+        project = repository.list_projects(connection)[0]
+        repository.update_project(connection, project.id, name=project.name)
+    finally:
+        connection.close()
+
+    delta = test_client.get(
+        f"/export/changes?since={initial['cursor']}", headers=headers
+    ).json()
+    assert delta["since"] == initial["cursor"]
+    assert delta["cursor"] > initial["cursor"]
+    assert delta["data"]["vendors"] == []
+    assert delta["data"]["projects"] == []
+    assert [host["name"] for host in delta["data"]["hosts"]] == ["node-02"]
+    assert [
+        (asset["ip_address"], asset["host_name"], asset["archived"])
+        for asset in delta["data"]["ip_assets"]
+    ] == [("10.0.0.10", "node-02", True), ("10.0.0.50", None, False)]
+    assert delta["deleted"] == {
+        "vendors": [],
+        "projects": [],
+        "tags": [],
+        "hosts": ["node-01"],
+        "ip_assets": ["10.0.0.99"],
+    }
+
+    idle = test_client.get(
+        f"/export/changes?since={delta['cursor']}", headers=headers
+    ).json()
+    assert idle["cursor"] == delta["cursor"]
+    assert all(rows == [] for rows in idle["data"].values())
+    ahead = test_client.get(
+        f"/export/changes?since={delta['cursor'] + 100}", headers=headers
+    ).json()
+    assert ahead["since"] == 0
+
+
+def test_exports_return_not_modified_until_data_changes(client) -> None:
+    test_client, db_path = client
+    _create_user(db_path, "export-user", "export-pass")
+    _seed_export_data(db_path)
+    headers = _auth_headers(_login_ui(test_client, "export-user", "export-pass"))
+
+    first = test_client.get("/export/ip-assets.csv", headers=headers)
+    etag = first.headers["ETag"]
+    assert etag.startswith('W/"')
+    assert first.headers["Cache-Control"] == "no-cache"
+    for path in ("/export/ip-assets.csv", "/export/bundle.zip", "/export/changes"):
+        cached = test_client.get(path, headers={**headers, "If-None-Match": etag})
+        assert cached.status_code == 304
+        assert cached.content == b""
+
+    connection = db.connect(str(db_path))
+    try:
+        # Touching updated_at alone changes what /ip-assets serves.
+        connection.execute(
+            "UPDATE ip_assets SET updated_at = '2000-01-01 00:00:00' "
+            "WHERE ip_address = '10.0.0.10'"
+        )
+        connection.commit()
+    finally:
+        connection.close()
+
+    refreshed = test_client.get(
+        "/export/ip-assets.csv", headers={**headers, "If-None-Match": etag}
+    )
+    assert refreshed.status_code == 200
+    assert refreshed.headers["ETag"] != etag
+
+
 def test_ui_export_page_has_bundle_link(client) -> None:
     test_client, db_path = client
     _create_user(db_path, "ui-user", "ui-pass")
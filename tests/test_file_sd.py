@@ -0,0 +1,119 @@
+from __future__ import annotations
+
+import json
+
+import pytest
+from fastapi.testclient import TestClient as FastAPITestClient
+
+from app import db, file_sd, repository
+from app.main import app
+from app.models import IPAssetType
+
+
+@pytest.fixture
+def seeded_db(tmp_path):
+    db_path = tmp_path / "file-sd.db"
+    connection = db.connect(str(db_path))
+    try:
+        db.init_db(connection)
+        core = repository.create_project(connection, name="core")
+        repository.create_ip_asset(
+            connection, "10.30.0.1", IPAssetType.VM, project_id=core.id
+        )
+        repository.create_ip_asset(connection, "10.30.0.2", IPAssetType.OS)
+    finally:
+        connection.close()
+    return db_path
+
+
+def test_parse_file_sd_targets_uses_sd_query_parameters() -> None:
+    groups = file_sd.parse_file_sd_targets(
+        "core-vms:project=core&type=VM,VIP&port=9200; all:group_by=project"
+    )
+
+    assert [group.filename for group in groups] == ["core-vms.json", "all.json"]
+    assert groups[0].query.project_names == ("core",)
+    assert groups[0].query.asset_types == (IPAssetType.VIP, IPAssetType.VM)
+    assert groups[0].query.port == 9200
+    assert groups[1].query.port == 9100
+    assert groups[1].query.group_by == "project"
+
+    for invalid in ("../x:port=1", "a:port=0", "a:colour=red", "a:;a:", ""):
+        with pytest.raises(ValueError):
+            file_sd.parse_file_sd_targets(invalid)
+
+
+def test_file_sd_writer_coalesces_writes_until_version_settles(
+    seeded_db, tmp_path
+) -> None:
+    out_dir = tmp_path / "file_sd"
+    out_dir.mkdir()
+    writer = file_sd.FileSDWriter(
+        str(seeded_db),
+        out_dir,
+        file_sd.parse_file_sd_targets("core:project=core;all:port=9100"),
+        debounce_seconds=2,
+        max_delay_seconds=30,
+    )
+    writer.write_files(writer._read_version())
+    assert json.loads((out_dir / "core.json").read_text()) == [
+        {"targets": ["10.30.0.1:9100"], "labels": {"project": "core", "type": "VM"}}
+    ]
+    assert writer.poll(now=100.0) is False
+
+    connection = db.connect(str(seeded_db))
+    try:
+        for index in range(10, 60):
+            repository.create_ip_asset(connection, f"10.30.1.{index}", IPAssetType.VM)
+            # Polls during the burst keep seeing a moving version.
+            writer.poll(now=100.0 + index / 100)
+    finally:
+        connection.close()
+
+    assert writer.write_count == 1
+    assert writer.poll(now=101.0) is False
+    assert writer.poll(now=103.0) is True
+    assert writer.write_count == 2
+    all_targets = json.loads((out_dir / "all.json").read_text())[0]["targets"]
+    assert len(all_targets) == 52
+    assert writer.poll(now=110.0) is False
+    assert sorted(path.name for path in out_dir.iterdir()) == ["all.json", "core.json"]
+
+
+def test_file_sd_writer_flushes_a_steady_stream_after_max_delay(
+    seeded_db, tmp_path
+) -> None:
+    writer = file_sd.FileSDWriter(
+        str(seeded_db),
+        tmp_path,
+        file_sd.parse_file_sd_targets("node:"),
+        debounce_seconds=2,
+        max_delay_seconds=5,
+    )
+    writer.write_files(writer._read_version())
+    connection = db.connect(str(seeded_db))
+    try:
+        written = []
+        for step in range(8):
+            repository.create_ip_asset(connection, f"10.30.2.{step}", IPAssetType.VM)
+            written.append(writer.poll(now=float(step)))
+    finally:
+        connection.close()
+
+    assert written == [False] * 5 + [True, False, False]
+
+
+def test_file_sd_writer_starts_with_the_app(seeded_db, tmp_path, monkeypatch) -> None:
+    out_dir = tmp_path / "prometheus" / "file_sd"
+    monkeypatch.setenv("IPAM_DB_PATH", str(seeded_db))
+    monkeypatch.setenv("IPOCKET_FILE_SD_DIR", str(out_dir))
+    monkeypatch.setenv("IPOCKET_FILE_SD_TARGETS", "vms:type=VM&port=9300")
+
+    with FastAPITestClient(app):
+        writer = file_sd._FILE_SD_WRITER
+        assert writer is not None
+    assert file_sd._FILE_SD_WRITER is None
+    assert writer.write_count >= 1
+    assert json.loads((out_dir / "vms.json").read_text())[0]["targets"] == [
+        "10.30.0.1:9300"
+    ]
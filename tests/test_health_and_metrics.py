@@ -2,7 +2,9 @@ from __future__ import annotations
 
 from fastapi.testclient import TestClient as FastAPITestClient
 
+from app import db, metrics_cache, repository
 from app.main import app
+from app.models import IPAssetType
 
 
 def _parse_metrics(text: str) -> dict[str, int]:
@@ -33,3 +35,42 @@ def test_health_and_metrics_endpoints(db_path) -> None:
         assert metrics["ipam_ip_unassigned_project_total"] == 0
         assert metrics["ipam_ip_unassigned_owner_total"] == 0
         assert metrics["ipam_ip_unassigned_both_total"] == 0
+
+
+def test_metrics_expose_labelled_inventory_gauges(db_path, monkeypatch) -> None:
+    monkeypatch.setenv("IPOCKET_METRICS_CACHE_SECONDS", "3600")
+    metrics_cache.clear_metrics_cache()
+    with FastAPITestClient(app) as client:
+        connection = db.connect(str(db_path))
+        try:
+            project = repository.create_project(connection, name='Core "A"')
+            repository.create_ip_range(connection, name="Lab", cidr="10.1.0.0/30")
+            repository.create_ip_asset(
+                connection,
+                "10.1.0.1",
+                IPAssetType.VM,
+                project_id=project.id,
+                tags=["prod"],
+            )
+        finally:
+            connection.close()
+
+        text = client.get("/metrics").text
+        assert 'ipam_ip_active_total{project="Core \\"A\\"",type="VM"} 1' in text
+        assert 'ipam_ip_tag_total{tag="prod"} 1' in text
+        assert (
+            'ipam_range_utilization_ratio{range="Lab",cidr="10.1.0.0/30"} 0.5' in text
+        )
+
+        # Within the TTL a write is not picked up until the cache expires.
+        connection = db.connect(str(db_path))
+        try:
+            repository.create_ip_asset(connection, "10.1.0.2", IPAssetType.VM)
+        finally:
+            connection.close()
+        assert "ipam_ip_total 1" in client.get("/metrics").text
+
+        monkeypatch.setenv("IPOCKET_METRICS_CACHE_SECONDS", "0")
+        refreshed = client.get("/metrics").text
+        assert "ipam_ip_total 2" in refreshed
+        assert 'ipam_ip_active_total{project="unassigned",type="VM"} 1' in refreshed
@@ -1,12 +1,20 @@
 from __future__ import annotations
 
+import gzip
+import io
 import json
+import sqlite3
+import time
 
 import pytest
 from fastapi.testclient import TestClient as FastAPITestClient
+from sqlalchemy.exc import OperationalError
 
 from app import auth, db, exports, repository
-from app.imports import BundleImporter, ImportAuditContext, run_import
+from app.imports import BundleImporter, CsvImporter, ImportAuditContext, run_import
+from app.imports import jobs as import_jobs
+from app.imports.json_stream import iter_json_bundle_entries
+from app.imports.models import ImportParseError, ImportSource
 from app.main import app
 from app.models import IPAssetType, UserRole
 from app.routes.api import imports as imports_routes
@@ -96,6 +104,81 @@ def test_bundle_json_dry_run_does_not_write(client) -> None:
         connection.close()
 
 
+def test_bundle_json_dry_run_reports_field_level_changes(client) -> None:
+    test_client, db_path = client
+    _create_user(db_path, "viewer", "viewer-pass", UserRole.VIEWER)
+    token = _login(test_client, "viewer", "viewer-pass")
+
+    connection = db.connect(str(db_path))
+    try:
+        project = repository.create_project(connection, name="Core")
+        repository.create_ip_asset(
+            connection,
+            ip_address="10.0.0.10",
+            asset_type=IPAssetType.OS,
+            project_id=project.id,
+            notes="old",
+        )
+    finally:
+        connection.close()
+
+    payload = json.dumps(_bundle_payload()).encode("utf-8")
+    response = test_client.post(
+        "/import/bundle?dry_run=1",
+        headers=_auth_headers(token),
+        files={"file": ("bundle.json", payload, "application/json")},
+    )
+    assert response.status_code == 200
+    changes = {
+        (change["entity"], change["key"]): change
+        for change in response.json()["changes"]
+    }
+    asset_change = changes[("ip_asset", "10.0.0.10")]
+    assert asset_change["action"] == "update"
+    assert asset_change["location"] == "data.ip_assets[0]"
+    assert asset_change["fields"] == {
+        "type": {"before": "OS", "after": "VM"},
+        "host": {"before": None, "after": "node-01"},
+        "notes": {"before": "old", "after": "prod"},
+    }
+    assert changes[("host", "node-01")]["action"] == "create"
+    assert isinstance(response.json()["catalog_load_ms"], float)
+
+    connection = db.connect(str(db_path))
+    try:
+        asset = repository.get_ip_asset_by_ip(connection, "10.0.0.10")
+        assert asset is not None
+        assert asset.asset_type == IPAssetType.OS
+        assert asset.notes == "old"
+        assert list(repository.list_hosts(connection)) == []
+        assert list(repository.list_vendors(connection)) == []
+    finally:
+        connection.close()
+
+
+def test_run_import_dry_run_summary_matches_apply(tmp_path) -> None:
+    connection = db.connect(str(tmp_path / "dry-run-exact.db"))
+    try:
+        db.init_db(connection)
+        payload = _bundle_payload()
+        payload["data"]["ip_assets"].append(dict(payload["data"]["ip_assets"][0]))
+        inputs = {"bundle": json.dumps(payload).encode("utf-8")}
+
+        preview = run_import(connection, BundleImporter(), inputs, dry_run=True)
+        assert list(repository.list_projects(connection)) == []
+        applied = run_import(connection, BundleImporter(), inputs)
+
+        assert preview.errors == applied.errors == []
+        assert preview.summary == applied.summary
+        assert applied.summary.ip_assets.would_create == 1
+        assert applied.summary.ip_assets.would_skip == 1
+        assert [(c.entity, c.action, c.key) for c in preview.changes] == [
+            (c.entity, c.action, c.key) for c in applied.changes
+        ]
+    finally:
+        connection.close()
+
+
 def test_bundle_json_apply_creates_and_updates(client) -> None:
     test_client, db_path = client
     _create_user(db_path, "editor", "editor-pass", UserRole.EDITOR)
@@ -291,7 +374,7 @@ def test_api_bundle_import_rejects_files_over_size_limit(client, monkeypatch) ->
     test_client, db_path = client
     _create_user(db_path, "viewer-limit", "viewer-pass", UserRole.VIEWER)
     token = _login(test_client, "viewer-limit", "viewer-pass")
-    monkeypatch.setattr(imports_routes, "IMPORT_UPLOAD_MAX_BYTES", 10)
+    monkeypatch.setattr(imports_routes, "IMPORT_STREAMED_UPLOAD_MAX_BYTES", 10)
 
     response = test_client.post(
         "/import/bundle?dry_run=1",
@@ -308,7 +391,7 @@ def test_api_csv_import_rejects_files_over_size_limit(client, monkeypatch) -> No
     test_client, db_path = client
     _create_user(db_path, "viewer-csv-limit", "viewer-pass", UserRole.VIEWER)
     token = _login(test_client, "viewer-csv-limit", "viewer-pass")
-    monkeypatch.setattr(imports_routes, "IMPORT_UPLOAD_MAX_BYTES", 10)
+    monkeypatch.setattr(imports_routes, "IMPORT_STREAMED_UPLOAD_MAX_BYTES", 10)
 
     response = test_client.post(
         "/import/csv?dry_run=1",
@@ -321,6 +404,83 @@ def test_api_csv_import_rejects_files_over_size_limit(client, monkeypatch) -> No
     )
 
 
+def test_api_csv_import_accepts_gzip_uploads(client) -> None:
+    test_client, db_path = client
+    _create_user(db_path, "viewer-gzip", "viewer-pass", UserRole.VIEWER)
+    token = _login(test_client, "viewer-gzip", "viewer-pass")
+    ip_assets_csv = (
+        "ip_address,type,project_name,host_name,tags,notes,archived\n"
+        "10.7.0.1,VM,,,,,false\n"
+    ).encode("utf-8")
+    # Two gzip members back to back, as produced by concatenating .gz files.
+    compressed = gzip.compress(ip_assets_csv[:20]) + gzip.compress(ip_assets_csv[20:])
+
+    response = test_client.post(
+        "/import/csv?dry_run=1",
+        headers=_auth_headers(token),
+        files={"ip_assets": ("ip-assets.csv.gz", compressed, "application/gzip")},
+    )
+
+    assert response.status_code == 200
+    assert response.json()["summary"]["ip_assets"]["would_create"] == 1
+
+
+def test_api_bundle_import_reads_gzip_content_encoding(client) -> None:
+    test_client, db_path = client
+    _create_user(db_path, "viewer-gzip-bundle", "viewer-pass", UserRole.VIEWER)
+    token = _login(test_client, "viewer-gzip-bundle", "viewer-pass")
+    ndjson = (
+        '{"schema_version": "1"}\n'
+        '{"entity": "ip_asset", "ip_address": "10.7.0.2", "type": "VM"}\n'
+    ).encode("utf-8")
+
+    response = test_client.post(
+        "/import/bundle?dry_run=1",
+        headers=_auth_headers(token),
+        files={
+            "file": (
+                "bundle.ndjson",
+                gzip.compress(ndjson),
+                "application/x-ndjson",
+                {"Content-Encoding": "gzip"},
+            )
+        },
+    )
+
+    assert response.status_code == 200
+    assert response.json()["summary"]["ip_assets"]["would_create"] == 1
+
+
+def test_api_import_limits_decompressed_gzip_size(client, monkeypatch) -> None:
+    test_client, db_path = client
+    _create_user(db_path, "viewer-gzip-limit", "viewer-pass", UserRole.VIEWER)
+    token = _login(test_client, "viewer-gzip-limit", "viewer-pass")
+    monkeypatch.setattr(imports_routes, "IMPORT_STREAMED_UPLOAD_MAX_BYTES", 1024)
+    compressed = gzip.compress(b"0" * (256 * 1024))
+    assert len(compressed) < 1024
+
+    too_large = test_client.post(
+        "/import/bundle?dry_run=1",
+        headers=_auth_headers(token),
+        files={"file": ("bundle.json.gz", compressed, "application/gzip")},
+    )
+    truncated = test_client.post(
+        "/import/bundle?dry_run=1",
+        headers=_auth_headers(token),
+        files={
+            "file": ("bundle.json.gz", gzip.compress(b"{}")[:-8], "application/gzip")
+        },
+    )
+
+    assert too_large.status_code == 413
+    assert (
+        too_large.json()["detail"]
+        == "Uploaded file exceeds maximum size of 1024 bytes."
+    )
+    assert truncated.status_code == 400
+    assert truncated.json()["detail"] == "Uploaded gzip file is truncated."
+
+
 def test_csv_apply_clears_existing_ip_asset_note_when_note_cell_is_empty(
     client,
 ) -> None:
@@ -936,3 +1096,634 @@ def test_round_trip_bundle_import(tmp_path) -> None:
         assert tag_map[imported.id] == ["edge", "prod"]
     finally:
         target_connection.close()
+
+
+def test_run_import_reports_failed_row_and_keeps_rest_of_batch(
+    tmp_path, monkeypatch
+) -> None:
+    connection = db.connect(str(tmp_path / "row-failure.db"))
+    try:
+        db.init_db(connection)
+        original_create = repository.create_ip_asset
+
+        def _failing_create(session, *args, **kwargs):
+            created = original_create(session, *args, **kwargs)
+            if kwargs["ip_address"] == "10.0.0.11":
+                raise sqlite3.IntegrityError("simulated failure")
+            return created
+
+        monkeypatch.setattr(repository, "create_ip_asset", _failing_create)
+        payload = _bundle_payload()
+        payload["data"]["ip_assets"].append(
+            {"ip_address": "10.0.0.11", "type": "VM", "tags": ["edge"]}
+        )
+        result = run_import(
+            connection,
+            BundleImporter(),
+            {"bundle": json.dumps(payload).encode("utf-8")},
+            audit_context=ImportAuditContext(
+                user=None,
+                source="test_row_failure",
+                mode="apply",
+                input_label="bundle.json",
+            ),
+        )
+
+        assert [issue.location for issue in result.errors] == ["data.ip_assets[1]"]
+        assert "simulated failure" in result.errors[0].message
+        assert result.summary.ip_assets.would_create == 1
+        assert repository.get_ip_asset_by_ip(connection, "10.0.0.10") is not None
+        assert repository.get_ip_asset_by_ip(connection, "10.0.0.11") is None
+        assert repository.get_tag_by_name(connection, "edge") is None
+        logs = repository.list_audit_logs(
+            connection, target_type="IMPORT_RUN", limit=10
+        )
+        assert len(logs) == 1
+        assert "errors=1" in (logs[0].changes or "")
+    finally:
+        connection.close()
+
+
+def test_run_import_rolls_back_everything_on_unexpected_error(
+    tmp_path, monkeypatch
+) -> None:
+    connection = db.connect(str(tmp_path / "abort.db"))
+    try:
+        db.init_db(connection)
+
+        def _crash(*args, **kwargs):
+            raise RuntimeError("boom")
+
+        monkeypatch.setattr(repository, "create_ip_asset", _crash)
+        with pytest.raises(RuntimeError):
+            run_import(
+                connection,
+                BundleImporter(),
+                {"bundle": json.dumps(_bundle_payload()).encode("utf-8")},
+            )
+
+        assert list(repository.list_vendors(connection)) == []
+        assert list(repository.list_projects(connection)) == []
+        assert list(repository.list_hosts(connection)) == []
+    finally:
+        connection.close()
+
+
+def test_run_import_aborts_when_the_database_is_locked(tmp_path) -> None:
+    db_path = tmp_path / "locked.db"
+    connection = db.connect(str(db_path))
+    holder = sqlite3.connect(str(db_path), isolation_level=None)
+    try:
+        db.init_db(connection)
+        holder.execute("BEGIN IMMEDIATE")
+        with pytest.raises(OperationalError, match="database is locked"):
+            run_import(
+                connection,
+                BundleImporter(),
+                {"bundle": json.dumps(_bundle_payload()).encode("utf-8")},
+            )
+        holder.execute("ROLLBACK")
+
+        assert list(repository.list_vendors(connection)) == []
+        assert list(repository.list_hosts(connection)) == []
+    finally:
+        holder.close()
+        connection.close()
+
+
+def test_run_import_applies_csv_in_batches(tmp_path) -> None:
+    connection = db.connect(str(tmp_path / "batched.db"))
+    try:
+        db.init_db(connection)
+        hosts_csv = (
+            b"name,notes,vendor_name,project_name,os_ip\n"
+            b"node-01,,Dell,core,10.1.0.1\n"
+            b"node-02,,Dell,core,10.1.0.2\n"
+            b"node-03,,HPE,edge,10.1.0.3\n"
+        )
+        ip_assets_csv = (
+            b"ip_address,type,project_name,host_name,notes,archived\n"
+            b"10.1.1.1,VM,core,node-01,,false\n"
+            b"10.1.1.2,VIP,edge,node-03,,false\n"
+            b"10.1.0.3,OS,edge,node-03,updated,false\n"
+        )
+        result = run_import(
+            connection,
+            CsvImporter(),
+            {"hosts": hosts_csv, "ip_assets": ip_assets_csv},
+            batch_size=2,
+        )
+
+        assert result.errors == []
+        assert result.summary.vendors.would_create == 2
+        assert result.summary.projects.would_create == 2
+        assert result.summary.hosts.would_create == 3
+        assert result.summary.ip_assets.would_create == 5
+        assert result.summary.ip_assets.would_update == 1
+        assert len(repository.list_hosts(connection)) == 3
+        asset = repository.get_ip_asset_by_ip(connection, "10.1.0.3")
+        assert asset is not None
+        assert asset.notes == "updated"
+    finally:
+        connection.close()
+
+
+def test_run_import_rolls_back_earlier_batches_when_later_batch_is_invalid(
+    tmp_path,
+) -> None:
+    connection = db.connect(str(tmp_path / "batched-invalid.db"))
+    try:
+        db.init_db(connection)
+        ip_assets_csv = (
+            b"ip_address,type,project_name,host_name,notes,archived\n"
+            b"10.2.0.1,VM,,,,false\n"
+            b"10.2.0.2,VM,,,,false\n"
+            b"not-an-ip,VM,,,,false\n"
+            b"10.2.0.4,VM,,missing-host,,false\n"
+        )
+        result = run_import(
+            connection,
+            CsvImporter(),
+            {"ip_assets": ip_assets_csv},
+            batch_size=2,
+        )
+
+        assert [issue.location for issue in result.errors] == [
+            "ip-assets.csv:line 4.ip_address",
+            "ip-assets.csv:line 5.host_name",
+        ]
+        assert result.summary.total().would_create == 0
+        assert repository.get_ip_asset_by_ip(connection, "10.2.0.1") is None
+    finally:
+        connection.close()
+
+
+def test_run_import_loads_catalog_once_without_full_model_lists(
+    tmp_path, monkeypatch
+) -> None:
+    connection = db.connect(str(tmp_path / "catalog.db"))
+    try:
+        db.init_db(connection)
+        repository.create_vendor(connection, "Dell")
+        repository.create_host(connection, name="node-01", vendor="Dell")
+
+        def _full_list(*args, **kwargs):
+            raise AssertionError("imports should use the catalog snapshot")
+
+        for name in ("list_vendors", "list_projects", "list_hosts"):
+            monkeypatch.setattr(repository, name, _full_list)
+        catalog_loads = []
+        original_load = repository.list_host_ids_by_name
+
+        def _counting_load(*args, **kwargs):
+            catalog_loads.append(1)
+            return original_load(*args, **kwargs)
+
+        monkeypatch.setattr(repository, "list_host_ids_by_name", _counting_load)
+        hosts_csv = (
+            b"name,notes,vendor_name,project_name,os_ip\n"
+            b"node-01,updated,Dell,core,10.3.0.1\n"
+            b"node-02,,Dell,core,10.3.0.2\n"
+            b"node-03,,HPE,,\n"
+        )
+        ip_assets_csv = (
+            b"ip_address,type,project_name,host_name,notes,archived\n"
+            b"10.3.1.1,VM,core,node-03,,false\n"
+        )
+
+        result = run_import(
+            connection,
+            CsvImporter(),
+            {"hosts": hosts_csv, "ip_assets": ip_assets_csv},
+            batch_size=1,
+        )
+
+        assert result.errors == []
+        assert catalog_loads == [1]
+        assert result.catalog_load_ms is not None
+        assert result.summary.hosts.would_create == 2
+        assert result.summary.hosts.would_update == 1
+        asset = repository.get_ip_asset_by_ip(connection, "10.3.1.1")
+        assert asset is not None
+        assert asset.host_id == repository.get_host_by_name(connection, "node-03").id
+    finally:
+        connection.close()
+
+
+def test_run_import_reports_progress_per_batch(tmp_path) -> None:
+    connection = db.connect(str(tmp_path / "progress.db"))
+    try:
+        db.init_db(connection)
+        hosts_csv = b"name,notes,vendor_name\nnode-01,,Dell\nnode-02,,Dell\n"
+        updates = []
+
+        result = run_import(
+            connection,
+            CsvImporter(),
+            {"hosts": hosts_csv},
+            batch_size=1,
+            progress=updates.append,
+        )
+
+        assert result.errors == []
+        phases = [update.phase for update in updates]
+        assert phases[0] == "parsing"
+        assert phases[-1] == "finalizing"
+        assert phases.count("applying") == 2
+        assert updates[-1].rows_processed == 2
+        assert updates[-1].batches_processed == 2
+    finally:
+        connection.close()
+
+
+def _wait_for_import_job(test_client, token: str, job_id: str) -> dict:
+    for _ in range(200):
+        response = test_client.get(
+            f"/import/jobs/{job_id}", headers=_auth_headers(token)
+        )
+        assert response.status_code == 200
+        payload = response.json()
+        if payload["status"] in {"completed", "failed"}:
+            return payload
+        time.sleep(0.05)
+    raise AssertionError("import job did not finish")
+
+
+def test_csv_import_job_reports_progress_and_result(client) -> None:
+    test_client, db_path = client
+    _create_user(db_path, "editor", "editor-pass", UserRole.EDITOR)
+    _create_user(db_path, "other", "other-pass", UserRole.EDITOR)
+    token = _login(test_client, "editor", "editor-pass")
+    hosts_csv = "name,notes,vendor_name\nnode-02,worker,Dell\n"
+
+    response = test_client.post(
+        "/import/jobs/csv",
+        headers=_auth_headers(token),
+        files={"hosts": ("hosts.csv", hosts_csv, "text/csv")},
+    )
+
+    assert response.status_code == 202
+    submitted = response.json()
+    job_id = submitted["job_id"]
+    assert submitted["status_url"] == f"/import/jobs/{job_id}"
+    payload = _wait_for_import_job(test_client, token, job_id)
+    assert payload["status"] == "completed"
+    assert payload["progress"]["phase"] == "completed"
+    assert payload["progress"]["rows_processed"] == 1
+    assert payload["result"]["summary"]["hosts"]["would_create"] == 1
+
+    with test_client.stream(
+        "GET", f"/import/jobs/{job_id}/events", headers=_auth_headers(token)
+    ) as events:
+        assert events.headers["content-type"].startswith("text/event-stream")
+        body = "".join(events.iter_text())
+    assert "event: result" in body
+
+    other_token = _login(test_client, "other", "other-pass")
+    assert (
+        test_client.get(
+            f"/import/jobs/{job_id}", headers=_auth_headers(other_token)
+        ).status_code
+        == 404
+    )
+    connection = db.connect(str(db_path))
+    try:
+        assert repository.get_host_by_name(connection, "node-02") is not None
+    finally:
+        connection.close()
+
+
+def test_import_job_submit_rejects_when_queue_is_full(client, monkeypatch) -> None:
+    test_client, db_path = client
+    _create_user(db_path, "viewer", "viewer-pass", UserRole.VIEWER)
+    token = _login(test_client, "viewer", "viewer-pass")
+    monkeypatch.setattr(import_jobs, "IMPORT_JOB_MAX_PENDING", 0)
+
+    response = test_client.post(
+        "/import/jobs/bundle?dry_run=1",
+        headers=_auth_headers(token),
+        files={
+            "file": ("bundle.json", json.dumps(_bundle_payload()), "application/json")
+        },
+    )
+
+    assert response.status_code == 429
+
+
+def test_sync_import_rejects_when_import_pool_is_full(client, monkeypatch) -> None:
+    test_client, db_path = client
+    _create_user(db_path, "viewer", "viewer-pass", UserRole.VIEWER)
+    token = _login(test_client, "viewer", "viewer-pass")
+    bundle = json.dumps(_bundle_payload())
+
+    monkeypatch.setattr(import_jobs, "IMPORT_SYNC_MAX_PENDING", 0)
+    rejected = test_client.post(
+        "/import/bundle?dry_run=1",
+        headers=_auth_headers(token),
+        files={"file": ("bundle.json", bundle, "application/json")},
+    )
+    monkeypatch.setattr(import_jobs, "IMPORT_SYNC_MAX_PENDING", 1)
+    first = test_client.post(
+        "/import/bundle?dry_run=1",
+        headers=_auth_headers(token),
+        files={"file": ("bundle.json", bundle, "application/json")},
+    )
+    second = test_client.post(
+        "/import/bundle?dry_run=1",
+        headers=_auth_headers(token),
+        files={"file": ("bundle.json", bundle, "application/json")},
+    )
+
+    assert rejected.status_code == 429
+    assert "Too many imports in progress" in rejected.json()["detail"]
+    # Finished imports hand their slot back.
+    assert first.status_code == 200
+    assert second.status_code == 200
+    assert import_jobs._IMPORT_SYNC_PENDING == 0
+
+
+def test_import_job_marks_failed_and_closes_inputs_when_connect_fails(
+    monkeypatch,
+) -> None:
+    def _refuse_connect(_db_path):
+        raise sqlite3.OperationalError("unable to open database file")
+
+    monkeypatch.setattr(import_jobs.db, "connect", _refuse_connect)
+    job = import_jobs.ImportJob(id="connect-fails", source="bundle", dry_run=True)
+    monkeypatch.setitem(import_jobs._IMPORT_JOBS, job.id, job)
+    bundle = io.BytesIO(json.dumps(_bundle_payload()).encode("utf-8"))
+
+    import_jobs._run_import_job(
+        job.id,
+        db_path="/nonexistent/import.db",
+        importer=BundleImporter(),
+        inputs={"bundle": bundle},
+        options=None,
+        dry_run=True,
+        audit_context=None,
+    )
+
+    finished = import_jobs.get_import_job(job.id)
+    assert finished is not None
+    assert finished.status == "failed"
+    assert finished.error == "unable to open database file"
+    assert finished.progress.phase == "failed"
+    assert bundle.closed
+
+
+def test_run_import_skips_rows_matching_stored_fingerprint(
+    tmp_path, monkeypatch
+) -> None:
+    connection = db.connect(str(tmp_path / "fingerprint.db"))
+    try:
+        db.init_db(connection)
+        ip_assets_csv = (
+            b"ip_address,type,project_name,host_name,notes,archived,tags\n"
+            b"10.4.0.1,VM,,,web,false,prod\n"
+            b"10.4.0.2,OS,,,db,false,\n"
+        )
+        first = run_import(connection, CsvImporter(), {"ip_assets": ip_assets_csv})
+        assert first.summary.ip_assets.would_create == 2
+
+        lookups = []
+        original_get = repository.get_ip_asset_by_ip
+
+        def _counting_get(*args, **kwargs):
+            lookups.append(args[1])
+            return original_get(*args, **kwargs)
+
+        monkeypatch.setattr(repository, "get_ip_asset_by_ip", _counting_get)
+        second = run_import(connection, CsvImporter(), {"ip_assets": ip_assets_csv})
+        assert second.summary.ip_assets.would_skip == 2
+        assert lookups == []
+
+        repository.update_ip_asset(connection, "10.4.0.1", notes="edited")
+        repository.set_ip_asset_tags(
+            connection, original_get(connection, "10.4.0.2").id, ["manual"]
+        )
+        third = run_import(connection, CsvImporter(), {"ip_assets": ip_assets_csv})
+        assert third.summary.ip_assets.would_update == 2
+        assert sorted(lookups) == ["10.4.0.1", "10.4.0.2"]
+        assert original_get(connection, "10.4.0.1").notes == "web"
+    finally:
+        connection.close()
+
+
+def test_json_bundle_entries_survive_small_read_chunks() -> None:
+    payload = _bundle_payload()
+    payload["data"]["ip_assets"].append(
+        {"ip_address": "10.0.0.99", "type": "OTHER", "tags": [], "archived": True}
+    )
+    payload["extra"] = {"ignored": [1, 2.5, None, "x" * 50]}
+    encoded = json.dumps(payload, indent=2).encode("utf-8")
+
+    entries = [
+        (section, entry, source.location)
+        for section, entry, source in iter_json_bundle_entries(
+            io.BytesIO(encoded), chunk_size=7
+        )
+    ]
+
+    assert entries == [
+        (section, entry, f"data.{section}[{index}]")
+        for section in ("vendors", "projects", "hosts", "ip_assets")
+        for index, entry in enumerate(payload["data"][section])
+    ]
+
+
+def test_json_bundle_syntax_error_is_raised_without_reading_the_rest() -> None:
+    entity = b'{"ip_address": "10.0.0.1", "type": "VM", "notes": "' + b"x" * 200 + b'"}'
+    payload = (
+        b'{"schema_version": "1", "data": {"ip_assets": ['
+        + entity
+        + b",,"
+        + b",".join([entity] * 20_000)
+        + b"]}}"
+    )
+
+    class _CountingStream(io.BytesIO):
+        bytes_read = 0
+
+        def read(self, size=-1):
+            chunk = super().read(size)
+            self.bytes_read += len(chunk)
+            return chunk
+
+        def read1(self, size=-1):
+            chunk = super().read1(size)
+            self.bytes_read += len(chunk)
+            return chunk
+
+    stream = _CountingStream(payload)
+    with pytest.raises(ImportParseError):
+        list(iter_json_bundle_entries(stream))
+
+    assert len(payload) > 4_000_000
+    assert stream.bytes_read < 256 * 1024
+
+
+def test_json_bundle_numbers_survive_a_chunk_split_at_every_offset() -> None:
+    payload = _bundle_payload()
+    payload["ratio"] = 1.25
+    payload["scale"] = -3.5e10
+    payload["data"]["metrics"] = [12, -0.125, 2e-3]
+    encoded = json.dumps(payload, separators=(",", ":")).encode("utf-8")
+    # json.dumps never writes an upper-case or signed exponent, so add them.
+    encoded = encoded.replace(b"-35000000000.0", b"-3.5E+10")
+    encoded = encoded.replace(b"0.002", b"2e-3")
+    assert b"-3.5E+10" in encoded and b"2e-3" in encoded
+    expected = [
+        (section, entry)
+        for section in ("vendors", "projects", "hosts", "ip_assets")
+        for entry in payload["data"][section]
+    ]
+
+    # The first chunk boundary falls at every offset in turn.
+    for chunk_size in range(1, len(encoded) + 1):
+        entries = [
+            (section, entry)
+            for section, entry, _source in iter_json_bundle_entries(
+                io.BytesIO(encoded), chunk_size=chunk_size
+            )
+        ]
+        assert entries == expected, chunk_size
+
+
+def test_bundle_importer_yields_json_batches_in_document_order() -> None:
+    batches = list(
+        BundleImporter().iter_batches(
+            {"bundle": io.BytesIO(json.dumps(_bundle_payload()).encode("utf-8"))},
+            batch_size=2,
+        )
+    )
+
+    assert [
+        (
+            len(batch.vendors),
+            len(batch.projects),
+            len(batch.hosts),
+            len(batch.ip_assets),
+        )
+        for batch in batches
+    ] == [(1, 1, 0, 0), (0, 0, 1, 1)]
+    assert batches[1].ip_assets[0].source.location == "data.ip_assets[0]"
+
+
+@pytest.mark.parametrize(
+    ("payload", "location"),
+    [
+        (b'{"schema_version": "2", "data": {}}', "schema_version"),
+        (b'{"schema_version": "1"}', "data"),
+        (b'{"schema_version": "1", "data": {"hosts": {}}}', "data.hosts"),
+        (b'{"schema_version": "1", "data": {"hosts": [1]}}', "data.hosts[0]"),
+        (b'{"schema_version": "1", "data": {"hosts": [', "import"),
+    ],
+)
+def test_bundle_importer_reports_streaming_parse_errors(payload, location) -> None:
+    with pytest.raises(ImportParseError) as excinfo:
+        list(BundleImporter().iter_batches({"bundle": payload}))
+
+    assert excinfo.value.location == location
+
+
+def test_run_import_applies_ndjson_bundle(tmp_path) -> None:
+    ndjson = b"\n".join(
+        [
+            b'{"app": "ipocket", "schema_version": "1"}',
+            b'{"entity": "vendor", "name": "HPE"}',
+            b'{"entity": "host", "name": "node-01", "vendor_name": "HPE"}',
+            b"",
+            b'{"entity": "ip_asset", "ip_address": "10.5.0.1", "type": "VM", '
+            b'"host_name": "node-01", "tags": ["edge"]}',
+        ]
+    )
+    connection = db.connect(str(tmp_path / "ndjson.db"))
+    try:
+        db.init_db(connection)
+        result = run_import(
+            connection,
+            BundleImporter(),
+            {"bundle": io.BytesIO(ndjson)},
+            options={"format": "ndjson"},
+            batch_size=1,
+        )
+
+        assert result.errors == []
+        assert result.summary.hosts.would_create == 1
+        asset = repository.get_ip_asset_by_ip(connection, "10.5.0.1")
+        assert asset is not None
+        assert asset.host_id == repository.get_host_by_name(connection, "node-01").id
+
+        invalid = run_import(
+            connection,
+            BundleImporter(),
+            {"bundle": ndjson + b'\n{"entity": "subnet"}\n'},
+            options={"format": "ndjson"},
+        )
+        assert [(error.location, error.message) for error in invalid.errors] == [
+            (
+                "line 6.entity",
+                "Unknown entity (expected vendor, project, host or ip_asset).",
+            )
+        ]
+    finally:
+        connection.close()
+
+
+def test_api_bundle_import_accepts_ndjson_upload(client) -> None:
+    test_client, db_path = client
+    _create_user(db_path, "viewer", "viewer-pass", UserRole.VIEWER)
+    token = _login(test_client, "viewer", "viewer-pass")
+    ndjson = (
+        '{"schema_version": "1"}\n'
+        '{"entity": "ip_asset", "ip_address": "10.6.0.1", "type": "VM"}\n'
+    )
+
+    response = test_client.post(
+        "/import/bundle?dry_run=1",
+        headers=_auth_headers(token),
+        files={"file": ("bundle.ndjson", ndjson, "application/octet-stream")},
+    )
+
+    assert response.status_code == 200
+    assert response.json()["summary"]["ip_assets"]["would_create"] == 1
+
+
+def test_import_source_formats_location_on_demand() -> None:
+    assert ImportSource("ip-assets.csv", 12).location == "ip-assets.csv:line 12"
+    assert ImportSource("data.hosts", index=3).location == "data.hosts[3]"
+    assert ImportSource("", 7).with_field("entity").location == "line 7.entity"
+    assert (
+        ImportSource("hosts.csv", 2).with_field("os_ip").with_field("ip_address")
+    ).location == "hosts.csv:line 2.os_ip.ip_address"
+    assert not hasattr(ImportSource("hosts.csv", 2), "__dict__")
+
+
+def test_csv_importer_reads_columns_by_position() -> None:
+    csv_text = (
+        "host_name,tags,ip_address,type,notes,archived,project_name,tags\n"
+        "node-01,ignored,10.0.0.1,VM,first,yes,core,prod\n"
+        "\n"
+        "node-01,ignored,10.0.0.2,VM\n"
+        ",,10.0.0.3,VM,, ,core,prod,extra\n"
+    )
+
+    bundle = CsvImporter().parse({"ip_assets": csv_text.encode("utf-8")})
+
+    first, second, third = bundle.ip_assets
+    assert (first.ip_address, first.notes, first.archived, first.tags) == (
+        "10.0.0.1",
+        "first",
+        True,
+        ["prod"],
+    )
+    assert (second.project_name, second.notes, second.tags) == (None, None, None)
+    assert (third.host_name, third.archived) == (None, None)
+    assert third.tags is first.tags
+    assert first.host_name is second.host_name
+    assert [asset.source.location for asset in bundle.ip_assets] == [
+        "ip-assets.csv:line 2",
+        "ip-assets.csv:line 4",
+        "ip-assets.csv:line 5",
+    ]
+    assert [project.name for project in bundle.projects] == ["core"]
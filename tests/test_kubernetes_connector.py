@@ -1,11 +1,18 @@
 from __future__ import annotations
 
 import json
+import sqlite3
 import ssl
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
 
 import pytest
 
+from app import repository
 from app.connectors import kubernetes
+from app.models import IPAssetType
 from app.connectors.kubernetes import (
     KubernetesConnectorError,
     KubernetesNodeRecord,
@@ -79,7 +86,7 @@ def test_fetch_kubernetes_nodes_calls_api_and_parses_node_list(monkeypatch) -> N
         timeout=9,
     )
 
-    assert calls[0]["url"] == "https://k8s.example.local:6443/api/v1/nodes"
+    assert calls[0]["url"] == "https://k8s.example.local:6443/api/v1/nodes?limit=500"
     assert calls[0]["method"] == "GET"
     assert calls[0]["headers"]["Authorization"] == "Bearer token-123"
     assert calls[0]["timeout"] == 9
@@ -110,6 +117,114 @@ def test_fetch_kubernetes_nodes_rejects_unexpected_payload(monkeypatch) -> None:
         fetch_kubernetes_nodes(api_url="https://k8s.example.local", token="token")
 
 
+def test_fetch_kubernetes_nodes_pages_with_continue_and_selectors(
+    monkeypatch,
+) -> None:
+    urls: list[str] = []
+    pages = {
+        None: {
+            "metadata": {"continue": "next-page"},
+            "items": [
+                {
+                    "metadata": {"name": "worker-01"},
+                    "status": {
+                        "addresses": [{"type": "InternalIP", "address": "10.42.0.1"}]
+                    },
+                }
+            ],
+        },
+        "next-page": {
+            "metadata": {"continue": ""},
+            "items": [
+                {
+                    "metadata": {"name": "worker-02"},
+                    "status": {
+                        "addresses": [{"type": "InternalIP", "address": "10.42.0.2"}]
+                    },
+                }
+            ],
+        },
+    }
+
+    def _fake_urlopen(request, timeout, context):
+        urls.append(request.full_url)
+        token = parse_qs(urlsplit(request.full_url).query).get("continue", [None])[0]
+        return _FakeResponse(json.dumps(pages[token]).encode("utf-8"))
+
+    monkeypatch.setattr(kubernetes.urllib_request, "urlopen", _fake_urlopen)
+
+    pages_seen = list(
+        kubernetes.iter_kubernetes_node_pages(
+            api_url="https://k8s.example.local",
+            token="token",
+            page_size=1,
+            label_selector="node-role.kubernetes.io/worker",
+            field_selector="spec.unschedulable=false",
+        )
+    )
+
+    assert [[record.name for record in page] for page in pages_seen] == [
+        ["worker-01"],
+        ["worker-02"],
+    ]
+    assert urls == [
+        "https://k8s.example.local/api/v1/nodes?limit=1"
+        "&labelSelector=node-role.kubernetes.io%2Fworker"
+        "&fieldSelector=spec.unschedulable%3Dfalse",
+        "https://k8s.example.local/api/v1/nodes?limit=1&continue=next-page"
+        "&labelSelector=node-role.kubernetes.io%2Fworker"
+        "&fieldSelector=spec.unschedulable%3Dfalse",
+    ]
+
+
+def test_fetch_kubernetes_nodes_reads_metadata_only_table(monkeypatch) -> None:
+    requests = []
+
+    def _fake_urlopen(request, timeout, context):
+        requests.append(request)
+        return _FakeResponse(
+            json.dumps(
+                {
+                    "kind": "Table",
+                    "metadata": {},
+                    "columnDefinitions": [
+                        {"name": "Name"},
+                        {"name": "Status"},
+                        {"name": "Internal-IP"},
+                    ],
+                    "rows": [
+                        {
+                            "cells": ["worker-01", "Ready", "10.42.0.10"],
+                            "object": {
+                                "kind": "PartialObjectMetadata",
+                                "metadata": {
+                                    "name": "worker-01",
+                                    "labels": {"zone": "az-a"},
+                                },
+                            },
+                        },
+                        {"cells": ["worker-02", "NotReady", "<none>"]},
+                    ],
+                }
+            ).encode("utf-8")
+        )
+
+    monkeypatch.setattr(kubernetes.urllib_request, "urlopen", _fake_urlopen)
+
+    result = fetch_kubernetes_nodes(
+        api_url="https://k8s.example.local", token="token", table_format=True
+    )
+
+    assert requests[0].full_url.endswith("?limit=500&includeObject=Metadata")
+    assert requests[0].get_header("Accept") == kubernetes.KUBERNETES_TABLE_ACCEPT
+    assert result == [
+        KubernetesNodeRecord(
+            name="worker-01", internal_ips=("10.42.0.10",), labels={"zone": "az-a"}
+        ),
+        KubernetesNodeRecord(name="worker-02", internal_ips=(), labels={}),
+    ]
+
+
 def test_extract_inventory_from_nodes_maps_hosts_ips_and_warnings() -> None:
     records = [
         KubernetesNodeRecord(
@@ -294,3 +409,252 @@ def test_cli_validation_requires_output_or_db_path() -> None:
                 "0",
             ]
         )
+
+
+def _node(name: str, ip: str, resource_version: str, **labels: str) -> dict:
+    return {
+        "metadata": {
+            "name": name,
+            "resourceVersion": resource_version,
+            "labels": labels,
+        },
+        "status": {"addresses": [{"type": "InternalIP", "address": ip}]},
+    }
+
+
+class _FakeKubernetesAPI:
+    """Serve scripted node lists and watch streams over real HTTP."""
+
+    def __init__(self, lists: list[dict], watches: list[object]) -> None:
+        self.lists = list(lists)
+        self.watches = list(watches)
+        self.requests: list[dict[str, list[str]]] = []
+        api = self
+
+        class _Handler(BaseHTTPRequestHandler):
+            def log_message(self, *_args) -> None:
+                pass
+
+            def do_GET(self) -> None:
+                query = parse_qs(urlsplit(self.path).query)
+                api.requests.append(query)
+                if "watch" not in query:
+                    self._send(200, json.dumps(api.lists.pop(0)).encode("utf-8"))
+                    return
+                script = api.watches.pop(0) if api.watches else []
+                if script == "gone":
+                    self._send(410, b'{"kind":"Status","code":410}')
+                    return
+                time.sleep(0 if script else 0.05)
+                body = b"".join(
+                    json.dumps(event).encode("utf-8") + b"\n" for event in script
+                )
+                self._send(200, body)
+
+            def _send(self, status: int, body: bytes) -> None:
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+        self.url = f"http://127.0.0.1:{self.server.server_address[1]}"
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+
+    def __enter__(self) -> _FakeKubernetesAPI:
+        self.thread.start()
+        return self
+
+    def __exit__(self, *_exc) -> None:
+        self.server.shutdown()
+        self.server.server_close()
+
+
+def test_node_watch_applies_only_changed_nodes_and_relists_on_gone() -> None:
+    first_list = {
+        "metadata": {"resourceVersion": "10"},
+        "items": [
+            _node("node-a", "10.50.0.1", "5"),
+            _node("node-b", "10.50.0.2", "6"),
+        ],
+    }
+    lists = [
+        first_list,
+        first_list,
+        {
+            "metadata": {"resourceVersion": "20"},
+            "items": [
+                _node("node-b", "10.50.0.22", "18", zone="b"),
+                _node("node-c", "10.50.0.3", "13"),
+            ],
+        },
+    ]
+    watches = [
+        "gone",
+        [
+            # A status heartbeat leaves the parsed record unchanged.
+            {"type": "MODIFIED", "object": _node("node-a", "10.50.0.1", "11")},
+            {
+                "type": "MODIFIED",
+                "object": _node("node-b", "10.50.0.2", "12", zone="b"),
+            },
+            {"type": "ADDED", "object": _node("node-c", "10.50.0.3", "13")},
+            {"type": "DELETED", "object": _node("node-a", "10.50.0.1", "14")},
+            {"type": "BOOKMARK", "object": {"metadata": {"resourceVersion": "15"}}},
+        ],
+        [{"type": "ERROR", "object": {"kind": "Status", "code": 410}}],
+    ]
+    batches: list[tuple[list[str], list[str]]] = []
+    stop = threading.Event()
+
+    def _apply_batch(upserts, deleted) -> None:
+        batches.append(
+            (
+                [f"{record.name}={record.internal_ips[0]}" for record in upserts],
+                [record.name for record in deleted],
+            )
+        )
+        if len(batches) == 5:
+            stop.set()
+
+    with _FakeKubernetesAPI(lists, watches) as api:
+        watch = kubernetes.KubernetesNodeWatch(
+            api_url=api.url,
+            token="token",
+            apply_batch=_apply_batch,
+            label_selector="pool=general",
+            debounce_seconds=0,
+            poll_seconds=0.05,
+            retry_seconds=0.05,
+        )
+        runner = threading.Thread(target=watch.run, args=(stop,))
+        runner.start()
+        runner.join(timeout=10)
+        assert not runner.is_alive()
+
+    assert batches == [
+        (["node-a=10.50.0.1", "node-b=10.50.0.2"], []),
+        (["node-b=10.50.0.2"], []),
+        (["node-c=10.50.0.3"], []),
+        ([], ["node-a"]),
+        (["node-b=10.50.0.22"], []),
+    ]
+    assert watch.relist_count == 3
+    watch_requests = [query for query in api.requests if "watch" in query]
+    assert [query["resourceVersion"] for query in watch_requests[:4]] == [
+        ["10"],
+        ["10"],
+        ["15"],
+        ["20"],
+    ]
+    assert watch_requests[0]["labelSelector"] == ["pool=general"]
+
+
+def test_node_watch_retries_a_batch_that_failed_to_apply() -> None:
+    node_list = {
+        "metadata": {"resourceVersion": "10"},
+        "items": [
+            _node("node-a", "10.50.0.1", "5"),
+            _node("node-b", "10.50.0.2", "6"),
+        ],
+    }
+    watches = [
+        "gone",
+        [{"type": "MODIFIED", "object": _node("node-b", "10.50.0.22", "11")}],
+    ]
+    attempts: list[list[str]] = []
+    batches: list[list[str]] = []
+    stop = threading.Event()
+
+    def _apply_batch(upserts, deleted) -> None:
+        names = [f"{record.name}={record.internal_ips[0]}" for record in upserts]
+        attempts.append(names)
+        if len(attempts) == 1:
+            raise sqlite3.OperationalError("database is locked")
+        batches.append(names)
+        if len(batches) == 2:
+            stop.set()
+
+    with _FakeKubernetesAPI([node_list, node_list], watches) as api:
+        watch = kubernetes.KubernetesNodeWatch(
+            api_url=api.url,
+            token="token",
+            apply_batch=_apply_batch,
+            debounce_seconds=0,
+            poll_seconds=0.05,
+            retry_seconds=0.05,
+        )
+        runner = threading.Thread(target=watch.run, args=(stop,))
+        runner.start()
+        runner.join(timeout=10)
+        assert not runner.is_alive()
+
+    # The failed batch is kept and applied after the re-list, which finds
+    # nothing new because the listed nodes are already known.
+    assert attempts[0] == ["node-a=10.50.0.1", "node-b=10.50.0.2"]
+    assert batches == [
+        ["node-a=10.50.0.1", "node-b=10.50.0.2"],
+        ["node-b=10.50.0.22"],
+    ]
+    assert watch.relist_count == 2
+
+
+def test_node_watch_debounces_a_burst_into_one_batch() -> None:
+    now = [100.0]
+    batches = []
+    watch = kubernetes.KubernetesNodeWatch(
+        api_url="https://k8s.example.local",
+        token="token",
+        apply_batch=lambda upserts, deleted: batches.append((upserts, deleted)),
+        debounce_seconds=2,
+        max_delay_seconds=30,
+        clock=lambda: now[0],
+    )
+    for index in range(20):
+        now[0] += 0.5
+        watch.handle_event(
+            {"type": "ADDED", "object": _node(f"node-{index}", f"10.50.1.{index}", "1")}
+        )
+        assert watch.flush() is False
+
+    now[0] += 2
+    assert watch.flush() is True
+    assert len(batches) == 1
+    assert len(batches[0][0]) == 20
+    assert watch.flush() is False
+
+    with pytest.raises(kubernetes._WatchExpired):
+        watch.handle_event({"type": "ERROR", "object": {"code": 410}})
+
+
+def test_build_node_change_bundle_archives_deleted_node_ips(_setup_connection) -> None:
+    connection = _setup_connection()
+    try:
+        repository.create_host(connection, "node-b")
+        repository.create_ip_asset(
+            connection,
+            "10.50.2.2",
+            IPAssetType.OS,
+            host_id=repository.get_host_by_name(connection, "node-b").id,
+            notes="rack 4",
+        )
+        bundle, _warnings = kubernetes.build_node_change_bundle(
+            [KubernetesNodeRecord(name="node-a", internal_ips=("10.50.2.1",))],
+            [KubernetesNodeRecord(name="node-b", internal_ips=("10.50.2.2",))],
+            tags=["kubernetes"],
+        )
+        result = import_bundle_via_pipeline(
+            connection, bundle=bundle, user=None, dry_run=False
+        )
+        assert not result.errors
+
+        assert bundle["data"]["hosts"] == [{"name": "node-a"}]
+        node_a_ip = repository.get_ip_asset_by_ip(connection, "10.50.2.1")
+        node_b_ip = repository.get_ip_asset_by_ip(connection, "10.50.2.2")
+        assert node_a_ip is not None and node_a_ip.archived is False
+        assert node_b_ip is not None and node_b_ip.archived is True
+        assert node_b_ip.notes == "rack 4"
+        assert node_b_ip.host_id is not None
+    finally:
+        connection.close()
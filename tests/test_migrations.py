@@ -23,6 +23,9 @@ def test_init_db_runs_alembic_migrations(tmp_path) -> None:
         assert "tags" in tables
         assert "ip_asset_tags" in tables
         assert "sessions" in tables
+        assert "change_sequence" in tables
+        assert "change_tombstones" in tables
+        assert "inventory_counters" in tables
 
         tag_columns = {
             row["name"]
@@ -40,6 +43,15 @@ def test_init_db_runs_alembic_migrations(tmp_path) -> None:
             for row in connection.execute("PRAGMA table_info(ip_assets)").fetchall()
         }
         assert "ip_int" in ip_asset_columns
+        assert "import_fingerprint" in ip_asset_columns
+        assert "change_seq" in ip_asset_columns
+        change_sequence_columns = {
+            row["name"]
+            for row in connection.execute(
+                "PRAGMA table_info(change_sequence)"
+            ).fetchall()
+        }
+        assert "changed_at" in change_sequence_columns
     finally:
         connection.close()
 
@@ -77,6 +89,7 @@ def test_listing_indexes_exist_after_migrations(tmp_path) -> None:
         assert "ix_ip_assets_archived_project_type" in ip_assets_indexes
         assert "ix_ip_assets_archived_ip_address" in ip_assets_indexes
         assert "ix_ip_assets_archived_ip_int" in ip_assets_indexes
+        assert "ix_ip_assets_host_archived_type_ip_int" in ip_assets_indexes
 
         ip_asset_tags_indexes = {
             row["name"]
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from datetime import datetime, timezone
+import io
 from pathlib import Path
 import warnings
 
@@ -8,7 +9,12 @@ import pytest
 from fastapi.testclient import TestClient as FastAPITestClient
 
 from app import auth, db, repository
-from app.imports.nmap import NmapParseError, import_nmap_xml, parse_nmap_xml
+from app.imports.nmap import (
+    NmapParseError,
+    import_nmap_xml,
+    iter_nmap_hosts,
+    parse_nmap_xml,
+)
 from app.main import app
 from app.models import IPAssetType, User, UserRole
 from app.routes import ui
@@ -241,3 +247,38 @@ def test_import_nmap_redirect_has_no_redirect_deprecation_warning(client) -> Non
         and "allow_redirects" in str(w.message)
     ]
     assert redirect_warnings == []
+
+
+def test_iter_nmap_hosts_reads_file_objects_incrementally() -> None:
+    hosts_xml = "".join(
+        f'<host><status state="up"/><address addr="10.9.{i // 256}.{i % 256}" '
+        'addrtype="ipv4"/></host>'
+        for i in range(600)
+    )
+    payload = io.BytesIO(f"<nmaprun>{hosts_xml}</nmaprun>".encode())
+
+    hosts = iter_nmap_hosts(payload)
+
+    assert next(hosts).ip_address == "10.9.0.0"
+    assert sum(1 for _ in hosts) == 599
+
+
+def test_nmap_import_truncated_xml_rolls_back_earlier_batches(client) -> None:
+    _, db_path = client
+    connection = db.connect(str(db_path))
+    try:
+        db.init_db(connection)
+        hosts_xml = "".join(
+            f'<host><status state="up"/><address addr="10.8.0.{i}" '
+            'addrtype="ipv4"/></host>'
+            for i in range(1, 6)
+        )
+        payload = f"<nmaprun>{hosts_xml}<host><status".encode()
+
+        result = import_nmap_xml(connection, payload, dry_run=False, batch_size=2)
+
+        assert result.errors == ["Invalid Nmap XML payload."]
+        assert result.new_ips_created == 0
+        assert list(repository.list_active_ip_assets(connection)) == []
+    finally:
+        connection.close()
@@ -1,8 +1,12 @@
 from __future__ import annotations
 
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
 from fastapi.testclient import TestClient as FastAPITestClient
 
-from app import db, repository
+from app import db, repository, sd_cache
 from app.main import app
 from app.models import IPAssetType
 
@@ -30,3 +34,116 @@ def test_sd_targets_support_project_grouping(tmp_path, monkeypatch) -> None:
         labels = [g["labels"]["project"] for g in grouped.json()]
         assert "core" in labels
         assert "unassigned" in labels
+
+
+def test_sd_targets_answer_conditional_requests(tmp_path, monkeypatch) -> None:
+    db_path = tmp_path / "test.db"
+    monkeypatch.setenv("IPAM_DB_PATH", str(db_path))
+    monkeypatch.setenv("IPOCKET_SD_TOKEN", "sd-secret")
+
+    with FastAPITestClient(app) as client:
+        token_header = {"X-SD-Token": "sd-secret"}
+        first = client.get("/sd/node", headers=token_header)
+        assert first.status_code == 200
+        etag = first.headers["ETag"]
+
+        assert (
+            client.get("/sd/node", headers={"If-None-Match": etag}).status_code == 401
+        )
+        cached = client.get("/sd/node", headers={**token_header, "If-None-Match": etag})
+        assert cached.status_code == 304
+
+        connection = db.connect(str(db_path))
+        try:
+            repository.create_ip_asset(connection, "10.20.0.1", IPAssetType.VM)
+        finally:
+            connection.close()
+
+        refreshed = client.get(
+            "/sd/node", headers={**token_header, "If-None-Match": etag}
+        )
+        assert refreshed.status_code == 200
+        assert refreshed.headers["ETag"] != etag
+        assert refreshed.json()[0]["targets"] == ["10.20.0.1:9100"]
+
+
+def test_sd_responses_are_cached_per_normalized_query(tmp_path, monkeypatch) -> None:
+    db_path = tmp_path / "test.db"
+    monkeypatch.setenv("IPAM_DB_PATH", str(db_path))
+    sd_cache.clear_sd_cache()
+
+    with FastAPITestClient(app) as client:
+        connection = db.connect(str(db_path))
+        try:
+            core = repository.create_project(connection, name="core")
+            edge = repository.create_project(connection, name="edge")
+            repository.create_ip_asset(
+                connection, "10.20.0.1", IPAssetType.VM, project_id=core.id
+            )
+            repository.create_ip_asset(
+                connection, "10.20.0.2", IPAssetType.OS, project_id=edge.id
+            )
+        finally:
+            connection.close()
+
+        first = client.get("/sd/node?project=core,edge&type=VM&type=OS")
+        reordered = client.get("/sd/node?project=edge&project=core&type=OS,VM")
+        assert reordered.content == first.content
+        assert sd_cache.get_sd_cache_stats()["hits"] == 1
+        assert sd_cache.get_sd_cache_stats()["misses"] == 1
+
+        connection = db.connect(str(db_path))
+        try:
+            repository.update_project(connection, core.id, name="core-2")
+        finally:
+            connection.close()
+
+        refreshed = client.get("/sd/node?project=core-2")
+        assert refreshed.json()[0]["labels"]["project"] == "core-2"
+        stats = sd_cache.get_sd_cache_stats()
+        assert stats["misses"] == 2
+        assert stats["entries"] == 1
+
+        metrics = client.get("/metrics").text
+        assert "ipam_sd_cache_hits_total 1" in metrics
+        assert "ipam_sd_cache_misses_total 2" in metrics
+
+
+def test_concurrent_sd_misses_share_one_computation() -> None:
+    sd_cache.clear_sd_cache()
+    query = sd_cache.SDQuery.normalize(
+        port=9100,
+        only_assigned=False,
+        project_names=None,
+        asset_types=None,
+        group_by="none",
+    )
+    started = threading.Event()
+    release = threading.Event()
+    calls: list[str] = []
+
+    def slow_render(db_path: str, _query: sd_cache.SDQuery) -> bytes:
+        calls.append(db_path)
+        started.set()
+        release.wait(timeout=5)
+        return b"[]"
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        leader = executor.submit(
+            sd_cache.get_sd_targets_json, "sd.db", 7, query, render=slow_render
+        )
+        assert started.wait(timeout=5)
+        followers = [
+            executor.submit(
+                sd_cache.get_sd_targets_json, "sd.db", 7, query, render=slow_render
+            )
+            for _ in range(3)
+        ]
+        while sd_cache.get_sd_cache_stats()["coalesced"] < 3:
+            time.sleep(0.01)
+        release.set()
+        results = [leader.result()] + [future.result() for future in followers]
+
+    assert results == [b"[]"] * 4
+    assert calls == ["sd.db"]
+    assert sd_cache.get_sd_cache_stats()["misses"] == 1
@@ -158,3 +158,106 @@ def test_import_bundle_via_pipeline_calls_run_import(monkeypatch) -> None:
         "schema_version": "1",
         "data": {},
     }
+
+
+class _FakeHostSystem(SimpleNamespace):
+    pass
+
+
+class _FakeVirtualMachine(SimpleNamespace):
+    pass
+
+
+def _fake_spec(**kwargs):
+    return SimpleNamespace(**kwargs)
+
+
+def _object_content(obj, **properties):
+    return SimpleNamespace(
+        obj=obj,
+        propSet=[
+            SimpleNamespace(name=name.replace("__", "."), val=value)
+            for name, value in properties.items()
+        ],
+    )
+
+
+def test_collect_inventory_uses_one_paged_property_collector_query() -> None:
+    host_ref = _FakeHostSystem(_moId="host-1")
+    pages = {
+        None: SimpleNamespace(
+            objects=[
+                _object_content(
+                    _FakeVirtualMachine(_moId="vm-1"),
+                    name="app-01",
+                    guest__ipAddress="10.0.0.50",
+                    runtime__host=_FakeHostSystem(_moId="host-1"),
+                )
+            ],
+            token="page-2",
+        ),
+        "page-2": SimpleNamespace(
+            objects=[
+                _object_content(
+                    host_ref,
+                    name="esxi-01.lab",
+                    summary__managementServerIp="10.0.0.10",
+                )
+            ],
+            token=None,
+        ),
+    }
+    calls: list[tuple[str, object]] = []
+
+    class _PropertyCollector:
+        def RetrievePropertiesEx(self, specSet, options):
+            calls.append(("retrieve", options.maxObjects))
+            calls.append(("paths", [spec.pathSet for spec in specSet[0].propSet]))
+            return pages[None]
+
+        def ContinueRetrievePropertiesEx(self, token):
+            calls.append(("continue", token))
+            return pages[token]
+
+    view = SimpleNamespace(destroyed=False)
+    view.Destroy = lambda: setattr(view, "destroyed", True)
+    content = SimpleNamespace(
+        rootFolder="root",
+        viewManager=SimpleNamespace(CreateContainerView=lambda *args: view),
+        propertyCollector=_PropertyCollector(),
+    )
+    vim = SimpleNamespace(
+        HostSystem=_FakeHostSystem,
+        VirtualMachine=_FakeVirtualMachine,
+        view=SimpleNamespace(ContainerView=object),
+    )
+    vmodl = SimpleNamespace(
+        query=SimpleNamespace(
+            PropertyCollector=SimpleNamespace(
+                FilterSpec=_fake_spec,
+                ObjectSpec=_fake_spec,
+                PropertySpec=_fake_spec,
+                RetrieveOptions=_fake_spec,
+                TraversalSpec=_fake_spec,
+            )
+        )
+    )
+
+    hosts, vms, warnings = vcenter._collect_inventory(
+        SimpleNamespace(RetrieveContent=lambda: content), vim, vmodl, page_size=1
+    )
+
+    assert hosts == [VCenterHostRecord(name="esxi-01.lab", ip_address="10.0.0.10")]
+    assert vms == [
+        VCenterVmRecord(name="app-01", ip_address="10.0.0.50", host_name="esxi-01.lab")
+    ]
+    assert warnings == []
+    assert calls == [
+        ("retrieve", 1),
+        (
+            "paths",
+            [list(vcenter.HOST_PROPERTY_PATHS), list(vcenter.VM_PROPERTY_PATHS)],
+        ),
+        ("continue", "page-2"),
+    ]
+    assert view.destroyed is True
@@ -546,23 +546,6 @@ def test_prometheus_connector_dry_run_logs_per_ip_change_details(
                 ),
             ],
         )
-        monkeypatch.setattr(
-            prometheus_routes,
-            "import_prometheus_bundle_via_pipeline",
-            lambda *_args, **_kwargs: ImportApplyResult(
-                summary=ImportSummary(
-                    vendors=ImportEntitySummary(),
-                    projects=ImportEntitySummary(),
-                    hosts=ImportEntitySummary(),
-                    ip_assets=ImportEntitySummary(
-                        would_create=1, would_update=1, would_skip=1
-                    ),
-                ),
-                errors=[],
-                warnings=[],
-            ),
-        )
-
         logs, warnings, _warning_count, _error_count = (
             prometheus_routes._run_prometheus_connector(
                 connection=connection,
@@ -579,10 +562,17 @@ def test_prometheus_connector_dry_run_logs_per_ip_change_details(
                 dry_run=True,
             )
         )
+        assert repository.get_ip_asset_by_ip(connection, "10.0.0.12") is None
+        legacy_asset = repository.get_ip_asset_by_ip(connection, "10.0.0.10")
+        assert legacy_asset is not None
+        assert legacy_asset.project_id == legacy_project.id
     finally:
         connection.close()
 
     assert warnings == []
+    assert any(
+        "IP assets summary: create=1, update=1, skip=1." in line for line in logs
+    )
     assert "Dry-run per-IP change details:" in logs
     assert any(
         "[UPDATE] 10.0.0.10: project Legacy -> Core; "
@@ -1,9 +1,11 @@
 from __future__ import annotations
 
+import gzip
 import io
 import zipfile
 
 from app import repository
+from app.imports import jobs as import_jobs
 from app.imports.models import (
     ImportApplyResult,
     ImportEntitySummary,
@@ -89,7 +91,7 @@ def test_nmap_import_validation_and_apply_branches(client, monkeypatch) -> None:
 
 
 def test_ui_nmap_import_rejects_files_over_size_limit(client, monkeypatch) -> None:
-    monkeypatch.setattr(data_ops_routes, "IMPORT_UPLOAD_MAX_BYTES", 10)
+    monkeypatch.setattr(data_ops_routes, "IMPORT_STREAMED_UPLOAD_MAX_BYTES", 10)
     app.dependency_overrides[ui.get_current_ui_user] = lambda: _user(UserRole.EDITOR)
     try:
         response = client.post(
@@ -104,6 +106,47 @@ def test_ui_nmap_import_rejects_files_over_size_limit(client, monkeypatch) -> No
     assert "Uploaded file exceeds maximum size of 10 bytes." in response.text
 
 
+def test_ui_nmap_import_decompresses_gzip_uploads(client, monkeypatch) -> None:
+    received: list[bytes] = []
+
+    def _fake_import(_connection, data, **_kwargs):
+        received.append(data.read())
+        return NmapImportResult(
+            discovered_up_hosts=0,
+            new_ips_created=0,
+            existing_ips_seen=0,
+            errors=[],
+            new_assets=[],
+        )
+
+    monkeypatch.setattr(data_ops_routes, "import_nmap_xml", _fake_import)
+    app.dependency_overrides[ui.get_current_ui_user] = lambda: _user(UserRole.EDITOR)
+    try:
+        response = client.post(
+            "/ui/import/nmap",
+            data={"mode": "dry-run"},
+            files={
+                "nmap_file": (
+                    "scan.xml.gz",
+                    gzip.compress(b"<nmaprun />"),
+                    "application/gzip",
+                )
+            },
+        )
+        invalid = client.post(
+            "/ui/import/nmap",
+            data={"mode": "dry-run"},
+            files={"nmap_file": ("scan.xml.gz", b"<nmaprun />", "application/gzip")},
+        )
+    finally:
+        app.dependency_overrides.pop(ui.get_current_ui_user, None)
+
+    assert response.status_code == 200
+    assert received == [b"<nmaprun />"]
+    assert invalid.status_code == 400
+    assert "Uploaded file is not valid gzip data." in invalid.text
+
+
 def test_bundle_import_validation_and_result_payload_rendering(
     client, monkeypatch
 ) -> None:
@@ -147,6 +190,33 @@ def test_bundle_import_validation_and_result_payload_rendering(
     assert "bundle.hosts[0]: warn" in rendered.text
 
 
+def test_ui_imports_render_error_when_import_pool_is_full(client, monkeypatch) -> None:
+    monkeypatch.setattr(import_jobs, "IMPORT_SYNC_MAX_PENDING", 0)
+    app.dependency_overrides[ui.get_current_ui_user] = lambda: _user(UserRole.EDITOR)
+    try:
+        nmap = client.post(
+            "/ui/import/nmap",
+            data={"mode": "dry-run"},
+            files={"nmap_file": ("scan.xml", b"<nmaprun />", "text/xml")},
+        )
+        bundle = client.post(
+            "/ui/import/bundle",
+            data={"mode": "dry-run"},
+            files={"bundle_file": ("bundle.json", b"{}", "application/json")},
+        )
+        csv = client.post(
+            "/ui/import/csv",
+            data={"mode": "dry-run"},
+            files={"hosts_file": ("hosts.csv", b"name\nnode\n", "text/csv")},
+        )
+    finally:
+        app.dependency_overrides.pop(ui.get_current_ui_user, None)
+
+    for response in (nmap, bundle, csv):
+        assert response.status_code == 429
+        assert "Too many imports in progress (limit 0)." in response.text
+
+
 def test_csv_import_validation_and_result_payload_rendering(
     client, monkeypatch
 ) -> None:
@@ -202,7 +272,7 @@ def test_csv_import_validation_and_result_payload_rendering(
 
 
 def test_ui_csv_import_rejects_files_over_size_limit(client, monkeypatch) -> None:
-    monkeypatch.setattr(data_ops_routes, "IMPORT_UPLOAD_MAX_BYTES", 10)
+    monkeypatch.setattr(data_ops_routes, "IMPORT_STREAMED_UPLOAD_MAX_BYTES", 10)
     app.dependency_overrides[ui.get_current_ui_user] = lambda: _user(UserRole.EDITOR)
     try:
         response = client.post(